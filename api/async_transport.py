@@ -0,0 +1,203 @@
+"""
+키움증권 REST API 비동기 전송 계층
+
+전용 asyncio 이벤트 루프 스레드에서 REST 요청을 수행합니다.
+httpx가 설치되어 있으면 keep-alive 연결 풀(가능하면 HTTP/2)을 사용하고,
+없으면 requests 세션을 전송 계층 전용 executor에서 실행합니다.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Callable, Coroutine, Dict, Optional, Tuple, TypeVar
+
+httpx: Any = None
+try:
+    import httpx  # type: ignore[no-redef]
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # type: ignore[import-not-found]  # noqa: F401
+    HTTP2_AVAILABLE = HTTPX_AVAILABLE
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+T = TypeVar("T")
+
+# (status_code, json 로더, 본문 텍스트 로더)
+TransportResponse = Tuple[int, Callable[[], Any], Callable[[], str]]
+
+
+class AsyncRESTTransport:
+    """전용 이벤트 루프에서 동작하는 REST 전송 계층"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        *,
+        max_connections: int = 16,
+        max_keepalive: int = 8,
+        keepalive_expiry: float = 30.0,
+        max_workers: int = 8,
+        timeout: float = 10.0,
+    ):
+        """
+        Args:
+            session_factory: httpx 미설치 시 사용할 requests 세션 생성 함수
+            max_connections: 최대 동시 연결 수
+            max_keepalive: 유지할 keep-alive 연결 수
+            keepalive_expiry: keep-alive 연결 유휴 만료(초)
+            max_workers: 응답 파싱/블로킹 전송용 executor 스레드 수
+            timeout: 요청 타임아웃(초)
+        """
+        self.logger = logging.getLogger('AsyncRESTTransport')
+        self._session_factory = session_factory
+        self._max_connections = max(1, int(max_connections))
+        self._max_keepalive = max(0, int(max_keepalive))
+        self._keepalive_expiry = float(keepalive_expiry)
+        self._timeout = float(timeout)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._start_lock = threading.Lock()
+        self._client: Any = None
+        self._session: Any = None
+        workers = max(1, int(max_workers))
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="kiwoom-rest",
+        )
+        # httpx 미설치 시 블로킹 전송 전용 (파싱 executor 포화로 인한 교착 방지)
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(workers, self._max_connections),
+            thread_name_prefix="kiwoom-rest-io",
+        )
+
+    # =========================================================================
+    # 루프 관리
+    # =========================================================================
+
+    @property
+    def uses_httpx(self) -> bool:
+        return HTTPX_AVAILABLE
+
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive() and self._loop is not None)
+
+    def start(self):
+        """이벤트 루프 스레드 시작 (중복 호출 안전)"""
+        with self._start_lock:
+            if self.is_running():
+                return
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run_event_loop, name="kiwoom-rest-loop", daemon=True)
+            self._thread.start()
+        self._ready.wait(timeout=5)
+
+    def stop(self, timeout: float = 5.0):
+        """연결 풀을 닫고 이벤트 루프 종료"""
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._aclose(), loop).result(timeout=timeout)
+            except Exception as e:
+                self.logger.warning(f"전송 계층 종료 중 오류: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self._executor.shutdown(wait=False)
+        self._io_executor.shutdown(wait=False)
+
+    def _run_event_loop(self):
+        """이벤트 루프 실행 (별도 스레드)"""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        except Exception as e:
+            self.logger.error(f"이벤트 루프 오류: {e}")
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    async def _aclose(self):
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+        session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """코루틴을 전송 루프에 예약하고 concurrent.futures.Future 반환"""
+        self.start()
+        loop = self._loop
+        if loop is None:
+            coro.close()
+            raise RuntimeError("REST 전송 루프를 시작할 수 없습니다.")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    async def run_blocking(self, fn: Callable[..., T], *args: Any) -> T:
+        """블로킹 함수를 전송 계층 전용 executor에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    # =========================================================================
+    # 요청
+    # =========================================================================
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive,
+                keepalive_expiry=self._keepalive_expiry,
+            )
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=limits,
+                timeout=self._timeout,
+            )
+        return self._client
+
+    def _get_session(self) -> Any:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+    ) -> TransportResponse:
+        """HTTP 요청 수행 (네트워크 예외는 호출자에게 전달)"""
+        is_get = method.upper() == "GET"
+        if HTTPX_AVAILABLE:
+            client = self._get_client()
+            if is_get:
+                response = await client.get(url, headers=headers, params=params)
+            else:
+                response = await client.post(url, headers=headers, json=data)
+            return response.status_code, response.json, lambda: response.text
+
+        session = self._get_session()
+
+        def _send():
+            if is_get:
+                return session.get(url, headers=headers, params=params, timeout=self._timeout)
+            return session.post(url, headers=headers, json=data, timeout=self._timeout)
+
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(self._io_executor, _send)
+        return response.status_code, response.json, lambda: response.text
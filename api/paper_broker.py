@@ -0,0 +1,676 @@
+"""
+모의 체결(paper trading) 매칭 엔진
+
+실시간/재생 체결 틱과 호가를 기준으로 로컬 주문을 체결시키고,
+키움 실시간 주문체결(`_on_order_execution`)과 같은 형식의 이벤트를 발생시킵니다.
+`PaperBrokerClient`는 `KiwoomRESTClient`의 주문/계좌 API만 대체하고
+시세 조회는 감싼 실제 클라이언트로 넘깁니다.
+"""
+
+import concurrent.futures
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from config import Config
+
+from .models import AccountInfo, OpenOrder, OrderBook, OrderResult, OrderType, PriceType, Position
+
+
+class LatencyModel:
+    """주문 -> 거래소 도달 지연: `base_ms` + [0, `jitter_ms`) 균등 분포 (seed 고정 시 재현 가능)."""
+
+    def __init__(self, base_ms: float = 40.0, jitter_ms: float = 20.0, seed: Optional[int] = None):
+        self.base_ms = max(0.0, float(base_ms))
+        self.jitter_ms = max(0.0, float(jitter_ms))
+        self._rng = random.Random(seed)
+
+    def sample_sec(self) -> float:
+        jitter = self._rng.random() * self.jitter_ms if self.jitter_ms > 0 else 0.0
+        return (self.base_ms + jitter) / 1000.0
+
+
+class PaperOrder:
+    __slots__ = (
+        "order_no",
+        "code",
+        "side",
+        "price",
+        "quantity",
+        "filled",
+        "market",
+        "queue_ahead",
+        "seq",
+        "state",
+        "fill_value",
+    )
+
+    def __init__(self, order_no: str, code: str, side: str, quantity: int, price: int, market: bool, seq: int):
+        self.order_no = order_no
+        self.code = code
+        self.side = side
+        self.price = int(price)
+        self.quantity = int(quantity)
+        self.filled = 0
+        self.market = bool(market)
+        self.queue_ahead = 0
+        self.seq = seq
+        self.state = "pending"  # pending -> open -> filled / cancelled
+        self.fill_value = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.quantity - self.filled)
+
+    @property
+    def is_live(self) -> bool:
+        return self.state in {"pending", "open"}
+
+
+_SIDE_CODES = {"buy": "1", "sell": "2"}
+_CANCEL_CODES = {"buy": "3", "sell": "4"}
+_MODIFY_CODES = {"buy": "5", "sell": "6"}
+
+
+class PaperMatchingEngine:
+    """체결 틱 기준 가격-시간 우선 매칭.
+
+    - 주문/취소/정정은 `LatencyModel` 지연 후 거래소에 도달한 것으로 처리한다.
+    - 시장가와 상대호가에 닿는 지정가는 표시 잔량 한도 내에서 즉시 체결되고 나머지는 대기한다.
+    - 대기 지정가는 같은 가격의 표시 잔량을 앞선 대기열(`queue_ahead`)로 잡고,
+      그 가격의 체결량이 대기열을 소진한 뒤부터 부분 체결된다. 가격이 관통하면 전량 체결.
+    - 호가 갱신에서 해당 가격 잔량이 줄면 앞선 취소로 보고 대기열을 줄인다.
+
+    이벤트는 잠금 밖에서 `on_event`로 전달되므로 콜백 안에서 다시 주문해도 된다.
+    체결/취소된 주문은 바로 장부에서 빠지고, 매수 약정금액과 매도 대기수량은 종목별 누계로
+    유지하므로 주문 한 건의 비용이 누적 주문 수와 무관하다 (초당 수천 건의 주문/틱).
+    """
+
+    def __init__(
+        self,
+        latency: Optional[LatencyModel] = None,
+        on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.latency = latency or LatencyModel(0.0, 0.0)
+        self.on_event = on_event
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._seq = itertools.count(1)
+        self._orders: Dict[str, PaperOrder] = {}  # 살아 있는 주문만
+        # 종목별 누계: 지정가 매수 잔량 x 가격, 시장가 매수 잔량, 매도 잔량
+        self._buy_value: Dict[str, int] = {}
+        self._buy_market_qty: Dict[str, int] = {}
+        self._sell_qty: Dict[str, int] = {}
+        self._resting: Dict[str, List[PaperOrder]] = {}
+        self._inbound: List[Tuple[float, int, str, PaperOrder, Dict[str, Any]]] = []
+        self._quotes: Dict[str, Dict[str, Any]] = {}
+        self.fill_count = 0
+
+    # ------------------------------------------------------------------
+    # Order entry (any thread)
+    # ------------------------------------------------------------------
+    def submit(self, code: str, side: str, quantity: int, price: int = 0, market: bool = False) -> PaperOrder:
+        events: List[Dict[str, Any]] = []
+        with self._lock:
+            seq = next(self._seq)
+            order = PaperOrder(f"P{seq:08d}", str(code), side, quantity, price, market or int(price) <= 0, seq)
+            self._orders[order.order_no] = order
+            self._commit(order, 1)
+            self._schedule("new", order, {})
+            # 도달 처리는 다음 틱/호가/advance()에서 한다: 체결 이벤트가 주문 응답보다 먼저 가지 않도록.
+            events.append(self._event(order, _SIDE_CODES[side], "접수", ord_qty=order.quantity))
+        self._dispatch(events)
+        return order
+
+    def cancel(self, order_no: str) -> Optional[PaperOrder]:
+        with self._lock:
+            order = self._orders.get(str(order_no))
+            if order is None or not order.is_live:
+                return None
+            self._schedule("cancel", order, {})
+        return order
+
+    def modify(self, order_no: str, quantity: int, price: int) -> Optional[PaperOrder]:
+        with self._lock:
+            order = self._orders.get(str(order_no))
+            if order is None or not order.is_live:
+                return None
+            self._schedule("modify", order, {"quantity": int(quantity), "price": int(price)})
+        return order
+
+    def order(self, order_no: str) -> Optional[PaperOrder]:
+        """살아 있는 주문 조회 (체결/취소가 끝난 주문은 None)."""
+        return self._orders.get(str(order_no))
+
+    def open_orders(self) -> List[PaperOrder]:
+        with self._lock:
+            return list(self._orders.values())
+
+    def committed_buy_cash(self) -> int:
+        """미체결 매수 잔량의 약정금액 (시장가는 현재 호가 기준)."""
+        with self._lock:
+            committed = sum(self._buy_value.values())
+            for code, qty in self._buy_market_qty.items():
+                committed += qty * self.last_price(code)
+            return committed
+
+    def selling_qty(self, code: str) -> int:
+        with self._lock:
+            return self._sell_qty.get(str(code), 0)
+
+    def last_price(self, code: str) -> int:
+        quote = self._quotes.get(code, {})
+        return int(quote.get("ask") or quote.get("last") or 0)
+
+    # ------------------------------------------------------------------
+    # Market data (any thread)
+    # ------------------------------------------------------------------
+    def on_tick(self, code: str, price: int, volume: int = 0, bid: int = 0, ask: int = 0) -> None:
+        events: List[Dict[str, Any]] = []
+        with self._lock:
+            quote = self._quote(code)
+            price = int(price or 0)
+            if price > 0:
+                quote["last"] = price
+            if int(bid or 0) > 0:
+                quote["bid"] = int(bid)
+                if quote["bids"] and quote["bids"][0][0] != quote["bid"]:
+                    quote["bids"] = []  # 호가가 움직였으면 이전 잔량 스냅샷은 버린다
+            if int(ask or 0) > 0:
+                quote["ask"] = int(ask)
+                if quote["asks"] and quote["asks"][0][0] != quote["ask"]:
+                    quote["asks"] = []
+            self._release(self._clock(), events)
+            if price > 0:
+                self._match_tick(code, price, max(0, int(volume or 0)), events)
+        self._dispatch(events)
+
+    def on_order_book(self, book: OrderBook) -> None:
+        events: List[Dict[str, Any]] = []
+        with self._lock:
+            quote = self._quote(book.code)
+            quote["asks"] = [(int(p), int(v)) for p, v in zip(book.ask_prices, book.ask_volumes) if int(p) > 0]
+            quote["bids"] = [(int(p), int(v)) for p, v in zip(book.bid_prices, book.bid_volumes) if int(p) > 0]
+            if quote["asks"]:
+                quote["ask"] = quote["asks"][0][0]
+            if quote["bids"]:
+                quote["bid"] = quote["bids"][0][0]
+            for order in self._resting.get(book.code, []):
+                if order.is_live and order.queue_ahead > 0:
+                    shown = self._level_volume(quote, order.side, order.price)
+                    if shown is not None:
+                        order.queue_ahead = min(order.queue_ahead, shown)
+            self._release(self._clock(), events)
+            self._sweep_crossed(book.code, events)
+        self._dispatch(events)
+
+    def advance(self, now: Optional[float] = None) -> None:
+        """지연이 지난 주문/취소/정정을 처리한다 (틱이 드문 종목용)."""
+        events: List[Dict[str, Any]] = []
+        with self._lock:
+            self._release(self._clock() if now is None else float(now), events)
+        self._dispatch(events)
+
+    # ------------------------------------------------------------------
+    # Internals (lock held)
+    # ------------------------------------------------------------------
+    def _quote(self, code: str) -> Dict[str, Any]:
+        quote = self._quotes.get(code)
+        if quote is None:
+            quote = {"last": 0, "bid": 0, "ask": 0, "asks": [], "bids": []}
+            self._quotes[code] = quote
+        return quote
+
+    def _schedule(self, kind: str, order: PaperOrder, payload: Dict[str, Any]) -> None:
+        heapq.heappush(self._inbound, (self._clock() + self.latency.sample_sec(), next(self._seq), kind, order, payload))
+
+    def _release(self, now: float, events: List[Dict[str, Any]]) -> None:
+        while self._inbound and self._inbound[0][0] <= now:
+            _due, _seq, kind, order, payload = heapq.heappop(self._inbound)
+            if not order.is_live:
+                continue
+            if kind == "new":
+                self._arrive(order, events)
+            elif kind == "cancel":
+                self._commit(order, -1)
+                order.state = "cancelled"
+                self._orders.pop(order.order_no, None)
+                events.append(
+                    self._event(order, _CANCEL_CODES[order.side], "취소", ord_qty=order.remaining, unexec_qty=0)
+                )
+            elif kind == "modify":
+                self._commit(order, -1)
+                order.quantity = max(order.filled, int(payload["quantity"]))
+                order.price = int(payload["price"])
+                order.market = order.price <= 0
+                order.seq = next(self._seq)  # 정정은 시간 우선순위를 잃는다
+                events.append(self._event(order, _MODIFY_CODES[order.side], "확인", ord_qty=order.quantity))
+                if order.remaining <= 0:
+                    order.state = "filled"
+                    self._orders.pop(order.order_no, None)
+                    continue
+                self._commit(order, 1)
+                if order.state == "open":
+                    self._take_liquidity(order, events)
+                    if order.is_live:
+                        order.queue_ahead = self._queue_estimate(order)
+
+    def _arrive(self, order: PaperOrder, events: List[Dict[str, Any]]) -> None:
+        order.state = "open"
+        self._resting.setdefault(order.code, []).append(order)
+        self._take_liquidity(order, events)
+        if order.is_live and not order.market:
+            order.queue_ahead = self._queue_estimate(order)
+
+    def _take_liquidity(self, order: PaperOrder, events: List[Dict[str, Any]]) -> None:
+        """상대 호가에 닿으면 표시 잔량(없으면 전량) 한도로 즉시 체결."""
+        quote = self._quote(order.code)
+        levels_key = "asks" if order.side == "buy" else "bids"
+        best = int(quote.get("ask" if order.side == "buy" else "bid") or 0)
+        levels = quote.get(levels_key) or []
+
+        def crosses(level_price: int) -> bool:
+            if order.market:
+                return True
+            return level_price <= order.price if order.side == "buy" else level_price >= order.price
+
+        if best <= 0 and order.market:
+            best = int(quote.get("last") or 0)
+        if best <= 0 or not crosses(best):
+            return
+        if not levels:
+            self._fill(order, order.remaining, best, events)
+            return
+        remaining_levels = []
+        for level_price, level_volume in levels:
+            if order.remaining > 0 and crosses(level_price):
+                taken = min(order.remaining, level_volume)
+                self._fill(order, taken, level_price, events)
+                level_volume -= taken
+            if level_volume > 0:
+                remaining_levels.append((level_price, level_volume))
+        quote[levels_key] = remaining_levels  # 가져간 잔량은 다음 주문이 다시 쓰지 못한다
+
+    def _queue_estimate(self, order: PaperOrder) -> int:
+        shown = self._level_volume(self._quote(order.code), order.side, order.price)
+        return int(shown or 0)
+
+    @staticmethod
+    def _level_volume(quote: Dict[str, Any], side: str, price: int) -> Optional[int]:
+        levels = quote.get("bids" if side == "buy" else "asks") or []
+        if not levels:
+            return None
+        for level_price, level_volume in levels:
+            if level_price == price:
+                return int(level_volume)
+        return 0
+
+    def _match_tick(self, code: str, price: int, volume: int, events: List[Dict[str, Any]]) -> None:
+        resting = self._resting.get(code)
+        if not resting:
+            return
+        buys = sorted(
+            (o for o in resting if o.is_live and o.side == "buy" and (o.market or o.price >= price)),
+            key=lambda o: (not o.market, -o.price, o.seq),
+        )
+        sells = sorted(
+            (o for o in resting if o.is_live and o.side == "sell" and (o.market or o.price <= price)),
+            key=lambda o: (not o.market, o.price, o.seq),
+        )
+        for book_side in (buys, sells):
+            printed = volume
+            for order in book_side:
+                through = order.market or (order.price > price if order.side == "buy" else order.price < price)
+                if through:
+                    # 가격이 관통했으면 앞선 대기열과 무관하게 주문가(시장가는 체결가)로 전량 체결
+                    self._fill(order, order.remaining, price if order.market else order.price, events)
+                    continue
+                used = min(order.queue_ahead, printed)
+                order.queue_ahead -= used
+                printed -= used
+                qty = min(order.remaining, printed)
+                if qty > 0:
+                    printed -= qty
+                    self._fill(order, qty, order.price, events)
+        self._sweep_crossed(code, events)
+
+    def _sweep_crossed(self, code: str, events: List[Dict[str, Any]]) -> None:
+        resting = self._resting.get(code)
+        if not resting:
+            return
+        for order in resting:
+            if order.is_live and order.state == "open":
+                self._take_liquidity(order, events)
+        self._resting[code] = [order for order in resting if order.is_live]
+
+    def _fill(self, order: PaperOrder, quantity: int, price: int, events: List[Dict[str, Any]]) -> None:
+        quantity = min(int(quantity), order.remaining)
+        if quantity <= 0 or price <= 0:
+            return
+        self._commit(order, -1)
+        order.filled += quantity
+        order.fill_value += quantity * int(price)
+        if order.remaining <= 0:
+            order.state = "filled"
+            self._orders.pop(order.order_no, None)
+        else:
+            self._commit(order, 1)
+        self.fill_count += 1
+        events.append(
+            self._event(
+                order,
+                _SIDE_CODES[order.side],
+                "체결",
+                ord_qty=order.quantity,
+                exec_qty=quantity,
+                exec_price=int(price),
+                unexec_qty=order.remaining,
+            )
+        )
+
+    def _commit(self, order: PaperOrder, sign: int) -> None:
+        """주문 잔량을 종목별 누계에 더하거나(+1) 뺀다(-1): 잔량/가격을 바꾸기 전후로 짝지어 호출."""
+        if order.side == "sell":
+            totals, amount = self._sell_qty, order.remaining
+        elif order.price > 0:
+            totals, amount = self._buy_value, order.remaining * order.price
+        else:
+            totals, amount = self._buy_market_qty, order.remaining
+        value = totals.get(order.code, 0) + sign * amount
+        if value:
+            totals[order.code] = value
+        else:
+            totals.pop(order.code, None)
+
+    @staticmethod
+    def _event(order: PaperOrder, order_type: str, status: str, **fields: Any) -> Dict[str, Any]:
+        event = {
+            "code": order.code,
+            "order_no": order.order_no,
+            "order_type": order_type,
+            "order_status": status,
+            "ord_prc": 0 if order.market else order.price,
+            "exec_qty": 0,
+            "side": order.side,
+            "source": "paper",
+        }
+        event.update(fields)
+        return event
+
+    def _dispatch(self, events: List[Dict[str, Any]]) -> None:
+        callback = self.on_event
+        if callback is None:
+            return
+        for event in events:
+            callback(event)
+
+
+class PaperBrokerClient:
+    """주문/잔고/미체결 API를 `PaperMatchingEngine`으로 처리하는 `KiwoomRESTClient` 대용.
+
+    시세/차트 등 나머지 호출은 감싼 `inner` 클라이언트로 그대로 넘어간다.
+    체결 이벤트는 모의 잔고에 반영한 뒤 `on_order_event`(앱의 실시간 주문체결 콜백)로 전달한다.
+    `cash`를 주지 않으면 첫 주문/계좌 조회 때 `Config.PAPER_INITIAL_CASH`(0이면 `inner`의
+    실제 예수금)로 한 번 채운다.
+    """
+
+    supports_open_orders = True
+
+    def __init__(
+        self,
+        inner: Any = None,
+        cash: Optional[int] = None,
+        engine: Optional[PaperMatchingEngine] = None,
+        on_order_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.inner = inner
+        self.engine = engine or PaperMatchingEngine(
+            LatencyModel(
+                float(getattr(Config, "PAPER_LATENCY_MS", 40)),
+                float(getattr(Config, "PAPER_LATENCY_JITTER_MS", 20)),
+            )
+        )
+        self.engine.on_event = self._on_engine_event
+        self.on_order_event = on_order_event
+        self.cash = int(cash or 0)
+        self._cash_seeded = cash is not None
+        self._book_lock = threading.RLock()
+        self._positions: Dict[str, Dict[str, int]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        inner = self.__dict__.get("inner")
+        if inner is None:
+            raise AttributeError(name)
+        return getattr(inner, name)
+
+    # ------------------------------------------------------------------
+    # 주문 API
+    # ------------------------------------------------------------------
+    def send_order(
+        self,
+        account_no: str,
+        code: str,
+        order_type: OrderType,
+        quantity: int,
+        price: int = 0,
+        price_type: PriceType = PriceType.LIMIT,
+    ) -> OrderResult:
+        side = "buy" if order_type == OrderType.BUY else "sell"
+        market = price_type != PriceType.LIMIT or int(price or 0) <= 0
+        quantity = int(quantity or 0)
+        if quantity <= 0:
+            return OrderResult(success=False, code=code, order_type=order_type.value, message="주문수량 오류", error_code=-1)
+        self._seed_cash(account_no)
+        with self._book_lock:
+            if side == "buy":
+                unit = int(price) if not market else self.engine.last_price(code)
+                if unit > 0 and quantity * unit > self._orderable_cash():
+                    return OrderResult(
+                        success=False, code=code, order_type=order_type.value, quantity=quantity, price=price,
+                        message="주문가능금액 부족", error_code=-1,
+                    )
+            elif quantity > self._sellable_qty(code):
+                return OrderResult(
+                    success=False, code=code, order_type=order_type.value, quantity=quantity, price=price,
+                    message="매도가능수량 부족", error_code=-1,
+                )
+        order = self.engine.submit(code, side, quantity, 0 if market else int(price), market=market)
+        return OrderResult(
+            success=True,
+            order_no=order.order_no,
+            code=code,
+            order_type=order_type.value,
+            quantity=quantity,
+            price=price,
+            message="모의 주문 접수",
+        )
+
+    def buy_market(self, account_no: str, code: str, quantity: int) -> OrderResult:
+        return self.send_order(account_no, code, OrderType.BUY, quantity, 0, PriceType.MARKET)
+
+    def sell_market(self, account_no: str, code: str, quantity: int) -> OrderResult:
+        return self.send_order(account_no, code, OrderType.SELL, quantity, 0, PriceType.MARKET)
+
+    def buy_limit(self, account_no: str, code: str, quantity: int, price: int) -> OrderResult:
+        return self.send_order(account_no, code, OrderType.BUY, quantity, price, PriceType.LIMIT)
+
+    def sell_limit(self, account_no: str, code: str, quantity: int, price: int) -> OrderResult:
+        return self.send_order(account_no, code, OrderType.SELL, quantity, price, PriceType.LIMIT)
+
+    def cancel_order(self, account_no: str, order_no: str, code: str, quantity: int) -> OrderResult:
+        if self.engine.cancel(order_no) is None:
+            return OrderResult(success=False, order_no=order_no, code=code, message="취소 가능한 주문 없음")
+        return OrderResult(success=True, order_no=order_no, code=code, message="모의 취소 접수")
+
+    def modify_order(
+        self,
+        account_no: str,
+        order_no: str,
+        code: str,
+        quantity: int,
+        price: int,
+        price_type: PriceType = PriceType.LIMIT,
+    ) -> OrderResult:
+        if self.engine.modify(order_no, quantity, price) is None:
+            return OrderResult(
+                success=False, order_no=order_no, code=code, quantity=quantity, price=price, message="정정 가능한 주문 없음"
+            )
+        return OrderResult(success=True, order_no=order_no, code=code, quantity=quantity, price=price, message="모의 정정 접수")
+
+    def submit(self, method_name: str, *args: Any, **kwargs: Any) -> "concurrent.futures.Future[Any]":
+        """비동기 전송 계층 대용: 로컬 메서드는 즉시 실행한 완료 Future를 돌려준다.
+
+        위임 호출은 `inner.submit`으로 넘기고, `inner`에 전송 계층이 없으면 AttributeError를
+        올려 호출부가 자체 스레드풀로 폴백하게 한다 (호출 스레드에서 동기 실행하지 않는다).
+        """
+        fn = getattr(type(self), method_name, None)
+        if fn is None:
+            inner_submit = getattr(self.inner, "submit", None)
+            if not callable(inner_submit):
+                raise AttributeError(f"inner client has no async transport for {method_name}")
+            return cast("concurrent.futures.Future[Any]", inner_submit(method_name, *args, **kwargs))
+        fn = getattr(self, method_name)
+        future: "concurrent.futures.Future[Any]" = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def request_backlog_sec(self) -> float:
+        return 0.0
+
+    # ------------------------------------------------------------------
+    # 계좌 API
+    # ------------------------------------------------------------------
+    def get_positions(self, account_no: str) -> List[Position]:
+        self.engine.advance()
+        with self._book_lock:
+            rows = []
+            for code, pos in self._positions.items():
+                qty = int(pos["quantity"])
+                if qty <= 0:
+                    continue
+                avg = int(pos["cost"] / qty) if qty else 0
+                current = self.engine.last_price(code) or avg
+                rows.append(
+                    Position(
+                        code=code,
+                        quantity=qty,
+                        available_qty=self._sellable_qty(code),
+                        buy_price=avg,
+                        current_price=current,
+                        buy_amount=int(pos["cost"]),
+                        eval_amount=qty * current,
+                        profit=qty * current - int(pos["cost"]),
+                        profit_rate=((current - avg) / avg * 100.0) if avg else 0.0,
+                    )
+                )
+            return rows
+
+    def get_account_info(self, account_no: str) -> AccountInfo:
+        self._seed_cash(account_no)
+        with self._book_lock:
+            positions = self.get_positions(account_no)
+            buy_amount = sum(p.buy_amount for p in positions)
+            eval_amount = sum(p.eval_amount for p in positions)
+            return AccountInfo(
+                account_no=account_no,
+                deposit=self.cash,
+                available_amount=self._orderable_cash(),
+                total_buy_amount=buy_amount,
+                total_eval_amount=eval_amount,
+                total_profit=eval_amount - buy_amount,
+                total_profit_rate=((eval_amount - buy_amount) / buy_amount * 100.0) if buy_amount else 0.0,
+            )
+
+    def get_open_orders(self, account_no: str) -> List[OpenOrder]:
+        self.engine.advance()
+        return [
+            OpenOrder(
+                order_no=order.order_no,
+                code=order.code,
+                side=order.side,
+                quantity=order.quantity,
+                remaining_qty=order.remaining,
+                price=order.price,
+                status="대기",
+                source="paper",
+            )
+            for order in self.engine.open_orders()
+        ]
+
+    # ------------------------------------------------------------------
+    # 시세 입력
+    # ------------------------------------------------------------------
+    def on_market_tick(self, data: Any) -> None:
+        self.engine.on_tick(
+            str(getattr(data, "code", "") or ""),
+            int(getattr(data, "exec_price", 0) or 0),
+            int(getattr(data, "exec_volume", 0) or 0),
+            bid=int(getattr(data, "bid_price", 0) or 0),
+            ask=int(getattr(data, "ask_price", 0) or 0),
+        )
+
+    def get_order_book(self, code: str) -> Optional[OrderBook]:
+        getter = getattr(self.inner, "get_order_book", None)
+        book = getter(code) if callable(getter) else None
+        if not isinstance(book, OrderBook):
+            return None
+        self.engine.on_order_book(book)
+        return book
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _seed_cash(self, account_no: str) -> None:
+        """시작 현금을 한 번만 채운다: 설정값 우선, 없으면 실제 계좌 예수금 (조회 실패 시 다음 호출에 재시도)."""
+        if self._cash_seeded:
+            return
+        deposit = int(getattr(Config, "PAPER_INITIAL_CASH", 0) or 0)
+        if deposit <= 0:
+            getter = getattr(self.inner, "get_account_info", None)
+            try:
+                info = getter(account_no) if callable(getter) else None
+            except Exception:
+                info = None
+            if not isinstance(info, AccountInfo):
+                return
+            deposit = int(info.deposit or 0)
+        with self._book_lock:
+            if self._cash_seeded:
+                return
+            self.cash += deposit
+            self._cash_seeded = True
+
+    def _orderable_cash(self) -> int:
+        return max(0, self.cash - self.engine.committed_buy_cash())
+
+    def _sellable_qty(self, code: str) -> int:
+        held = int(self._positions.get(code, {}).get("quantity", 0))
+        return max(0, held - self.engine.selling_qty(code))
+
+    def _on_engine_event(self, event: Dict[str, Any]) -> None:
+        qty = int(event.get("exec_qty", 0) or 0)
+        if qty > 0:
+            price = int(event.get("exec_price", 0) or 0)
+            with self._book_lock:
+                pos = self._positions.setdefault(event["code"], {"quantity": 0, "cost": 0})
+                if event.get("side") == "buy":
+                    pos["quantity"] += qty
+                    pos["cost"] += qty * price
+                    self.cash -= qty * price
+                else:
+                    held = max(1, int(pos["quantity"]))
+                    pos["cost"] -= int(pos["cost"] * qty / held)
+                    pos["quantity"] = max(0, pos["quantity"] - qty)
+                    self.cash += qty * price
+                    if pos["quantity"] <= 0:
+                        self._positions.pop(event["code"], None)
+        callback = self.on_order_event
+        if callback is not None:
+            callback(dict(event))
@@ -4,16 +4,23 @@
 시세 조회, 계좌 조회, 주문 등 REST API 호출을 담당합니다.
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import logging
 import time
 import threading
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Generator, NamedTuple, TypeVar
+from typing import Concatenate, ParamSpec
 from datetime import datetime
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from config import Config
+
+from .async_transport import AsyncRESTTransport
 from .auth import KiwoomAuth
 from .endpoints import LIVE_REST_BASE_URL
 from .models import (
@@ -48,6 +55,65 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+# call_async/submit 대상에서 제외할 공개 메서드 (REST 호출이 아니거나 라이프사이클 제어)
+_NON_REST_METHODS = {"call_async", "submit", "close"}
+
+_T = TypeVar("_T")
+_P = ParamSpec("_P")
+
+
+class _RestRequest(NamedTuple):
+    """`_request`/`_request_async` 인자 묶음 (요청 계획이 yield 하는 단위)"""
+    method: str
+    endpoint: str
+    tr_code: Optional[str] = None
+    data: Optional[Dict] = None
+    params: Optional[Dict] = None
+    cont_yn: str = "N"
+    next_key: str = ""
+
+
+# 공개 REST 메서드 본문: 요청을 yield 하고 응답을 받아 파싱 결과를 return 하는 제너레이터
+RestPlan = Generator[_RestRequest, Optional[Dict], _T]
+
+
+def _rest_method(
+    plan: Callable[Concatenate["KiwoomRESTClient", _P], RestPlan[_T]],
+) -> Callable[Concatenate["KiwoomRESTClient", _P], _T]:
+    """요청 계획을 동기 메서드로 노출한다.
+
+    동기 호출은 계획을 `_request`로 진행하고, `call_async`/`submit`은 같은 계획을
+    전송 루프에서 `_request_async`로 진행한다 (호출마다 스레드를 붙잡지 않는다).
+    """
+
+    @functools.wraps(plan)
+    def method(self: "KiwoomRESTClient", *args: _P.args, **kwargs: _P.kwargs) -> _T:
+        return self._drive(plan(self, *args, **kwargs))
+
+    setattr(method, "__rest_plan__", plan)
+    return method
+
+
+def _plan_of(method: Any) -> Optional[Callable[..., RestPlan[Any]]]:
+    return getattr(getattr(method, "__func__", method), "__rest_plan__", None)
+
+
+class _AsyncMethodNamespace:
+    """`client.aio.get_positions(acc)` 형태의 awaitable 접근자"""
+
+    def __init__(self, client: "KiwoomRESTClient"):
+        self._client = client
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        self._client._resolve_public_method(name)
+
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            return await self._client.call_async(name, *args, **kwargs)
+
+        _call.__name__ = name
+        return _call
+
+
 class KiwoomRESTClient:
     """키움증권 REST API 클라이언트"""
     
@@ -107,11 +173,16 @@ class KiwoomRESTClient:
         
         # 요청 속도 제한 (1초에 최대 5건)
         self._last_request_time = 0
-        self._min_request_interval = 0.2  # 200ms
+        self._min_request_interval = 1.0 / max(1, int(getattr(Config, "API_RATE_LIMIT", 5) or 5))
         self._lock = threading.Lock()
+
+        # 비동기 전송 계층 (최초 사용 시 생성)
+        self._transport: Optional[AsyncRESTTransport] = None
+        self._transport_lock = threading.Lock()
+        self.aio = _AsyncMethodNamespace(self)
         
     def _create_session(self) -> requests.Session:
-        """재시도 로직이 포함된 세션 생성"""
+        """재시도 로직과 keep-alive 연결 풀이 설정된 세션 생성"""
         session = requests.Session()
         
         retry_strategy = Retry(
@@ -121,18 +192,71 @@ class KiwoomRESTClient:
             allowed_methods=["GET", "POST"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=int(getattr(Config, "API_POOL_CONNECTIONS", 4)),
+            pool_maxsize=int(getattr(Config, "API_POOL_MAXSIZE", 16)),
+        )
         session.mount("https://", adapter)
         
         return session
+
+    def _reserve_request_slot(self) -> float:
+        """다음 요청 슬롯을 예약하고 대기해야 할 시간(초)을 반환 (Thread-Safe)"""
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._last_request_time + self._min_request_interval)
+            self._last_request_time = slot
+            return slot - now
     
-    def _rate_limit(self):
-        """요청 속도 제한 (Thread-Safe)"""
+    def request_backlog_sec(self) -> float:
+        """이미 예약된 요청 슬롯이 소진될 때까지 남은 시간(초)"""
         with self._lock:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self._min_request_interval:
-                time.sleep(self._min_request_interval - elapsed)
-            self._last_request_time = time.time()
+            return max(0.0, self._last_request_time - time.time())
+    
+    def _rate_limit(self):
+        """요청 속도 제한 (Thread-Safe, 대기는 lock 밖에서 수행)"""
+        wait = self._reserve_request_slot()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def _rate_limit_async(self):
+        """요청 속도 제한 (이벤트 루프를 막지 않는 비동기 대기)"""
+        wait = self._reserve_request_slot()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _build_headers(self, tr_code: Optional[str], cont_yn: str, next_key: str) -> Optional[Dict[str, str]]:
+        """키움 필수 헤더 생성, 토큰이 없으면 None"""
+        headers = {
+            "Content-Type": "application/json;charset=UTF-8",
+            **self.auth.get_auth_header(),
+            "cont-yn": str(cont_yn or "N"),
+        }
+        if tr_code:
+            headers["api-id"] = str(tr_code)
+        if next_key:
+            headers["next-key"] = str(next_key)
+        
+        if not headers.get("Authorization"):
+            self.logger.error("인증 토큰이 없습니다. 먼저 로그인해주세요.")
+            return None
+        return headers
+
+    def _handle_response(self, status_code: int, load_json: Callable[[], Any], load_text: Callable[[], str]) -> Optional[Dict]:
+        """HTTP 응답 공통 처리"""
+        if status_code == 200:
+            result = load_json()
+            
+            # 키움 API 응답 코드 확인
+            return_code = result.get("return_code", 0)
+            if return_code != 0:
+                error_msg = result.get("return_msg", "알 수 없는 오류")
+                self.logger.warning(f"API 오류 ({return_code}): {error_msg}")
+            
+            return result
+        self.logger.error(f"HTTP 오류: {status_code} - {load_text()}")
+        return None
     
     def _request(self, method: str, endpoint: str, 
                  tr_code: Optional[str] = None,
@@ -158,18 +282,8 @@ class KiwoomRESTClient:
         self._rate_limit()
         
         url = f"{self.base_url}{endpoint}"
-        headers = {
-            "Content-Type": "application/json;charset=UTF-8",
-            **self.auth.get_auth_header(),
-            "cont-yn": str(cont_yn or "N"),
-        }
-        if tr_code:
-            headers["api-id"] = str(tr_code)
-        if next_key:
-            headers["next-key"] = str(next_key)
-        
-        if not headers.get("Authorization"):
-            self.logger.error("인증 토큰이 없습니다. 먼저 로그인해주세요.")
+        headers = self._build_headers(tr_code, cont_yn, next_key)
+        if headers is None:
             return None
         
         try:
@@ -177,20 +291,7 @@ class KiwoomRESTClient:
                 response = self.session.get(url, headers=headers, params=params, timeout=10)
             else:
                 response = self.session.post(url, headers=headers, json=data, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                # 키움 API 응답 코드 확인
-                return_code = result.get("return_code", 0)
-                if return_code != 0:
-                    error_msg = result.get("return_msg", "알 수 없는 오류")
-                    self.logger.warning(f"API 오류 ({return_code}): {error_msg}")
-                
-                return result
-            else:
-                self.logger.error(f"HTTP 오류: {response.status_code} - {response.text}")
-                return None
+            return self._handle_response(response.status_code, response.json, lambda: response.text)
                 
         except requests.RequestException as e:
             self.logger.error(f"네트워크 오류: {e}")
@@ -199,6 +300,120 @@ class KiwoomRESTClient:
             self.logger.error(f"요청 예외: {e}")
             return None
 
+    async def _request_async(self, method: str, endpoint: str,
+                             tr_code: Optional[str] = None,
+                             data: Optional[Dict] = None,
+                             params: Optional[Dict] = None,
+                             cont_yn: str = "N",
+                             next_key: str = "") -> Optional[Dict]:
+        """`_request`의 비동기 버전 (전송 루프에서 실행)"""
+        await self._rate_limit_async()
+
+        url = f"{self.base_url}{endpoint}"
+        headers = self._build_headers(tr_code, cont_yn, next_key)
+        if headers is None:
+            return None
+
+        try:
+            status_code, load_json, load_text = await self._get_transport().request(
+                method, url, headers=headers, data=data, params=params
+            )
+            return self._handle_response(status_code, load_json, load_text)
+        except requests.RequestException as e:
+            self.logger.error(f"네트워크 오류: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"요청 예외: {e}")
+            return None
+
+    # =========================================================================
+    # 비동기 / Future API
+    # =========================================================================
+
+    def _get_transport(self) -> AsyncRESTTransport:
+        with self._transport_lock:
+            if self._transport is None:
+                self._transport = AsyncRESTTransport(
+                    self._create_session,
+                    max_connections=int(getattr(Config, "API_POOL_MAXSIZE", 16)),
+                    max_keepalive=int(getattr(Config, "API_POOL_KEEPALIVE", 8)),
+                    keepalive_expiry=float(getattr(Config, "API_KEEPALIVE_EXPIRY_SEC", 30)),
+                    max_workers=int(getattr(Config, "API_ASYNC_MAX_WORKERS", 8)),
+                    timeout=float(getattr(Config, "API_REQUEST_TIMEOUT", 10)),
+                )
+            return self._transport
+
+    def _resolve_public_method(self, method_name: str) -> Callable[..., Any]:
+        name = str(method_name or "")
+        fn = getattr(self, name, None) if not name.startswith("_") else None
+        if not callable(fn) or name in _NON_REST_METHODS:
+            raise AttributeError(f"비동기 호출을 지원하지 않는 메서드: {method_name}")
+        return fn
+
+    def _drive(self, plan: RestPlan[_T]) -> _T:
+        """요청 계획을 동기 `_request`로 진행 (요청 예외는 계획 안으로 되던진다)"""
+        try:
+            request = next(plan)
+            while True:
+                try:
+                    response = self._request(*request)
+                except Exception as exc:
+                    request = plan.throw(exc)
+                else:
+                    request = plan.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _drive_async(self, plan: RestPlan[_T]) -> _T:
+        """요청 계획을 전송 루프에서 `_request_async`로 진행"""
+        try:
+            request = next(plan)
+            while True:
+                try:
+                    response = await self._request_async(*request)
+                except Exception as exc:
+                    request = plan.throw(exc)
+                else:
+                    request = plan.send(response)
+        except StopIteration as stop:
+            return stop.value
+
+    def _subplan(self, method: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> RestPlan[_T]:
+        """다른 공개 REST 메서드를 현재 계획 안에서 호출 (`yield from`으로 사용)"""
+        plan = _plan_of(method)
+        if plan is None:
+            return method(*args, **kwargs)  # 계획이 없는 (재정의된) 메서드는 그대로 호출
+        return (yield from plan(self, *args, **kwargs))
+
+    async def _call_resolved(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        plan = _plan_of(fn)
+        if plan is None:
+            # 계획이 없는 (재정의된) 메서드만 전송 계층 executor에서 실행
+            return await self._get_transport().run_blocking(functools.partial(fn, *args, **kwargs))
+        return await self._drive_async(plan(self, *args, **kwargs))
+
+    async def call_async(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        공개 REST 메서드의 awaitable 버전
+
+        메서드의 요청 계획을 전송 루프에서 그대로 진행하므로 속도 제한 대기와
+        네트워크 대기가 스레드를 점유하지 않고, 응답 파싱도 루프에서 수행됩니다.
+        """
+        fn = self._resolve_public_method(method_name)
+        return await self._call_resolved(fn, args, kwargs)
+
+    def submit(self, method_name: str, *args: Any, **kwargs: Any) -> "concurrent.futures.Future[Any]":
+        """공개 REST 메서드를 전송 루프에 예약하고 Future 반환 (Qt 워커 불필요)"""
+        fn = self._resolve_public_method(method_name)
+        return self._get_transport().submit(self._call_resolved(fn, args, kwargs))
+
+    def close(self):
+        """비동기 전송 계층 종료"""
+        with self._transport_lock:
+            transport, self._transport = self._transport, None
+        if transport is not None:
+            transport.stop()
+
     def _parse_market_type(self, output: Dict) -> str:
         """시장 구분 파싱"""
         mkt_gb = output.get("mkt_gb", "")
@@ -212,7 +427,8 @@ class KiwoomRESTClient:
     # 시세 조회 API
     # =========================================================================
     
-    def get_stock_quote(self, code: str) -> Optional[StockQuote]:
+    @_rest_method
+    def get_stock_quote(self, code: str) -> RestPlan[Optional[StockQuote]]:
         """
         주식 현재가 조회
         
@@ -228,7 +444,7 @@ class KiwoomRESTClient:
             "stk_cd": code
         }
         
-        result = self._request("POST", "/api/dostk/stkprice", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/stkprice", tr_code=tr_code, data=data)
         
         if result and result.get("return_code") == 0:
             output = result.get("output", {})
@@ -253,7 +469,8 @@ class KiwoomRESTClient:
         
         return None
     
-    def get_order_book(self, code: str) -> Optional[OrderBook]:
+    @_rest_method
+    def get_order_book(self, code: str) -> RestPlan[Optional[OrderBook]]:
         """
         호가 정보 조회
         
@@ -269,7 +486,7 @@ class KiwoomRESTClient:
             "stk_cd": code
         }
         
-        result = self._request("POST", "/api/dostk/stkhoga", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/stkhoga", tr_code=tr_code, data=data)
         
         if result and result.get("return_code") == 0:
             output = result.get("output", {})
@@ -298,7 +515,8 @@ class KiwoomRESTClient:
         
         return None
     
-    def get_daily_chart(self, code: str, count: int = 60) -> List[DailyOHLC]:
+    @_rest_method
+    def get_daily_chart(self, code: str, count: int = 60) -> RestPlan[List[DailyOHLC]]:
         """
         일봉 차트 데이터 조회
         
@@ -316,7 +534,7 @@ class KiwoomRESTClient:
             "req_cnt": min(count, 100)
         }
         
-        result = self._request("POST", "/api/dostk/stkdaily", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/stkdaily", tr_code=tr_code, data=data)
         
         candles = []
         if result and result.get("return_code") == 0:
@@ -338,7 +556,8 @@ class KiwoomRESTClient:
     # 계좌 조회 API
     # =========================================================================
     
-    def get_account_info(self, account_no: str) -> Optional[AccountInfo]:
+    @_rest_method
+    def get_account_info(self, account_no: str) -> RestPlan[Optional[AccountInfo]]:
         """
         계좌 평가 정보 조회
         
@@ -354,7 +573,7 @@ class KiwoomRESTClient:
             "acnt_no": account_no
         }
         
-        result = self._request("POST", "/api/dostk/acntbal", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/acntbal", tr_code=tr_code, data=data)
         
         if result and result.get("return_code") == 0:
             output = result.get("output", {})
@@ -371,7 +590,8 @@ class KiwoomRESTClient:
         
         return None
     
-    def get_positions(self, account_no: str) -> Optional[List[Position]]:
+    @_rest_method
+    def get_positions(self, account_no: str) -> RestPlan[Optional[List[Position]]]:
         """
         보유 종목 조회
         
@@ -387,7 +607,7 @@ class KiwoomRESTClient:
             "acnt_no": account_no
         }
         
-        result = self._request("POST", "/api/dostk/acntbal", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/acntbal", tr_code=tr_code, data=data)
         
         if not result:
             return None
@@ -417,11 +637,14 @@ class KiwoomRESTClient:
     def supports_open_orders(self) -> bool:
         return True
 
-    def get_open_orders(self, account_no: str) -> List[OpenOrder]:
+    @_rest_method
+    def get_open_orders(self, account_no: str) -> RestPlan[Optional[List[OpenOrder]]]:
         """미체결 주문 조회.
 
         키움 REST TR `ka10075`(미체결요청) 기반.
-        여러 필드명 후보를 허용하고 실패 시 빈 리스트를 반환하여 안전하게 동작하도록 한다.
+        여러 필드명 후보를 허용하고 예외를 전가하지 않는다. 조회 자체가 실패하면
+        None, 정상 응답에 미체결이 없으면 빈 리스트를 반환하므로 호출부는
+        None을 "브로커 상태 미확인"으로 다뤄야 한다.
         """
         tr_code = self.TR_CODES["ORDER_OPEN"]
         data = {
@@ -430,21 +653,23 @@ class KiwoomRESTClient:
         }
 
         try:
-            result = self._request("POST", "/api/dostk/ordunfilled", tr_code=tr_code, data=data)
+            result = yield _RestRequest("POST", "/api/dostk/ordunfilled", tr_code=tr_code, data=data)
         except Exception as exc:
             self.logger.warning(f"미체결 주문 조회 예외: {exc}")
-            return []
+            return None
 
         if not result or result.get("return_code") != 0:
-            return []
+            return None
 
         rows = result.get("output", [])
+        if rows is None or rows == "":
+            rows = []
         if not isinstance(rows, list):
             # 단건 응답인 경우 단일 dict를 리스트로 정규화
             if isinstance(rows, dict):
                 rows = [rows]
             else:
-                return []
+                return None
 
         orders: List[OpenOrder] = []
         for item in rows:
@@ -480,13 +705,14 @@ class KiwoomRESTClient:
     # 주문 API
     # =========================================================================
     
+    @_rest_method
     def send_order(self, 
                    account_no: str,
                    code: str,
                    order_type: OrderType,
                    quantity: int,
                    price: int = 0,
-                   price_type: PriceType = PriceType.LIMIT) -> OrderResult:
+                   price_type: PriceType = PriceType.LIMIT) -> RestPlan[OrderResult]:
         """
         주식 주문 전송 (키움 공식 주문 엔드포인트 POST /api/dostk/ordr)
         
@@ -512,7 +738,7 @@ class KiwoomRESTClient:
             "prc_tp": price_type.value
         }
         
-        result = self._request("POST", "/api/dostk/ordr", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/ordr", tr_code=tr_code, data=data)
         
         if result:
             return_code = result.get("return_code", -1)
@@ -546,51 +772,60 @@ class KiwoomRESTClient:
             error_code=-1
         )
     
-    def buy_market(self, account_no: str, code: str, quantity: int) -> OrderResult:
+    @_rest_method
+    def buy_market(self, account_no: str, code: str, quantity: int) -> RestPlan[OrderResult]:
         """시장가 매수"""
-        return self.send_order(
+        return (yield from self._subplan(
+            self.send_order,
             account_no=account_no,
             code=code,
             order_type=OrderType.BUY,
             quantity=quantity,
             price=0,
             price_type=PriceType.MARKET
-        )
+        ))
     
-    def sell_market(self, account_no: str, code: str, quantity: int) -> OrderResult:
+    @_rest_method
+    def sell_market(self, account_no: str, code: str, quantity: int) -> RestPlan[OrderResult]:
         """시장가 매도"""
-        return self.send_order(
+        return (yield from self._subplan(
+            self.send_order,
             account_no=account_no,
             code=code,
             order_type=OrderType.SELL,
             quantity=quantity,
             price=0,
             price_type=PriceType.MARKET
-        )
+        ))
     
-    def buy_limit(self, account_no: str, code: str, quantity: int, price: int) -> OrderResult:
+    @_rest_method
+    def buy_limit(self, account_no: str, code: str, quantity: int, price: int) -> RestPlan[OrderResult]:
         """지정가 매수"""
-        return self.send_order(
+        return (yield from self._subplan(
+            self.send_order,
             account_no=account_no,
             code=code,
             order_type=OrderType.BUY,
             quantity=quantity,
             price=price,
             price_type=PriceType.LIMIT
-        )
+        ))
     
-    def sell_limit(self, account_no: str, code: str, quantity: int, price: int) -> OrderResult:
+    @_rest_method
+    def sell_limit(self, account_no: str, code: str, quantity: int, price: int) -> RestPlan[OrderResult]:
         """지정가 매도"""
-        return self.send_order(
+        return (yield from self._subplan(
+            self.send_order,
             account_no=account_no,
             code=code,
             order_type=OrderType.SELL,
             quantity=quantity,
             price=price,
             price_type=PriceType.LIMIT
-        )
+        ))
     
-    def cancel_order(self, account_no: str, order_no: str, code: str, quantity: int) -> OrderResult:
+    @_rest_method
+    def cancel_order(self, account_no: str, order_no: str, code: str, quantity: int) -> RestPlan[OrderResult]:
         """주문 취소 (키움 공식 주문 엔드포인트 POST /api/dostk/ordr)"""
         tr_code = self.TR_CODES["ORDER_CANCEL"]
         data = {
@@ -601,7 +836,7 @@ class KiwoomRESTClient:
             "ord_qty": quantity
         }
         
-        result = self._request("POST", "/api/dostk/ordr", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/ordr", tr_code=tr_code, data=data)
         
         if result and result.get("return_code") == 0:
             return OrderResult(
@@ -618,7 +853,8 @@ class KiwoomRESTClient:
             message=result.get("return_msg", "취소 실패") if result else "네트워크 오류"
         )
     
-    def modify_order(self, account_no: str, order_no: str, code: str, quantity: int, price: int, price_type: PriceType = PriceType.LIMIT) -> OrderResult:
+    @_rest_method
+    def modify_order(self, account_no: str, order_no: str, code: str, quantity: int, price: int, price_type: PriceType = PriceType.LIMIT) -> RestPlan[OrderResult]:
         """주문 정정 (키움 공식 주문 엔드포인트 POST /api/dostk/ordr)"""
         tr_code = self.TR_CODES["ORDER_MODIFY"]
         data = {
@@ -631,7 +867,7 @@ class KiwoomRESTClient:
             "prc_tp": price_type.value
         }
         
-        result = self._request("POST", "/api/dostk/ordr", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/ordr", tr_code=tr_code, data=data)
         
         if result and result.get("return_code") == 0:
             return OrderResult(
@@ -656,7 +892,8 @@ class KiwoomRESTClient:
     # 유틸리티
     # =========================================================================
     
-    def get_account_list(self) -> List[str]:
+    @_rest_method
+    def get_account_list(self) -> RestPlan[List[str]]:
         """
         계좌 목록 조회
         
@@ -664,23 +901,25 @@ class KiwoomRESTClient:
             계좌번호 리스트
         """
         tr_code = self.TR_CODES["ACCOUNT_LIST"]
-        result = self._request("POST", "/api/dostk/acntlist", tr_code=tr_code, data={})
+        result = yield _RestRequest("POST", "/api/dostk/acntlist", tr_code=tr_code, data={})
         
         if result and result.get("return_code") == 0:
             return result.get("accounts", [])
         
         return []
     
-    def get_stock_name(self, code: str) -> str:
+    @_rest_method
+    def get_stock_name(self, code: str) -> RestPlan[str]:
         """종목명 조회"""
-        quote = self.get_stock_quote(code)
+        quote = yield from self._subplan(self.get_stock_quote, code)
         return quote.name if quote else ""
     
     # =========================================================================
     # 차트 API 확장
     # =========================================================================
     
-    def get_minute_chart(self, code: str, interval: int = 1, count: int = 60) -> List[DailyOHLC]:
+    @_rest_method
+    def get_minute_chart(self, code: str, interval: int = 1, count: int = 60) -> RestPlan[List[DailyOHLC]]:
         """
         분봉 차트 데이터 조회
         
@@ -700,7 +939,7 @@ class KiwoomRESTClient:
             "req_cnt": min(count, 100)
         }
         
-        result = self._request("POST", "/api/dostk/stkminute", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/stkminute", tr_code=tr_code, data=data)
         
         candles = []
         if result and result.get("return_code") == 0:
@@ -718,7 +957,8 @@ class KiwoomRESTClient:
         
         return candles
     
-    def get_weekly_chart(self, code: str, count: int = 52) -> List[DailyOHLC]:
+    @_rest_method
+    def get_weekly_chart(self, code: str, count: int = 52) -> RestPlan[List[DailyOHLC]]:
         """주봉 차트 데이터 조회"""
         tr_code = self.TR_CODES["STOCK_WEEKLY"]
         data = {
@@ -727,7 +967,7 @@ class KiwoomRESTClient:
             "req_cnt": min(count, 100)
         }
         
-        result = self._request("POST", "/api/dostk/stkweekly", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/stkweekly", tr_code=tr_code, data=data)
         
         candles = []
         if result and result.get("return_code") == 0:
@@ -749,7 +989,8 @@ class KiwoomRESTClient:
     # 조건검색 API
     # =========================================================================
     
-    def get_condition_list(self) -> List[Dict[str, Any]]:
+    @_rest_method
+    def get_condition_list(self) -> RestPlan[List[Dict[str, Any]]]:
         """
         조건검색식 목록 조회
         
@@ -757,7 +998,7 @@ class KiwoomRESTClient:
             [{"index": 0, "name": "조건식명"}, ...]
         """
         tr_code = self.TR_CODES["CONDITION_LIST"]
-        result = self._request("POST", "/api/dostk/condition/list", tr_code=tr_code, data={})
+        result = yield _RestRequest("POST", "/api/dostk/condition/list", tr_code=tr_code, data={})
         
         conditions = []
         if result and result.get("return_code") == 0:
@@ -770,7 +1011,8 @@ class KiwoomRESTClient:
         
         return conditions
     
-    def search_by_condition(self, condition_index: int, condition_name: str = "") -> List[Dict[str, Any]]:
+    @_rest_method
+    def search_by_condition(self, condition_index: int, condition_name: str = "") -> RestPlan[List[Dict[str, Any]]]:
         """
         조건검색 실행
         
@@ -787,7 +1029,7 @@ class KiwoomRESTClient:
             "cond_nm": condition_name
         }
         
-        result = self._request("POST", "/api/dostk/condition/search", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/condition/search", tr_code=tr_code, data=data)
         
         stocks = []
         if result and result.get("return_code") == 0:
@@ -807,7 +1049,8 @@ class KiwoomRESTClient:
     # 순위 정보 API
     # =========================================================================
     
-    def get_volume_ranking(self, market: str = "0", count: int = 30) -> List[Dict[str, Any]]:
+    @_rest_method
+    def get_volume_ranking(self, market: str = "0", count: int = 30) -> RestPlan[List[Dict[str, Any]]]:
         """
         거래량 상위 종목 조회
         
@@ -825,7 +1068,7 @@ class KiwoomRESTClient:
             "req_cnt": min(count, 50)
         }
         
-        result = self._request("POST", "/api/dostk/ranking/volume", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/ranking/volume", tr_code=tr_code, data=data)
         
         rankings = []
         if result and result.get("return_code") == 0:
@@ -843,7 +1086,8 @@ class KiwoomRESTClient:
         
         return rankings
     
-    def get_fluctuation_ranking(self, market: str = "0", sort_type: str = "1", count: int = 30) -> List[Dict[str, Any]]:
+    @_rest_method
+    def get_fluctuation_ranking(self, market: str = "0", sort_type: str = "1", count: int = 30) -> RestPlan[List[Dict[str, Any]]]:
         """
         등락률 상위 종목 조회
         
@@ -863,7 +1107,7 @@ class KiwoomRESTClient:
             "req_cnt": min(count, 50)
         }
         
-        result = self._request("POST", "/api/dostk/ranking/fluctuation", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/ranking/fluctuation", tr_code=tr_code, data=data)
         
         rankings = []
         if result and result.get("return_code") == 0:
@@ -881,7 +1125,8 @@ class KiwoomRESTClient:
         
         return rankings
     
-    def get_investor_trading(self, code: str) -> Dict[str, Any]:
+    @_rest_method
+    def get_investor_trading(self, code: str) -> RestPlan[Dict[str, Any]]:
         """
         투자자별 매매 동향 조회
         
@@ -897,7 +1142,7 @@ class KiwoomRESTClient:
             "stk_cd": code
         }
         
-        result = self._request("POST", "/api/dostk/investor", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/investor", tr_code=tr_code, data=data)
         
         if result and result.get("return_code") == 0:
             output = result.get("output", {})
@@ -916,7 +1161,8 @@ class KiwoomRESTClient:
         
         return {}
     
-    def get_program_trading(self, code: str) -> Dict[str, Any]:
+    @_rest_method
+    def get_program_trading(self, code: str) -> RestPlan[Dict[str, Any]]:
         """
         프로그램 매매 동향 조회
         
@@ -932,7 +1178,7 @@ class KiwoomRESTClient:
             "stk_cd": code
         }
         
-        result = self._request("POST", "/api/dostk/program", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/program", tr_code=tr_code, data=data)
         
         if result and result.get("return_code") == 0:
             output = result.get("output", {})
@@ -953,30 +1199,33 @@ class KiwoomRESTClient:
     # 시장 상태/지수 API (v4 확장)
     # =========================================================================
 
-    def get_market_status(self) -> Dict[str, Any]:
+    @_rest_method
+    def get_market_status(self) -> RestPlan[Dict[str, Any]]:
         """시장 상태 조회 (지원 시). 지원되지 않으면 빈 dict 반환."""
         tr_code = self.TR_CODES["MARKET_STATUS"]
-        result = self._request("POST", "/api/dostk/market/status", tr_code=tr_code, data={})
+        result = yield _RestRequest("POST", "/api/dostk/market/status", tr_code=tr_code, data={})
         if result and result.get("return_code") == 0:
             output = result.get("output", {})
             if isinstance(output, dict):
                 return output
         return {}
 
-    def get_index_quote(self, index_code: str) -> Dict[str, Any]:
+    @_rest_method
+    def get_index_quote(self, index_code: str) -> RestPlan[Dict[str, Any]]:
         """지수 시세 조회 (지원 시). 지원되지 않으면 빈 dict 반환."""
         if not index_code:
             return {}
         tr_code = self.TR_CODES["INDEX_QUOTE"]
         data = {"idx_cd": index_code}
-        result = self._request("POST", "/api/dostk/index/quote", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/index/quote", tr_code=tr_code, data=data)
         if result and result.get("return_code") == 0:
             output = result.get("output", {})
             if isinstance(output, dict):
                 return output
         return {}
 
-    def get_market_indexes(self) -> List[SectorQuote]:
+    @_rest_method
+    def get_market_indexes(self) -> RestPlan[List[SectorQuote]]:
         """
         주요 시장 지수 시세 조회 (코스피: 001, 코스닥: 101, 코스피200: 201)
         
@@ -991,7 +1240,7 @@ class KiwoomRESTClient:
         quotes: List[SectorQuote] = []
         for idx_cd, name in major_indexes:
             try:
-                res = self.get_index_quote(idx_cd)
+                res = yield from self._subplan(self.get_index_quote, idx_cd)
                 if res:
                     quotes.append(SectorQuote(
                         code=idx_cd,
@@ -1010,7 +1259,8 @@ class KiwoomRESTClient:
                 continue
         return quotes
 
-    def get_deposit_detail(self, account_no: str) -> Optional[DepositDetail]:
+    @_rest_method
+    def get_deposit_detail(self, account_no: str) -> RestPlan[Optional[DepositDetail]]:
         """
         예수금 상세 정보 조회 (ka30002)
         
@@ -1026,7 +1276,7 @@ class KiwoomRESTClient:
             "acnt_no": account_no
         }
         
-        result = self._request("POST", "/api/dostk/acntdeposit", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/acntdeposit", tr_code=tr_code, data=data)
         
         if result and result.get("return_code") == 0:
             output = result.get("output", {})
@@ -1044,7 +1294,8 @@ class KiwoomRESTClient:
             )
         return None
 
-    def get_executed_orders(self, account_no: str, date: str = "") -> List[ExecutedOrder]:
+    @_rest_method
+    def get_executed_orders(self, account_no: str, date: str = "") -> RestPlan[List[ExecutedOrder]]:
         """
         당일 체결 주문 목록 조회 (ka10076)
         
@@ -1063,7 +1314,7 @@ class KiwoomRESTClient:
         }
         
         try:
-            result = self._request("POST", "/api/dostk/ordexecuted", tr_code=tr_code, data=data)
+            result = yield _RestRequest("POST", "/api/dostk/ordexecuted", tr_code=tr_code, data=data)
         except Exception as exc:
             self.logger.warning(f"체결 주문 조회 예외: {exc}")
             return []
@@ -1101,7 +1352,8 @@ class KiwoomRESTClient:
             ))
         return orders
 
-    def get_tick_chart(self, code: str, count: int = 60) -> List[TickCandle]:
+    @_rest_method
+    def get_tick_chart(self, code: str, count: int = 60) -> RestPlan[List[TickCandle]]:
         """
         틱 차트 데이터 조회 (ka10007)
         
@@ -1119,7 +1371,7 @@ class KiwoomRESTClient:
             "req_cnt": min(count, 100)
         }
         
-        result = self._request("POST", "/api/dostk/stktick", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/stktick", tr_code=tr_code, data=data)
         
         candles: List[TickCandle] = []
         if result and result.get("return_code") == 0:
@@ -1136,7 +1388,8 @@ class KiwoomRESTClient:
                 ))
         return candles
 
-    def get_vi_status(self, market: str = "0") -> List[VIEvent]:
+    @_rest_method
+    def get_vi_status(self, market: str = "0") -> RestPlan[List[VIEvent]]:
         """
         변동성완화장치(VI) 발동 현황 조회 (ka20009)
         
@@ -1152,7 +1405,7 @@ class KiwoomRESTClient:
             "mkt_tp": market,
         }
         
-        result = self._request("POST", "/api/dostk/vi/status", tr_code=tr_code, data=data)
+        result = yield _RestRequest("POST", "/api/dostk/vi/status", tr_code=tr_code, data=data)
         
         events: List[VIEvent] = []
         if result and result.get("return_code") == 0:
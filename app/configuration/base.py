@@ -139,6 +139,7 @@ def _default_market_intel_state() -> Dict[str, Any]:
         "intel_error": "",
         "last_alert": "",
         "ai_summary": {},
+        "ai_story_key": "",
     }
 
 @dataclass
@@ -316,6 +317,11 @@ class Config:
     API_REQUEST_TIMEOUT = 10
     API_MAX_RETRIES = 3
     API_RETRY_DELAY = 1
+    API_POOL_CONNECTIONS = 4
+    API_POOL_MAXSIZE = 16
+    API_POOL_KEEPALIVE = 8
+    API_KEEPALIVE_EXPIRY_SEC = 30
+    API_ASYNC_MAX_WORKERS = 8
 
     # =========================================================================
     # 기본값
@@ -636,32 +642,89 @@ class Config:
     SETTINGS_FILE = str(_BASE_PATH / "kiwoom_settings.json")
     PRESETS_FILE = str(_BASE_PATH / "kiwoom_presets.json")
     TRADE_HISTORY_FILE = str(_BASE_PATH / "kiwoom_trade_history.json")
+    TRADE_HISTORY_DB_FILE = str(_BASE_PATH / "data" / "trade_history.db")
     LOG_DIR = str(_BASE_PATH / "logs")
 
     # =========================================================================
     # 메모리 관리
     # =========================================================================
     MAX_LOG_LINES = 500
+    LOG_FLUSH_INTERVAL_MS = 50
     MAX_PRICE_HISTORY = 100
     UI_REFRESH_INTERVAL_MS = 100
+    DIAGNOSTICS_AGE_REFRESH_MS = 1000
     DECISION_CACHE_MS = 100
     POSITION_SYNC_DEBOUNCE_MS = 200
     POSITION_SYNC_MAX_RETRIES = 5
     POSITION_SYNC_BACKOFF_MAX_MS = 5000
+    POSITION_SYNC_COALESCE_MAX_MS = 1500
+    POSITION_SYNC_FILL_WINDOW_SEC = 2.0
+    POSITION_SYNC_MAX_PER_SEC = 2.0
     LOG_DEDUP_SEC = 30
     TABLE_BATCH_LIMIT = 200
     ORDER_REJECT_COOLDOWN_SEC = 10
+    ORDER_CLEANUP_TIMEOUT_SEC = 8.0
+    ORDER_CLEANUP_CANCEL_TIMEOUT_SEC = 10.0
+    ORDER_CLEANUP_MAX_POLLS = 3
+    ORDER_CLEANUP_POLL_INTERVAL_MS = 500
     EXTERNAL_FLOW_REFRESH_SEC = 10
     EXTERNAL_FLOW_STALE_SEC = 30
     EXTERNAL_FLOW_ON_DEMAND_DEBOUNCE_SEC = 5
     MARKET_INTEL_REFRESH_SEC = 60
     MARKET_INTEL_MACRO_REFRESH_SEC = 300
+    # FRED 관측치 로컬 저장소: 최초 동기화 때 받아올 기간(일), 이후에는 마지막 저장일부터 증분 조회
+    MARKET_INTEL_MACRO_HISTORY_DAYS = 400
+    # AI 요약 묶음 호출: 트리거를 모으는 창(ms), 호출당 최대 종목 수, 응답 캐시 보존(초), 호출 제한 시간(초)
+    MARKET_INTEL_AI_BATCH_WINDOW_MS = 1500
+    MARKET_INTEL_AI_BATCH_MAX = 8
+    MARKET_INTEL_AI_CACHE_TTL_SEC = 6 * 3600
+    MARKET_INTEL_AI_TIMEOUT_SEC = 20
+    # 예산 차감용 추정 비용: 호출 1회 기본 + 묶음에 추가된 종목당
+    MARKET_INTEL_AI_CALL_COST_KRW = 100
+    MARKET_INTEL_AI_BATCH_ITEM_COST_KRW = 25
     MARKET_INTEL_STALE_SEC = 180
     MARKET_INTEL_ALERT_DEDUP_SEC = 600
     MARKET_INTEL_BRIEFING_TIME = "08:50"
+    MARKET_INTEL_FETCH_DEADLINE_SEC = 45
+    # 공급자별 동시 호출 수와 초당 호출 한도 (NAVER/DART/FRED 쿼터가 서로 다름)
+    MARKET_INTEL_PROVIDER_LIMITS = {
+        "news": {"concurrency": 4, "rate_per_sec": 8.0},
+        "dart": {"concurrency": 2, "rate_per_sec": 4.0},
+        "datalab": {"concurrency": 2, "rate_per_sec": 2.0},
+        "macro": {"concurrency": 1, "rate_per_sec": 1.5},
+    }
+    # 유사 헤드라인 묶음(동일 기사 재전송) 판정: 보존 시간과 바이그램 Jaccard 임계값
+    MARKET_INTEL_NEWS_DEDUP_WINDOW_SEC = 6 * 3600
+    MARKET_INTEL_NEWS_DEDUP_THRESHOLD = 0.6
+    # 전체 시장 공시 피드: 주기당 최대 페이지(100건/페이지)와 종목별 캐시 보존 기간
+    MARKET_INTEL_DART_FEED_MAX_PAGES = 10
+    MARKET_INTEL_DART_FEED_RETENTION_DAYS = 30
+    # 외부 데이터 HTTP 캐시: 제공자별 신선 유지(TTL)와 그 뒤 백그라운드 재검증 동안 재사용할 시간(초)
+    PROVIDER_HTTP_CACHE_DIR = str(_BASE_PATH / "data" / "http_cache")
+    PROVIDER_HTTP_CACHE_TTL_SEC = {"news": 50, "dart": 50, "datalab": 600, "macro": 1800, "ai": 0}
+    PROVIDER_HTTP_STALE_SEC = {"news": 0, "dart": 0, "datalab": 1800, "macro": 3600, "ai": 0}
+    # 디스크 캐시 정리: 이 기간 동안 갱신되지 않은 파일을 지우고 전체 크기를 상한 안으로 유지
+    PROVIDER_HTTP_CACHE_MAX_AGE_SEC = 7 * 24 * 3600
+    PROVIDER_HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
     MARKET_INTELLIGENCE_EVENTS_FILE = str(_BASE_PATH / "data" / "market_intelligence_events.jsonl")
     MARKET_INTELLIGENCE_DECISION_AUDIT_FILE = str(_BASE_PATH / "data" / "decision_audit.jsonl")
     ORDER_LIFECYCLE_EVENTS_FILE = str(_BASE_PATH / "data" / "order_lifecycle_events.jsonl")
+    MARKET_INTELLIGENCE_DB_FILE = str(_BASE_PATH / "data" / "market_intelligence.db")
+    MARKET_INTEL_STORE_ENABLED = True
+    MACRO_SERIES_DB_FILE = str(_BASE_PATH / "data" / "macro_series.db")
+    EVENT_LOG_QUEUE_MAX = 20000
+    EVENT_LOG_BATCH_LINES = 256
+    EVENT_LOG_FLUSH_INTERVAL_MS = 200
+    EVENT_LOG_FSYNC = "interval"  # never | interval | batch
+    EVENT_LOG_FSYNC_INTERVAL_SEC = 1.0
+    EVENT_LOG_ROTATE_BYTES = 64 * 1024 * 1024
+    EVENT_LOG_ROTATE_KEEP = 20
+    EVENT_LOG_BLOCK_TIMEOUT_MS = 20
+    ORDER_JOURNAL_ENABLED = True
+    ORDER_JOURNAL_DIR = str(_BASE_PATH / "data" / "order_journal")
+    ORDER_JOURNAL_FSYNC_BATCH = 16
+    ORDER_JOURNAL_FSYNC_INTERVAL_SEC = 0.5
+    ORDER_JOURNAL_COMPACT_EVERY = 500
 
     # =========================================================================
     # 기본 프리셋 정의
@@ -885,7 +948,12 @@ A: 보기 메뉴 > 테마 전환 또는 Ctrl+T
     }
     DEFAULT_EXECUTION_POLICY = "market"
     DEFAULT_EXECUTION_MODE = "signal_only"
-    EXECUTION_MODES = {"signal_only", "live"}
+    EXECUTION_MODES = {"signal_only", "paper", "live"}
+    # paper 모드: 로컬 매칭 엔진의 주문 도달 지연 (기본 + 균등 지터)
+    PAPER_LATENCY_MS = 40
+    PAPER_LATENCY_JITTER_MS = 20
+    # paper 모드 시작 현금: 0이면 첫 계좌 조회 때 실제 계좌 예수금으로 한 번 채운다
+    PAPER_INITIAL_CASH = 0
     STRATEGY_CAPABILITIES: Dict[str, Dict[str, bool]] = {
         "volatility_breakout": {"live_supported": True, "requires_external_data": False},
         "time_series_momentum": {"live_supported": True, "requires_external_data": False},
@@ -1,5 +1,7 @@
 """Core application window package."""
 
+from .scheduler import CoreScheduler, CoreSignal, CoreThreadPool
+from .trading_core import TradingCore, init_trading_state
 from .window import KiwoomProTrader
 
-__all__ = ["KiwoomProTrader"]
+__all__ = ["KiwoomProTrader", "TradingCore", "CoreScheduler", "CoreSignal", "CoreThreadPool", "init_trading_state"]
@@ -0,0 +1,196 @@
+"""Thread-based event loop for running the trading core without a Qt event loop."""
+
+import concurrent.futures
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+
+class CoreScheduler:
+    """Single-threaded callback loop with timers, standing in for the Qt event loop.
+
+    Every callback (posted work, timers, signal slots, worker results) runs on
+    one loop thread, so mixin state keeps the same single-writer guarantee it
+    has on the Qt main thread. `start()` runs the loop on a daemon thread;
+    tests and simulations can instead drive it from the calling thread with
+    `run_pending()` / `run_until_idle()`.
+    """
+
+    def __init__(self, name: str = "trading-core"):
+        self.name = name
+        self._ready: Deque[Tuple[Callable, tuple]] = deque()
+        self._timers: List[Tuple[float, int, Callable, tuple]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._jobs = 0
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+        self._stopping = False
+        self.logger = logging.getLogger("KiwoomTrader")
+
+    # ------------------------------------------------------------------
+    # Scheduling (any thread)
+    # ------------------------------------------------------------------
+    def post(self, fn: Callable, *args: Any) -> None:
+        with self._cond:
+            self._ready.append((fn, args))
+            self._cond.notify()
+
+    def call_later(self, delay_ms: int, fn: Callable, *args: Any) -> None:
+        due = time.monotonic() + max(0, int(delay_ms)) / 1000.0
+        with self._cond:
+            heapq.heappush(self._timers, (due, next(self._seq), fn, args))
+            self._cond.notify()
+
+    def begin_job(self) -> None:
+        """Count background work whose result will be posted back (see `run_until_idle`)."""
+        with self._cond:
+            self._jobs += 1
+
+    def end_job(self, fn: Callable, *args: Any) -> None:
+        with self._cond:
+            self._jobs = max(0, self._jobs - 1)
+            self._ready.append((fn, args))
+            self._cond.notify()
+
+    def in_loop_thread(self) -> bool:
+        return self._loop_thread_id == threading.get_ident()
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+    def run_pending(self) -> int:
+        """Run everything that is ready now (posted callbacks and due timers); returns the count."""
+        batch: List[Tuple[Callable, tuple]] = []
+        with self._cond:
+            now = time.monotonic()
+            while self._timers and self._timers[0][0] <= now:
+                _due, _seq, fn, args = heapq.heappop(self._timers)
+                self._ready.append((fn, args))
+            while self._ready:
+                batch.append(self._ready.popleft())
+        previous = self._loop_thread_id
+        self._loop_thread_id = threading.get_ident()
+        try:
+            for fn, args in batch:
+                try:
+                    fn(*args)
+                except Exception:
+                    self.logger.exception(f"[{self.name}] callback failed: {fn!r}")
+        finally:
+            self._loop_thread_id = previous
+        return len(batch)
+
+    def run_until_idle(self, timeout: float = 5.0, include_timers: bool = False) -> bool:
+        """Drive the loop on the calling thread until nothing is queued or in flight.
+
+        With `include_timers`, pending timers must fire too. Returns False on timeout.
+        """
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        while True:
+            self.run_pending()
+            with self._cond:
+                busy = bool(self._ready) or self._jobs > 0
+                next_due = self._timers[0][0] if self._timers else None
+                if not busy and (next_due is None or not include_timers):
+                    return True
+                now = time.monotonic()
+                if now >= deadline:
+                    return False
+                wait = deadline - now
+                if next_due is not None:
+                    wait = min(wait, max(0.0, next_due - now))
+                if not self._ready:
+                    self._cond.wait(wait)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run_forever, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    def _run_forever(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopping:
+                    return
+                if not self._ready:
+                    wait = None
+                    if self._timers:
+                        wait = max(0.0, self._timers[0][0] - time.monotonic())
+                    if wait is None or wait > 0:
+                        self._cond.wait(wait)
+                if self._stopping:
+                    return
+            self.run_pending()
+
+
+class CoreSignal:
+    """`pyqtSignal` stand-in: `emit()` queues every connected slot on the core loop."""
+
+    def __init__(self, scheduler: CoreScheduler):
+        self._scheduler = scheduler
+        self._slots: List[Callable] = []
+
+    def connect(self, slot: Callable) -> None:
+        if slot not in self._slots:
+            self._slots.append(slot)
+
+    def disconnect(self, slot: Optional[Callable] = None) -> None:
+        if slot is None:
+            self._slots.clear()
+        elif slot in self._slots:
+            self._slots.remove(slot)
+
+    def emit(self, *args: Any) -> None:
+        self._scheduler.post(self._dispatch, *args)
+
+    def _dispatch(self, *args: Any) -> None:
+        for slot in list(self._slots):
+            slot(*args)
+
+
+class CoreThreadPool:
+    """`QThreadPool.start(Worker)` 호환 풀: `fn`은 워커 스레드에서, 결과 emit은 코어 루프에서 실행한다."""
+
+    def __init__(self, scheduler: CoreScheduler, max_workers: int = 4):
+        self._scheduler = scheduler
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)), thread_name_prefix=f"{scheduler.name}-worker"
+        )
+
+    def start(self, worker) -> None:
+        self._scheduler.begin_job()
+        try:
+            future = self._executor.submit(worker.fn, *worker.args, **worker.kwargs)
+        except RuntimeError as exc:
+            self._scheduler.end_job(worker.signals.error.emit, exc)
+            return
+        future.add_done_callback(lambda fut, w=worker: self._scheduler.end_job(self._deliver, w, fut))
+
+    @staticmethod
+    def _deliver(worker, future: concurrent.futures.Future) -> None:
+        try:
+            result = future.result()
+        except Exception as exc:
+            worker.signals.error.emit(exc)
+            return
+        worker.signals.result.emit(result)
+        worker.signals.finished.emit(result)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,173 @@
+"""Headless trading core: the trading mixins hosted without a Qt window."""
+
+from collections import deque
+import datetime
+import logging
+from typing import Any, Callable, Optional
+
+from api.models import ExecutionData
+from config import TradingConfig
+from strategies.manager import StrategyManager
+
+from app.features.diagnostics import DiagnosticsMixin
+from app.features.execution import ExecutionEngineMixin
+from app.features.order_sync import OrderSyncMixin
+from app.features.trading_session import TradingSessionPositionsMixin, TradingSessionRiskStateMixin
+
+from .scheduler import CoreScheduler, CoreSignal, CoreThreadPool
+
+
+def init_trading_state(owner: Any) -> None:
+    """Universe, pending-order, guard and P&L state shared by the window and `TradingCore`."""
+    owner.universe = {}
+    owner.external_positions = {}
+    owner.deposit = 0
+    owner.initial_deposit = 0
+    owner.is_running = False
+    owner.is_connected = False
+    owner.daily_loss_triggered = False
+    owner.time_liquidate_executed = False
+    owner.total_realized_profit = 0
+    owner.daily_realized_profit = 0
+    owner.daily_initial_deposit = 0
+    owner.trade_count = 0
+    owner.win_count = 0
+    owner._trading_day = datetime.date.today()
+    owner._position_sync_pending = set()
+    owner._position_sync_batch = set()
+    owner._position_sync_scheduled = False
+    owner._position_sync_retry_count = 0
+    owner._pending_order_state = {}
+    owner._manual_pending_state = {}
+    owner._last_exec_event = {}
+    owner._reserved_cash_by_code = {}
+    owner._diagnostics_by_code = {}
+    owner._diagnostics_dirty_codes = set()
+    owner._account_refresh_pending = False
+    owner._last_account_refresh_ts = 0.0
+    owner._dirty_codes = set()
+    owner._log_cooldown_map = {}
+    owner._holding_or_pending_count = 0
+    owner._sync_failed_codes = set()
+    owner.total_equity = 0
+    owner._global_risk_mode = "normal"
+    owner._global_risk_until = None
+    owner._order_health_mode = "normal"
+    owner._order_health_until = None
+    owner._recent_slippage_bps = deque(maxlen=300)
+    owner._order_fail_events = deque(maxlen=500)
+    owner._index_ticks_by_market = {}
+    owner._shock_fallback_rep_by_market = {}
+    owner._recent_ticks_by_code = {}
+    owner._guard_reason_by_code = {}
+
+
+class TradingCore(
+    TradingSessionPositionsMixin,
+    TradingSessionRiskStateMixin,
+    OrderSyncMixin,
+    ExecutionEngineMixin,
+    DiagnosticsMixin,
+):
+    """Universe, pending state, guards and execution driven by a `CoreScheduler`.
+
+    The same mixins the window hosts run here against `CoreSignal`s and a
+    `CoreThreadPool`, so ticks, order events and REST results are handled on
+    one loop thread with no QApplication. Feeds push market data in through
+    `on_tick()` / `on_order_event()`; consumers (a simulator, a log sink and,
+    once migrated, the Qt window) attach through `subscribe()`.
+    """
+
+    EVENTS = ("log", "execution", "order_execution", "update", "trade")
+
+    def __init__(
+        self,
+        config: Optional[TradingConfig] = None,
+        *,
+        rest_client: Any = None,
+        account: str = "",
+        deposit: int = 0,
+        scheduler: Optional[CoreScheduler] = None,
+        max_workers: int = 4,
+    ):
+        init_trading_state(self)
+        self.core_scheduler = scheduler or CoreScheduler()
+        self.threadpool = CoreThreadPool(self.core_scheduler, max_workers=max_workers)
+        self.sig_log = CoreSignal(self.core_scheduler)
+        self.sig_execution = CoreSignal(self.core_scheduler)
+        self.sig_order_execution = CoreSignal(self.core_scheduler)
+        self.sig_update_table = CoreSignal(self.core_scheduler)
+        self.sig_trade = CoreSignal(self.core_scheduler)
+        self.logger = logging.getLogger("KiwoomTrader")
+
+        self.config = config or TradingConfig()
+        self.rest_client = rest_client
+        self.current_account = str(account or "")
+        self.deposit = int(deposit or 0)
+        self.initial_deposit = self.deposit
+        self.daily_initial_deposit = self.deposit
+        self.virtual_deposit = self.deposit
+        self.trade_history = []
+        self.telegram = None
+        self.sound = None
+        self.strategy = StrategyManager(self, self.config)
+
+        self.sig_execution.connect(self._on_execution)
+        self.sig_order_execution.connect(self._on_order_execution)
+
+    def on_tick(self, data: ExecutionData) -> None:
+        """Queue one realtime execution tick; it is handled on the core loop."""
+        self._on_realtime(data)
+
+    def on_order_event(self, data: dict) -> None:
+        """Queue one broker order/fill notification; it is handled on the core loop."""
+        self._on_order_realtime(data)
+
+    def subscribe(self, event: str, callback: Callable) -> None:
+        """Attach a consumer to one of `EVENTS`."""
+        self._event_signal(event).connect(callback)
+
+    def unsubscribe(self, event: str, callback: Callable) -> None:
+        self._event_signal(event).disconnect(callback)
+
+    def _event_signal(self, event: str) -> CoreSignal:
+        signals = {
+            "log": self.sig_log,
+            "execution": self.sig_execution,
+            "order_execution": self.sig_order_execution,
+            "update": self.sig_update_table,
+            "trade": self.sig_trade,
+        }
+        if event not in signals:
+            raise ValueError(f"unknown core event: {event}")
+        return signals[event]
+
+    def log(self, msg):
+        self.sig_log.emit(msg)
+        self.logger.info(msg)
+
+    def _add_trade(self, record: dict):
+        """체결 기록을 메모리에 쌓고 `trade` 구독자에게 넘긴다 (저장/표시는 구독자 몫)."""
+        record["timestamp"] = datetime.datetime.now().isoformat()
+        self.trade_history.append(record)
+        if record.get("type") == "매수":
+            self.trade_count += 1
+        if record.get("profit", 0) > 0:
+            self.win_count += 1
+        self.total_realized_profit += record.get("profit", 0)
+        if record.get("type") == "매도":
+            self.daily_realized_profit = int(self.daily_realized_profit or 0) + int(record.get("profit", 0) or 0)
+            check_fn = getattr(self, "_check_daily_loss_limit", None)
+            if callable(check_fn):
+                check_fn()
+        self.sig_trade.emit(dict(record))
+
+    def start(self) -> None:
+        """Start the loop thread and begin trading."""
+        self.is_running = True
+        self.core_scheduler.start()
+
+    def stop(self) -> None:
+        self.is_running = False
+        self.core_scheduler.stop()
+        self.threadpool.shutdown()
@@ -1,8 +1,7 @@
 """Main window class assembled from mixins."""
 
-from collections import deque
-import datetime
-from typing import Any, Deque, Dict, List, Optional, Set, cast
+import threading
+from typing import Any, Dict, List, Optional, Set, cast
 
 from PyQt6.QtCore import QThreadPool, QTimer, Qt, pyqtSignal
 from PyQt6.QtWidgets import QMainWindow
@@ -14,7 +13,13 @@ from strategies.manager import StrategyManager
 from telegram_notifier import TelegramNotifier
 
 from api import KiwoomAuth, KiwoomRESTClient, KiwoomWebSocketClient
+from data.macro_store import MacroSeriesStore
+from data.providers import DartDisclosureFeed, configure_provider_http
 
+from app.core.trading_core import init_trading_state
+from app.support.ai_batch import AISummaryScheduler
+from app.support.market_screen import MarketScreenIndex
+from app.support.near_duplicate import NearDuplicateIndex
 from app.support.ui_text import combo_value
 from app.mixins.api_account import APIAccountMixin
 from app.mixins.dialogs_profiles import DialogsProfilesMixin
@@ -56,53 +61,50 @@ class KiwoomProTrader(
         super().__init__()
 
         # 상태 변수
-        self.universe: Dict[str, Dict[str, Any]] = {}
-        self.external_positions: Dict[str, Dict[str, Any]] = {}
-        self.deposit = 0
-        self.initial_deposit = 0
-        self.is_running = False
-        self.is_connected = False
-        self.daily_loss_triggered = False
-        self.time_liquidate_executed = False
-        self.total_realized_profit = 0
-        self.daily_realized_profit = 0
-        self.daily_initial_deposit = 0
-        self.trade_count = 0
-        self.win_count = 0
-        self._trading_day = datetime.date.today()
+        init_trading_state(self)
         self._history_dirty = False
         self._history_save_inflight = False
         self._history_save_pending_snapshot = None
-        self._position_sync_pending: Set[str] = set()
-        self._position_sync_batch: Set[str] = set()
-        self._position_sync_scheduled = False
-        self._position_sync_retry_count = 0
-        self._pending_order_state: Dict[str, Dict[str, Any]] = {}
-        self._manual_pending_state: Dict[str, Dict[str, Any]] = {}
-        self._last_exec_event: Dict[str, Dict[str, Any]] = {}
-        self._reserved_cash_by_code: Dict[str, int] = {}
-        self._diagnostics_by_code: Dict[str, Dict[str, Any]] = {}
-        self._diagnostics_dirty_codes: Set[str] = set()
-        self._account_refresh_pending = False
-        self._last_account_refresh_ts = 0.0
+        # 저장 워커와 동기 저장이 진행 중 배치를 한쪽만 기록하도록 잡는 락
+        self._history_save_lock = threading.RLock()
+        self._history_save_inflight_batch: Optional[list] = None
         self._external_refresh_inflight: Set[str] = set()
         self._external_last_fetch_ts: Dict[str, float] = {}
         self._external_refresh_timer: Optional[QTimer] = None
         self._market_intel_timer: Optional[QTimer] = None
         self._market_intel_sources: Dict[str, Dict[str, Any]] = {}
         self._market_intel_dirty_codes: Set[str] = set()
+        self._market_intel_fingerprints: Dict[str, Dict[str, Any]] = {}
         self._market_intel_row_to_code: Dict[int, str] = {}
         self._last_market_intel_fetch_ts = 0.0
         self._market_intel_alert_ts: Dict[str, float] = {}
         self._market_ai_usage: Dict[str, Any] = {}
+        self._ai_summary_scheduler = AISummaryScheduler(
+            window_ms=Config.MARKET_INTEL_AI_BATCH_WINDOW_MS,
+            max_batch=Config.MARKET_INTEL_AI_BATCH_MAX,
+            cache_ttl_sec=Config.MARKET_INTEL_AI_CACHE_TTL_SEC,
+        )
         self._market_briefing_sent_day = ""
         self._market_macro_cache: Dict[str, Any] = {"values": {}, "ts": 0.0}
+        self._macro_series_store: Optional[MacroSeriesStore] = None
         self._market_dart_cursor_by_code: Dict[str, str] = {}
+        self._dart_disclosure_feed: Optional[DartDisclosureFeed] = None
+        self._provider_http = configure_provider_http(
+            Config.PROVIDER_HTTP_CACHE_DIR,
+            ttl_sec=Config.PROVIDER_HTTP_CACHE_TTL_SEC,
+            stale_sec=Config.PROVIDER_HTTP_STALE_SEC,
+            disk_max_age_sec=Config.PROVIDER_HTTP_CACHE_MAX_AGE_SEC,
+            disk_max_bytes=Config.PROVIDER_HTTP_CACHE_MAX_BYTES,
+        )
+        self._market_keyword_matcher_cache: Optional[tuple] = None
+        self._market_alias_matchers: Dict[str, tuple] = {}
+        self._market_news_story_index: Optional[NearDuplicateIndex] = None
         self._market_risk_mode = "neutral"
         self._portfolio_budget_scale = 1.0
         self._sector_blocks: Dict[str, Dict[str, Any]] = {}
         self._theme_heat_map: Dict[str, float] = {}
         self._aggregate_news_risk = 0.0
+        self._market_screen_index = MarketScreenIndex()
         self._candidate_universe: Dict[str, Dict[str, Any]] = {}
         self._active_market_candidates: Dict[str, Dict[str, Any]] = {}
         self._candidate_last_refresh_ts = 0.0
@@ -117,25 +119,10 @@ class KiwoomProTrader(
         self._connect_inflight = False
         self._trading_start_inflight = False
         self._scheduled_start_requested = False
-        self._dirty_codes: Set[str] = set()
         self._code_to_row: Dict[str, int] = {}
         self._last_status_badge = None
         self._last_profit_sign: Optional[int] = None
         self._last_connection_mode: Optional[str] = None
-        self._log_cooldown_map: Dict[str, float] = {}
-        self._holding_or_pending_count = 0
-        self._sync_failed_codes: Set[str] = set()
-        self.total_equity = 0
-        self._global_risk_mode = "normal"
-        self._global_risk_until: Optional[datetime.datetime] = None
-        self._order_health_mode = "normal"
-        self._order_health_until: Optional[datetime.datetime] = None
-        self._recent_slippage_bps: Deque[float] = deque(maxlen=300)
-        self._order_fail_events: Deque[float] = deque(maxlen=500)
-        self._index_ticks_by_market: Dict[str, Deque[tuple]] = {}
-        self._shock_fallback_rep_by_market: Dict[str, str] = {}
-        self._recent_ticks_by_code: Dict[str, Deque[tuple]] = {}
-        self._guard_reason_by_code: Dict[str, str] = {}
         self._market_status_probe_logged = False
         self._diagnostic_row_to_code: Dict[int, str] = {}
 
@@ -191,6 +178,10 @@ class KiwoomProTrader(
 
         # 스레드 풀 초기화
         self.threadpool = QThreadPool()
+        # 시장 인텔 저장소를 열어 기존 JSONL 가져오기를 백그라운드에서 시작한다.
+        open_intel_store = getattr(self, "_intel_store_safe", None)
+        if callable(open_intel_store):
+            open_intel_store()
         self._ui_flush_timer = QTimer(self)
         self._ui_flush_timer.setInterval(Config.UI_REFRESH_INTERVAL_MS)
         self._ui_flush_timer.timeout.connect(self.sig_update_table.emit)
@@ -319,10 +310,8 @@ class KiwoomProTrader(
             )
         if hasattr(self, "combo_execution_mode"):
             self.combo_execution_mode.currentTextChanged.connect(
-                lambda _v: setattr(
-                    self.config,
-                    "execution_mode",
-                    combo_value(self.combo_execution_mode, getattr(Config, "DEFAULT_EXECUTION_MODE", "signal_only")),
+                lambda _v: self._set_execution_mode(
+                    combo_value(self.combo_execution_mode, getattr(Config, "DEFAULT_EXECUTION_MODE", "signal_only"))
                 )
             )
         if hasattr(self, "combo_backtest_timeframe"):
@@ -465,9 +454,8 @@ class KiwoomProTrader(
         if hasattr(self, "combo_execution_policy"):
             self.config.execution_policy = combo_value(self.combo_execution_policy, "market")
         if hasattr(self, "combo_execution_mode"):
-            self.config.execution_mode = combo_value(
-                self.combo_execution_mode,
-                getattr(Config, "DEFAULT_EXECUTION_MODE", "signal_only"),
+            self._set_execution_mode(
+                combo_value(self.combo_execution_mode, getattr(Config, "DEFAULT_EXECUTION_MODE", "signal_only"))
             )
         if hasattr(self, "combo_backtest_timeframe"):
             self.config.backtest_config["timeframe"] = combo_value(self.combo_backtest_timeframe, "1d")
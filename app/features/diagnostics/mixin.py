@@ -1,11 +1,11 @@
 """Diagnostics table and detail panel behavior for KiwoomProTrader."""
 
 import datetime
-from typing import Any, Dict, cast
+import time
+from typing import Any, Dict, List, Optional, Tuple, cast
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QModelIndex
 from PyQt6.QtGui import QColor
-from PyQt6.QtWidgets import QTableWidgetItem
 
 from app.mixins._typing import TraderMixinBase
 from app.support.ui_text import (
@@ -19,6 +19,8 @@ from app.support.ui_text import (
 )
 from config import Config
 
+from .model import DIAG_COL_EXTERNAL_AGE, DIAG_COL_EXTERNAL_STATUS, DIAG_COL_HEALTH_MODE, DIAG_COL_RISK_MODE, DiagnosticsTableModel
+
 
 def _dict_or_empty(value: object) -> Dict[str, Any]:
     return cast(Dict[str, Any], value) if isinstance(value, dict) else {}
@@ -71,162 +73,193 @@ class DiagnosticsMixin(TraderMixinBase):
             age = int((datetime.datetime.now() - value).total_seconds())
             return str(max(0, age))
         return ""
+    def _diagnostics_model_safe(self) -> DiagnosticsTableModel:
+        model = getattr(self, "diagnostic_model", None)
+        if not isinstance(model, DiagnosticsTableModel):
+            model = DiagnosticsTableModel(self._diagnostic_row, self._diagnostic_volatile_cell)
+            self.diagnostic_model = model
+            set_model = getattr(getattr(self, "diagnostic_table", None), "setModel", None)
+            if callable(set_model):
+                set_model(model)
+        return model
+    def _diagnostic_codes(self) -> List[str]:
+        external_positions = _dict_or_empty(getattr(self, "external_positions", {}))
+        codes = list(self.universe.keys())
+        codes.extend(code for code in sorted(external_positions.keys()) if code not in self.universe)
+        return codes
+    def _diagnostic_info(self, code: str) -> Dict[str, Any]:
+        tracked_getter = getattr(self, "_get_tracked_position_info", None)
+        raw_info = tracked_getter(code) if callable(tracked_getter) else self.universe.get(code, {})
+        return _dict_or_empty(raw_info)
+    def _diagnostic_external_status(self, info: Dict[str, Any]) -> str:
+        external_status = str(info.get("external_status", "") or "")
+        external_age = self._diag_age_seconds(info.get("external_updated_at"))
+        stale_limit = int(getattr(Config, "EXTERNAL_FLOW_STALE_SEC", 30))
+        if external_status == "fresh" and external_age and int(external_age) > stale_limit:
+            external_status = "stale"
+        return external_status
+    def _diagnostic_volatile_cell(self, code: str, col: int) -> Optional[Tuple[str, Optional[QColor]]]:
+        """경과 시간 등 시간/전역 상태에 따라 바뀌는 열 (행 캐시 대상 아님)."""
+        if col in {DIAG_COL_RISK_MODE, DIAG_COL_HEALTH_MODE}:
+            attr = "_global_risk_mode" if col == DIAG_COL_RISK_MODE else "_order_health_mode"
+            raw_mode = str(getattr(self, attr, "normal") or "normal")
+            state = raw_mode.lower()
+            color = None
+            if state in {"shock", "degraded"}:
+                color = QColor("#f85149")
+            elif state in {"normal", ""}:
+                color = QColor("#8b949e")
+            return display_regime(raw_mode), color
+        info = self._diagnostic_info(code)
+        if col == DIAG_COL_EXTERNAL_AGE:
+            return self._diag_age_seconds(info.get("external_updated_at")), None
+        if col == DIAG_COL_EXTERNAL_STATUS:
+            external_status = self._diagnostic_external_status(info)
+            state = external_status.lower()
+            if state == "error":
+                color = QColor("#f85149")
+            elif state == "stale":
+                color = QColor("#d29922")
+            elif state == "fresh":
+                color = QColor("#3fb950")
+            else:
+                color = QColor("#8b949e")
+            return display_status(external_status), color
+        return None
+    def _diagnostic_row(self, code: str) -> Optional[Tuple[List[str], Dict[int, QColor]]]:
+        info = self._diagnostic_info(code)
+        market_intel = _dict_or_empty(info.get("market_intel", {}))
+        diag = self._diagnostics_by_code.get(code, {})
+        pending = self._pending_order_state.get(code, {})
+        if not pending:
+            pending = _dict_or_empty(getattr(self, "_manual_pending_state", {})).get(code, {})
+        pending = _dict_or_empty(pending)
+        sync_status = str(info.get("status", ""))
+        external_updated = info.get("external_updated_at")
+        external_status = str(info.get("external_status", "") or "")
+        external_error = str(info.get("external_error", "") or "")
+        if external_status == "error" and external_error:
+            sync_error = str(diag.get("last_sync_error", "") or "")
+            if sync_error:
+                sync_error = f"{sync_error} | ext:{external_error}"
+            else:
+                sync_error = f"ext:{external_error}"
+        else:
+            sync_error = str(diag.get("last_sync_error", ""))
+        raw_market_state = str(info.get("market_state", "normal") or "normal")
+        raw_guard_reason = str(
+            info.get("last_guard_reason")
+            or self._guard_reason_by_code.get(code, "")
+            or ""
+        )
+        raw_action_policy = str(market_intel.get("action_policy", "allow") or "allow")
+        raw_exit_policy = str(market_intel.get("exit_policy", "none") or "none")
+        source_health = display_source_health(market_intel.get("source_health", "") or "")
+        sync_failed_reason = str(info.get("sync_failed_reason", "") or "")
+
+        values = [
+            code,
+            str(info.get("name", code)),
+            str(diag.get("pending_side") or pending.get("side") or ""),
+            str(diag.get("pending_reason") or pending.get("reason") or ""),
+            self._diag_fmt_dt(diag.get("pending_until") or pending.get("until")),
+            display_status(sync_status),
+            str(diag.get("retry_count", 0)),
+            sync_error,
+            self._diag_fmt_dt(diag.get("last_update")),
+            "",
+            self._diag_fmt_dt(external_updated),
+            "",
+            display_market_state(raw_market_state),
+            display_guard_reason(raw_guard_reason),
+            source_health,
+            display_action_policy(raw_action_policy),
+            f"{float(market_intel.get('size_multiplier', 1.0) or 1.0):.2f}",
+            display_exit_policy(raw_exit_policy),
+            str(market_intel.get("last_event_id", "") or ""),
+            "",
+            "",
+            display_status(diag.get("pending_state") or pending.get("state") or ""),
+            str(diag.get("pending_remaining") or pending.get("remaining_qty") or ""),
+            sync_failed_reason,
+        ]
+
+        colors: Dict[int, QColor] = {}
+        state = raw_market_state.lower()
+        if state in {"halt", "vi"}:
+            colors[12] = QColor("#f85149")
+        elif state == "reopen_cooldown":
+            colors[12] = QColor("#d29922")
+        else:
+            colors[12] = QColor("#8b949e")
+        colors[13] = QColor("#f85149") if raw_guard_reason else QColor("#8b949e")
+        colors[14] = QColor("#8b949e" if not source_health else "#d29922")
+        state = raw_action_policy.lower()
+        if state in {"force_exit", "tighten_exit", "reduce_size", "block_entry"}:
+            colors[15] = QColor("#f85149")
+        elif state in {"allow", ""}:
+            colors[15] = QColor("#8b949e")
+        state = raw_exit_policy.lower()
+        if state in {"force_exit", "tighten_exit", "reduce_size"}:
+            colors[17] = QColor("#f85149")
+        elif state in {"none", ""}:
+            colors[17] = QColor("#8b949e")
+        colors[23] = QColor("#f85149") if sync_failed_reason else QColor("#8b949e")
+        return values, colors
     def _refresh_diagnostics(self):
+        """Dirty 행만 무효화하고, 경과 시간 열은 주기적으로 열 단위로만 다시 그린다."""
         if not hasattr(self, "diagnostic_table"):
             return
 
-        external_positions = _dict_or_empty(getattr(self, "external_positions", {}))
-        codes = list(self.universe.keys())
-        codes.extend(code for code in sorted(external_positions.keys()) if code not in self.universe)
+        model = self._diagnostics_model_safe()
+        dirty = self._diagnostics_dirty_codes
+        intel_dirty = getattr(self, "_market_intel_dirty_codes", None)
+        if isinstance(intel_dirty, set) and intel_dirty:
+            dirty.update(intel_dirty)
 
-        if not self._diagnostics_dirty_codes and self.diagnostic_table.rowCount() == len(codes):
-            has_external_clock = any(
-                isinstance(info.get("external_updated_at"), datetime.datetime)
-                for info in self.universe.values()
-            )
-            has_external_clock = has_external_clock or any(
-                isinstance(_dict_or_empty(info).get("external_updated_at"), datetime.datetime)
-                for info in external_positions.values()
-            )
-            if not has_external_clock and not external_positions:
-                return
+        external_positions = _dict_or_empty(getattr(self, "external_positions", {}))
+        layout_key = (id(self.universe), len(self.universe), len(external_positions))
+        rows_changed = False
+        if layout_key != getattr(self, "_diagnostic_layout_key", None) or any(
+            code not in model.row_map for code in dirty if code != "__all__"
+        ):
+            self._diagnostic_layout_key = layout_key
+            rows_changed = model.follow_codes(self._diagnostic_codes())
+            if rows_changed:
+                self._diagnostic_row_to_code = dict(enumerate(model.codes))
 
-        self.diagnostic_table.setUpdatesEnabled(False)
-        try:
-            self.diagnostic_table.setRowCount(len(codes))
-            row_to_code: Dict[int, str] = {}
-            for row, code in enumerate(codes):
-                row_to_code[row] = code
-                tracked_getter = getattr(self, "_get_tracked_position_info", None)
-                raw_info = tracked_getter(code) if callable(tracked_getter) else self.universe.get(code, {})
-                info = _dict_or_empty(raw_info)
-                market_intel = _dict_or_empty(info.get("market_intel", {}))
-                diag = self._diagnostics_by_code.get(code, {})
-                pending = self._pending_order_state.get(code, {})
-                if not pending:
-                    pending = _dict_or_empty(getattr(self, "_manual_pending_state", {})).get(code, {})
-                pending = _dict_or_empty(pending)
-                sync_status = str(info.get("status", ""))
-                if sync_status == "sync_failed":
-                    sync_status = "sync_failed"
-                external_updated = info.get("external_updated_at")
-                external_status = str(info.get("external_status", "") or "")
-                external_error = str(info.get("external_error", "") or "")
-                external_age = self._diag_age_seconds(external_updated)
-                stale_limit = int(getattr(Config, "EXTERNAL_FLOW_STALE_SEC", 30))
-                if external_status == "fresh" and external_age and int(external_age) > stale_limit:
-                    external_status = "stale"
-                if external_status == "error" and external_error:
-                    sync_error = str(diag.get("last_sync_error", "") or "")
-                    if sync_error:
-                        sync_error = f"{sync_error} | ext:{external_error}"
-                    else:
-                        sync_error = f"ext:{external_error}"
-                else:
-                    sync_error = str(diag.get("last_sync_error", ""))
-                raw_market_state = str(info.get("market_state", "normal") or "normal")
-                raw_guard_reason = str(
-                    info.get("last_guard_reason")
-                    or self._guard_reason_by_code.get(code, "")
-                    or ""
-                )
-                raw_action_policy = str(market_intel.get("action_policy", "allow") or "allow")
-                raw_exit_policy = str(market_intel.get("exit_policy", "none") or "none")
-                raw_risk_mode = str(getattr(self, "_global_risk_mode", "normal") or "normal")
-                raw_health_mode = str(getattr(self, "_order_health_mode", "normal") or "normal")
+        if "__all__" in dirty:
+            model.mark_all_dirty()
+        elif dirty:
+            # 행 추가(insert) 경로는 기존 행 캐시를 유지하므로 같은 틱에 바뀐 기존 행도 무효화한다.
+            model.mark_dirty(dirty)
 
-                values = [
-                    code,
-                    str(info.get("name", code)),
-                    str(diag.get("pending_side") or pending.get("side") or ""),
-                    str(diag.get("pending_reason") or pending.get("reason") or ""),
-                    self._diag_fmt_dt(diag.get("pending_until") or pending.get("until")),
-                    display_status(sync_status),
-                    str(diag.get("retry_count", 0)),
-                    sync_error,
-                    self._diag_fmt_dt(diag.get("last_update")),
-                    display_status(external_status),
-                    self._diag_fmt_dt(external_updated),
-                    external_age,
-                    display_market_state(raw_market_state),
-                    display_guard_reason(raw_guard_reason),
-                    display_source_health(market_intel.get("source_health", "") or ""),
-                    display_action_policy(raw_action_policy),
-                    f"{float(market_intel.get('size_multiplier', 1.0) or 1.0):.2f}",
-                    display_exit_policy(raw_exit_policy),
-                    str(market_intel.get("last_event_id", "") or ""),
-                    display_regime(raw_risk_mode),
-                    display_regime(raw_health_mode),
-                    display_status(diag.get("pending_state") or pending.get("state") or ""),
-                    str(diag.get("pending_remaining") or pending.get("remaining_qty") or ""),
-                    str(info.get("sync_failed_reason", "") or ""),
-                ]
+        now_ts = time.monotonic()
+        age_interval = max(0.0, float(getattr(Config, "DIAGNOSTICS_AGE_REFRESH_MS", 1000)) / 1000.0)
+        if now_ts - float(getattr(self, "_diagnostic_age_refresh_ts", 0.0) or 0.0) >= age_interval:
+            self._diagnostic_age_refresh_ts = now_ts
+            model.mark_columns_dirty(model.volatile_columns)
 
-                for col, text in enumerate(values):
-                    item = self.diagnostic_table.item(row, col)
-                    if item is None:
-                        item = QTableWidgetItem(str(text))
-                        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                        self.diagnostic_table.setItem(row, col, item)
-                    elif item.text() != str(text):
-                        item.setText(str(text))
-                    if col == 9:
-                        state = str(text).lower()
-                        if state == "error":
-                            item.setForeground(QColor("#f85149"))
-                        elif state == "stale":
-                            item.setForeground(QColor("#d29922"))
-                        elif state == "fresh":
-                            item.setForeground(QColor("#3fb950"))
-                        else:
-                            item.setForeground(QColor("#8b949e"))
-                    elif col == 12:
-                        state = raw_market_state.lower()
-                        if state in {"halt", "vi"}:
-                            item.setForeground(QColor("#f85149"))
-                        elif state == "reopen_cooldown":
-                            item.setForeground(QColor("#d29922"))
-                        else:
-                            item.setForeground(QColor("#8b949e"))
-                    elif col == 13:
-                        item.setForeground(QColor("#f85149") if raw_guard_reason else QColor("#8b949e"))
-                    elif col == 14:
-                        item.setForeground(QColor("#8b949e" if not str(text) else "#d29922"))
-                    elif col == 15:
-                        state = raw_action_policy.lower()
-                        if state in {"force_exit", "tighten_exit", "reduce_size", "block_entry"}:
-                            item.setForeground(QColor("#f85149"))
-                        elif state in {"allow", ""}:
-                            item.setForeground(QColor("#8b949e"))
-                    elif col == 17:
-                        state = raw_exit_policy.lower()
-                        if state in {"force_exit", "tighten_exit", "reduce_size"}:
-                            item.setForeground(QColor("#f85149"))
-                        elif state in {"none", ""}:
-                            item.setForeground(QColor("#8b949e"))
-                    elif col in {19, 20}:
-                        state = raw_risk_mode.lower() if col == 19 else raw_health_mode.lower()
-                        if state in {"shock", "degraded"}:
-                            item.setForeground(QColor("#f85149"))
-                        elif state in {"normal", ""}:
-                            item.setForeground(QColor("#8b949e"))
-                    elif col == 23:
-                        item.setForeground(QColor("#f85149") if str(text) else QColor("#8b949e"))
-        finally:
-            self.diagnostic_table.setUpdatesEnabled(True)
-        self._diagnostic_row_to_code = row_to_code
+        selected = self._selected_diagnostic_code()
+        needs_detail = rows_changed or "__all__" in dirty or (bool(selected) and selected in dirty)
+        dirty.clear()
+        if needs_detail:
+            render_detail = getattr(self, "_render_selected_diagnostic_detail", None)
+            if callable(render_detail):
+                render_detail()
 
-        self._diagnostics_dirty_codes.clear()
-        render_detail = getattr(self, "_render_selected_diagnostic_detail", None)
-        if callable(render_detail):
-            render_detail()
     def _selected_diagnostic_code(self) -> str:
         table = getattr(self, "diagnostic_table", None)
         if table is None:
             return ""
 
         row = -1
-        getter = getattr(table, "currentRow", None)
+        current_index = getattr(table, "currentIndex", None)
+        if callable(current_index):
+            index = current_index()
+            if isinstance(index, QModelIndex) and index.isValid():
+                row = index.row()
+        getter = getattr(table, "currentRow", None) if row < 0 else None
         if callable(getter):
             current_row = getter()
             if isinstance(current_row, int):
@@ -241,6 +274,9 @@ class DiagnosticsMixin(TraderMixinBase):
                         row_value = row_fn()
                         if isinstance(row_value, int):
                             row = row_value
+        model = getattr(self, "diagnostic_model", None)
+        if isinstance(model, DiagnosticsTableModel):
+            return model.code_at(row)
         row_to_code = getattr(self, "_diagnostic_row_to_code", {})
         if isinstance(row_to_code, dict):
             return str(row_to_code.get(row, "") or "")
@@ -0,0 +1,53 @@
+"""Table model behind the diagnostics tab."""
+
+from typing import Callable, Optional
+
+from app.support.code_table_model import CellData, CodeTableModel, RowData
+
+
+DIAGNOSTIC_COLUMNS = [
+    "코드",
+    "종목명",
+    "대기 주문 방향",
+    "대기 주문 사유",
+    "대기 만료 시각",
+    "동기화 상태",
+    "재시도 횟수",
+    "마지막 동기화 오류",
+    "최근 갱신",
+    "외부 데이터 상태",
+    "외부 데이터 시각",
+    "외부 데이터 경과(초)",
+    "시장 상태",
+    "보호 사유",
+    "인텔리전스 소스 상태",
+    "자동매매 정책",
+    "수량 배수",
+    "청산 정책",
+    "마지막 이벤트 ID",
+    "시장 위험 모드",
+    "주문 안정성 모드",
+    "대기 주문 상태",
+    "미체결 수량",
+    "동기화 실패 사유",
+]
+
+DIAG_COL_EXTERNAL_STATUS = 9
+DIAG_COL_EXTERNAL_AGE = 11
+DIAG_COL_RISK_MODE = 19
+DIAG_COL_HEALTH_MODE = 20
+
+
+class DiagnosticsTableModel(CodeTableModel):
+    """Per-row cached diagnostics; age- and global-mode columns are computed per paint."""
+
+    # 경과 시간/신선도와 전역 모드는 행 캐시 없이 타이머 기반 열 무효화로 갱신한다.
+    volatile_columns = {DIAG_COL_EXTERNAL_STATUS, DIAG_COL_EXTERNAL_AGE, DIAG_COL_RISK_MODE, DIAG_COL_HEALTH_MODE}
+
+    def __init__(
+        self,
+        row_builder: Callable[[str], Optional[RowData]],
+        cell_builder: Callable[[str, int], Optional[CellData]],
+        parent=None,
+    ):
+        super().__init__(DIAGNOSTIC_COLUMNS, row_builder, cell_builder, parent)
@@ -2,12 +2,13 @@
 
 from .mode_lifecycle import ExecutionModeLifecycleMixin
 from .cash_reservation import ExecutionCashReservationMixin
+from .order_journal import ExecutionOrderJournalMixin
 from .guards import ExecutionGuardsMixin
 from .buy_flow import ExecutionBuyFlowMixin
 from .sell_flow import ExecutionSellFlowMixin
 
 
-class ExecutionEngineMixin(ExecutionModeLifecycleMixin, ExecutionCashReservationMixin, ExecutionGuardsMixin, ExecutionBuyFlowMixin, ExecutionSellFlowMixin):
+class ExecutionEngineMixin(ExecutionModeLifecycleMixin, ExecutionCashReservationMixin, ExecutionOrderJournalMixin, ExecutionGuardsMixin, ExecutionBuyFlowMixin, ExecutionSellFlowMixin):
     """Composed ExecutionEngineMixin split by feature responsibility."""
 
     pass
@@ -16,6 +17,7 @@ __all__ = [
     "ExecutionEngineMixin",
     "ExecutionModeLifecycleMixin",
     "ExecutionCashReservationMixin",
+    "ExecutionOrderJournalMixin",
     "ExecutionGuardsMixin",
     "ExecutionBuyFlowMixin",
     "ExecutionSellFlowMixin",
@@ -360,6 +360,10 @@ class ExecutionBuyFlowMixin(TraderMixinBase):
         if not (self.rest_client and self.current_account):
             self.log(f"BUY failed [{name}]: API/account not ready")
             return
+        mismatch = self._order_client_mismatch()
+        if mismatch:
+            self.log(f"BUY blocked [{name}]: {mismatch}")
+            return
 
         current_price = int(price) if int(price) > 0 else int(info.get("current", 0) or 0)
         if current_price <= 0:
@@ -28,6 +28,7 @@ class ExecutionCashReservationMixin(TraderMixinBase):
         mapping[code] = int(mapping.get(code, 0)) + amount
         current_v = int(getattr(self, "virtual_deposit", int(getattr(self, "deposit", 0) or 0)) or 0)
         self.virtual_deposit = max(0, current_v - amount)
+        self._journal_cash(code, "reserve")
         return amount
     def _release_reserved_cash(self, code: str, reason: str = "", refund: bool = True) -> int:
         if not code:
@@ -36,6 +37,7 @@ class ExecutionCashReservationMixin(TraderMixinBase):
         amount = int(mapping.pop(code, 0) or 0)
         if amount <= 0:
             return 0
+        self._journal_cash(code, "release")
 
         if refund:
             base = int(getattr(self, "virtual_deposit", int(getattr(self, "deposit", 0) or 0)) or 0)
@@ -61,6 +63,7 @@ class ExecutionCashReservationMixin(TraderMixinBase):
             mapping[code] = remaining
         else:
             mapping.pop(code, None)
+        self._journal_cash(code, "release")
 
         if refund:
             base = int(getattr(self, "virtual_deposit", int(getattr(self, "deposit", 0) or 0)) or 0)
@@ -90,6 +93,8 @@ class ExecutionCashReservationMixin(TraderMixinBase):
             mapping[code] = remaining
         else:
             mapping.pop(code, None)
+        if consumed > 0:
+            self._journal_cash(code, "consume")
         if consumed > 0 and reason and hasattr(self, "log"):
             self.log(f"Reserved cash consumed [{code}]: {consumed:,} ({reason})")
         return consumed
@@ -1,13 +1,13 @@
 """Execution engine mixin for KiwoomProTrader."""
 
 import datetime
-import json
 import time
 from collections import deque
-from pathlib import Path
 
 from api.models import ExecutionData
+from api.paper_broker import PaperBrokerClient
 from app.support.execution_policy import ExecutionPolicy
+from app.support.jsonl_writer import get_jsonl_writer, jsonl_writer_options
 from app.support.worker import Worker
 from config import Config
 from app.mixins._typing import TraderMixinBase
@@ -22,18 +22,58 @@ class ExecutionModeLifecycleMixin(TraderMixinBase):
         return mode
     def _is_signal_only_mode(self) -> bool:
         return self._execution_mode() == "signal_only"
+    def _is_paper_mode(self) -> bool:
+        return self._execution_mode() == "paper"
+    def _sync_paper_broker(self):
+        """paper 모드면 주문/계좌 API를 로컬 매칭 엔진으로 감싸고, 다른 모드면 원래 클라이언트로 되돌린다.
+
+        `rest_client` 교체(재연결)와 `execution_mode` 변경 직후마다 호출한다. 재연결 시에는
+        기존 paper 장부(현금/포지션/미체결)를 유지한 채 내부 클라이언트만 바꾼다.
+        """
+        client = getattr(self, "rest_client", None)
+        raw = client.inner if isinstance(client, PaperBrokerClient) else client
+        if not self._is_paper_mode():
+            if raw is not client:
+                self.rest_client = raw
+                if hasattr(self, "log"):
+                    self.log("[paper] local matching engine detached; orders go to the broker")
+            return raw
+        if raw is None:
+            return client
+        broker = getattr(self, "_paper_broker", None)
+        if isinstance(broker, PaperBrokerClient):
+            broker.inner = raw
+        else:
+            # 시작 현금은 브로커가 첫 계좌 조회 때 채운다: 여기서는 deposit이 아직 로드되지 않았을 수 있다.
+            broker = PaperBrokerClient(inner=raw, on_order_event=self._on_order_realtime)
+            self._paper_broker = broker
+            if hasattr(self, "log"):
+                self.log("[paper] local matching engine enabled")
+        self.rest_client = broker
+        return broker
+    def _set_execution_mode(self, mode: str):
+        cfg = getattr(self, "config", None)
+        if cfg is not None:
+            cfg.execution_mode = str(mode or "")
+        self._sync_paper_broker()
+    def _order_client_mismatch(self) -> str:
+        """주문 직전 확인: 실행 모드와 `rest_client` 종류가 어긋나면 사유를, 맞으면 ""를 돌려준다."""
+        if self._is_signal_only_mode():
+            return ""  # signal_only 는 주문을 보내지 않는다
+        is_paper_client = isinstance(getattr(self, "rest_client", None), PaperBrokerClient)
+        if self._is_paper_mode() and not is_paper_client:
+            return "paper mode but broker client attached"
+        if not self._is_paper_mode() and is_paper_client:
+            return f"{self._execution_mode()} mode but paper client attached"
+        return ""
     def _record_order_lifecycle_event(self, event: dict) -> None:
         payload = dict(event)
         payload.setdefault("ts", datetime.datetime.now().isoformat())
-        path = Path(getattr(Config, "ORDER_LIFECYCLE_EVENTS_FILE", "data/order_lifecycle_events.jsonl"))
-        try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "a", encoding="utf-8") as file:
-                file.write(json.dumps(payload, ensure_ascii=False, default=str) + "\n")
-        except OSError as exc:
+        path = getattr(Config, "ORDER_LIFECYCLE_EVENTS_FILE", "data/order_lifecycle_events.jsonl")
+        if not get_jsonl_writer(path, **jsonl_writer_options(Config)).append(payload):
             logger = getattr(self, "logger", None)
             if logger is not None:
-                logger.warning(f"order lifecycle event write failed: {exc}")
+                logger.warning("order lifecycle event dropped: event log queue full")
     def _record_signal_only_order(
         self,
         *,
@@ -0,0 +1,210 @@
+"""Order journal (write-ahead log) mixin for KiwoomProTrader."""
+
+import datetime
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.support.order_journal import JournalReplay, OrderJournal, encode_pending
+from app.support.worker import start_rest_call
+from config import Config
+from app.mixins._typing import TraderMixinBase
+
+
+class ExecutionOrderJournalMixin(TraderMixinBase):
+    def _order_journal_active(self) -> Optional[OrderJournal]:
+        journal = getattr(self, "_order_journal", None)
+        return journal if isinstance(journal, OrderJournal) else None
+    def _journal_cash(self, code: str, event: str = ""):
+        journal = self._order_journal_active()
+        if journal is None or not code:
+            return
+        mapping = getattr(self, "_reserved_cash_by_code", {})
+        amount = int(mapping.get(code, 0) or 0) if isinstance(mapping, dict) else 0
+        journal.append("cash", code, amount=max(0, amount), event=event)
+        self._maybe_compact_order_journal()
+    def _journal_pending(self, code: str, event: str = ""):
+        journal = self._order_journal_active()
+        if journal is None or not code:
+            return
+        pending = getattr(self, "_pending_order_state", {}).get(code)
+        if isinstance(pending, dict):
+            journal.append("pending", code, event=event, entry=encode_pending(pending))
+        else:
+            journal.append("pending_clear", code, event=event)
+        self._maybe_compact_order_journal()
+    def _maybe_compact_order_journal(self):
+        journal = self._order_journal_active()
+        if journal is not None and journal.should_compact():
+            self._compact_order_journal()
+    def _compact_order_journal(self):
+        journal = self._order_journal_active()
+        if journal is None:
+            return
+        mapping = getattr(self, "_reserved_cash_by_code", {})
+        journal.compact(
+            dict(mapping) if isinstance(mapping, dict) else {},
+            dict(getattr(self, "_pending_order_state", {})),
+        )
+    @staticmethod
+    def _order_journal_paths(account: str) -> tuple[str, str]:
+        safe_account = re.sub(r"[^0-9A-Za-z_-]", "_", str(account or "").strip()) or "default"
+        base = Path(getattr(Config, "ORDER_JOURNAL_DIR", str(Path(Config.DATA_DIR) / "order_journal")))
+        return str(base / f"{safe_account}.wal.jsonl"), str(base / f"{safe_account}.snapshot.json")
+    def _open_order_journal(self, account: str) -> Optional[JournalReplay]:
+        """Open (or reuse) the journal for `account` and return the replayed state."""
+        if not account or not bool(getattr(Config, "ORDER_JOURNAL_ENABLED", True)):
+            return None
+        if self._order_journal_active() is not None and getattr(self, "_order_journal_account", "") == account:
+            return None
+        self._close_order_journal()
+        path, snapshot_path = self._order_journal_paths(account)
+        journal = OrderJournal(
+            path,
+            snapshot_path,
+            fsync_batch=int(getattr(Config, "ORDER_JOURNAL_FSYNC_BATCH", 16)),
+            fsync_interval_sec=float(getattr(Config, "ORDER_JOURNAL_FSYNC_INTERVAL_SEC", 0.5)),
+            compact_every=int(getattr(Config, "ORDER_JOURNAL_COMPACT_EVERY", 500)),
+        )
+        replay = journal.load()
+        self._order_journal = journal
+        self._order_journal_account = account
+        return replay
+    def _close_order_journal(self):
+        journal = self._order_journal_active()
+        if journal is not None:
+            journal.close()
+        self._order_journal = None
+        self._order_journal_account = ""
+    def _restore_journal_state(self, replay: JournalReplay) -> List[str]:
+        """Load replayed pending orders/reserved cash into memory; returns the restored codes."""
+        pending_state = getattr(self, "_pending_order_state", None)
+        if not isinstance(pending_state, dict):
+            pending_state = {}
+            self._pending_order_state = pending_state
+        reserved = self._reserved_cash_map()
+
+        restored: List[str] = []
+        for code, entry in replay.pending.items():
+            if code in pending_state:
+                continue
+            pending_state[code] = entry
+            restored.append(code)
+        for code, amount in replay.reserved_cash.items():
+            if code not in reserved and int(amount or 0) > 0:
+                reserved[code] = int(amount)
+
+        refresher = getattr(self, "_refresh_pending_order_aggregate", None)
+        for code in restored:
+            if callable(refresher):
+                refresher(code)
+        return restored
+    def _recover_order_journal(self, account: str):
+        """Replay the journal for `account`, then reconcile with one open-order query."""
+        replay = self._open_order_journal(account)
+        if replay is None:
+            return
+        if bool(getattr(self, "is_running", False)) or replay.empty:
+            self._compact_order_journal()
+            return
+
+        restored = self._restore_journal_state(replay)
+        if hasattr(self, "log"):
+            self.log(
+                f"[order-journal] replayed {replay.replayed} records in {replay.elapsed_ms:.1f}ms: "
+                f"pending={len(restored)} reserved={len(replay.reserved_cash)}"
+            )
+        self._compact_order_journal()
+
+        rest_client = getattr(self, "rest_client", None)
+        if rest_client is None or not bool(getattr(rest_client, "supports_open_orders", False)):
+            return
+        codes = list(restored)
+        start_rest_call(
+            self,
+            "get_open_orders",
+            account,
+            on_result=lambda orders, acc=account: self._reconcile_journal_with_open_orders(acc, orders, codes),
+            on_error=lambda exc: self.log(f"[order-journal] open-order reconcile failed: {exc}"),
+        )
+    def _reconcile_journal_with_open_orders(self, account: str, orders: Optional[Iterable[Any]], codes: List[str]):
+        """Keep restored orders the broker still reports as open and release the rest.
+
+        `orders is None` means the poll itself failed; the broker state is then
+        unknown, so restored entries stay pending for the next sync.
+        """
+        if account != str(getattr(self, "current_account", "") or ""):
+            return
+        if orders is None:
+            if hasattr(self, "log"):
+                self.log(f"[order-journal] open-order poll failed; keeping {len(codes)} restored orders pending")
+            return
+        open_by_no: Dict[str, Any] = {}
+        open_buy_codes = set()
+        for order in orders:
+            order_no = str(getattr(order, "order_no", "") or "").strip()
+            if order_no:
+                open_by_no[order_no] = order
+            if str(getattr(order, "side", "") or "").lower() == "buy":
+                open_buy_codes.add(str(getattr(order, "code", "") or ""))
+
+        pending_state = getattr(self, "_pending_order_state", {})
+        active_states = set(getattr(self, "ACTIVE_PENDING_STATES", {"submitted", "partial"}))
+        book = self._pending_order_book_safe()
+        now = datetime.datetime.now()
+        kept = 0
+        dropped = 0
+
+        for code in codes:
+            pending = self._pending_book_entry(code)
+            if pending is None:
+                continue
+            side = str(pending.get("side", "") or "").lower()
+            children = self._pending_children(pending)
+            if children:
+                for child in children:
+                    if str(child.get("state", "submitted") or "submitted").lower() not in active_states:
+                        continue
+                    order = open_by_no.get(str(child.get("order_no", "") or "").strip())
+                    if order is not None:
+                        remaining = max(0, int(getattr(order, "remaining_qty", 0) or 0))
+                        current = max(0, int(child.get("remaining_qty", 0) or 0))
+                        book.update_child(code, child, remaining_qty=min(current, remaining) if remaining else current, updated_at=now)
+                        kept += 1
+                        continue
+                    refund = max(0, int(child.get("reserved_cash", 0) or 0)) if side == "buy" else 0
+                    if refund > 0:
+                        self._release_reserved_cash_amount(code, refund, reason="JOURNAL_RECONCILE", refund=True)
+                    book.update_child(code, child, state="cancelled", remaining_qty=0, reserved_cash=0, updated_at=now)
+                    dropped += 1
+                state_text, remaining_qty = self._sync_pending_order_aggregate(code)
+                if remaining_qty <= 0 or state_text not in active_states:
+                    self._clear_pending_order(code, final_state="filled" if state_text == "filled" else "cancelled")
+                else:
+                    self._journal_pending(code, "reconciled")
+                continue
+
+            order = open_by_no.get(str(pending.get("order_no", "") or "").strip())
+            if order is not None and str(pending.get("state", "submitted") or "submitted").lower() in active_states:
+                remaining = max(0, int(getattr(order, "remaining_qty", 0) or 0))
+                if remaining > 0:
+                    pending["remaining_qty"] = remaining
+                pending["updated_at"] = now
+                self._journal_pending(code, "reconciled")
+                kept += 1
+                continue
+            if side == "buy":
+                self._release_reserved_cash(code, reason="JOURNAL_RECONCILE", refund=True)
+            self._clear_pending_order(code, final_state="cancelled")
+            dropped += 1
+
+        for code in list(self._reserved_cash_map().keys()):
+            if code not in pending_state and code not in open_buy_codes:
+                self._release_reserved_cash(code, reason="JOURNAL_RECONCILE", refund=True)
+
+        if hasattr(self, "log"):
+            self.log(f"[order-journal] reconciled with open orders: kept={kept} released={dropped}")
+        self._compact_order_journal()
+        recompute_count = getattr(self, "_recompute_holding_or_pending_count", None)
+        if callable(recompute_count):
+            recompute_count()
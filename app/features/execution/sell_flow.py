@@ -51,6 +51,10 @@ class ExecutionSellFlowMixin(TraderMixinBase):
         if not (self.rest_client and self.current_account):
             self.log(f"SELL failed [{name}]: API/account not ready")
             return
+        mismatch = self._order_client_mismatch()
+        if mismatch:
+            self.log(f"SELL blocked [{name}]: {mismatch}")
+            return
 
         info["status"] = "selling"
         diag_touch = getattr(self, "_diag_touch", None)
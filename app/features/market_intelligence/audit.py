@@ -8,9 +8,10 @@ import hashlib
 import html
 import json
 import re
+import sqlite3
+import threading
 import time
 from collections import deque
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import QTimer, Qt
@@ -31,6 +32,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from app.support.jsonl_writer import JsonlWriter, get_jsonl_writer, jsonl_writer_options
 from app.support.ui_text import (
     AI_PROVIDER_CHOICES,
     REPLAY_AUDIT_CHOICES,
@@ -54,11 +56,81 @@ from app.support.ui_text import (
 )
 from app.support.widgets import NoScrollComboBox, NoScrollSpinBox
 from config import Config
+from data.intel_store import KIND_AUDITS, KIND_EVENTS, IntelStore
 from data.providers import AIProvider, DartProvider, MacroProvider, NaverTrendProvider, NewsProvider
 from app.mixins._typing import TraderMixinBase
 
 
 class MarketIntelAuditMixin(TraderMixinBase):
+    def _intel_store_safe(self) -> Optional[IntelStore]:
+        """Queryable copy of the event/audit logs; the first open imports the existing JSONL on a worker."""
+        if not bool(getattr(Config, "MARKET_INTEL_STORE_ENABLED", True)):
+            return None
+        path = str(getattr(Config, "MARKET_INTELLIGENCE_DB_FILE", "") or "")
+        if not path:
+            return None
+        store = getattr(self, "_intel_store", None)
+        if isinstance(store, IntelStore) and str(store.path) == path:
+            return store
+        store = IntelStore(path)
+        ready = threading.Event()
+        self._intel_store = store
+        self._intel_store_ready = ready
+        threading.Thread(
+            target=self._import_intel_logs, args=(store, ready), name="IntelStoreImport", daemon=True
+        ).start()
+        return store
+    def _import_intel_logs(self, store: IntelStore, ready: threading.Event):
+        """Attach the store to both log writers, then import what they had written before that point."""
+        logs = (
+            (KIND_EVENTS, str(getattr(Config, "MARKET_INTELLIGENCE_EVENTS_FILE", "") or "")),
+            (KIND_AUDITS, str(getattr(Config, "MARKET_INTELLIGENCE_DECISION_AUDIT_FILE", "") or "")),
+        )
+        try:
+            for kind, log_path in logs:
+                if not log_path:
+                    continue
+                writer = get_jsonl_writer(log_path, **jsonl_writer_options(Config))
+                # 싱크를 먼저 붙이고 그 시점까지 기록된 범위만 읽어야 누락/중복이 없다.
+                snapshot = writer.attach_sink(self._intel_store_sink(store, kind))
+                if snapshot is None:
+                    continue
+                cutoff, segments = snapshot
+                rotated = [seg for seg in writer.segment_paths() if seg not in segments]
+                store.import_jsonl(
+                    kind,
+                    str(writer.path),
+                    segments=[str(seg) for seg in segments],
+                    source=str(rotated[0]) if rotated else None,
+                    max_bytes=cutoff,
+                )
+        except (OSError, sqlite3.Error) as exc:
+            logger = getattr(self, "logger", None)
+            if logger is not None:
+                logger.warning(f"market intel store import failed: {exc}")
+        finally:
+            ready.set()
+    @staticmethod
+    def _intel_store_sink(store: IntelStore, kind: str):
+        return lambda lines: store.append_lines(kind, lines)
+    def _intel_log_writer(self, path: str, kind: str) -> JsonlWriter:
+        """JSONL writer for `path`; the import worker attaches the intel store to it."""
+        writer = get_jsonl_writer(path, **jsonl_writer_options(Config))
+        store = self._intel_store_safe()
+        ready = getattr(self, "_intel_store_ready", None)
+        if store is not None and writer.on_batch is None and isinstance(ready, threading.Event) and ready.is_set():
+            # 종료 등으로 새로 만들어진 기록기: 아직 기록된 줄이 없으니 바로 붙인다.
+            writer.on_batch = self._intel_store_sink(store, kind)
+        return writer
+    def _close_intel_store(self, timeout: float = 30.0):
+        store = getattr(self, "_intel_store", None)
+        ready = getattr(self, "_intel_store_ready", None)
+        if isinstance(ready, threading.Event):
+            # 가져오기가 끝나야 완료 표시가 남는다 (중간에 끊기면 다음 실행에서 다시 가져온다).
+            ready.wait(timeout)
+        if isinstance(store, IntelStore):
+            store.close()
+        self._intel_store = None
     def _record_market_intel_event(
         self,
         *,
@@ -95,10 +167,8 @@ class MarketIntelAuditMixin(TraderMixinBase):
             "payload": payload if isinstance(payload, dict) else {},
             "raw_ref": legacy_raw_ref,
         }
-        path = Path(getattr(Config, "MARKET_INTELLIGENCE_EVENTS_FILE", "data/market_intelligence_events.jsonl"))
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        path = getattr(Config, "MARKET_INTELLIGENCE_EVENTS_FILE", "data/market_intelligence_events.jsonl")
+        self._intel_log_writer(path, KIND_EVENTS).append(record)
         self._schedule_market_replay_refresh()
     def _record_decision_audit_event(
         self,
@@ -111,8 +181,6 @@ class MarketIntelAuditMixin(TraderMixinBase):
         metrics: Optional[Dict[str, Any]] = None,
         quantity: int = 0,
     ):
-        path = Path(getattr(Config, "MARKET_INTELLIGENCE_DECISION_AUDIT_FILE", "data/decision_audit.jsonl"))
-        path.parent.mkdir(parents=True, exist_ok=True)
         state = self._ensure_market_intel_state(info)
         record = {
             "ts": datetime.datetime.now().isoformat(),
@@ -136,8 +204,8 @@ class MarketIntelAuditMixin(TraderMixinBase):
             "conditions": dict(conditions or {}),
             "metrics": dict(metrics or {}),
         }
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        path = getattr(Config, "MARKET_INTELLIGENCE_DECISION_AUDIT_FILE", "data/decision_audit.jsonl")
+        self._intel_log_writer(path, KIND_AUDITS).append(record)
         self._schedule_market_replay_refresh()
     def _maybe_emit_market_intel_alert(
         self,
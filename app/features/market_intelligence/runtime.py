@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import copy
 import datetime
 import hashlib
 import html
 import json
 import re
+import threading
 import time
 from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from PyQt6.QtCore import QTimer, Qt
 from PyQt6.QtWidgets import (
@@ -31,6 +33,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from app.support.bounded_set import BoundedOrderedSet
+from app.support.fetch_pipeline import DeadlineExceeded, FetchPipeline
 from app.support.ui_text import (
     AI_PROVIDER_CHOICES,
     REPLAY_AUDIT_CHOICES,
@@ -54,7 +58,8 @@ from app.support.ui_text import (
 )
 from app.support.widgets import NoScrollComboBox, NoScrollSpinBox
 from config import Config
-from data.providers import AIProvider, DartProvider, MacroProvider, NaverTrendProvider, NewsProvider
+from data.macro_store import MacroSeriesStore
+from data.providers import AIProvider, DartDisclosureFeed, DartProvider, MacroProvider, NaverTrendProvider, NewsProvider
 from app.mixins._typing import TraderMixinBase
 
 
@@ -67,20 +72,117 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
         return DartProvider(creds.get("dart_api_key", ""), cache_dir=getattr(Config, "DATA_DIR", "data"))
     def _build_macro_provider(self) -> MacroProvider:
         creds = self._market_api_credentials()
-        return MacroProvider(creds.get("fred_api_key", ""))
+        return MacroProvider(
+            creds.get("fred_api_key", ""),
+            store=self._macro_series_store_safe(),
+            history_days=int(getattr(Config, "MARKET_INTEL_MACRO_HISTORY_DAYS", 400)),
+        )
+    def _macro_series_store_safe(self) -> Optional[MacroSeriesStore]:
+        path = str(getattr(Config, "MACRO_SERIES_DB_FILE", "") or "")
+        if not path:
+            return None
+        store = getattr(self, "_macro_series_store", None)
+        if isinstance(store, MacroSeriesStore) and str(store.path) == path:
+            return store
+        store = MacroSeriesStore(path)
+        self._macro_series_store = store
+        return store
+    def _close_macro_series_store(self):
+        store = getattr(self, "_macro_series_store", None)
+        if isinstance(store, MacroSeriesStore):
+            store.close()
+        self._macro_series_store = None
+    @staticmethod
+    def _stored_macro_values(provider: MacroProvider, series: List[str], max_age_sec: float) -> Dict[str, float]:
+        """Values from the provider's store when every series was synced within `max_age_sec` (survives restarts)."""
+        store = getattr(provider, "store", None)
+        if not isinstance(store, MacroSeriesStore) or not series:
+            return {}
+        now_ts = time.time()
+        values: Dict[str, float] = {}
+        for sid in series:
+            latest = store.latest_value(sid)
+            if latest is None or (now_ts - store.synced_at(sid)) >= max_age_sec:
+                return {}
+            values[sid] = latest
+        values.update(provider.history_features(series))
+        return values
     def _build_trend_provider(self) -> NaverTrendProvider:
         creds = self._market_api_credentials()
         return NaverTrendProvider(creds.get("naver_client_id", ""), creds.get("naver_client_secret", ""))
+    def _market_intel_fingerprints_safe(self) -> Dict[str, Dict[str, Any]]:
+        fingerprints = getattr(self, "_market_intel_fingerprints", None)
+        if not isinstance(fingerprints, dict):
+            fingerprints = {}
+            self._market_intel_fingerprints = fingerprints
+        return fingerprints
+    def _market_intel_input_fingerprint(self, row: Dict[str, Any], macro_values: Dict[str, float], ranking_overlap: float) -> str:
+        """Hash of everything the scoring step reads for one symbol (fetch timestamps excluded)."""
+        source_meta = row.get("source_meta", {}) if isinstance(row.get("source_meta"), dict) else {}
+        material = {
+            "news": row.get("news", []),
+            "dart": row.get("dart", []),
+            "trend_ratio": row.get("trend_ratio", 0.0),
+            "ranking_overlap": ranking_overlap,
+            "macro": macro_values,
+            "sources": {
+                source: {key: value for key, value in meta.items() if key != "updated_at"}
+                for source, meta in source_meta.items()
+                if isinstance(meta, dict)
+            },
+            "config": getattr(getattr(self, "config", None), "market_intelligence", {}),
+        }
+        encoded = json.dumps(material, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+    def _market_intel_policy_fingerprint(self, state: Dict[str, Any]) -> tuple:
+        """Inputs of `_resolve_market_intel_policy` that can change without new provider data."""
+        block_until = state.get("dart_block_until")
+        ai_summary = state.get("ai_summary", {}) if isinstance(state.get("ai_summary"), dict) else {}
+        return (
+            str(state.get("status", state.get("intel_status", "idle")) or "idle"),
+            float(state.get("news_score", 0.0) or 0.0),
+            float(state.get("theme_score", 0.0) or 0.0),
+            str(state.get("macro_regime", "neutral") or "neutral"),
+            str(state.get("dart_risk_level", "normal") or "normal"),
+            isinstance(block_until, datetime.datetime) and datetime.datetime.now() < block_until,
+            str(ai_summary.get("action_hint", "") or ""),
+            float(ai_summary.get("confidence", 0.0) or 0.0),
+            float(getattr(self, "_portfolio_budget_scale", 1.0) or 1.0),
+        )
     def _apply_market_intelligence_payload(self, code: str, row: Dict[str, Any], macro_values: Dict[str, float]):
         info = self._market_intel_entity(code)
         if not info:
             return
         state = self._ensure_market_intel_state(info)
         now_dt = datetime.datetime.now()
+        now_ts = time.time()
+        ranking_overlap = self._ranking_intersection_score(code)
+        source_meta = row.get("source_meta", {}) if isinstance(row.get("source_meta"), dict) else {}
+        fingerprints = self._market_intel_fingerprints_safe()
+        input_fingerprint = self._market_intel_input_fingerprint(row, macro_values, ranking_overlap)
+        previous = fingerprints.get(code)
+        if (
+            previous
+            and previous["state"] is state
+            and previous["input"] == input_fingerprint
+            and now_ts < previous["recheck_ts"]
+        ):
+            # 공급자가 같은 항목을 돌려준 주기: 재채점 없이 시각만 갱신하고,
+            # 공시 차단 만료처럼 시간이 바꾸는 정책 입력이 달라졌을 때만 정책을 다시 푼다.
+            self._sync_source_meta(state, source_meta)
+            state["updated_at"] = now_dt
+            state["intel_updated_at"] = now_dt
+            info["external_updated_at"] = now_dt
+            policy_fingerprint = self._market_intel_policy_fingerprint(state)
+            if policy_fingerprint != previous["policy"]:
+                state.update(self._resolve_market_intel_policy(code, info))
+                state["briefing_summary"] = self._build_briefing_summary(code, info)
+                previous["policy"] = policy_fingerprint
+                self._market_intel_dirty_codes.add(code)
+            return
         news = self._score_news_items(info, row.get("news", []))
         dart = self._score_dart_events(row.get("dart", []))
         trend_ratio = float(row.get("trend_ratio", 0.0) or 0.0)
-        ranking_overlap = self._ranking_intersection_score(code)
         theme = self._calculate_theme_score(
             info,
             [item.get("title", "") for item in news["headlines"]],
@@ -89,7 +191,6 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
         )
         macro = self._derive_macro_regime(macro_values)
         session_block_until = datetime.datetime.combine(now_dt.date(), datetime.time(15, 30))
-        source_meta = row.get("source_meta", {}) if isinstance(row.get("source_meta"), dict) else {}
         self._sync_source_meta(state, source_meta)
         symbol_status = self._determine_symbol_status(source_meta)
         velocity_threshold = int(self._market_intelligence_config().get("scoring", {}).get("headline_velocity_threshold", 5))
@@ -105,7 +206,10 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
             for item in list(news.get("headlines", []) or []) + list(dart.get("events", []) or [])
             if str(item.get("event_id", "") or "")
         ]
-        seen_event_ids = list(dict.fromkeys(list(state.get("seen_event_ids", []) or []) + event_ids))[-200:]
+        seen_event_ids = state.get("seen_event_ids")
+        if not isinstance(seen_event_ids, BoundedOrderedSet):
+            seen_event_ids = BoundedOrderedSet(200, list(seen_event_ids or []))
+        seen_event_ids.update(event_ids)
         state.update(
             {
                 "status": symbol_status,
@@ -137,6 +241,12 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
         info["external_status"] = symbol_status
         info["external_error"] = str(state.get("intel_error", "") or "")
         state["briefing_summary"] = self._build_briefing_summary(code, info)
+        # 헤드라인 급증(최근 5분) 집계는 입력이 같아도 시간이 지나면 바뀌므로 그때 다시 채점한다.
+        recheck_ts = float("inf")
+        for item in list(row.get("news", []) or []):
+            published_at = item.get("published_at") if isinstance(item, dict) else None
+            if isinstance(published_at, datetime.datetime) and published_at.timestamp() + 300.0 > now_ts:
+                recheck_ts = min(recheck_ts, published_at.timestamp() + 300.0)
         if bool(self._market_intelligence_config().get("ai", {}).get("enabled", False)):
             triggers = [
                 abs(float(state.get("news_score", 0.0) or 0.0))
@@ -145,11 +255,25 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
                 int(state.get("headline_velocity", 0) or 0)
                 >= int(self._market_intelligence_config().get("scoring", {}).get("headline_velocity_threshold", 5)),
             ]
-            if any(triggers):
-                self._maybe_run_ai_summary(code, info, reason="event_trigger")
-                state.update(self._resolve_market_intel_policy(code, info))
+            # 이미 요약한 기사 묶음만 다시 들어온 주기는 AI 호출(예산)을 건너뛴다.
+            story_key = self._build_market_intel_event_id(
+                *sorted(str(item.get("story_id", "") or item.get("event_id", "") or "") for item in news["headlines"]),
+                dart.get("latest_event_id", ""),
+            )
+            if any(triggers) and story_key != str(state.get("ai_story_key", "") or ""):
+                previous_summary = state.get("ai_summary")
+                # ai_story_key는 요약이 성공한 뒤에만 기록된다 (실패/예산 초과면 다음 주기에 재시도).
+                # 캐시된 요약이 바로 적용된 경우에만 정책을 다시 푼다 (대기 중이면 도착 시 반영).
+                if self._maybe_run_ai_summary(code, info, reason="event_trigger", story_key=story_key) is not previous_summary:
+                    state.update(self._resolve_market_intel_policy(code, info))
         else:
-            state["ai_summary"] = self._rules_based_ai_fallback(code, info, reason="disabled")
+            state["ai_summary"] = self._rules_based_ai_fallback(code, info, reason="disabled", policy=policy)
+        fingerprints[code] = {
+            "state": state,
+            "input": input_fingerprint,
+            "recheck_ts": recheck_ts,
+            "policy": self._market_intel_policy_fingerprint(state),
+        }
         if dart.get("blocking", False):
             self._maybe_emit_market_intel_alert(
                 code,
@@ -203,8 +327,42 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
                 },
             )
         self._market_intel_dirty_codes.add(code)
-    def _fetch_market_intelligence_worker(self, codes: List[str]) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {"codes": {}, "source_statuses": {}, "macro_values": {}}
+    def _dart_disclosure_feed_safe(self) -> DartDisclosureFeed:
+        feed = getattr(self, "_dart_disclosure_feed", None)
+        if feed is None:
+            feed = DartDisclosureFeed(
+                max_pages=int(getattr(Config, "MARKET_INTEL_DART_FEED_MAX_PAGES", 10)),
+                retention_days=int(getattr(Config, "MARKET_INTEL_DART_FEED_RETENTION_DAYS", 30)),
+            )
+            self._dart_disclosure_feed = feed
+        return feed
+    def _market_intel_fetch_limits(self) -> Dict[str, Dict[str, Any]]:
+        limits = copy.deepcopy(getattr(Config, "MARKET_INTEL_PROVIDER_LIMITS", {}))
+        overrides = self._market_intelligence_config().get("provider_limits", {})
+        if isinstance(overrides, dict):
+            for provider, spec in overrides.items():
+                if isinstance(spec, dict):
+                    limits.setdefault(str(provider), {}).update(spec)
+        for provider in ("news", "dart", "datalab", "macro"):
+            limits.setdefault(provider, {"concurrency": 1, "rate_per_sec": 1.0})
+        return limits
+    def _market_intel_fetch_deadline_sec(self) -> float:
+        refresh_sec = int(self._market_intelligence_config().get("refresh_sec", {}).get("news", getattr(Config, "MARKET_INTEL_REFRESH_SEC", 60)))
+        deadline_sec = float(getattr(Config, "MARKET_INTEL_FETCH_DEADLINE_SEC", 45))
+        # 다음 주기와 겹치지 않도록 갱신 주기 안에서 마감한다.
+        return max(5.0, min(deadline_sec, max(1, refresh_sec) * 0.9))
+    def _fetch_market_intelligence_worker(self, codes: List[str], on_code: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Fetch news/DataLab per code concurrently under per-provider limits and one deadline.
+
+        DART comes from one market-wide feed poll per cycle; only codes the
+        feed has not covered yet get a per-company backfill call.
+
+        Each finished code is passed to `on_code` (listed in `payload["delivered"]`)
+        as soon as its calls complete; without `on_code` rows are returned in
+        `payload["codes"]`. Calls that miss the deadline leave their source
+        `partial` with `deadline_exceeded`.
+        """
+        payload: Dict[str, Any] = {"codes": {}, "source_statuses": {}, "macro_values": {}, "delivered": []}
         if not self._market_intelligence_enabled():
             for source in ("news", "dart", "datalab", "macro"):
                 payload["source_statuses"][source] = {"status": "disabled", "error": "market_intelligence_disabled"}
@@ -220,177 +378,298 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
             if error:
                 bucket["errors"].append(str(error))
 
-        macro_values: Dict[str, float] = {}
-        macro_status = "disabled"
-        macro_error = "provider_disabled"
-        if self._market_intelligence_provider_enabled("macro"):
-            provider = self._build_macro_provider()
-            if provider.available():
-                cache = getattr(self, "_market_macro_cache", None)
-                now_ts = time.time()
-                macro_refresh_sec = int(
-                    self._market_intelligence_config().get("refresh_sec", {}).get(
-                        "macro", getattr(Config, "MARKET_INTEL_MACRO_REFRESH_SEC", 300)
-                    )
-                )
-                if (
-                    isinstance(cache, dict)
-                    and isinstance(cache.get("values"), dict)
-                    and cache.get("values")
-                    and (now_ts - float(cache.get("ts", 0.0))) < max(30, macro_refresh_sec)
-                ):
-                    macro_values = dict(cache.get("values", {}))
-                    macro_status = "fresh"
-                    macro_error = ""
-                else:
-                    macro_values = provider.latest_values(list(self._market_intelligence_config().get("macro_series", [])))
-                    self._market_macro_cache = {"values": dict(macro_values), "ts": now_ts}
-                    macro_status = str(getattr(provider, "last_status", "idle") or "idle")
-                    macro_error = str(getattr(provider, "last_error", "") or "")
-            else:
-                macro_status = "disabled_by_missing_credentials"
-                macro_error = "api_key_missing"
-        else:
+        # 공급자 객체는 last_status를 인스턴스에 기록하므로 풀 스레드마다 따로 만든다.
+        thread_providers = threading.local()
+
+        def _provider(name: str, builder: Callable[[], Any]) -> Any:
+            providers = getattr(thread_providers, "providers", None)
+            if providers is None:
+                providers = {}
+                thread_providers.providers = providers
+            if name not in providers:
+                providers[name] = builder()
+            return providers[name]
+
+        def _status_of(provider: Any) -> tuple:
+            return str(getattr(provider, "last_status", "idle") or "idle"), str(getattr(provider, "last_error", "") or "")
+
+        def _fetch_macro(series: List[str]):
+            provider = _provider("macro", self._build_macro_provider)
+            values = provider.latest_values(series)
+            status = _status_of(provider)
+            values.update(provider.history_features(series))
+            return (values, *status)
+
+        def _fetch_news(query: str):
+            provider = _provider("news", self._build_news_provider)
+            try:
+                items = provider.search(query, display=10, sort="date")
+            except Exception:
+                items = []
+            return (items, *_status_of(provider))
+
+        dart_feed = self._dart_disclosure_feed_safe()
+
+        def _poll_dart():
+            provider = _provider("dart", self._build_dart_provider)
+            fresh = dart_feed.poll(provider)
+            return (fresh, dart_feed.last_status, dart_feed.last_error)
+
+        def _backfill_dart(code: str):
+            provider = _provider("dart", self._build_dart_provider)
+            try:
+                disclosures = dart_feed.backfill(provider, code, start_date, end_date, page_count=10)
+            except Exception:
+                disclosures = []
+            return (disclosures, *_status_of(provider))
+
+        def _fetch_datalab(queries: List[str]):
+            provider = _provider("datalab", self._build_trend_provider)
+            ratios = provider.latest_ratios(queries)
+            return (ratios, *_status_of(provider))
+
+        def _outcome(future: Optional[concurrent.futures.Future], empty: Any) -> tuple:
+            if future is None or not future.done() or future.cancelled():
+                return empty, "partial", "deadline_exceeded"
+            try:
+                return future.result()
+            except DeadlineExceeded:
+                return empty, "partial", "deadline_exceeded"
+            except Exception as exc:
+                return empty, "error", str(exc)
+
+        pipeline = FetchPipeline(self._market_intel_fetch_limits(), self._market_intel_fetch_deadline_sec())
+        try:
+            macro_values: Dict[str, float] = {}
             macro_status = "disabled"
             macro_error = "provider_disabled"
-        _track_source("macro", macro_status, macro_error)
-        payload["macro_values"] = macro_values
-
-        news_provider = self._build_news_provider()
-        dart_provider = self._build_dart_provider()
-        trend_provider = self._build_trend_provider()
+            macro_future = None
+            if self._market_intelligence_provider_enabled("macro"):
+                provider = self._build_macro_provider()
+                if provider.available():
+                    cache = getattr(self, "_market_macro_cache", None)
+                    now_ts = time.time()
+                    macro_refresh_sec = int(
+                        self._market_intelligence_config().get("refresh_sec", {}).get(
+                            "macro", getattr(Config, "MARKET_INTEL_MACRO_REFRESH_SEC", 300)
+                        )
+                    )
+                    if (
+                        isinstance(cache, dict)
+                        and isinstance(cache.get("values"), dict)
+                        and cache.get("values")
+                        and (now_ts - float(cache.get("ts", 0.0))) < max(30, macro_refresh_sec)
+                    ):
+                        macro_values = dict(cache.get("values", {}))
+                        macro_status = "fresh"
+                        macro_error = ""
+                    else:
+                        series = list(self._market_intelligence_config().get("macro_series", []))
+                        macro_values = self._stored_macro_values(provider, series, max(30, macro_refresh_sec))
+                        if macro_values:
+                            macro_status = "fresh"
+                            macro_error = ""
+                            self._market_macro_cache = {"values": dict(macro_values), "ts": now_ts}
+                        else:
+                            macro_future = pipeline.submit("macro", _fetch_macro, series)
+                else:
+                    macro_status = "disabled_by_missing_credentials"
+                    macro_error = "api_key_missing"
 
-        today = datetime.date.today()
-        start_date = (today - datetime.timedelta(days=30)).strftime("%Y%m%d")
-        end_date = today.strftime("%Y%m%d")
-        for code in codes:
-            info = self._market_intel_entity(code)
             news_enabled = self._market_intelligence_provider_enabled("news")
             dart_enabled = self._market_intelligence_provider_enabled("dart")
             datalab_enabled = self._market_intelligence_provider_enabled("datalab")
-            news_available = bool(news_enabled and news_provider.available())
-            dart_available = bool(dart_enabled and dart_provider.available())
-            datalab_available = bool(datalab_enabled and trend_provider.available())
-            row = {
-                "news": [],
-                "dart": [],
-                "trend_ratio": 0.0,
-                "source_meta": {
-                    "news": {
-                        "status": "idle" if news_available else ("disabled" if not news_enabled else "disabled_by_missing_credentials"),
-                        "error": "" if news_available else ("provider_disabled" if not news_enabled else "api_key_missing"),
-                        "updated_at": datetime.datetime.now(),
-                        "count": 0,
+            news_available = bool(news_enabled and self._build_news_provider().available())
+            dart_available = bool(dart_enabled and self._build_dart_provider().available())
+            datalab_available = bool(datalab_enabled and self._build_trend_provider().available())
+
+            today = datetime.date.today()
+            start_date = (today - datetime.timedelta(days=30)).strftime("%Y%m%d")
+            end_date = today.strftime("%Y%m%d")
+
+            # DART는 전체 시장 피드 한 번으로 새 공시만 받고, 피드가 덮지 못한 종목만 개별 조회한다.
+            dart_poll_future = pipeline.submit("dart", _poll_dart) if dart_available else None
+            jobs: Dict[str, Dict[str, Any]] = {}
+            owner_by_future: Dict[concurrent.futures.Future, str] = {}
+            for code in codes:
+                info = self._market_intel_entity(code)
+                queries = self._news_queries_for_symbol(info, code)
+                job: Dict[str, Any] = {"news": [], "dart": None, "datalab": None}
+                if news_available:
+                    job["news"] = [pipeline.submit("news", _fetch_news, query) for query in queries]
+                if dart_available and dart_feed.needs_backfill(code):
+                    job["dart"] = pipeline.submit("dart", _backfill_dart, code)
+                if datalab_available:
+                    job["datalab"] = (pipeline.submit("datalab", _fetch_datalab, queries), queries)
+                futures = list(job["news"])
+                if job["dart"] is not None:
+                    futures.append(job["dart"])
+                if job["datalab"] is not None:
+                    futures.append(job["datalab"][0])
+                job["remaining"] = len(futures)
+                for future in futures:
+                    owner_by_future[future] = code
+                jobs[code] = job
+
+            if macro_future is not None:
+                concurrent.futures.wait([macro_future], timeout=pipeline.remaining())
+                macro_values, macro_status, macro_error = _outcome(macro_future, {})
+                if macro_status != "partial":
+                    self._market_macro_cache = {"values": dict(macro_values), "ts": time.time()}
+            _track_source("macro", macro_status, macro_error)
+            payload["macro_values"] = macro_values
+            dart_poll_status, dart_poll_error = "idle", ""
+            if dart_poll_future is not None:
+                concurrent.futures.wait([dart_poll_future], timeout=pipeline.remaining())
+                _fresh, dart_poll_status, dart_poll_error = _outcome(dart_poll_future, {})
+            macro_summary = self._derive_macro_regime(macro_values).get("summary", "") if macro_values else ""
+
+            def _finalize(code: str):
+                job = jobs[code]
+                info = self._market_intel_entity(code)
+                row = {
+                    "news": [],
+                    "dart": [],
+                    "trend_ratio": 0.0,
+                    "source_meta": {
+                        "news": {
+                            "status": "idle" if news_available else ("disabled" if not news_enabled else "disabled_by_missing_credentials"),
+                            "error": "" if news_available else ("provider_disabled" if not news_enabled else "api_key_missing"),
+                            "updated_at": datetime.datetime.now(),
+                            "count": 0,
+                        },
+                        "dart": {
+                            "status": "idle" if dart_available else ("disabled" if not dart_enabled else "disabled_by_missing_credentials"),
+                            "error": "" if dart_available else ("provider_disabled" if not dart_enabled else "api_key_missing"),
+                            "updated_at": datetime.datetime.now(),
+                            "count": 0,
+                        },
+                        "datalab": {
+                            "status": "idle" if datalab_available else ("disabled" if not datalab_enabled else "disabled_by_missing_credentials"),
+                            "error": "" if datalab_available else ("provider_disabled" if not datalab_enabled else "api_key_missing"),
+                            "updated_at": datetime.datetime.now(),
+                            "value": 0.0,
+                        },
+                        "macro": {
+                            "status": macro_status,
+                            "error": macro_error,
+                            "updated_at": datetime.datetime.now(),
+                            "summary": macro_summary,
+                        },
                     },
-                    "dart": {
-                        "status": "idle" if dart_available else ("disabled" if not dart_enabled else "disabled_by_missing_credentials"),
-                        "error": "" if dart_available else ("provider_disabled" if not dart_enabled else "api_key_missing"),
+                }
+                if news_available:
+                    merged_news: List[Dict[str, Any]] = []
+                    seen_ids = set()
+                    query_statuses: List[str] = []
+                    query_errors: List[str] = []
+                    for future in job["news"]:
+                        items, current_status, current_error = _outcome(future, [])
+                        query_statuses.append(current_status)
+                        if current_error:
+                            query_errors.append(current_error)
+                        _track_source("news", current_status, current_error)
+                        for item in items:
+                            if not isinstance(item, dict):
+                                continue
+                            item_id = self._build_market_intel_event_id(
+                                self._clean_text(item.get("title")),
+                                self._normalize_link(item.get("origin_link") or item.get("link")),
+                                self._published_bucket(item.get("published_at")),
+                            )
+                            if item_id in seen_ids:
+                                continue
+                            seen_ids.add(item_id)
+                            merged_news.append(item)
+                    row["news"] = merged_news
+                    row["source_meta"]["news"] = {
+                        "status": self._combine_source_statuses(query_statuses),
+                        "error": " | ".join(dict.fromkeys([error for error in query_errors if error])),
                         "updated_at": datetime.datetime.now(),
-                        "count": 0,
-                    },
-                    "datalab": {
-                        "status": "idle" if datalab_available else ("disabled" if not datalab_enabled else "disabled_by_missing_credentials"),
-                        "error": "" if datalab_available else ("provider_disabled" if not datalab_enabled else "api_key_missing"),
+                        "count": len(merged_news),
+                    }
+                elif not news_enabled:
+                    _track_source("news", "disabled", "provider_disabled")
+                else:
+                    _track_source("news", "disabled_by_missing_credentials", "api_key_missing")
+                if dart_available:
+                    dart_statuses = [dart_poll_status]
+                    dart_errors = [dart_poll_error]
+                    if job["dart"] is not None:
+                        _backfilled, backfill_status, backfill_error = _outcome(job["dart"], [])
+                        dart_statuses.append(backfill_status)
+                        dart_errors.append(backfill_error)
+                    dart_status = self._combine_source_statuses(dart_statuses)
+                    dart_error = " | ".join(dict.fromkeys([error for error in dart_errors if error]))
+                    disclosures = dart_feed.recent(code)
+                    if dart_status in {"ok_with_data", "ok_empty"}:
+                        dart_status = "ok_with_data" if disclosures else "ok_empty"
+                    cursor = str(getattr(self, "_market_dart_cursor_by_code", {}).get(code, "") or "")
+                    fresh_disclosures = []
+                    max_cursor = cursor
+                    for item in disclosures:
+                        receipt_no = str(item.get("rcept_no", "") or item.get("rcp_no", "") or "")
+                        if receipt_no and receipt_no > max_cursor:
+                            max_cursor = receipt_no
+                        if not cursor or (receipt_no and receipt_no > cursor):
+                            fresh_disclosures.append(item)
+                    row["dart"] = fresh_disclosures if fresh_disclosures else disclosures[:3]
+                    getattr(self, "_market_dart_cursor_by_code", {})[code] = max_cursor
+                    _track_source("dart", dart_status, dart_error)
+                    row["source_meta"]["dart"] = {
+                        "status": dart_status,
+                        "error": dart_error,
                         "updated_at": datetime.datetime.now(),
-                        "value": 0.0,
-                    },
-                    "macro": {
-                        "status": macro_status,
-                        "error": macro_error,
+                        "count": len(row["dart"]),
+                    }
+                elif not dart_enabled:
+                    _track_source("dart", "disabled", "provider_disabled")
+                else:
+                    _track_source("dart", "disabled_by_missing_credentials", "api_key_missing")
+                if datalab_available:
+                    future, queries = job["datalab"]
+                    ratios, datalab_status, datalab_error = _outcome(future, {})
+                    best_ratio = 0.0
+                    for query in queries:
+                        best_ratio = max(best_ratio, float(ratios.get(query, 0.0) or 0.0))
+                    row["trend_ratio"] = best_ratio
+                    _track_source("datalab", datalab_status, datalab_error)
+                    row["source_meta"]["datalab"] = {
+                        "status": datalab_status,
+                        "error": datalab_error,
                         "updated_at": datetime.datetime.now(),
-                        "summary": self._derive_macro_regime(macro_values).get("summary", "") if macro_values else "",
-                    },
-                },
-            }
-            if news_available:
-                merged_news: List[Dict[str, Any]] = []
-                seen_ids = set()
-                query_statuses: List[str] = []
-                query_errors: List[str] = []
-                for query in self._news_queries_for_symbol(info, code):
-                    try:
-                        items = news_provider.search(query, display=10, sort="date")
-                    except Exception:
-                        items = []
-                    current_status = str(getattr(news_provider, "last_status", "idle") or "idle")
-                    current_error = str(getattr(news_provider, "last_error", "") or "")
-                    query_statuses.append(current_status)
-                    if current_error:
-                        query_errors.append(current_error)
-                    _track_source("news", current_status, current_error)
-                    for item in items:
-                        if not isinstance(item, dict):
-                            continue
-                        item_id = self._build_market_intel_event_id(
-                            self._clean_text(item.get("title")),
-                            self._normalize_link(item.get("origin_link") or item.get("link")),
-                            self._published_bucket(item.get("published_at")),
-                        )
-                        if item_id in seen_ids:
-                            continue
-                        seen_ids.add(item_id)
-                        merged_news.append(item)
-                news_status = self._combine_source_statuses(query_statuses)
-                row["news"] = merged_news
-                row["source_meta"]["news"] = {
-                    "status": news_status,
-                    "error": " | ".join(dict.fromkeys([error for error in query_errors if error])),
-                    "updated_at": datetime.datetime.now(),
-                    "count": len(merged_news),
-                }
-            elif not news_enabled:
-                _track_source("news", "disabled", "provider_disabled")
-            else:
-                _track_source("news", "disabled_by_missing_credentials", "api_key_missing")
-            if dart_available:
-                try:
-                    disclosures = dart_provider.get_recent_disclosures(code, start_date=start_date, end_date=end_date, page_count=10)
-                except Exception:
-                    disclosures = []
-                cursor = str(getattr(self, "_market_dart_cursor_by_code", {}).get(code, "") or "")
-                fresh_disclosures = []
-                max_cursor = cursor
-                for item in disclosures:
-                    receipt_no = str(item.get("rcept_no", "") or item.get("rcp_no", "") or "")
-                    if receipt_no and receipt_no > max_cursor:
-                        max_cursor = receipt_no
-                    if not cursor or (receipt_no and receipt_no > cursor):
-                        fresh_disclosures.append(item)
-                row["dart"] = fresh_disclosures if fresh_disclosures else disclosures[:3]
-                getattr(self, "_market_dart_cursor_by_code", {})[code] = max_cursor
-                dart_status = str(getattr(dart_provider, "last_status", "idle") or "idle")
-                dart_error = str(getattr(dart_provider, "last_error", "") or "")
-                _track_source("dart", dart_status, dart_error)
-                row["source_meta"]["dart"] = {
-                    "status": dart_status,
-                    "error": dart_error,
-                    "updated_at": datetime.datetime.now(),
-                    "count": len(row["dart"]),
-                }
-            elif not dart_enabled:
-                _track_source("dart", "disabled", "provider_disabled")
-            else:
-                _track_source("dart", "disabled_by_missing_credentials", "api_key_missing")
-            if datalab_available:
-                ratios = trend_provider.latest_ratios(self._news_queries_for_symbol(info, code))
-                best_ratio = 0.0
-                for query in self._news_queries_for_symbol(info, code):
-                    best_ratio = max(best_ratio, float(ratios.get(query, 0.0) or 0.0))
-                row["trend_ratio"] = best_ratio
-                datalab_status = str(getattr(trend_provider, "last_status", "idle") or "idle")
-                datalab_error = str(getattr(trend_provider, "last_error", "") or "")
-                _track_source("datalab", datalab_status, datalab_error)
-                row["source_meta"]["datalab"] = {
-                    "status": datalab_status,
-                    "error": datalab_error,
-                    "updated_at": datetime.datetime.now(),
-                    "value": best_ratio,
-                }
-            elif not datalab_enabled:
-                _track_source("datalab", "disabled", "provider_disabled")
-            else:
-                _track_source("datalab", "disabled_by_missing_credentials", "api_key_missing")
-            payload["codes"][code] = row
+                        "value": best_ratio,
+                    }
+                elif not datalab_enabled:
+                    _track_source("datalab", "disabled", "provider_disabled")
+                else:
+                    _track_source("datalab", "disabled_by_missing_credentials", "api_key_missing")
+                if on_code is not None:
+                    on_code({"code": code, "row": row, "macro_values": macro_values})
+                    payload["delivered"].append(code)
+                else:
+                    payload["codes"][code] = row
+
+            for code, job in jobs.items():
+                if job["remaining"] == 0:
+                    _finalize(code)
+            pending = set(owner_by_future)
+            while pending:
+                done, pending = concurrent.futures.wait(
+                    pending, timeout=pipeline.remaining(), return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for future in done:
+                    code = owner_by_future[future]
+                    jobs[code]["remaining"] -= 1
+                    if jobs[code]["remaining"] == 0:
+                        _finalize(code)
+            for code, job in jobs.items():
+                if job["remaining"] > 0:
+                    _finalize(code)
+        finally:
+            pipeline.shutdown()
         for source_name, bucket in source_buckets.items():
             status = self._combine_source_statuses(list(bucket.get("statuses", [])))
             errors = [str(error) for error in bucket.get("errors", []) if str(error or "").strip()]
@@ -399,13 +678,34 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
                 "error": " | ".join(dict.fromkeys(errors)),
             }
         return payload
+    def _on_market_intelligence_partial(self, item: Dict[str, Any]):
+        if not isinstance(item, dict):
+            return
+        code = str(item.get("code", "") or "")
+        row = item.get("row", {})
+        macro_values = item.get("macro_values", {})
+        if not code:
+            return
+        self._apply_market_intelligence_payload(code, row if isinstance(row, dict) else {}, macro_values if isinstance(macro_values, dict) else {})
+        self._schedule_market_intelligence_table_refresh()
+    def _schedule_market_intelligence_table_refresh(self):
+        if getattr(self, "_market_intel_table_refresh_scheduled", False):
+            return
+        self._market_intel_table_refresh_scheduled = True
+        QTimer.singleShot(250, self._run_scheduled_market_intelligence_table_refresh)
+    def _run_scheduled_market_intelligence_table_refresh(self):
+        self._market_intel_table_refresh_scheduled = False
+        self._refresh_market_intelligence_table()
     def _on_market_intelligence_result(self, requested_codes: List[str], payload: Dict[str, Any]):
         source_statuses = payload.get("source_statuses", {}) if isinstance(payload, dict) else {}
         for source, row in source_statuses.items():
             if isinstance(row, dict):
                 self._set_market_intel_source_status(source, str(row.get("status", "idle") or "idle"), str(row.get("error", "") or ""))
         macro_values = payload.get("macro_values", {}) if isinstance(payload, dict) else {}
+        delivered = set(payload.get("delivered", []) or []) if isinstance(payload, dict) else set()
         for code in requested_codes:
+            if code in delivered:
+                continue
             row = payload.get("codes", {}).get(code, {}) if isinstance(payload, dict) else {}
             self._apply_market_intelligence_payload(code, row if isinstance(row, dict) else {}, macro_values if isinstance(macro_values, dict) else {})
         self._refresh_candidate_universe_state()
@@ -471,6 +771,8 @@ class MarketIntelRuntimeMixin(TraderMixinBase):
             from app.support.worker import Worker
 
             worker = Worker(self._fetch_market_intelligence_worker, selected)
+            worker.kwargs["on_code"] = worker.signals.partial.emit
+            worker.signals.partial.connect(self._on_market_intelligence_partial)
             worker.signals.result.connect(lambda payload, requested=selected: self._on_market_intelligence_result(requested, payload))
             worker.signals.error.connect(lambda error, requested=selected: self._on_market_intelligence_error(requested, error))
             self.threadpool.start(worker)
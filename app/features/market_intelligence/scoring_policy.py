@@ -52,6 +52,8 @@ from app.support.ui_text import (
     populate_combo,
     set_combo_value,
 )
+from app.support.ai_batch import AISummaryScheduler, build_batch_prompt, split_batch_result, summary_content_key
+from app.support.market_screen import MarketScreenIndex
 from app.support.widgets import NoScrollComboBox, NoScrollSpinBox
 from config import Config
 from data.providers import AIProvider, DartProvider, MacroProvider, NaverTrendProvider, NewsProvider
@@ -76,6 +78,9 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
         min_relevance = float(
             self._market_intelligence_config().get("scoring", {}).get("min_relevance_score", 0.4)
         )
+        matcher = self._market_keyword_matcher()
+        story_index = self._news_story_index()
+        by_story: Dict[str, Dict[str, Any]] = {}
         for raw in items:
             if not isinstance(raw, dict):
                 continue
@@ -92,6 +97,11 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
             if event_id in seen:
                 continue
             seen.add(event_id)
+            # 같은 기사의 재전송/요약본은 대표 헤드라인 하나만 점수·속도에 반영한다.
+            story_id = story_index.assign(title, key=event_id)
+            if story_id in by_story:
+                by_story[story_id]["duplicate_count"] += 1
+                continue
             relevance_score = self._news_relevance_score(info, code, title, description)
             if relevance_score <= 0:
                 continue
@@ -100,12 +110,17 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
             item["description"] = description
             item["event_id"] = event_id
             item["relevance_score"] = relevance_score
+            item["story_id"] = story_id
+            item["duplicate_count"] = 0
+            by_story[story_id] = item
+            hits = matcher.find(title)
+            item["keyword_hits"] = [hit.as_dict() for hit in hits]
             unique_items.append(item)
             relevance_total += relevance_score
-            lowered = title.lower()
-            if any(keyword.lower() in lowered for keyword in getattr(Config, "MARKET_INTELLIGENCE_POSITIVE_KEYWORDS", set())):
+            categories = {category for hit in hits for category in hit.categories}
+            if "positive" in categories:
                 positive_hits += max(1, int(round(relevance_score * 2)))
-            if any(keyword.lower() in lowered for keyword in getattr(Config, "MARKET_INTELLIGENCE_NEGATIVE_KEYWORDS", set())):
+            if "negative" in categories:
                 negative_hits += max(1, int(round(relevance_score * 2)))
             if isinstance(published_at, datetime.datetime):
                 published = published_at.astimezone(now.tzinfo) if published_at.tzinfo else published_at.replace(tzinfo=now.tzinfo)
@@ -133,20 +148,18 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
         event_type = "general"
         severity = "low"
         latest_event_id = ""
+        matcher = self._market_keyword_matcher()
         for row in disclosures:
             if not isinstance(row, dict):
                 continue
             title = self._clean_text(row.get("report_nm") or row.get("report_name") or row.get("rpt_nm"))
             if not title:
                 continue
-            lowered = title.lower()
-            row_event_type = self._classify_disclosure_event(title)
+            matched = matcher.categories(title)
+            row_event_type = self._classify_disclosure_event(title, matched)
             receipt_no = str(row.get("rcept_no", "") or row.get("rcp_no", "") or "")
             event_id = self._build_market_intel_event_id(receipt_no or title, row.get("rcept_dt", "") or row.get("filing_date", ""))
-            tags: List[str] = []
-            for keyword in getattr(Config, "MARKET_INTELLIGENCE_HIGH_RISK_KEYWORDS", set()):
-                if keyword.lower() in lowered:
-                    tags.append(keyword)
+            tags: List[str] = list(matched.get("high_risk", []))
             if tags:
                 high_risk = True
                 risk_level = "high"
@@ -181,11 +194,17 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
     def _derive_macro_regime(self, values: Dict[str, float]) -> Dict[str, Any]:
         vix = float(values.get("VIXCLS", 0.0) or 0.0)
         yield_10y = float(values.get("DGS10", 0.0) or 0.0)
-        if vix >= 25.0 or yield_10y >= 4.5:
-            return {"regime": "risk_off", "score": -60.0, "summary": f"VIX={vix:.1f}, 10Y={yield_10y:.2f}"}
-        if 0 < vix <= 18.0 and 0 < yield_10y <= 4.0:
-            return {"regime": "risk_on", "score": 20.0, "summary": f"VIX={vix:.1f}, 10Y={yield_10y:.2f}"}
-        return {"regime": "neutral", "score": 0.0, "summary": f"VIX={vix:.1f}, 10Y={yield_10y:.2f}"}
+        # 저장된 이력에서 계산한 5영업일 변화폭 (이력이 없으면 키가 없다)
+        vix_change = float(values.get("VIXCLS_chg_5d", 0.0) or 0.0)
+        yield_change = float(values.get("DGS10_chg_5d", 0.0) or 0.0)
+        summary = f"VIX={vix:.1f}, 10Y={yield_10y:.2f}"
+        if "VIXCLS_chg_5d" in values or "DGS10_chg_5d" in values:
+            summary = f"{summary} (5일 ΔVIX={vix_change:+.1f}, Δ10Y={yield_change:+.2f})"
+        if vix >= 25.0 or yield_10y >= 4.5 or vix_change >= 5.0 or yield_change >= 0.3:
+            return {"regime": "risk_off", "score": -60.0, "summary": summary}
+        if 0 < vix <= 18.0 and 0 < yield_10y <= 4.0 and vix_change <= 2.0:
+            return {"regime": "risk_on", "score": 20.0, "summary": summary}
+        return {"regime": "neutral", "score": 0.0, "summary": summary}
     def _calculate_theme_score(
         self, info: Dict[str, Any], news_titles: List[str], trend_ratio: float, ranking_overlap: float = 0.0
     ) -> Dict[str, Any]:
@@ -204,22 +223,26 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
             + overlap_score * float(weights.get("ranking_intersection", 20)) / 100.0
         )
         return {"score": min(100.0, total), "keywords": top_keywords}
+    def _market_screen_index_safe(self) -> MarketScreenIndex:
+        index = getattr(self, "_market_screen_index", None)
+        if index is None:
+            index = MarketScreenIndex()
+            self._market_screen_index = index
+        return index
+    def _record_market_screen_results(self, source: str, rows: List[Dict[str, Any]]):
+        """Store condition-search/ranking results (called when the REST call completes)."""
+        self._market_screen_index_safe().replace_source(
+            source,
+            [
+                {"code": row.get("code", ""), "name": row.get("name", ""), "rank": row.get("rank", position)}
+                for position, row in enumerate(rows or [], start=1)
+                if isinstance(row, dict)
+            ],
+        )
     def _ranking_intersection_score(self, code: str) -> float:
-        def _contains_code(table_name: str, code_col: int) -> bool:
-            table = getattr(self, table_name, None)
-            if table is None:
-                return False
-            try:
-                for row in range(table.rowCount()):
-                    item = table.item(row, code_col)
-                    if item is not None and str(item.text()).strip() == code:
-                        return True
-            except Exception:
-                return False
-            return False
-
-        in_condition = _contains_code("condition_table", 0)
-        in_ranking = _contains_code("ranking_table", 1)
+        sources = self._market_screen_index_safe().sources_for(code)
+        in_condition = "condition" in sources
+        in_ranking = "ranking" in sources
         if in_condition and in_ranking:
             return 100.0
         if in_condition or in_ranking:
@@ -237,37 +260,26 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
         dual_required = bool(cfg.get("promotion_requires_dual_source", True))
         promotion_news = float(cfg.get("promotion_news_score", 70))
         promotion_theme = float(cfg.get("promotion_theme_score", 70))
-        pool = copy.deepcopy(getattr(self, "_candidate_universe", {}))
+        pool = getattr(self, "_candidate_universe", None)
+        if not isinstance(pool, dict):
+            pool = {}
 
-        def _upsert_from_table(table_name: str, code_col: int, name_col: int, source_name: str):
-            table = getattr(self, table_name, None)
-            if table is None:
-                return
-            for row in range(table.rowCount()):
-                code_item = table.item(row, code_col)
-                name_item = table.item(row, name_col)
-                code = str(code_item.text()).strip() if code_item is not None else ""
-                if not code or code in self.universe:
-                    continue
-                entry = pool.get(code, {})
-                if not isinstance(entry, dict):
-                    entry = {}
-                source_hits = set(entry.get("source_hits", []) or [])
-                source_hits.add(source_name)
-                entry.update(
-                    {
-                        "code": code,
-                        "name": str(name_item.text()).strip() if name_item is not None else code,
-                        "source_hits": sorted(source_hits),
-                        "last_seen_ts": now_ts,
-                        "is_candidate": True,
-                    }
-                )
-                self._ensure_market_intel_state(entry)
+        # 현재 조건검색/순위 결과에 남아 있는 종목만 갱신한다 (후보 풀은 제자리 수정).
+        for screened in self._market_screen_index_safe().entries():
+            code = screened["code"]
+            if code in self.universe:
+                continue
+            entry = pool.get(code)
+            if not isinstance(entry, dict):
+                entry = {"code": code, "source_hits": [], "is_candidate": True}
                 pool[code] = entry
-
-        _upsert_from_table("condition_table", 0, 1, "condition")
-        _upsert_from_table("ranking_table", 1, 2, "ranking")
+            source_hits = entry.get("source_hits", []) or []
+            missing = [source for source in screened["sources"] if source not in source_hits]
+            if missing:
+                entry["source_hits"] = sorted(set(source_hits) | set(missing))
+            entry["name"] = screened["name"]
+            entry["last_seen_ts"] = now_ts
+            self._ensure_market_intel_state(entry)
 
         active: Dict[str, Dict[str, Any]] = {}
         for code, entry in list(pool.items()):
@@ -542,7 +554,24 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
             f"공시 리스크는 {state.get('dart_risk_level', 'normal')}, 매크로 레짐은 {state.get('macro_regime', 'neutral')}입니다.",
             f"테마 점수는 {float(state.get('theme_score', 0.0) or 0.0):.0f}, 정책은 {state.get('action_policy', 'allow')}입니다.",
         ]
+        highlights = self._market_intel_keyword_highlights(state)
+        if highlights:
+            lines.append(f"주요 키워드: {', '.join(highlights)}.")
         return " ".join(lines)
+    @staticmethod
+    def _market_intel_keyword_highlights(state: Dict[str, Any], limit: int = 5) -> List[str]:
+        """Dictionary keywords already matched during scoring (headline hits, then DART tags)."""
+        keywords: List[str] = []
+        for item in list(state.get("news_headlines", []) or []):
+            for hit in list(item.get("keyword_hits", []) or []) if isinstance(item, dict) else []:
+                keyword = str(hit.get("keyword", "") or "") if isinstance(hit, dict) else ""
+                if keyword and keyword not in keywords:
+                    keywords.append(keyword)
+        for event in list(state.get("dart_events", []) or []):
+            for tag in list(event.get("tags", []) or []) if isinstance(event, dict) else []:
+                if tag and tag not in keywords:
+                    keywords.append(str(tag))
+        return keywords[: max(0, int(limit))]
     def _ai_usage_bucket(self) -> Dict[str, Any]:
         today = datetime.date.today().isoformat()
         usage = getattr(self, "_market_ai_usage", None)
@@ -550,23 +579,32 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
             usage = {"day": today, "count": 0, "cost_krw": 0, "by_symbol": {}}
             self._market_ai_usage = usage
         return usage
-    def _consume_ai_budget(self, code: str, estimated_cost_krw: int = 100) -> bool:
+    def _consume_ai_batch_budget(self, codes: List[str]) -> List[str]:
+        """Charge one call for `codes`; returns the codes still under their per-symbol cap (empty = over budget)."""
         usage = self._ai_usage_bucket()
         ai_cfg = self._market_intelligence_config().get("ai", {})
-        if int(usage.get("count", 0)) >= int(ai_cfg.get("max_calls_per_day", 30)):
-            return False
-        if int(usage.get("cost_krw", 0)) + int(estimated_cost_krw) > int(ai_cfg.get("daily_budget_krw", 1000)):
-            return False
         by_symbol = usage.setdefault("by_symbol", {})
-        if int(by_symbol.get(code, 0)) >= int(ai_cfg.get("max_calls_per_symbol", 3)):
-            return False
+        max_per_symbol = int(ai_cfg.get("max_calls_per_symbol", 3))
+        allowed = [code for code in codes if int(by_symbol.get(code, 0)) < max_per_symbol]
+        if not allowed or int(usage.get("count", 0)) >= int(ai_cfg.get("max_calls_per_day", 30)):
+            return []
+        # 묶음 호출은 호출 1회 기본 비용 + 종목당 추가 비용으로 추정한다.
+        estimated_cost_krw = int(getattr(Config, "MARKET_INTEL_AI_CALL_COST_KRW", 100)) + int(
+            getattr(Config, "MARKET_INTEL_AI_BATCH_ITEM_COST_KRW", 25)
+        ) * (len(allowed) - 1)
+        if int(usage.get("cost_krw", 0)) + estimated_cost_krw > int(ai_cfg.get("daily_budget_krw", 1000)):
+            return []
         usage["count"] = int(usage.get("count", 0)) + 1
-        usage["cost_krw"] = int(usage.get("cost_krw", 0)) + int(estimated_cost_krw)
-        by_symbol[code] = int(by_symbol.get(code, 0)) + 1
-        return True
-    def _rules_based_ai_fallback(self, code: str, info: Dict[str, Any], reason: str = "", error: str = "") -> Dict[str, Any]:
+        usage["cost_krw"] = int(usage.get("cost_krw", 0)) + estimated_cost_krw
+        for code in allowed:
+            by_symbol[code] = int(by_symbol.get(code, 0)) + 1
+        return allowed
+    def _rules_based_ai_fallback(
+        self, code: str, info: Dict[str, Any], reason: str = "", error: str = "", policy: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         state = self._ensure_market_intel_state(info)
-        policy = self._resolve_market_intel_policy(code, info)
+        if policy is None:
+            policy = self._resolve_market_intel_policy(code, info)
         news_score = float(state.get("news_score", 0.0) or 0.0)
         stance = "bullish" if news_score >= 60 else "bearish" if news_score <= -60 else "neutral"
         summary = self._build_briefing_summary(code, info)
@@ -581,19 +619,19 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
             "reason": reason,
             "source": "rules",
         }
-    def _maybe_run_ai_summary(self, code: str, info: Dict[str, Any], reason: str = "") -> Dict[str, Any]:
+    def _ai_summary_scheduler_safe(self) -> AISummaryScheduler:
+        scheduler = getattr(self, "_ai_summary_scheduler", None)
+        if scheduler is None:
+            scheduler = AISummaryScheduler(
+                window_ms=int(getattr(Config, "MARKET_INTEL_AI_BATCH_WINDOW_MS", 1500)),
+                max_batch=int(getattr(Config, "MARKET_INTEL_AI_BATCH_MAX", 8)),
+                cache_ttl_sec=float(getattr(Config, "MARKET_INTEL_AI_CACHE_TTL_SEC", 6 * 3600)),
+            )
+            self._ai_summary_scheduler = scheduler
+        return scheduler
+    def _ai_summary_prompt(self, code: str, info: Dict[str, Any], reason: str = "") -> str:
         state = self._ensure_market_intel_state(info)
-        ai_cfg = self._market_intelligence_config().get("ai", {})
-        if not bool(ai_cfg.get("enabled", False)):
-            summary = self._rules_based_ai_fallback(code, info, reason=reason)
-            state["ai_summary"] = summary
-            return summary
-        if not self._consume_ai_budget(code):
-            summary = self._rules_based_ai_fallback(code, info, reason=reason, error="budget_exceeded")
-            state["ai_summary"] = summary
-            return summary
-        provider = AIProvider(provider=str(ai_cfg.get("provider", "gemini")), api_key=self._market_api_credentials().get("ai_api_key", ""))
-        prompt = (
+        return (
             f"종목: {info.get('name', code)} ({code})\n"
             f"뉴스 점수: {state.get('news_score', 0)}\n"
             f"공시 리스크: {state.get('dart_risk_level', 'normal')}\n"
@@ -601,30 +639,153 @@ class MarketIntelScoringPolicyMixin(TraderMixinBase):
             f"매크로 레짐: {state.get('macro_regime', 'neutral')}\n"
             f"헤드라인: {[item.get('title', '') for item in state.get('news_headlines', [])[:5]]}\n"
             f"공시: {[item.get('title', '') for item in state.get('dart_events', [])[:5]]}\n"
+            f"키워드: {self._market_intel_keyword_highlights(state, limit=10)}\n"
             f"사유: {reason}\n"
         )
-        try:
-            summary = provider.summarize_event(prompt, str(ai_cfg.get("model", "gemini-2.5-flash-lite")))
-            if not isinstance(summary, dict):
-                raise RuntimeError("invalid_ai_payload")
-            normalized = {
-                "summary": str(summary.get("summary", "") or self._build_briefing_summary(code, info)),
-                "stance": str(summary.get("stance", "neutral") or "neutral"),
-                "risk_tags": list(summary.get("risk_tags", []) or []),
-                "confidence": float(summary.get("confidence", 0.5) or 0.5),
-                "action_hint": str(summary.get("action_hint", "watch_only") or "watch_only"),
-                "reason": reason,
-                "source": str(ai_cfg.get("provider", "gemini")),
-            }
-            state["ai_summary"] = normalized
-            self._set_market_intel_source_status("ai", "fresh")
-            state.setdefault("sources", {}).setdefault("ai", {})
-            state["sources"]["ai"].update({"status": "ok_with_data", "updated_at": datetime.datetime.now(), "error": ""})
-            return normalized
-        except Exception as exc:
-            self._set_market_intel_source_status("ai", "error", error=str(exc))
-            summary = self._rules_based_ai_fallback(code, info, reason=reason, error=str(exc))
+    def _normalize_ai_summary(self, code: str, info: Dict[str, Any], summary: Dict[str, Any], reason: str = "") -> Dict[str, Any]:
+        return {
+            "summary": str(summary.get("summary", "") or self._build_briefing_summary(code, info)),
+            "stance": str(summary.get("stance", "neutral") or "neutral"),
+            "risk_tags": list(summary.get("risk_tags", []) or []),
+            "confidence": float(summary.get("confidence", 0.5) or 0.5),
+            "action_hint": str(summary.get("action_hint", "watch_only") or "watch_only"),
+            "reason": reason,
+            "source": str(self._market_intelligence_config().get("ai", {}).get("provider", "gemini")),
+        }
+    def _apply_ai_summary(
+        self, code: str, info: Dict[str, Any], summary: Dict[str, Any], error: str = "", story_key: str = ""
+    ):
+        """Store a summary that arrived after the payload was applied and re-resolve the policy.
+
+        `story_key` is marked as summarized only when the summary succeeded, so a
+        failed or budget-blocked story is retried on the next trigger.
+        """
+        state = self._ensure_market_intel_state(info)
+        state["ai_summary"] = summary
+        if story_key and not error:
+            state["ai_story_key"] = story_key
+        state.setdefault("sources", {}).setdefault("ai", {})
+        state["sources"]["ai"].update(
+            {"status": "error" if error else "ok_with_data", "updated_at": datetime.datetime.now(), "error": error}
+        )
+        state.update(self._resolve_market_intel_policy(code, info))
+        dirty_codes = getattr(self, "_market_intel_dirty_codes", None)
+        if isinstance(dirty_codes, set):
+            dirty_codes.add(code)
+    def _maybe_run_ai_summary(
+        self, code: str, info: Dict[str, Any], reason: str = "", story_key: str = ""
+    ) -> Dict[str, Any]:
+        """Summary for `code` now: cached answer, or the current one while a batched call is queued."""
+        state = self._ensure_market_intel_state(info)
+        ai_cfg = self._market_intelligence_config().get("ai", {})
+        if not bool(ai_cfg.get("enabled", False)):
+            summary = self._rules_based_ai_fallback(code, info, reason=reason)
             state["ai_summary"] = summary
-            state.setdefault("sources", {}).setdefault("ai", {})
-            state["sources"]["ai"].update({"status": "error", "updated_at": datetime.datetime.now(), "error": str(exc)})
             return summary
+        scheduler = self._ai_summary_scheduler_safe()
+        key = summary_content_key(
+            code,
+            [str(item.get("title", "") or "") for item in state.get("news_headlines", []) if isinstance(item, dict)],
+            [str(item.get("title", "") or "") for item in state.get("dart_events", []) if isinstance(item, dict)],
+        )
+        cached = scheduler.cached(key)
+        if cached is not None:
+            cached["reason"] = reason
+            state["ai_summary"] = cached
+            if story_key:
+                state["ai_story_key"] = story_key
+            return cached
+        scheduler.enqueue(code, key, self._ai_summary_prompt(code, info, reason), reason, story_key=story_key)
+        self._schedule_ai_summary_flush()
+        current = state.get("ai_summary")
+        if isinstance(current, dict) and current:
+            return current
+        summary = self._rules_based_ai_fallback(code, info, reason=reason)
+        state["ai_summary"] = summary
+        return summary
+    def _schedule_ai_summary_flush(self):
+        scheduler = self._ai_summary_scheduler_safe()
+        if scheduler.flush_armed or scheduler.in_flight or not len(scheduler):
+            return
+        scheduler.flush_armed = True
+        if hasattr(self, "threadpool"):
+            # 같은 갱신 주기에 트리거된 종목을 창(window_ms) 동안 모아 한 번에 요청한다.
+            QTimer.singleShot(scheduler.window_ms, self._flush_ai_summary_batch)
+        else:
+            self._flush_ai_summary_batch()
+    def _flush_ai_summary_batch(self):
+        scheduler = self._ai_summary_scheduler_safe()
+        scheduler.flush_armed = False
+        if scheduler.in_flight:
+            return
+        batch = scheduler.drain()
+        requests: List[Dict[str, Any]] = []
+        for request in batch:
+            info = self._market_intel_entity(request["code"])
+            if not info:
+                continue
+            cached = scheduler.cached(request["key"])
+            if cached is not None:
+                cached["reason"] = request["reason"]
+                self._apply_ai_summary(request["code"], info, cached, story_key=request.get("story_key", ""))
+            else:
+                requests.append(request)
+        allowed = set(self._consume_ai_batch_budget([request["code"] for request in requests])) if requests else set()
+        for request in [request for request in requests if request["code"] not in allowed]:
+            info = self._market_intel_entity(request["code"])
+            fallback = self._rules_based_ai_fallback(request["code"], info, reason=request["reason"], error="budget_exceeded")
+            self._apply_ai_summary(request["code"], info, fallback)
+        requests = [request for request in requests if request["code"] in allowed]
+        if not requests:
+            scheduler.finish()
+            self._schedule_ai_summary_flush()
+            return
+        ai_cfg = self._market_intelligence_config().get("ai", {})
+        provider = AIProvider(provider=str(ai_cfg.get("provider", "gemini")), api_key=self._market_api_credentials().get("ai_api_key", ""))
+        model = str(ai_cfg.get("model", "gemini-2.5-flash-lite"))
+        timeout = float(ai_cfg.get("timeout_sec", getattr(Config, "MARKET_INTEL_AI_TIMEOUT_SEC", 20)))
+        prompt = build_batch_prompt(requests)
+        if hasattr(self, "threadpool"):
+            from app.support.worker import Worker
+
+            worker = Worker(provider.summarize_batch, prompt, model, timeout=timeout)
+            worker.signals.result.connect(lambda payload, batch=requests: self._on_ai_summary_batch_result(batch, payload))
+            worker.signals.error.connect(lambda error, batch=requests: self._on_ai_summary_batch_error(batch, error))
+            self.threadpool.start(worker)
+            return
+        try:
+            payload = provider.summarize_batch(prompt, model, timeout=timeout)
+        except Exception as exc:
+            self._on_ai_summary_batch_error(requests, exc)
+            return
+        self._on_ai_summary_batch_result(requests, payload)
+    def _on_ai_summary_batch_result(self, requests: List[Dict[str, Any]], payload: Any):
+        scheduler = self._ai_summary_scheduler_safe()
+        scheduler.finish()
+        by_code = split_batch_result(payload)
+        if len(requests) == 1 and not by_code and isinstance(payload, dict) and "summary" in payload:
+            by_code = {requests[0]["code"]: payload}
+        for request in requests:
+            code = request["code"]
+            info = self._market_intel_entity(code)
+            if not info:
+                continue
+            raw = by_code.get(code)
+            if not isinstance(raw, dict):
+                fallback = self._rules_based_ai_fallback(code, info, reason=request["reason"], error="missing_in_batch")
+                self._apply_ai_summary(code, info, fallback, error="missing_in_batch")
+                continue
+            summary = self._normalize_ai_summary(code, info, raw, request["reason"])
+            scheduler.store(request["key"], summary)
+            self._apply_ai_summary(code, info, summary, story_key=request.get("story_key", ""))
+        self._set_market_intel_source_status("ai", "fresh")
+        self._schedule_ai_summary_flush()
+    def _on_ai_summary_batch_error(self, requests: List[Dict[str, Any]], error: Exception):
+        self._ai_summary_scheduler_safe().finish()
+        self._set_market_intel_source_status("ai", "error", error=str(error))
+        for request in requests:
+            info = self._market_intel_entity(request["code"])
+            if info:
+                fallback = self._rules_based_ai_fallback(request["code"], info, reason=request["reason"], error=str(error))
+                self._apply_ai_summary(request["code"], info, fallback, error=str(error))
+        self._schedule_ai_summary_flush()
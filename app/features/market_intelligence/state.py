@@ -31,6 +31,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from app.support.keyword_matcher import KeywordMatcher
+from app.support.near_duplicate import NearDuplicateIndex
 from app.support.ui_text import (
     AI_PROVIDER_CHOICES,
     REPLAY_AUDIT_CHOICES,
@@ -54,10 +56,14 @@ from app.support.ui_text import (
 )
 from app.support.widgets import NoScrollComboBox, NoScrollSpinBox
 from config import Config
-from data.providers import AIProvider, DartProvider, MacroProvider, NaverTrendProvider, NewsProvider
+from data.providers import AIProvider, DartProvider, MacroProvider, NaverTrendProvider, NewsProvider, provider_http_client
 from app.mixins._typing import TraderMixinBase
 
 
+class _MergedIntelState(dict):
+    """A per-symbol state dict that has already been merged with the defaults."""
+
+
 class MarketIntelStateMixin(TraderMixinBase):
     MARKET_INTEL_SOURCE_NAMES = ("news", "dart", "datalab", "macro", "ai")
     @staticmethod
@@ -99,10 +105,14 @@ class MarketIntelStateMixin(TraderMixinBase):
         return copy.deepcopy(getattr(Config, "DEFAULT_MARKET_INTEL_STATE", {}))
     def _ensure_market_intel_state(self, info: Dict[str, Any]) -> Dict[str, Any]:
         state = info.get("market_intel")
+        # 한 번 병합한 상태는 그대로 돌려준다: 호출마다 새 사본으로 바꾸면 앞서 받아 둔
+        # 참조에 쓴 값(정책 등)이 info에서 사라지고, 매번 전체를 deepcopy하게 된다.
+        if type(state) is _MergedIntelState:
+            return state
         if not isinstance(state, dict):
-            state = self._default_market_intel_state()
+            state = _MergedIntelState(self._default_market_intel_state())
         else:
-            state = self._deep_merge_dict(self._default_market_intel_state(), state)
+            state = _MergedIntelState(self._deep_merge_dict(self._default_market_intel_state(), state))
         info["market_intel"] = state
         return state
     def _ensure_market_intel_sources(self) -> Dict[str, Dict[str, Any]]:
@@ -122,12 +132,19 @@ class MarketIntelStateMixin(TraderMixinBase):
         sources[source]["status"] = str(status or "idle")
         sources[source]["error"] = str(error or "")
         sources[source]["updated_at"] = datetime.datetime.now()
+        http_stats = provider_http_client().stats().get(source, {})
+        sources[source]["http"] = http_stats
         label = getattr(self, f"lbl_market_source_{source}", None)
         if label is not None:
             text = f"{display_source_name(source)}: {display_status(sources[source]['status'])}"
             if error:
                 text = f"{text} ({error})"
             label.setText(text)
+            if http_stats.get("requests"):
+                label.setToolTip(
+                    f"HTTP 캐시 적중률 {float(http_stats['hit_rate']) * 100:.0f}% "
+                    f"({int(http_stats['requests'])}건), 평균 응답 {float(http_stats['avg_latency_ms']):.0f}ms"
+                )
     @staticmethod
     def _clean_text(value: Any) -> str:
         text = html.unescape(str(value or ""))
@@ -233,6 +250,43 @@ class MarketIntelStateMixin(TraderMixinBase):
                 seen.add(key)
                 aliases.append(normalized)
         return aliases[:4]
+    def _market_keyword_matcher(self) -> KeywordMatcher:
+        """One matcher over the sentiment/risk/event dictionaries, rebuilt only when a set is replaced or resized."""
+        sources = {
+            "positive": getattr(Config, "MARKET_INTELLIGENCE_POSITIVE_KEYWORDS", set()),
+            "negative": getattr(Config, "MARKET_INTELLIGENCE_NEGATIVE_KEYWORDS", set()),
+            "high_risk": getattr(Config, "MARKET_INTELLIGENCE_HIGH_RISK_KEYWORDS", set()),
+        }
+        for event_type, keywords in dict(getattr(Config, "MARKET_INTELLIGENCE_EVENT_KEYWORDS", {}) or {}).items():
+            sources[f"event:{event_type}"] = keywords
+        generation = tuple((name, id(keywords), len(keywords)) for name, keywords in sources.items())
+        cached = getattr(self, "_market_keyword_matcher_cache", None)
+        if not cached or cached[0] != generation:
+            cached = (generation, KeywordMatcher(sources))
+            self._market_keyword_matcher_cache = cached
+        return cached[1]
+    def _news_story_index(self) -> NearDuplicateIndex:
+        """Near-duplicate headline clusters shared across codes and queries."""
+        index = getattr(self, "_market_news_story_index", None)
+        if index is None:
+            index = NearDuplicateIndex(
+                window_sec=float(getattr(Config, "MARKET_INTEL_NEWS_DEDUP_WINDOW_SEC", 6 * 3600)),
+                threshold=float(getattr(Config, "MARKET_INTEL_NEWS_DEDUP_THRESHOLD", 0.6)),
+            )
+            self._market_news_story_index = index
+        return index
+    def _symbol_alias_matcher(self, info: Dict[str, Any], code: str) -> KeywordMatcher:
+        extra = info.get("aliases", [])
+        generation = (str(info.get("name", code) or code), tuple(extra) if isinstance(extra, list) else ())
+        matchers = getattr(self, "_market_alias_matchers", None)
+        if not isinstance(matchers, dict):
+            matchers = {}
+            self._market_alias_matchers = matchers
+        cached = matchers.get(code)
+        if not cached or cached[0] != generation:
+            cached = (generation, KeywordMatcher({"alias": self._symbol_aliases(info, code)}))
+            matchers[code] = cached
+        return cached[1]
     def _news_queries_for_symbol(self, info: Dict[str, Any], code: str) -> List[str]:
         aliases = [alias for alias in self._symbol_aliases(info, code) if not alias.isdigit()]
         return aliases[:2] or [str(info.get("name", code) or code)]
@@ -248,23 +302,18 @@ class MarketIntelStateMixin(TraderMixinBase):
             return datetime.datetime.fromtimestamp(ts, tz=dt.tzinfo).isoformat()
         return ""
     def _news_relevance_score(self, info: Dict[str, Any], code: str, title: str, description: str) -> float:
-        combined = f"{title} {description}".lower()
-        aliases = self._symbol_aliases(info, code)
-        if not aliases:
+        matcher = self._symbol_alias_matcher(info, code)
+        if not len(matcher):
             return 0.0
-        matched = 0
-        for alias in aliases:
-            alias_norm = alias.lower()
-            if alias_norm and alias_norm in combined:
-                matched += 1
+        matched = len({hit.keyword for hit in matcher.find(f"{title} {description}")})
         if matched <= 0:
             return 0.0
         return min(1.0, 0.35 + matched * 0.25)
-    def _classify_disclosure_event(self, title: str) -> str:
-        lowered = str(title or "").lower()
+    def _classify_disclosure_event(self, title: str, matched: Optional[Dict[str, List[str]]] = None) -> str:
+        if matched is None:
+            matched = self._market_keyword_matcher().categories(str(title or ""))
         for event_type in ("funding", "governance", "halt", "earnings", "contract", "correction"):
-            keywords = getattr(Config, "MARKET_INTELLIGENCE_EVENT_KEYWORDS", {}).get(event_type, set())
-            if any(str(keyword).lower() in lowered for keyword in keywords):
+            if matched.get(f"event:{event_type}"):
                 return event_type
         return "general"
     @staticmethod
@@ -31,6 +31,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from app.support.jsonl_tail import JsonlTailReader
 from app.support.ui_text import (
     AI_PROVIDER_CHOICES,
     REPLAY_AUDIT_CHOICES,
@@ -54,6 +55,7 @@ from app.support.ui_text import (
 )
 from app.support.widgets import NoScrollComboBox, NoScrollSpinBox
 from config import Config
+from data.intel_store import IntelStore
 from data.providers import AIProvider, DartProvider, MacroProvider, NaverTrendProvider, NewsProvider
 from app.mixins._typing import TraderMixinBase
 
@@ -204,28 +206,88 @@ class MarketIntelViewsMixin(TraderMixinBase):
             return datetime.datetime.fromisoformat(text)
         except ValueError:
             return None
+    def _jsonl_tail_reader(self, path_value: Any) -> Optional[JsonlTailReader]:
+        text = str(path_value or "").strip()
+        if not text:
+            return None
+        readers = getattr(self, "_jsonl_tail_readers", None)
+        if not isinstance(readers, dict):
+            readers = {}
+            self._jsonl_tail_readers = readers
+        path = str(Path(text).expanduser())
+        reader = readers.get(path)
+        if reader is None:
+            reader = JsonlTailReader(path)
+            readers[path] = reader
+        return reader
     def _read_jsonl_tail_records(self, path_value: Any, limit: int = 200) -> List[Dict[str, Any]]:
-        path = Path(str(path_value or "")).expanduser()
-        if not path.exists():
-            return []
-        tail = deque(maxlen=max(1, int(limit)))
-        try:
-            with path.open("r", encoding="utf-8") as handle:
-                for line in handle:
-                    text = str(line or "").strip()
-                    if text:
-                        tail.append(text)
-        except Exception:
-            return []
-        records: List[Dict[str, Any]] = []
-        for text in tail:
-            try:
-                record = json.loads(text)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(record, dict):
-                records.append(record)
-        return records
+        reader = self._jsonl_tail_reader(path_value)
+        return reader.records(limit) if reader is not None else []
+    def _market_replay_source_records(
+        self,
+        path_value: Any,
+        tail_records: List[Dict[str, Any]],
+        filters: Dict[str, Any],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Tail records, plus older records from the sidecar index when the filter is an exact symbol."""
+        symbol = str(filters.get("symbol_filter", "") or "")
+        reader = self._jsonl_tail_reader(path_value)
+        if not symbol or reader is None:
+            return tail_records
+        if not reader.index_ready():
+            # 첫 색인은 백그라운드에서 만들고, 그동안은 꼬리 기록만 보여준다.
+            reader.build_index_async()
+            return tail_records
+        if not reader.has_symbol(symbol):
+            return tail_records
+        return self._merge_market_replay_records(reader.symbol_records(symbol, limit=limit), tail_records, {symbol})
+    @staticmethod
+    def _merge_market_replay_records(
+        indexed: List[Dict[str, Any]],
+        recent: List[Dict[str, Any]],
+        symbols: set,
+    ) -> List[Dict[str, Any]]:
+        """Indexed symbol matches plus recent rows of other symbols (text filters still apply), in time order."""
+        merged = list(indexed)
+        merged.extend(record for record in recent if str(record.get("symbol", "") or "") not in symbols)
+        merged.sort(key=lambda record: str(record.get("ts", "") or ""))
+        return merged
+    def _market_replay_store_sources(
+        self,
+        store: Any,
+        raw_event_records: List[Dict[str, Any]],
+        raw_audit_records: List[Dict[str, Any]],
+        filters: Dict[str, Any],
+        limit: int,
+    ) -> tuple:
+        """Push the exact parts of the replay filters (scope, symbol, allowed) down to indexed queries."""
+        symbol = str(filters.get("symbol_filter", "") or "")
+        scope = str(filters.get("scope_filter", "all") or "all")
+        audit_filter = str(filters.get("audit_filter", "all") or "all")
+        symbols = {symbol, symbol.upper()} if symbol else set()
+        scopes = [scope] if scope != "all" else None
+        allowed = {"allowed": True, "blocked": False}.get(audit_filter)
+
+        event_source = raw_event_records
+        if scopes:
+            event_source = store.query_events(scopes=scopes, limit=limit)
+        if symbols:
+            indexed = store.query_events(scopes=scopes, symbols=sorted(symbols), limit=limit)
+            if indexed:
+                event_source = self._merge_market_replay_records(indexed, event_source, symbols)
+
+        audit_source = raw_audit_records
+        if allowed is not None:
+            audit_source = store.query_audits(allowed=allowed, limit=limit)
+        if symbols:
+            indexed = store.query_audits(symbols=sorted(symbols), allowed=allowed, limit=limit)
+            if indexed:
+                audit_source = self._merge_market_replay_records(indexed, audit_source, symbols)
+        return event_source, audit_source
+    def _save_jsonl_tail_indexes(self):
+        for reader in dict(getattr(self, "_jsonl_tail_readers", {}) or {}).values():
+            reader.save_index()
     def _collect_market_replay_scope_state(self, event_records: List[Dict[str, Any]]) -> Dict[str, Any]:
         market_mode = "unknown"
         portfolio_budget_scale = 1.0
@@ -403,10 +465,24 @@ class MarketIntelViewsMixin(TraderMixinBase):
             return
         filters = self._market_replay_filters()
         scan_limit = max(300, int(filters.get("limit", 100)) * 5)
-        raw_event_records = self._read_jsonl_tail_records(getattr(Config, "MARKET_INTELLIGENCE_EVENTS_FILE", ""), limit=scan_limit)
-        raw_audit_records = self._read_jsonl_tail_records(getattr(Config, "MARKET_INTELLIGENCE_DECISION_AUDIT_FILE", ""), limit=scan_limit)
-        event_records = self._filter_market_replay_event_records(raw_event_records, filters)
-        audit_records = self._filter_market_replay_audit_records(raw_audit_records, filters)
+        event_path = getattr(Config, "MARKET_INTELLIGENCE_EVENTS_FILE", "")
+        audit_path = getattr(Config, "MARKET_INTELLIGENCE_DECISION_AUDIT_FILE", "")
+        # 기록기는 flush 주기마다 내려쓰므로 UI를 막고 기다리지 않고 이미 기록된 줄만 읽는다.
+        store_getter = getattr(self, "_intel_store_safe", None)
+        store = store_getter() if callable(store_getter) else None
+        if isinstance(store, IntelStore):
+            raw_event_records = store.query_events(limit=scan_limit)
+            raw_audit_records = store.query_audits(limit=scan_limit)
+            event_source, audit_source = self._market_replay_store_sources(
+                store, raw_event_records, raw_audit_records, filters, scan_limit
+            )
+        else:
+            raw_event_records = self._read_jsonl_tail_records(event_path, limit=scan_limit)
+            raw_audit_records = self._read_jsonl_tail_records(audit_path, limit=scan_limit)
+            event_source = self._market_replay_source_records(event_path, raw_event_records, filters, scan_limit)
+            audit_source = self._market_replay_source_records(audit_path, raw_audit_records, filters, scan_limit)
+        event_records = self._filter_market_replay_event_records(event_source, filters)
+        audit_records = self._filter_market_replay_audit_records(audit_source, filters)
         self._market_replay_event_records = event_records
         self._market_replay_audit_records = audit_records
         self._market_replay_event_row_to_index = {}
@@ -0,0 +1,403 @@
+"""Pending-order book: order-number/code index with incremental aggregates."""
+
+import datetime
+import logging
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class OrderTransition:
+    """A state change of one child order (`scope="child"`) or a whole pending entry (`scope="order"`)."""
+
+    code: str
+    scope: str
+    previous: str
+    state: str
+    order_no: str = ""
+    remaining_qty: int = 0
+    at: datetime.datetime = field(default_factory=datetime.datetime.now)
+
+
+TransitionListener = Callable[[OrderTransition], None]
+
+# (submitted, filled, remaining, expected_price, state)
+_Contribution = Tuple[int, int, int, int, str]
+
+
+def _state_of(row: Dict[str, Any]) -> str:
+    return str(row.get("state", "submitted") or "submitted").lower()
+
+
+def _contribution(child: Dict[str, Any]) -> _Contribution:
+    return (
+        max(0, int(child.get("submitted_qty", 0) or 0)),
+        max(0, int(child.get("filled_qty", 0) or 0)),
+        max(0, int(child.get("remaining_qty", 0) or 0)),
+        max(0, int(child.get("expected_price", 0) or 0)),
+        _state_of(child),
+    )
+
+
+class _BookEntry:
+    __slots__ = (
+        "pending",
+        "children",
+        "child_count",
+        "contrib",
+        "submitted",
+        "filled",
+        "remaining",
+        "expected_notional",
+        "active",
+        "filled_children",
+        "terminal",
+        "state",
+        "order_nos",
+        "cursor",
+    )
+
+    def __init__(self, pending: Dict[str, Any], children: List[Dict[str, Any]]):
+        self.pending = pending
+        self.children = children
+        self.child_count = len(children)
+        self.contrib: Dict[int, _Contribution] = {}
+        self.submitted = 0
+        self.filled = 0
+        self.remaining = 0
+        self.expected_notional = 0
+        self.active = 0
+        self.filled_children = 0
+        self.terminal: Counter = Counter()
+        self.state = _state_of(pending)
+        self.order_nos: Set[str] = set()
+        # Children before `cursor` are settled, so FIFO fill allocation skips them.
+        self.cursor = 0
+
+
+class PendingOrderBook:
+    """Indexes pending orders by order number and by code.
+
+    The book does not own the pending dicts: it references the same
+    `_pending_order_state[code]` entries and their `child_orders` rows, keeps
+    running totals per code and adjusts them by the delta of each child update,
+    so fills and cancels cost O(1) instead of a rescan of every child order.
+    """
+
+    def __init__(
+        self,
+        active_states: Iterable[str] = ("submitted", "partial"),
+        terminal_states: Iterable[str] = ("filled", "cancelled", "rejected", "sync_failed"),
+        history_size: int = 256,
+    ):
+        self.active_states: Set[str] = {str(state).lower() for state in active_states}
+        self.terminal_states: Set[str] = {str(state).lower() for state in terminal_states}
+        self.logger = logging.getLogger("PendingOrderBook")
+        self._entries: Dict[str, _BookEntry] = {}
+        self._by_order_no: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._listeners: List[TransitionListener] = []
+        self.transitions: Deque[OrderTransition] = deque(maxlen=max(1, int(history_size)))
+        self.reindex_count = 0
+        self.index_misses = 0
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+    def add_listener(self, listener: TransitionListener):
+        if callable(listener) and listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: TransitionListener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _emit(self, transition: OrderTransition):
+        self.transitions.append(transition)
+        for listener in list(self._listeners):
+            try:
+                listener(transition)
+            except Exception as exc:
+                self.logger.warning(f"order transition listener failed: {exc}")
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _children_of(pending: Dict[str, Any]) -> List[Dict[str, Any]]:
+        rows = pending.get("child_orders") if isinstance(pending, dict) else None
+        return rows if isinstance(rows, list) else []
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def track(self, code: str, pending: Dict[str, Any]):
+        """(Re)index one pending entry; this is the only O(children) path."""
+        self._unindex(code)
+        children = self._children_of(pending)
+        entry = _BookEntry(pending, children)
+        self._entries[code] = entry
+        for child in children:
+            if not isinstance(child, dict):
+                continue
+            self._add_contribution(entry, child, _contribution(child))
+            order_no = str(child.get("order_no", "") or "").strip()
+            if order_no:
+                self._by_order_no[order_no] = (code, child)
+                entry.order_nos.add(order_no)
+        if not entry.contrib:
+            order_no = str(pending.get("order_no", "") or "").strip()
+            if order_no:
+                self._by_order_no[order_no] = (code, pending)
+                entry.order_nos.add(order_no)
+        entry.state = self._aggregate_state(entry)
+        self.reindex_count += 1
+
+    def ensure(self, code: str, pending: Dict[str, Any]) -> bool:
+        """Index `pending` if it was replaced or its child list changed outside the book."""
+        entry = self._entries.get(code)
+        children = self._children_of(pending)
+        if (
+            entry is None
+            or entry.pending is not pending
+            or entry.children is not children
+            or entry.child_count != len(children)
+        ):
+            self.track(code, pending)
+            return True
+        return False
+
+    def _unindex(self, code: str):
+        entry = self._entries.pop(code, None)
+        if entry is None:
+            return
+        for order_no in entry.order_nos:
+            hit = self._by_order_no.get(order_no)
+            if hit is not None and hit[0] == code:
+                self._by_order_no.pop(order_no, None)
+
+    def discard(self, code: str, final_state: str = ""):
+        entry = self._entries.get(code)
+        if entry is None:
+            return
+        state_text = str(final_state or "").lower()
+        if state_text and state_text != entry.state:
+            self._emit(
+                OrderTransition(
+                    code=code,
+                    scope="order",
+                    previous=entry.state,
+                    state=state_text,
+                    order_no=str(entry.pending.get("order_no", "") or ""),
+                    remaining_qty=0,
+                )
+            )
+        self._unindex(code)
+
+    def clear(self):
+        self._entries.clear()
+        self._by_order_no.clear()
+
+    def codes(self) -> List[str]:
+        return list(self._entries)
+
+    def active_codes(self) -> List[str]:
+        return [code for code, entry in self._entries.items() if entry.state in self.active_states]
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def find(self, order_no: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return `(code, row)` for an order number; `row` is a child or a child-less pending entry."""
+        key = str(order_no or "").strip()
+        if not key:
+            return None
+        hit = self._by_order_no.get(key)
+        if hit is None:
+            return None
+        code, row = hit
+        entry = self._entries.get(code)
+        if entry is None or str(row.get("order_no", "") or "").strip() != key:
+            self._by_order_no.pop(key, None)
+            self.index_misses += 1
+            return None
+        return hit
+
+    def child_for(self, code: str, order_no: str = "", *, allow_unbound: bool = True) -> Optional[Dict[str, Any]]:
+        """Child order of `code` matching `order_no`.
+
+        With `allow_unbound` the first child still waiting for its order number
+        (or the first child, when no number is given) is returned as a fallback.
+        """
+        entry = self._entries.get(code)
+        if entry is None:
+            return None
+        key = str(order_no or "").strip()
+        if key:
+            hit = self.find(key)
+            if hit is not None and hit[0] == code and hit[1] is not entry.pending:
+                return hit[1]
+        if not allow_unbound:
+            return None
+        for child in entry.children:
+            if not isinstance(child, dict):
+                continue
+            if not key or not str(child.get("order_no", "") or "").strip():
+                return child
+        return None
+
+    def bind_order_no(self, code: str, row: Dict[str, Any], order_no: str):
+        key = str(order_no or "").strip()
+        entry = self._entries.get(code)
+        if not key or entry is None:
+            return
+        row["order_no"] = key
+        self._by_order_no[key] = (code, row)
+        entry.order_nos.add(key)
+
+    # ------------------------------------------------------------------
+    # Incremental aggregates
+    # ------------------------------------------------------------------
+    def _add_contribution(self, entry: _BookEntry, child: Dict[str, Any], contrib: _Contribution, sign: int = 1):
+        submitted, filled, remaining, expected, state = contrib
+        entry.submitted += sign * submitted
+        entry.filled += sign * filled
+        entry.remaining += sign * remaining
+        entry.expected_notional += sign * expected * submitted
+        if state in self.active_states:
+            entry.active += sign
+        if filled > 0:
+            entry.filled_children += sign
+        if state in self.terminal_states:
+            entry.terminal[state] += sign
+            if entry.terminal[state] <= 0:
+                del entry.terminal[state]
+        if sign > 0:
+            entry.contrib[id(child)] = contrib
+        else:
+            entry.contrib.pop(id(child), None)
+
+    def update_child(self, code: str, child: Dict[str, Any], **changes: Any) -> Tuple[str, int]:
+        """Apply `changes` to one child and adjust its code's totals by the delta."""
+        entry = self._entries.get(code)
+        if entry is None:
+            child.update(changes)
+            return _state_of(child), max(0, int(child.get("remaining_qty", 0) or 0))
+
+        previous = entry.contrib.get(id(child))
+        if previous is not None:
+            self._add_contribution(entry, child, previous, sign=-1)
+        child.update(changes)
+        current = _contribution(child)
+        self._add_contribution(entry, child, current)
+
+        if current[4] in self.active_states and (previous is None or previous[4] not in self.active_states):
+            entry.cursor = 0
+        if previous is not None and previous[4] != current[4]:
+            self._emit(
+                OrderTransition(
+                    code=code,
+                    scope="child",
+                    previous=previous[4],
+                    state=current[4],
+                    order_no=str(child.get("order_no", "") or ""),
+                    remaining_qty=current[2],
+                )
+            )
+        return current[4], current[2]
+
+    def active_children(self, code: str) -> Iterator[Dict[str, Any]]:
+        """Yield active children with quantity left, in submission order."""
+        entry = self._entries.get(code)
+        if entry is None:
+            return
+        children = entry.children
+        index = entry.cursor
+        while index < len(children):
+            child = children[index]
+            if isinstance(child, dict):
+                contrib = entry.contrib.get(id(child))
+                if contrib is None:
+                    contrib = _contribution(child)
+                if contrib[4] in self.active_states and contrib[2] > 0:
+                    break
+            index += 1
+        entry.cursor = index
+        for child in children[index:]:
+            if not isinstance(child, dict):
+                continue
+            contrib = entry.contrib.get(id(child))
+            if contrib is not None and contrib[4] in self.active_states and contrib[2] > 0:
+                yield child
+
+    def _aggregate_state(self, entry: _BookEntry) -> str:
+        if entry.contrib:
+            if entry.active > 0:
+                return "partial" if entry.filled_children > 0 else "submitted"
+            if entry.remaining <= 0 and entry.filled_children > 0:
+                return "filled"
+            for state in ("rejected", "cancelled", "sync_failed"):
+                if entry.terminal.get(state, 0) > 0:
+                    return state
+        return _state_of(entry.pending)
+
+    def set_order_state(self, code: str, state: str):
+        """Record a state written directly on a child-less pending entry."""
+        entry = self._entries.get(code)
+        if entry is None:
+            return
+        self._transition_order(code, entry, str(state or "").lower())
+
+    def _transition_order(self, code: str, entry: _BookEntry, state: str):
+        if not state or state == entry.state:
+            return
+        previous = entry.state
+        entry.state = state
+        self._emit(
+            OrderTransition(
+                code=code,
+                scope="order",
+                previous=previous,
+                state=state,
+                order_no=str(entry.pending.get("order_no", "") or ""),
+                remaining_qty=max(0, int(entry.pending.get("remaining_qty", 0) or 0)),
+            )
+        )
+
+    def sync_aggregate(self, code: str) -> Tuple[str, int]:
+        """Write the running totals of `code` back onto its pending dict."""
+        entry = self._entries.get(code)
+        if entry is None:
+            return "", 0
+        pending = entry.pending
+        if not entry.contrib:
+            state = _state_of(pending)
+            self._transition_order(code, entry, state)
+            return state, max(0, int(pending.get("remaining_qty", 0) or 0))
+
+        state = self._aggregate_state(entry)
+        pending["submitted_qty"] = entry.submitted
+        pending["filled_qty"] = entry.filled
+        pending["remaining_qty"] = entry.remaining
+        pending["state"] = state
+        pending["expected_price"] = int(round(entry.expected_notional / entry.submitted)) if entry.submitted > 0 else 0
+        for child in entry.children:
+            order_no = str(child.get("order_no", "") or "").strip() if isinstance(child, dict) else ""
+            if order_no:
+                pending["order_no"] = order_no
+                break
+        self._transition_order(code, entry, state)
+        return state, entry.remaining
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "codes": len(self._entries),
+            "active_codes": len(self.active_codes()),
+            "indexed_order_nos": len(self._by_order_no),
+            "reindex_count": self.reindex_count,
+            "index_misses": self.index_misses,
+            "transitions": len(self.transitions),
+        }
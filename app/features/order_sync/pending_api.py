@@ -64,6 +64,8 @@ class OrderSyncPendingApiMixin(TraderMixinBase):
         if final_state and code in self._pending_order_state:
             self._mark_pending_state(code, final_state)
         self._pending_order_state.pop(code, None)
+        self._pending_order_book_safe().discard(code, final_state=final_state)
+        self._journal_pending_safe(code, final_state or "clear")
         self._diag_clear_pending_safe(code)
     def _set_manual_pending_order(
         self,
@@ -13,96 +13,52 @@ from app.mixins._typing import TraderMixinBase
 
 
 class OrderSyncPendingStateMixin(TraderMixinBase):
-    def _refresh_pending_order_aggregate(self, code: str) -> tuple[str, int]:
-        pending = self._pending_order_state.get(code)
-        if not isinstance(pending, dict):
-            return "", 0
-
-        children = self._pending_children(pending)
-        if not children:
-            remaining = max(0, int(pending.get("remaining_qty", 0) or 0))
-            state = str(pending.get("state", "submitted") or "submitted").lower()
-            pending["updated_at"] = datetime.datetime.now()
-            self._diag_touch_safe(
-                code,
-                pending_state=state,
-                pending_remaining=str(remaining),
-                pending_side=str(pending.get("side", "")),
-                pending_reason=str(pending.get("reason", "")),
-                pending_until=pending.get("until"),
-            )
-            return state, remaining
-
-        total_submitted = 0
-        total_filled = 0
-        total_remaining = 0
-        total_expected = 0
-        any_active = False
-        any_filled = False
-        terminal_states: set[str] = set()
-        first_order_no = ""
-
-        for child in children:
-            submitted = max(0, int(child.get("submitted_qty", 0) or 0))
-            filled = max(0, int(child.get("filled_qty", 0) or 0))
-            remaining = max(0, int(child.get("remaining_qty", 0) or 0))
-            expected = max(0, int(child.get("expected_price", 0) or 0))
-            state = str(child.get("state", "submitted") or "submitted").lower()
-            order_no = str(child.get("order_no", "") or "").strip()
-            if order_no and not first_order_no:
-                first_order_no = order_no
-            total_submitted += submitted
-            total_filled += filled
-            total_remaining += remaining
-            total_expected += expected * submitted
-            any_active = any_active or state in self.ACTIVE_PENDING_STATES
-            any_filled = any_filled or filled > 0
-            if state in self.TERMINAL_PENDING_STATES:
-                terminal_states.add(state)
-
-        if any_active:
-            aggregate_state = "partial" if any_filled else "submitted"
-        elif total_remaining <= 0 and any_filled:
-            aggregate_state = "filled"
-        elif "rejected" in terminal_states:
-            aggregate_state = "rejected"
-        elif "cancelled" in terminal_states:
-            aggregate_state = "cancelled"
-        elif "sync_failed" in terminal_states:
-            aggregate_state = "sync_failed"
-        else:
-            aggregate_state = str(pending.get("state", "submitted") or "submitted").lower()
-
-        pending["submitted_qty"] = total_submitted
-        pending["filled_qty"] = total_filled
-        pending["remaining_qty"] = total_remaining
-        pending["state"] = aggregate_state
-        pending["expected_price"] = int(round(total_expected / total_submitted)) if total_submitted > 0 else 0
-        if first_order_no:
-            pending["order_no"] = first_order_no
+    def _publish_pending_aggregate(self, code: str, pending: dict, state: str, remaining: int):
         pending["updated_at"] = datetime.datetime.now()
+        self._journal_pending_safe(code, state)
         self._diag_touch_safe(
             code,
-            pending_state=aggregate_state,
-            pending_remaining=str(total_remaining),
+            pending_state=state,
+            pending_remaining=str(remaining),
             pending_side=str(pending.get("side", "")),
             pending_reason=str(pending.get("reason", "")),
             pending_until=pending.get("until"),
         )
-        return aggregate_state, total_remaining
-    def _mark_pending_state(self, code: str, state: str):
+    def _refresh_pending_order_aggregate(self, code: str) -> tuple[str, int]:
+        """Rebuild the book entry for `code` from its child rows (full reconcile)."""
+        book = self._pending_order_book_safe()
         pending = self._pending_order_state.get(code)
+        if not isinstance(pending, dict):
+            book.discard(code)
+            return "", 0
+        book.track(code, pending)
+        state, remaining = book.sync_aggregate(code)
+        self._publish_pending_aggregate(code, pending, state, remaining)
+        return state, remaining
+    def _sync_pending_order_aggregate(self, code: str) -> tuple[str, int]:
+        """Write the book's running totals for `code` onto its pending dict."""
+        pending = self._pending_book_entry(code)
+        if pending is None:
+            return "", 0
+        state, remaining = self._pending_order_book_safe().sync_aggregate(code)
+        self._publish_pending_aggregate(code, pending, state, remaining)
+        return state, remaining
+    def _mark_pending_state(self, code: str, state: str):
+        pending = self._pending_book_entry(code)
         if not pending:
             return
         state_text = str(state or "").strip().lower()
         if not state_text:
             return
+        book = self._pending_order_book_safe()
+        now = datetime.datetime.now()
         pending["state"] = state_text
         for child in self._pending_children(pending):
             if str(child.get("state", "") or "").lower() in self.ACTIVE_PENDING_STATES:
-                child["state"] = state_text
-                child["updated_at"] = datetime.datetime.now()
-        pending["updated_at"] = datetime.datetime.now()
+                book.update_child(code, child, state=state_text, updated_at=now)
+        book.set_order_state(code, state_text)
+        pending["updated_at"] = now
+        self._journal_pending_safe(code, state_text)
         self._diag_touch_safe(
             code,
             pending_state=state_text,
@@ -112,30 +68,34 @@ class OrderSyncPendingStateMixin(TraderMixinBase):
             pending_until=pending.get("until"),
         )
     def _update_pending_from_order_event(self, code: str, order_no: str, order_qty: int):
-        pending = self._pending_order_state.get(code)
-        if not isinstance(pending, dict):
+        pending = self._pending_book_entry(code)
+        if pending is None:
             return
 
-        child_updated = False
-        for child in self._pending_children(pending):
-            child_order_no = str(child.get("order_no", "") or "").strip()
-            if order_no and child_order_no and child_order_no != order_no:
-                continue
-            if order_no and not child_order_no:
-                child["order_no"] = str(order_no).strip()
-            if order_qty > 0:
-                submitted = int(child.get("submitted_qty", 0) or 0)
-                if submitted <= 0:
-                    child["submitted_qty"] = int(order_qty)
-                    filled = int(child.get("filled_qty", 0) or 0)
-                    child["remaining_qty"] = max(0, int(order_qty) - filled)
-            child["updated_at"] = datetime.datetime.now()
-            child_updated = True
-            if order_no:
-                break
+        book = self._pending_order_book_safe()
+        order_no = str(order_no or "").strip()
+        now = datetime.datetime.now()
+        if order_no:
+            child = book.child_for(code, order_no)
+            targets = [child] if child is not None else []
+        else:
+            targets = self._pending_children(pending)
+
+        for child in targets:
+            if order_no and not str(child.get("order_no", "") or "").strip():
+                book.bind_order_no(code, child, order_no)
+            changes: dict = {"updated_at": now}
+            if order_qty > 0 and int(child.get("submitted_qty", 0) or 0) <= 0:
+                filled = int(child.get("filled_qty", 0) or 0)
+                changes["submitted_qty"] = int(order_qty)
+                changes["remaining_qty"] = max(0, int(order_qty) - filled)
+            book.update_child(code, child, **changes)
 
         if order_no and not str(pending.get("order_no", "")).strip():
-            pending["order_no"] = str(order_no).strip()
+            if self._pending_children(pending):
+                pending["order_no"] = order_no
+            else:
+                book.bind_order_no(code, pending, order_no)
 
         if order_qty > 0:
             submitted = int(pending.get("submitted_qty", 0) or 0)
@@ -144,50 +104,53 @@ class OrderSyncPendingStateMixin(TraderMixinBase):
                 filled = int(pending.get("filled_qty", 0) or 0)
                 pending["remaining_qty"] = max(0, int(order_qty) - filled)
 
-        pending["updated_at"] = datetime.datetime.now()
-        if child_updated:
-            self._refresh_pending_order_aggregate(code)
+        pending["updated_at"] = now
+        if targets:
+            self._sync_pending_order_aggregate(code)
             return
+        self._journal_pending_safe(code, "order_event")
         self._diag_touch_safe(
             code,
             pending_state=str(pending.get("state", "submitted")),
             pending_remaining=str(int(pending.get("remaining_qty", 0) or 0)),
         )
     def _apply_pending_fill(self, code: str, fill_qty: int) -> tuple[str, int, int]:
-        pending = self._pending_order_state.get(code)
-        if not isinstance(pending, dict):
+        pending = self._pending_book_entry(code)
+        if pending is None:
             return "", 0, 0
         qty = max(0, int(fill_qty or 0))
         if qty <= 0:
             return str(pending.get("state", "submitted")), int(pending.get("remaining_qty", 0) or 0), 0
 
-        children = self._pending_children(pending)
-        if children:
+        if self._pending_children(pending):
+            book = self._pending_order_book_safe()
             remaining_fill = qty
             reserved_consumed = 0
-            for child in children:
-                state = str(child.get("state", "submitted") or "submitted").lower()
-                if state not in self.ACTIVE_PENDING_STATES:
-                    continue
+            now = datetime.datetime.now()
+            # Fills are allocated FIFO over the children that still have quantity left.
+            for child in book.active_children(code):
                 child_remaining = max(0, int(child.get("remaining_qty", 0) or 0))
-                if child_remaining <= 0:
-                    continue
                 applied = min(child_remaining, remaining_fill)
                 if applied <= 0:
                     continue
-                child["filled_qty"] = max(0, int(child.get("filled_qty", 0) or 0)) + applied
-                child["remaining_qty"] = max(0, child_remaining - applied)
                 expected = max(0, int(child.get("expected_price", 0) or 0))
                 child_reserved = max(0, int(child.get("reserved_cash", 0) or 0))
                 consume_cash = min(child_reserved, expected * applied) if expected > 0 else 0
-                child["reserved_cash"] = max(0, child_reserved - consume_cash)
                 reserved_consumed += consume_cash
-                child["state"] = "filled" if int(child.get("remaining_qty", 0) or 0) <= 0 else "partial"
-                child["updated_at"] = datetime.datetime.now()
+                left = max(0, child_remaining - applied)
+                book.update_child(
+                    code,
+                    child,
+                    filled_qty=max(0, int(child.get("filled_qty", 0) or 0)) + applied,
+                    remaining_qty=left,
+                    reserved_cash=max(0, child_reserved - consume_cash),
+                    state="filled" if left <= 0 else "partial",
+                    updated_at=now,
+                )
                 remaining_fill -= applied
                 if remaining_fill <= 0:
                     break
-            state_text, remaining_qty = self._refresh_pending_order_aggregate(code)
+            state_text, remaining_qty = self._sync_pending_order_aggregate(code)
             return state_text, remaining_qty, reserved_consumed
 
         submitted = max(0, int(pending.get("submitted_qty", 0) or 0))
@@ -206,6 +169,8 @@ class OrderSyncPendingStateMixin(TraderMixinBase):
         else:
             pending["state"] = "filled"
         pending["updated_at"] = datetime.datetime.now()
+        self._pending_order_book_safe().set_order_state(code, str(pending.get("state", "")))
+        self._journal_pending_safe(code, str(pending.get("state", "")))
         self._diag_touch_safe(
             code,
             pending_state=str(pending.get("state", "")),
@@ -213,32 +178,31 @@ class OrderSyncPendingStateMixin(TraderMixinBase):
         )
         return str(pending.get("state", "")), remaining, 0
     def _apply_pending_cancel(self, code: str, order_no: str, final_state: str) -> tuple[bool, str]:
-        pending = self._pending_order_state.get(code)
-        if not isinstance(pending, dict):
+        pending = self._pending_book_entry(code)
+        if pending is None:
             return False, ""
 
         children = self._pending_children(pending)
         if not children:
             return True, final_state
 
-        target_child = None
-        order_no_text = str(order_no or "").strip()
-        if order_no_text:
-            for child in children:
-                if str(child.get("order_no", "") or "").strip() == order_no_text:
-                    target_child = child
-                    break
+        book = self._pending_order_book_safe()
+        target_child = book.child_for(code, order_no, allow_unbound=False) if order_no else None
         if target_child is None:
             if len(children) == 1:
                 target_child = children[0]
             else:
                 return False, ""
 
-        target_child["state"] = str(final_state or "cancelled").lower()
-        target_child["remaining_qty"] = 0
-        target_child["reserved_cash"] = 0
-        target_child["updated_at"] = datetime.datetime.now()
-        aggregate_state, remaining_qty = self._refresh_pending_order_aggregate(code)
+        book.update_child(
+            code,
+            target_child,
+            state=str(final_state or "cancelled").lower(),
+            remaining_qty=0,
+            reserved_cash=0,
+            updated_at=datetime.datetime.now(),
+        )
+        aggregate_state, remaining_qty = self._sync_pending_order_aggregate(code)
         should_clear = remaining_qty <= 0 or aggregate_state not in self.ACTIVE_PENDING_STATES
         clear_state = "filled" if aggregate_state == "filled" else str(final_state or aggregate_state)
         return should_clear, clear_state
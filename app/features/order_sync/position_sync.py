@@ -2,19 +2,36 @@
 
 import datetime
 from collections import deque
-from typing import Iterable, Set
+from typing import Any, Dict, Iterable, Set
 
 from PyQt6.QtCore import QTimer
 
 from api.models import ExecutionData
-from app.support.worker import Worker
+from app.support.worker import Worker, call_later
 from config import Config
 from app.mixins._typing import TraderMixinBase
+from .sync_engine import PositionSyncEngine, position_row
 
 
 class OrderSyncPositionSyncMixin(TraderMixinBase):
+    def _position_sync_engine_safe(self) -> PositionSyncEngine:
+        engine = getattr(self, "_position_sync_engine", None)
+        if not isinstance(engine, PositionSyncEngine):
+            engine = PositionSyncEngine()
+            self._position_sync_engine = engine
+        return engine
+    def _position_sync_delay_ms(self) -> int:
+        backlog_getter = getattr(getattr(self, "rest_client", None), "request_backlog_sec", None)
+        backlog_sec = 0.0
+        if callable(backlog_getter):
+            backlog = backlog_getter()
+            if isinstance(backlog, (int, float)):
+                backlog_sec = float(backlog)
+        return self._position_sync_engine_safe().next_delay_ms(rest_backlog_sec=backlog_sec)
+    def _position_sync_metrics(self) -> Dict[str, Any]:
+        return self._position_sync_engine_safe().metrics()
     def _sync_position_from_account(self, code: str):
-        """Sync positions from account API with debounce/batch."""
+        """Sync positions from account API with adaptive debounce/batch."""
         external_positions = getattr(self, "external_positions", {})
         manual_pending = self._manual_pending_map()
         if code and (
@@ -28,11 +45,12 @@ class OrderSyncPositionSyncMixin(TraderMixinBase):
             return
 
         if code:
+            self._position_sync_engine_safe().note_request(scheduled=bool(self._position_sync_scheduled))
             if self._position_sync_scheduled:
                 return
             self._position_sync_scheduled = True
-            delay_ms = max(0, int(Config.POSITION_SYNC_DEBOUNCE_MS))
-            QTimer.singleShot(delay_ms, lambda: self._sync_position_from_account(""))
+            delay_ms = self._position_sync_delay_ms()
+            call_later(self, delay_ms, lambda: self._sync_position_from_account(""))
             return
 
         self._position_sync_scheduled = False
@@ -44,6 +62,7 @@ class OrderSyncPositionSyncMixin(TraderMixinBase):
         request_codes = set(self._position_sync_batch)
         self._position_sync_batch.clear()
         self._position_sync_pending.add("__batch__")
+        self._position_sync_engine_safe().begin_sync()
 
         worker = Worker(self.rest_client.get_positions, self.current_account)
         worker.signals.result.connect(
@@ -67,17 +86,32 @@ class OrderSyncPositionSyncMixin(TraderMixinBase):
         if not target_codes:
             return
 
+        engine = self._position_sync_engine_safe()
+        changed_codes, _removed_codes = engine.apply_snapshot(positions or [])
         positions_by_code = {getattr(pos, "code", ""): pos for pos in positions or []}
         now = datetime.datetime.now()
         self._update_order_health_mode(now)
         sync_external_positions = getattr(self, "_sync_external_positions_from_account_positions", None)
         if callable(sync_external_positions):
-            sync_external_positions(list(positions or []), rebuild_strategy=False, now_dt=now)
+            sync_external_positions(
+                list(positions or []),
+                rebuild_strategy=False,
+                now_dt=now,
+                changed_codes=changed_codes,
+            )
 
+        touched = 0
+        skipped = 0
         for code_item in target_codes:
             info = self.universe.get(code_item)
             if not info:
                 continue
+            if code_item not in changed_codes and self._position_sync_row_settled(
+                code_item, info, positions_by_code.get(code_item)
+            ):
+                skipped += 1
+                continue
+            touched += 1
 
             sync_failed_codes = getattr(self, "_sync_failed_codes", set())
             was_sync_failed = code_item in sync_failed_codes
@@ -230,6 +264,7 @@ class OrderSyncPositionSyncMixin(TraderMixinBase):
             )
             self._dirty_codes.add(code_item)
 
+        engine.record_applied(touched, skipped)
         recompute_count = getattr(self, "_recompute_holding_or_pending_count", None)
         if callable(recompute_count):
             recompute_count()
@@ -269,11 +304,30 @@ class OrderSyncPositionSyncMixin(TraderMixinBase):
 
         if self._position_sync_batch and not self._position_sync_scheduled:
             self._position_sync_scheduled = True
-            delay_ms = max(0, int(Config.POSITION_SYNC_DEBOUNCE_MS))
-            QTimer.singleShot(delay_ms, lambda: self._sync_position_from_account(""))
+            delay_ms = self._position_sync_delay_ms()
+            call_later(self, delay_ms, lambda: self._sync_position_from_account(""))
 
         if not hasattr(self, "_ui_flush_timer"):
             self.sig_update_table.emit()
+    def _position_sync_row_settled(self, code: str, info: Dict[str, Any], matched) -> bool:
+        """True when the account row is already reflected and no fill/pending work is outstanding."""
+        if code in getattr(self, "_sync_failed_codes", set()):
+            return False
+        if code in self._last_exec_event or self._pending_order_state.get(code):
+            return False
+        if code in self._manual_pending_map():
+            return False
+        quantity, available_qty, buy_price, buy_amount, _current, _name = (
+            position_row(matched) if matched else (0, 0, 0, 0, 0, "")
+        )
+        if (
+            int(info.get("held", 0) or 0) != quantity
+            or int(info.get("available_qty", 0) or 0) != available_qty
+            or int(info.get("buy_price", 0) or 0) != buy_price
+            or int(info.get("invest_amount", 0) or 0) != buy_amount
+        ):
+            return False
+        return str(info.get("status", "")) == ("holding" if quantity > 0 else "watch")
     def _on_position_sync_error(self, code: Iterable[str], error: Exception):
         if isinstance(code, str):
             failed_codes: Set[str] = {code} if code else set()
@@ -281,6 +335,7 @@ class OrderSyncPositionSyncMixin(TraderMixinBase):
             failed_codes = {c for c in code if c}
 
         self._position_sync_pending.discard("__batch__")
+        self._position_sync_engine_safe().fail_sync()
         if isinstance(code, str):
             if code:
                 self._position_sync_batch.add(code)
@@ -402,4 +457,4 @@ class OrderSyncPositionSyncMixin(TraderMixinBase):
         )
         if self._position_sync_batch and not self._position_sync_scheduled:
             self._position_sync_scheduled = True
-            QTimer.singleShot(delay_ms, lambda: self._sync_position_from_account(""))
+            call_later(self, delay_ms, lambda: self._sync_position_from_account(""))
@@ -7,6 +7,7 @@ from typing import Iterable, Set
 from PyQt6.QtCore import QTimer
 
 from api.models import ExecutionData
+from api.paper_broker import PaperBrokerClient
 from app.support.worker import Worker
 from config import Config
 from app.mixins._typing import TraderMixinBase
@@ -14,6 +15,10 @@ from app.mixins._typing import TraderMixinBase
 
 class OrderSyncRealtimeMixin(TraderMixinBase):
     def _on_realtime(self, data: ExecutionData):
+        client = getattr(self, "rest_client", None)
+        if isinstance(client, PaperBrokerClient):
+            # paper 모드: 같은 틱으로 로컬 주문을 먼저 매칭해 체결 이벤트를 틱보다 앞서 큐잉한다.
+            client.on_market_tick(data)
         self.sig_execution.emit(data)
     def _on_order_realtime(self, data):
         """WebSocket thread -> main thread bridge."""
@@ -61,7 +66,7 @@ class OrderSyncRealtimeMixin(TraderMixinBase):
             elif "매도" in order_type or "sell" in lower_type:
                 side = "sell"
 
-            if code and code in self._pending_order_state and not bool(getattr(self, "_cleanup_polling", False)):
+            if code and code in self._pending_order_state:
                 self._update_pending_from_order_event(code, order_no=order_no, order_qty=order_qty)
 
             if code and exec_qty > 0 and side:
@@ -81,13 +86,6 @@ class OrderSyncRealtimeMixin(TraderMixinBase):
                 token in status_lower for token in ["reject", "fail"]
             )
             cancel_like = cancelled or rejected_or_failed
-            # cleanup 폴링 중 processEvents() 재진입으로 pending state 가 변경되면
-            # cleanup 의 active 판단이 흐려지므로, pending mutation 경로는 폴링 종료 후까지 보류.
-            if cancel_like and bool(getattr(self, "_cleanup_polling", False)):
-                self.logger.info(
-                    f"[order-sync] pending mutation deferred during cleanup poll: {code} {order_status}"
-                )
-                cancel_like = False
             if code and cancel_like:
                 recorder = getattr(self, "_record_order_lifecycle_event", None)
                 if callable(recorder):
@@ -111,10 +109,9 @@ class OrderSyncRealtimeMixin(TraderMixinBase):
                     refunded = 0
                     should_clear = False
                     clear_state = final_state
-                    for child in children:
-                        child_order_no = str(child.get("order_no", "") or "").strip()
-                        if order_no and child_order_no and child_order_no != order_no:
-                            continue
+                    self._pending_book_entry(code)
+                    child = self._pending_order_book_safe().child_for(code, order_no)
+                    if child is not None:
                         refunded = int(child.get("reserved_cash", 0) or 0)
                         if refunded > 0:
                             self._release_reserved_cash_amount_safe(
@@ -123,7 +120,6 @@ class OrderSyncRealtimeMixin(TraderMixinBase):
                                 reason="ORDER_CANCEL_OR_REJECT",
                                 refund=True,
                             )
-                        break
                     should_clear, clear_state = self._apply_pending_cancel(code, order_no, final_state)
                     if should_clear:
                         self._clear_pending_order(code, final_state=clear_state)
@@ -219,5 +215,8 @@ class OrderSyncRealtimeMixin(TraderMixinBase):
                         if isinstance(external_positions, dict) and code in external_positions:
                             external_positions[code]["status"] = "external_holding"
                             self._diag_touch_safe(code, sync_status="external_holding", retry_count=0)
+            notify_cleanup = getattr(self, "_notify_order_cleanup_event", None)
+            if code and callable(notify_cleanup):
+                notify_cleanup(code, order_no)
         except Exception as e:
             self.logger.error(f"주문 체결 처리 오류: {e}")
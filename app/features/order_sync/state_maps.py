@@ -10,6 +10,7 @@ from api.models import ExecutionData
 from app.support.worker import Worker
 from config import Config
 from app.mixins._typing import TraderMixinBase
+from .order_book import PendingOrderBook
 
 
 class OrderSyncStateMapsMixin(TraderMixinBase):
@@ -37,6 +38,10 @@ class OrderSyncStateMapsMixin(TraderMixinBase):
         fn = getattr(self, "_diag_touch", None)
         if callable(fn):
             fn(code, **fields)
+    def _journal_pending_safe(self, code: str, event: str = ""):
+        fn = getattr(self, "_journal_pending", None)
+        if callable(fn):
+            fn(code, event)
     def _diag_clear_pending_safe(self, code: str):
         fn = getattr(self, "_diag_clear_pending", None)
         if callable(fn):
@@ -98,6 +103,35 @@ class OrderSyncStateMapsMixin(TraderMixinBase):
             return False
         state = str(pending.get("state", "submitted") or "submitted").lower()
         return state in self.ACTIVE_PENDING_STATES
+    def _pending_order_book_safe(self) -> PendingOrderBook:
+        book = getattr(self, "_pending_order_book", None)
+        if not isinstance(book, PendingOrderBook):
+            book = PendingOrderBook(
+                getattr(self, "ACTIVE_PENDING_STATES", {"submitted", "partial"}),
+                getattr(self, "TERMINAL_PENDING_STATES", {"filled", "cancelled", "rejected", "sync_failed"}),
+            )
+            self._pending_order_book = book
+        return book
+    def _pending_book_entry(self, code: str) -> dict | None:
+        """Return the pending dict for `code`, (re)indexing it if it was replaced outside the book."""
+        book = self._pending_order_book_safe()
+        pending = getattr(self, "_pending_order_state", {}).get(code)
+        if not isinstance(pending, dict):
+            book.discard(code)
+            return None
+        book.ensure(code, pending)
+        return pending
+    def _pending_order_book_synced(self) -> PendingOrderBook:
+        """Align the book's code index with `_pending_order_state` (identity checks only)."""
+        book = self._pending_order_book_safe()
+        state_map = getattr(self, "_pending_order_state", {})
+        for code in book.codes():
+            if code not in state_map:
+                book.discard(code)
+        for code, pending in list(state_map.items()):
+            if isinstance(pending, dict):
+                book.ensure(code, pending)
+        return book
     @staticmethod
     def _pending_children(pending: dict) -> list[dict]:
         rows = pending.get("child_orders", []) if isinstance(pending, dict) else []
@@ -0,0 +1,179 @@
+"""Position sync engine: adaptive coalescing, snapshot diff and sync metrics."""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Set, Tuple
+
+from config import Config
+
+
+PositionRow = Tuple[int, int, int, int, int, str]
+
+
+def position_row(position: Any) -> PositionRow:
+    """Fields of an account position that downstream sync logic depends on."""
+    quantity = max(0, int(getattr(position, "quantity", 0) or 0))
+    return (
+        quantity,
+        max(0, int(getattr(position, "available_qty", quantity) or 0)),
+        max(0, int(getattr(position, "buy_price", 0) or 0)),
+        max(0, int(getattr(position, "buy_amount", 0) or 0)),
+        max(0, int(getattr(position, "current_price", 0) or 0)),
+        str(getattr(position, "name", "") or ""),
+    )
+
+
+class PositionSyncEngine:
+    """Decides when to pull account positions and which rows actually changed.
+
+    The engine holds no Qt state: the mixin asks it for the next debounce
+    delay, hands it each `get_positions` snapshot and applies only the codes
+    reported as changed.
+    """
+
+    def __init__(
+        self,
+        base_delay_ms: Optional[int] = None,
+        max_delay_ms: Optional[int] = None,
+        fill_window_sec: Optional[float] = None,
+        max_syncs_per_sec: Optional[float] = None,
+    ):
+        self.base_delay_ms = max(0, int(Config.POSITION_SYNC_DEBOUNCE_MS if base_delay_ms is None else base_delay_ms))
+        self.max_delay_ms = max(
+            self.base_delay_ms,
+            int(getattr(Config, "POSITION_SYNC_COALESCE_MAX_MS", 1500) if max_delay_ms is None else max_delay_ms),
+        )
+        self.fill_window_sec = max(
+            0.1,
+            float(getattr(Config, "POSITION_SYNC_FILL_WINDOW_SEC", 2.0) if fill_window_sec is None else fill_window_sec),
+        )
+        self.max_syncs_per_sec = max(
+            0.1,
+            float(getattr(Config, "POSITION_SYNC_MAX_PER_SEC", 2.0) if max_syncs_per_sec is None else max_syncs_per_sec),
+        )
+
+        self._request_ts: Deque[float] = deque(maxlen=512)
+        self._last_sync_started = 0.0
+        self._inflight_started: Optional[float] = None
+        self._rows: Dict[str, PositionRow] = {}
+        self._has_snapshot = False
+
+        self.sync_count = 0
+        self.error_count = 0
+        self.coalesced_requests = 0
+        self.last_latency_ms = 0.0
+        self.avg_latency_ms = 0.0
+        self.max_latency_ms = 0.0
+        self.last_rows_total = 0
+        self.last_rows_touched = 0
+        self.rows_touched_total = 0
+        self.rows_skipped_total = 0
+        self.last_delay_ms = self.base_delay_ms
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+    def note_request(self, now: Optional[float] = None, *, scheduled: bool = False):
+        """Record a fill-driven sync request; `scheduled` means it merged into a pending sync."""
+        self._request_ts.append(time.monotonic() if now is None else float(now))
+        if scheduled:
+            self.coalesced_requests += 1
+
+    def recent_request_count(self, now: Optional[float] = None) -> int:
+        now_ts = time.monotonic() if now is None else float(now)
+        cutoff = now_ts - self.fill_window_sec
+        while self._request_ts and self._request_ts[0] < cutoff:
+            self._request_ts.popleft()
+        return len(self._request_ts)
+
+    def next_delay_ms(self, now: Optional[float] = None, rest_backlog_sec: float = 0.0) -> int:
+        """Debounce delay that widens with fill rate and respects the REST budget."""
+        now_ts = time.monotonic() if now is None else float(now)
+        recent = self.recent_request_count(now_ts)
+        # Every two extra fills inside the window widen the merge window by one base step.
+        delay = self.base_delay_ms * (1 + max(0, recent - 1) // 2)
+        delay = min(self.max_delay_ms, delay)
+
+        if self._last_sync_started > 0:
+            min_gap_ms = 1000.0 / self.max_syncs_per_sec
+            since_last_ms = (now_ts - self._last_sync_started) * 1000.0
+            delay = max(delay, int(min_gap_ms - since_last_ms))
+        delay = max(delay, int(max(0.0, float(rest_backlog_sec)) * 1000.0))
+        self.last_delay_ms = max(0, int(min(delay, self.max_delay_ms)))
+        return self.last_delay_ms
+
+    def begin_sync(self, now: Optional[float] = None):
+        now_ts = time.monotonic() if now is None else float(now)
+        self._last_sync_started = now_ts
+        self._inflight_started = now_ts
+
+    def _finish_latency(self, now: Optional[float]) -> None:
+        if self._inflight_started is None:
+            return
+        now_ts = time.monotonic() if now is None else float(now)
+        latency_ms = max(0.0, (now_ts - self._inflight_started) * 1000.0)
+        self._inflight_started = None
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        if self.avg_latency_ms <= 0:
+            self.avg_latency_ms = latency_ms
+        else:
+            self.avg_latency_ms = self.avg_latency_ms * 0.8 + latency_ms * 0.2
+
+    def fail_sync(self, now: Optional[float] = None):
+        self.error_count += 1
+        self._finish_latency(now)
+
+    # ------------------------------------------------------------------
+    # Snapshot diff
+    # ------------------------------------------------------------------
+    def apply_snapshot(self, positions: Iterable[Any], now: Optional[float] = None) -> Tuple[Set[str], Set[str]]:
+        """Store a new snapshot and return `(changed_codes, removed_codes)` versus the previous one."""
+        self._finish_latency(now)
+        self.sync_count += 1
+
+        rows: Dict[str, PositionRow] = {}
+        for position in positions or []:
+            code = str(getattr(position, "code", "") or "").strip()
+            if code:
+                rows[code] = position_row(position)
+
+        previous = self._rows
+        if not self._has_snapshot:
+            changed = set(rows)
+        else:
+            changed = {code for code, row in rows.items() if previous.get(code) != row}
+        removed = {code for code in previous if code not in rows}
+
+        self._rows = rows
+        self._has_snapshot = True
+        self.last_rows_total = len(rows)
+        return changed, removed
+
+    def row(self, code: str) -> Optional[PositionRow]:
+        return self._rows.get(code)
+
+    def record_applied(self, touched: int, skipped: int):
+        self.last_rows_touched = max(0, int(touched))
+        self.rows_touched_total += self.last_rows_touched
+        self.rows_skipped_total += max(0, int(skipped))
+
+    def reset(self):
+        """Forget the last snapshot so the next sync is applied in full."""
+        self._rows = {}
+        self._has_snapshot = False
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "sync_count": self.sync_count,
+            "error_count": self.error_count,
+            "coalesced_requests": self.coalesced_requests,
+            "last_latency_ms": round(self.last_latency_ms, 1),
+            "avg_latency_ms": round(self.avg_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "last_rows_total": self.last_rows_total,
+            "last_rows_touched": self.last_rows_touched,
+            "rows_touched_total": self.rows_touched_total,
+            "rows_skipped_total": self.rows_skipped_total,
+            "last_delay_ms": self.last_delay_ms,
+        }
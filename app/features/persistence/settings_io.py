@@ -649,6 +649,9 @@ class PersistenceSettingsIOMixin(TraderMixinBase):
             sync_market_intel = getattr(self, "_update_market_intelligence_config_from_ui", None)
             if callable(sync_market_intel):
                 sync_market_intel()
+            sync_paper = getattr(self, "_sync_paper_broker", None)
+            if callable(sync_paper):
+                sync_paper()
 
             self.log("📂 설정 불러옴")
         except (json.JSONDecodeError, FileNotFoundError, OSError) as exc:
@@ -5,6 +5,7 @@ import csv
 import datetime
 import json
 import os
+import sqlite3
 from pathlib import Path
 
 try:
@@ -31,6 +32,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QFileDialog, QMessageBox, QTableWidgetItem
 
+from app.support.trade_store import TradeStore, accumulate_day_stats, empty_day_stats
 from app.support.ui_text import combo_value, set_combo_value
 from app.support.worker import Worker
 from config import Config
@@ -40,10 +42,44 @@ from app.mixins._typing import TraderMixinBase
 
 
 class PersistenceTradeHistoryMixin(TraderMixinBase):
+    def _trade_store_safe(self) -> TradeStore:
+        store = getattr(self, "_trade_store", None)
+        if not isinstance(store, TradeStore):
+            store = TradeStore(getattr(Config, "TRADE_HISTORY_DB_FILE", str(Path(Config.DATA_DIR) / "trade_history.db")))
+            self._trade_store = store
+        return store
+    def _today_trade_stats(self) -> dict:
+        """당일 통계 (로드 시 인덱스 집계, 이후 _add_trade에서 증분 갱신)."""
+        today = datetime.datetime.now().strftime("%Y-%m-%d")
+        stats = getattr(self, "_history_day_stats", None)
+        if not isinstance(stats, dict) or getattr(self, "_history_stats_day", "") != today:
+            stats = empty_day_stats()
+            try:
+                stats = self._trade_store_safe().day_stats(today)
+            except (OSError, sqlite3.Error) as exc:
+                self.logger.warning(f"거래 통계 조회 실패: {exc}")
+            for record in self._unsaved_trade_records():
+                if str(record.get("timestamp", "")).startswith(today):
+                    accumulate_day_stats(stats, record)
+            self._history_day_stats = stats
+            self._history_stats_day = today
+        return stats
+    def _unsaved_trade_records(self) -> list:
+        records = list(getattr(self, "_history_save_pending_snapshot", None) or [])
+        records.extend(getattr(self, "_history_unsaved", None) or [])
+        return records
     def _add_trade(self, record: dict):
         """거래 기록 추가."""
         record["timestamp"] = datetime.datetime.now().isoformat()
         self.trade_history.append(record)
+        unsaved = getattr(self, "_history_unsaved", None)
+        if not isinstance(unsaved, list):
+            unsaved = []
+            self._history_unsaved = unsaved
+        unsaved.append(record)
+        stats = getattr(self, "_history_day_stats", None)
+        if isinstance(stats, dict) and record["timestamp"].startswith(getattr(self, "_history_stats_day", "")):
+            accumulate_day_stats(stats, record)
         self._history_dirty = True
         today = datetime.datetime.now().strftime("%Y-%m-%d")
         if hasattr(self, "history_table") and record["timestamp"].startswith(today):
@@ -65,6 +101,8 @@ class PersistenceTradeHistoryMixin(TraderMixinBase):
                 if col == 6:
                     item.setForeground(QColor("#e63946" if record.get("profit", 0) > 0 else "#4361ee"))
                 self.history_table.setItem(0, col, item)
+            if hasattr(self, "stats_labels"):
+                self._update_stats()
         else:
             self._refresh_history_table()
 
@@ -83,6 +121,9 @@ class PersistenceTradeHistoryMixin(TraderMixinBase):
                 check_fn()
     def _refresh_history_table(self):
         today = datetime.datetime.now().strftime("%Y-%m-%d")
+        if self.trade_history and not str(self.trade_history[0].get("timestamp", "")).startswith(today):
+            # 날짜가 바뀌면 메모리에는 당일 기록만 유지한다 (이전 기록은 저장소에 있음).
+            self.trade_history = [r for r in self.trade_history if r.get("timestamp", "").startswith(today)]
         today_history = [r for r in self.trade_history if r.get("timestamp", "").startswith(today)]
 
         self.history_table.setUpdatesEnabled(False)
@@ -116,8 +157,17 @@ class PersistenceTradeHistoryMixin(TraderMixinBase):
             self.history_table.setUpdatesEnabled(True)
         if hasattr(self, "stats_labels"):
             self._update_stats()
+    def _all_trade_records(self) -> list:
+        try:
+            records = self._trade_store_safe().iter_all()
+        except (OSError, sqlite3.Error) as exc:
+            self.logger.warning(f"거래 내역 조회 실패: {exc}")
+            records = []
+        records.extend(self._unsaved_trade_records())
+        return records
     def _export_csv(self):
-        if not self.trade_history:
+        records = self._all_trade_records()
+        if not records:
             QMessageBox.information(self, "알림", "내보낼 내역이 없습니다.")
             return
         filename, _ = QFileDialog.getSaveFileName(
@@ -130,7 +180,7 @@ class PersistenceTradeHistoryMixin(TraderMixinBase):
             with open(filename, "w", newline="", encoding="utf-8-sig") as file:
                 writer = csv.writer(file)
                 writer.writerow(["시간", "코드", "종목", "구분", "가격", "수량", "금액", "손익", "사유"])
-                for record in self.trade_history:
+                for record in records:
                     writer.writerow(
                         [
                             record.get("timestamp"),
@@ -147,49 +197,61 @@ class PersistenceTradeHistoryMixin(TraderMixinBase):
             self.log(f"📤 CSV 저장: {filename}")
     def _clear_today_history(self):
         today = datetime.datetime.now().strftime("%Y-%m-%d")
-        count = sum(1 for r in self.trade_history if r.get("timestamp", "").startswith(today))
+        count = self._today_trade_stats()["trades"]
         if count == 0:
             return
         if QMessageBox.question(self, "확인", f"오늘 기록 {count}건 삭제?") == QMessageBox.StandardButton.Yes:
+            # 진행 중인 배치까지 먼저 기록한 뒤 같은 락 안에서 당일 파티션을 삭제한다.
+            with self._history_save_lock:
+                self._save_trade_history_sync()
+                try:
+                    self._trade_store_safe().delete_day(today)
+                except (OSError, sqlite3.Error) as exc:
+                    self.logger.error(f"당일 거래 내역 삭제 실패: {exc}")
             self.trade_history = [r for r in self.trade_history if not r.get("timestamp", "").startswith(today)]
-            self._save_trade_history()
+            self._history_day_stats = None
             self._refresh_history_table()
     def _update_stats(self):
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
-        today_trades = [r for r in self.trade_history if r.get("timestamp", "").startswith(today)]
-        sells = [r for r in today_trades if r.get("type") == "매도"]
-
-        wins = sum(1 for r in sells if r.get("profit", 0) > 0)
-        total_profit = sum(r.get("profit", 0) for r in sells)
-        profits = [r.get("profit", 0) for r in sells]
+        stats = self._today_trade_stats()
+        sells = stats["sells"]
+        wins = stats["wins"]
 
-        self.stats_labels["trades"].setText(str(len(today_trades)))
-        self.stats_labels["wins"].setText(f"{wins}/{len(sells)}")
-        self.stats_labels["winrate"].setText(f"{wins / len(sells) * 100:.1f}%" if sells else "-")
-        self.stats_labels["profit"].setText(f"{total_profit:+,} 원")
-        self.stats_labels["max_profit"].setText(f"{max(profits):+,}" if profits else "-")
-        self.stats_labels["max_loss"].setText(f"{min(profits):+,}" if profits else "-")
+        self.stats_labels["trades"].setText(str(stats["trades"]))
+        self.stats_labels["wins"].setText(f"{wins}/{sells}")
+        self.stats_labels["winrate"].setText(f"{wins / sells * 100:.1f}%" if sells else "-")
+        self.stats_labels["profit"].setText(f"{stats['total_profit']:+,} 원")
+        self.stats_labels["max_profit"].setText(f"{stats['max_profit']:+,}" if sells else "-")
+        self.stats_labels["max_loss"].setText(f"{stats['max_loss']:+,}" if sells else "-")
     def _load_trade_history(self):
-        """거래 내역 로드."""
+        """거래 내역 로드 (최초 1회 JSON -> SQLite 마이그레이션 후 당일 파티션만 메모리에 적재)."""
+        store = self._trade_store_safe()
         try:
-            if os.path.exists(Config.TRADE_HISTORY_FILE):
-                with open(Config.TRADE_HISTORY_FILE, "r", encoding="utf-8") as file:
-                    self.trade_history = json.load(file)
+            migrated = store.migrate_from_json(Config.TRADE_HISTORY_FILE)
+            if migrated:
+                self.logger.info(f"거래 내역 마이그레이션 완료: {migrated}건 ({Config.TRADE_HISTORY_FILE})")
         except json.JSONDecodeError as exc:
             self.logger.warning(f"거래 내역 파싱 실패: {exc}")
-            self.trade_history = []
-        except OSError as exc:
+        except (OSError, sqlite3.Error) as exc:
+            self.logger.warning(f"거래 내역 마이그레이션 실패: {exc}")
+        try:
+            self.trade_history = store.day_records(datetime.datetime.now().strftime("%Y-%m-%d"))
+        except (OSError, sqlite3.Error) as exc:
             self.logger.warning(f"거래 내역 로드 실패: {exc}")
+            self.trade_history = []
+        self._history_day_stats = None
     def _save_trade_history(self):
-        """거래 내역 저장 (single-writer 비동기)."""
-        history_snapshot = list(self.trade_history)
+        """미저장 거래 기록을 저장소에 추가 (single-writer 비동기)."""
+        unsaved = list(getattr(self, "_history_unsaved", None) or [])
+        self._history_unsaved = []
 
         if not hasattr(self, "threadpool"):
             # 테스트/동기 환경 대응
-            self._save_trade_history_sync(history_snapshot)
+            self._history_unsaved = unsaved
+            self._save_trade_history_sync()
             return
 
-        self._history_save_pending_snapshot = history_snapshot
+        pending = getattr(self, "_history_save_pending_snapshot", None)
+        self._history_save_pending_snapshot = list(pending or []) + unsaved
         if bool(getattr(self, "_history_save_inflight", False)):
             return
         self._start_next_trade_history_save()
@@ -197,43 +259,66 @@ class PersistenceTradeHistoryMixin(TraderMixinBase):
         if bool(getattr(self, "_history_save_inflight", False)):
             return
 
-        snapshot = getattr(self, "_history_save_pending_snapshot", None)
-        if snapshot is None:
+        batch = getattr(self, "_history_save_pending_snapshot", None)
+        if batch is None:
             return
         self._history_save_pending_snapshot = None
+        if not batch:
+            self._history_dirty = False
+            return
         self._history_save_inflight = True
+        records = list(batch)
+        # 워커가 가져가기 전의 배치: 동기 저장이 먼저 오면 여기서 가져가 대신 기록한다.
+        self._history_save_inflight_batch = records
 
-        worker = Worker(self._save_trade_history_worker, list(snapshot))
+        worker = Worker(self._run_trade_history_save, records)
         worker.signals.result.connect(lambda _res=None: self._on_trade_history_save_done(success=True, error=None))
-        worker.signals.error.connect(lambda err: self._on_trade_history_save_done(success=False, error=err))
+        worker.signals.error.connect(
+            lambda err, records=records: self._on_trade_history_save_done(success=False, error=err, batch=records)
+        )
         self.threadpool.start(worker)
-    def _save_trade_history_worker(self, history: list):
-        """실제 파일 IO 수행 워커"""
-        self._atomic_write_json(Config.TRADE_HISTORY_FILE, history)
-    def _on_trade_history_save_done(self, success: bool, error=None):
+    def _run_trade_history_save(self, records: list):
+        with self._history_save_lock:
+            if self._history_save_inflight_batch is not records:
+                return None  # 동기 저장이 이미 가져가 기록함
+            self._history_save_inflight_batch = None
+            return self._save_trade_history_worker(records)
+    def _save_trade_history_worker(self, records: list):
+        """실제 저장 수행 워커 (추가분만 INSERT)."""
+        self._trade_store_safe().append_many(records)
+    def _on_trade_history_save_done(self, success: bool, error=None, batch=None):
         self._history_save_inflight = False
+        batch = list(batch or [])
         if not success:
             self._history_dirty = True
             if error is not None:
                 self.logger.error(f"거래 내역 저장 실패: {error}")
-            # Keep latest pending snapshot queued for next timer/flush cycle.
+            # 실패한 배치를 다음 timer/flush 주기에 재시도하도록 대기열 앞에 되돌린다.
+            self._history_save_pending_snapshot = batch + list(getattr(self, "_history_save_pending_snapshot", None) or [])
             return
 
         if getattr(self, "_history_save_pending_snapshot", None) is not None:
             self._start_next_trade_history_save()
             return
-        self._history_dirty = False
-    def _save_trade_history_sync(self, history_snapshot=None):
-        """동기 거래 내역 저장 (테스트용)"""
-        try:
-            payload = list(self.trade_history) if history_snapshot is None else list(history_snapshot)
-            self._atomic_write_json(Config.TRADE_HISTORY_FILE, payload)
-            self._history_dirty = False
-            self._history_save_pending_snapshot = None
-            self._history_save_inflight = False
-        except OSError as exc:
-            self.logger.error(f"거래 내역 동기 저장 실패: {exc}")
-            self._history_dirty = True
+        self._history_dirty = bool(getattr(self, "_history_unsaved", None))
+    def _save_trade_history_sync(self):
+        """동기 거래 내역 저장 (종료 시/테스트용)."""
+        with self._history_save_lock:
+            # 워커가 아직 시작하지 않은 진행 중 배치는 여기서 가져와 함께 기록한다.
+            inflight = list(self._history_save_inflight_batch or [])
+            self._history_save_inflight_batch = None
+            pending = list(getattr(self, "_history_save_pending_snapshot", None) or [])
+            batch = inflight + pending + list(getattr(self, "_history_unsaved", None) or [])
+            try:
+                self._trade_store_safe().append_many(batch)
+                self._history_dirty = False
+                self._history_save_pending_snapshot = None
+                self._history_unsaved = []
+            except (OSError, sqlite3.Error) as exc:
+                self.logger.error(f"거래 내역 동기 저장 실패: {exc}")
+                self._history_dirty = True
+                if inflight:
+                    self._history_save_pending_snapshot = inflight + pending
     def _flush_trade_history_on_exit(self):
         if (
             not bool(getattr(self, "_history_dirty", False))
@@ -250,12 +335,11 @@ class PersistenceTradeHistoryMixin(TraderMixinBase):
                 getattr(Config, "DEFAULT_SYNC_HISTORY_FLUSH_ON_EXIT", True),
             )
         )
-        latest_snapshot = list(self.trade_history)
         if flush_sync:
-            self._save_trade_history_sync(latest_snapshot)
+            self._save_trade_history_sync()
             return
 
         self._save_trade_history()
-        # Exit path hardening: if async save may still be inflight, force sync flush with latest snapshot.
-        if bool(getattr(self, "_history_save_inflight", False)) or getattr(self, "_history_save_pending_snapshot", None) is not None:
-            self._save_trade_history_sync(latest_snapshot)
+        # Exit path hardening: anything still queued behind an inflight save is written synchronously.
+        if getattr(self, "_history_save_pending_snapshot", None) is not None or getattr(self, "_history_unsaved", None):
+            self._save_trade_history_sync()
@@ -1,17 +1,20 @@
 """Trading session lifecycle mixin for KiwoomProTrader."""
 
 from collections import deque
+import concurrent.futures
 import datetime
 import time
 from typing import Any, Deque, Dict, List, Literal, Optional, Tuple, overload
 
-from PyQt6.QtCore import QCoreApplication, Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
 
-from app.support.worker import Worker
+from app.support.worker import call_later, start_rest_call
 from config import Config
+from app.features.order_sync.order_book import PendingOrderBook
 from app.mixins._typing import TraderMixinBase
+from .cleanup_coordinator import OrderCleanupCoordinator
 
 
 BackgroundUniversePayload = Tuple[List[str], Dict[str, Dict[str, Any]], List[str]]
@@ -51,8 +54,13 @@ class TradingSessionCleanupMixin(TraderMixinBase):
         live_targets: List[Dict[str, Any]] = []
         placeholders: List[Dict[str, Any]] = []
 
-        for code, pending in list(getattr(self, "_pending_order_state", {}).items()):
-            if not self._pending_is_active_safe(pending):
+        state_map = getattr(self, "_pending_order_state", {})
+        book_synced = getattr(self, "_pending_order_book_synced", None)
+        book = book_synced() if callable(book_synced) else None
+        active_codes = book.active_codes() if isinstance(book, PendingOrderBook) else list(state_map)
+        for code in active_codes:
+            pending = state_map.get(code)
+            if not isinstance(pending, dict) or not self._pending_is_active_safe(pending):
                 continue
             side = str(pending.get("side", "") or "").lower()
             children = self._pending_children_safe(pending)
@@ -119,6 +127,21 @@ class TradingSessionCleanupMixin(TraderMixinBase):
                 )
 
         return live_targets, placeholders
+    def _cleanup_target_child(self, code: str, target: Dict[str, Any], pending: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        order_no = str(target.get("order_no", "") or "").strip()
+        if order_no and self._pending_book_entry(code) is pending:
+            child = self._pending_order_book_safe().child_for(code, order_no, allow_unbound=False)
+            if child is not None:
+                return child
+        children = self._pending_children_safe(pending)
+        child_index = max(1, int(target.get("child_index", 0) or 0)) - 1
+        if child_index >= len(children):
+            return None
+        child = children[child_index]
+        child_order_no = str(child.get("order_no", "") or "").strip()
+        if order_no and child_order_no not in {"", order_no}:
+            return None
+        return child
     def _cleanup_target_is_active(self, target: Dict[str, Any]) -> bool:
         source = str(target.get("source", "") or "")
         code = str(target.get("code", "") or "")
@@ -135,13 +158,8 @@ class TradingSessionCleanupMixin(TraderMixinBase):
         if not isinstance(pending, dict) or not self._pending_is_active_safe(pending):
             return False
         if source == "pending_child":
-            child_index = max(1, int(target.get("child_index", 0) or 0)) - 1
-            children = self._pending_children_safe(pending)
-            if child_index >= len(children):
-                return False
-            child = children[child_index]
-            child_order_no = str(child.get("order_no", "") or "").strip()
-            if order_no and child_order_no not in {"", order_no}:
+            child = self._cleanup_target_child(code, target, pending)
+            if child is None:
                 return False
             state = str(child.get("state", "submitted") or "submitted").lower()
             active_states = set(getattr(self, "ACTIVE_PENDING_STATES", {"submitted", "partial"}))
@@ -173,31 +191,29 @@ class TradingSessionCleanupMixin(TraderMixinBase):
             self._clear_manual_pending_order(code)
         elif source == "pending_child":
             pending = getattr(self, "_pending_order_state", {}).get(code, {})
-            children = self._pending_children_safe(pending)
-            child_index = max(1, int(target.get("child_index", 0) or 0)) - 1
-            if child_index < len(children):
-                child = children[child_index]
-                child_order_no = str(child.get("order_no", "") or "").strip()
-                if order_no and child_order_no not in {"", order_no}:
-                    child = None
-                if child is not None:
-                    refund_amount = max(0, int(child.get("reserved_cash", 0) or 0)) if side == "buy" else 0
-                    if refund_amount > 0:
-                        self._release_reserved_cash_amount_safe(
-                            code,
-                            refund_amount,
-                            reason=f"PENDING_CHILD_CLEANUP_{reason_text}",
-                            refund=True,
-                        )
-                    child["state"] = final_state
-                    child["remaining_qty"] = 0
-                    child["reserved_cash"] = 0
-                    child["updated_at"] = now
-                    aggregate_state, remaining_qty = self._refresh_pending_order_aggregate(code)
-                    active_states = set(getattr(self, "ACTIVE_PENDING_STATES", {"submitted", "partial"}))
-                    if remaining_qty <= 0 or aggregate_state not in active_states:
-                        clear_state = "filled" if aggregate_state == "filled" else final_state
-                        self._clear_pending_order(code, final_state=clear_state)
+            child = self._cleanup_target_child(code, target, pending)
+            if child is not None:
+                refund_amount = max(0, int(child.get("reserved_cash", 0) or 0)) if side == "buy" else 0
+                if refund_amount > 0:
+                    self._release_reserved_cash_amount_safe(
+                        code,
+                        refund_amount,
+                        reason=f"PENDING_CHILD_CLEANUP_{reason_text}",
+                        refund=True,
+                    )
+                self._pending_order_book_safe().update_child(
+                    code,
+                    child,
+                    state=final_state,
+                    remaining_qty=0,
+                    reserved_cash=0,
+                    updated_at=now,
+                )
+                aggregate_state, remaining_qty = self._sync_pending_order_aggregate(code)
+                active_states = set(getattr(self, "ACTIVE_PENDING_STATES", {"submitted", "partial"}))
+                if remaining_qty <= 0 or aggregate_state not in active_states:
+                    clear_state = "filled" if aggregate_state == "filled" else final_state
+                    self._clear_pending_order(code, final_state=clear_state)
         else:
             if side == "buy":
                 self._release_reserved_cash_safe(
@@ -250,18 +266,10 @@ class TradingSessionCleanupMixin(TraderMixinBase):
             pending = getattr(self, "_pending_order_state", {}).get(code, {})
             if not isinstance(pending, dict):
                 return
-            children = self._pending_children_safe(pending)
-            child_index = max(1, int(target.get("child_index", 0) or 0)) - 1
-            if child_index < len(children):
-                child = children[child_index]
-                child["state"] = "sync_failed"
-                child["updated_at"] = now
-                refresher = getattr(self, "_refresh_pending_order_aggregate", None)
-                if callable(refresher):
-                    refresher(code)
-                else:
-                    pending["state"] = "sync_failed"
-                    pending["updated_at"] = now
+            child = self._cleanup_target_child(code, target, pending)
+            if child is not None:
+                self._pending_order_book_safe().update_child(code, child, state="sync_failed", updated_at=now)
+                self._sync_pending_order_aggregate(code)
             return
 
         marker = getattr(self, "_mark_pending_state", None)
@@ -275,69 +283,98 @@ class TradingSessionCleanupMixin(TraderMixinBase):
 
         if hasattr(self, "log"):
             self.log(f"[order-cleanup] cancel unresolved ({reason}) {code}: state=sync_failed")
-    def _cleanup_active_orders(self, reason: str, timeout_sec: float = 8.0) -> Dict[str, Any]:
-        live_targets, placeholders = self._collect_active_order_cleanup_targets()
-        if not live_targets and not placeholders:
-            self._force_account_position_sync(reason=f"{reason}_noop")
-            return {"live_targets": [], "placeholders": [], "unresolved_codes": []}
-
-        if hasattr(self, "log"):
+    def _new_order_cleanup_coordinator(
+        self,
+        reason: str,
+        live_targets: List[Dict[str, Any]],
+        placeholders: List[Dict[str, Any]],
+        timeout_sec: Optional[float] = None,
+    ) -> OrderCleanupCoordinator:
+        return OrderCleanupCoordinator(
+            reason,
+            live_targets,
+            placeholders,
+            timeout_sec=float(
+                getattr(Config, "ORDER_CLEANUP_TIMEOUT_SEC", 8.0) if timeout_sec is None else timeout_sec
+            ),
+            max_polls=int(getattr(Config, "ORDER_CLEANUP_MAX_POLLS", 3)),
+        )
+    def _cleanup_cancel_args(self, target: Dict[str, Any]) -> Optional[Tuple[str, str, str, int]]:
+        client = getattr(self, "rest_client", None)
+        account = str(getattr(self, "current_account", "") or "")
+        order_no = str(target.get("order_no", "") or "").strip()
+        quantity = max(0, int(target.get("quantity", 0) or 0))
+        if client is None or not account or not order_no or quantity <= 0:
+            return None
+        return account, order_no, str(target["code"]), quantity
+    def _open_order_polling_supported(self) -> bool:
+        client = getattr(self, "rest_client", None)
+        account = str(getattr(self, "current_account", "") or "")
+        return bool(client is not None and account and getattr(client, "supports_open_orders", False))
+    def _record_cleanup_cancel(self, coordinator: OrderCleanupCoordinator, index: int, result: Any, error: Any = None):
+        if error is not None:
+            success, message = False, str(error)
+        else:
+            success = bool(getattr(result, "success", False))
+            message = str(getattr(result, "message", "") or "")
+        coordinator.record_cancel(index, success, message)
+        if not success and hasattr(self, "log"):
+            target = coordinator.live_targets[index]
             self.log(
-                f"[order-cleanup] {reason}: live={len(live_targets)} placeholder={len(placeholders)}"
+                f"[order-cleanup] cancel request failed ({coordinator.reason}) "
+                f"{target.get('code')} {target.get('order_no')}: {message}"
             )
-
+    def _submit_cleanup_cancels_blocking(self, coordinator: OrderCleanupCoordinator):
+        """Issue every cancel at once through the REST scheduler, then wait for the answers."""
         client = getattr(self, "rest_client", None)
-        account = str(getattr(self, "current_account", "") or "")
-        # 폴링 중 processEvents() 로 인해 _on_order_execution 이 재진입되어 pending state 를
-        # 변경하면 cleanup 판단이 흐려지므로, 폴링 구간 동안 pending mutation 을 억제한다.
-        # (체결 fill 동기화 자체는 _on_order_execution 내에서 별도로 유지된다)
-        self._cleanup_polling = True
-        try:
-            for target in live_targets:
-                order_no = str(target.get("order_no", "") or "").strip()
-                quantity = max(0, int(target.get("quantity", 0) or 0))
-                success = False
-                message = ""
-                if client is not None and account and order_no and quantity > 0:
-                    try:
-                        result = client.cancel_order(account, order_no, target["code"], quantity)
-                        success = bool(getattr(result, "success", False))
-                        message = str(getattr(result, "message", "") or "")
-                    except Exception as exc:
-                        message = str(exc)
-                else:
-                    message = "API/account not ready"
-                target["cancel_success"] = success
-                target["cancel_message"] = message
-                if not success and hasattr(self, "log"):
-                    self.log(
-                        f"[order-cleanup] cancel request failed ({reason}) {target['code']} {order_no}: {message}"
-                    )
-
-            unresolved = list(live_targets)
-            deadline = time.monotonic() + max(0.1, float(timeout_sec or 0.0))
-            while unresolved and time.monotonic() < deadline:
-                self._force_account_position_sync(reason=f"{reason}_poll")
-                unresolved = [target for target in live_targets if self._cleanup_target_is_active(target)]
-                if not unresolved:
-                    break
-                app = QCoreApplication.instance()
-                if app is not None:
-                    app.processEvents()
-                time.sleep(0.2)
+        submit = getattr(client, "submit", None)
+        inflight: Dict[concurrent.futures.Future, int] = {}
+        for index, target in enumerate(coordinator.live_targets):
+            args = self._cleanup_cancel_args(target)
+            if args is None or client is None:
+                self._record_cleanup_cancel(coordinator, index, None, error="API/account not ready")
+                continue
+            future = None
+            if callable(submit):
+                try:
+                    future = submit("cancel_order", *args)
+                except (AttributeError, RuntimeError):
+                    future = None
+            if isinstance(future, concurrent.futures.Future):
+                inflight[future] = index
+                continue
+            try:
+                self._record_cleanup_cancel(coordinator, index, client.cancel_order(*args))
+            except Exception as exc:
+                self._record_cleanup_cancel(coordinator, index, None, error=exc)
 
+        if not inflight:
+            return
+        done, not_done = concurrent.futures.wait(
+            list(inflight),
+            timeout=float(getattr(Config, "ORDER_CLEANUP_CANCEL_TIMEOUT_SEC", 10.0)),
+        )
+        for future in done:
+            try:
+                self._record_cleanup_cancel(coordinator, inflight[future], future.result())
+            except Exception as exc:
+                self._record_cleanup_cancel(coordinator, inflight[future], None, error=exc)
+        for future in not_done:
+            self._record_cleanup_cancel(coordinator, inflight[future], None, error="cancel response timeout")
+    def _complete_order_cleanup(self, coordinator: OrderCleanupCoordinator, pre_sync: bool = False) -> Dict[str, Any]:
+        reason = coordinator.reason
+        if pre_sync:
             self._force_account_position_sync(reason=f"{reason}_final")
-            unresolved = [target for target in live_targets if self._cleanup_target_is_active(target)]
-        finally:
-            self._cleanup_polling = False
+        coordinator.refresh(self._cleanup_target_is_active)
+        unresolved = coordinator.unresolved_targets()
 
-        for target in placeholders:
+        for target in coordinator.placeholders:
             self._force_finalize_cleanup_target(target, final_state="cancelled", reason=reason)
 
-        for target in live_targets:
+        for target in coordinator.live_targets:
             if not self._cleanup_target_is_active(target):
                 continue
-            if bool(target.get("cancel_success")):
+            if bool(target.get("cancel_success")) or bool(target.get("broker_closed")):
                 self._force_finalize_cleanup_target(target, final_state="cancelled", reason=reason)
             else:
                 self._mark_cleanup_target_failed(target, reason=reason)
@@ -358,76 +395,47 @@ class TradingSessionCleanupMixin(TraderMixinBase):
             if callable(emit):
                 emit()
         return {
-            "live_targets": live_targets,
-            "placeholders": placeholders,
+            "live_targets": coordinator.live_targets,
+            "placeholders": coordinator.placeholders,
             "unresolved_codes": unresolved_codes,
+            "elapsed_ms": round((time.monotonic() - coordinator.started_at) * 1000.0, 1),
+            "polls": coordinator.polls,
         }
-    def _cleanup_cancel_requests_worker(self, live_targets: List[Dict[str, Any]], reason: str) -> List[Dict[str, Any]]:
-        client = getattr(self, "rest_client", None)
-        account = str(getattr(self, "current_account", "") or "")
-        rows: List[Dict[str, Any]] = []
-        for raw_target in live_targets:
-            target = dict(raw_target)
-            order_no = str(target.get("order_no", "") or "").strip()
-            quantity = max(0, int(target.get("quantity", 0) or 0))
-            success = False
-            message = ""
-            if client is not None and account and order_no and quantity > 0:
-                try:
-                    result = client.cancel_order(account, order_no, target["code"], quantity)
-                    success = bool(getattr(result, "success", False))
-                    message = str(getattr(result, "message", "") or "")
-                except Exception as exc:
-                    message = str(exc)
-            else:
-                message = "API/account not ready"
-            target["cancel_success"] = success
-            target["cancel_message"] = message
-            target["cleanup_reason"] = reason
-            rows.append(target)
-        return rows
-    def _finalize_order_cleanup_requests(
-        self,
-        reason: str,
-        live_targets: List[Dict[str, Any]],
-        placeholders: List[Dict[str, Any]],
-    ) -> Dict[str, Any]:
-        for target in placeholders:
-            self._force_finalize_cleanup_target(target, final_state="cancelled", reason=reason)
+    def _cleanup_active_orders(self, reason: str, timeout_sec: float = 8.0) -> Dict[str, Any]:
+        """Blocking cleanup for shutdown: concurrent cancels plus one open-order poll (no sleeps, no event-loop pumping)."""
+        live_targets, placeholders = self._collect_active_order_cleanup_targets()
+        if not live_targets and not placeholders:
+            self._force_account_position_sync(reason=f"{reason}_noop")
+            return {"live_targets": [], "placeholders": [], "unresolved_codes": []}
 
-        for target in live_targets:
-            if bool(target.get("cancel_success")):
-                self._force_finalize_cleanup_target(target, final_state="cancelled", reason=reason)
+        if hasattr(self, "log"):
+            self.log(
+                f"[order-cleanup] {reason}: live={len(live_targets)} placeholder={len(placeholders)}"
+            )
+
+        coordinator = self._new_order_cleanup_coordinator(reason, live_targets, placeholders, timeout_sec)
+        self._submit_cleanup_cancels_blocking(coordinator)
+        coordinator.refresh(self._cleanup_target_is_active)
+
+        # 동기 경로(종료 시)는 대기 없이 한 번만 조회한다; 재조회는 비동기 경로의 몫이다.
+        client = getattr(self, "rest_client", None)
+        if client is not None and self._open_order_polling_supported() and coordinator.can_poll() and not coordinator.expired():
+            coordinator.begin_poll()
+            try:
+                orders = client.get_open_orders(str(getattr(self, "current_account", "") or ""))
+            except Exception as exc:
+                orders = None
+                self._log_once(f"cleanup_open_orders:{reason}", f"[order-cleanup] open-order poll failed ({reason}): {exc}")
             else:
-                if hasattr(self, "log"):
-                    self.log(
-                        f"[order-cleanup] cancel request failed ({reason}) "
-                        f"{target.get('code')} {target.get('order_no')}: {target.get('cancel_message', '')}"
-                    )
-                self._mark_cleanup_target_failed(target, reason=reason)
+                if orders is None:
+                    self._log_once(f"cleanup_open_orders:{reason}", f"[order-cleanup] open-order poll failed ({reason})")
+            coordinator.apply_open_orders(orders)
 
-        self._force_account_position_sync(reason=f"{reason}_async_finalize")
-        recompute_count = getattr(self, "_recompute_holding_or_pending_count", None)
-        if callable(recompute_count):
-            recompute_count()
-        if not hasattr(self, "_ui_flush_timer"):
-            signal = getattr(self, "sig_update_table", None)
-            emit = getattr(signal, "emit", None)
-            if callable(emit):
-                emit()
-        unresolved_codes = sorted(
-            {
-                str(target.get("code", "") or "")
-                for target in live_targets
-                if target.get("code") and not bool(target.get("cancel_success"))
-            }
-        )
-        return {
-            "live_targets": live_targets,
-            "placeholders": placeholders,
-            "unresolved_codes": unresolved_codes,
-        }
+        result = self._complete_order_cleanup(coordinator, pre_sync=True)
+        coordinator.finish(result)
+        return result
     def _cleanup_active_orders_async(self, reason: str, on_done=None) -> bool:
+        """Event-driven cleanup: resolves when every target is terminal or the deadline passes."""
         threadpool = getattr(self, "threadpool", None)
         starter = getattr(threadpool, "start", None)
         if not callable(starter):
@@ -446,29 +454,92 @@ class TradingSessionCleanupMixin(TraderMixinBase):
         if hasattr(self, "btn_start"):
             self.btn_start.setEnabled(False)
 
-        worker = Worker(self._cleanup_cancel_requests_worker, [dict(row) for row in live_targets], reason)
+        coordinator = self._new_order_cleanup_coordinator(reason, [dict(row) for row in live_targets], placeholders)
+        self._order_cleanup_coordinator = coordinator
+        if callable(on_done):
+            coordinator.future.add_done_callback(lambda future: on_done(future.result()))
 
-        def finish(rows):
-            self._order_cleanup_inflight = False
-            result = self._finalize_order_cleanup_requests(reason, list(rows or []), placeholders)
-            if not getattr(self, "is_running", False) and hasattr(self, "btn_start"):
-                self.btn_start.setEnabled(True)
-            if callable(on_done):
-                on_done(result)
-
-        def fail(exc):
-            self._order_cleanup_inflight = False
-            if hasattr(self, "log"):
-                self.log(f"[order-cleanup] async failed ({reason}): {exc}")
-            result = self._cleanup_active_orders(reason, timeout_sec=0.1)
-            if not getattr(self, "is_running", False) and hasattr(self, "btn_start"):
-                self.btn_start.setEnabled(True)
-            if callable(on_done):
-                on_done(result)
+        for index, target in enumerate(coordinator.live_targets):
+            args = self._cleanup_cancel_args(target)
+            if args is None:
+                self._record_cleanup_cancel(coordinator, index, None, error="API/account not ready")
+                continue
+            try:
+                start_rest_call(
+                    self,
+                    "cancel_order",
+                    *args,
+                    on_result=lambda result, c=coordinator, i=index: self._on_cleanup_cancel_result(c, i, result),
+                    on_error=lambda exc, c=coordinator, i=index: self._on_cleanup_cancel_result(c, i, None, exc),
+                )
+            except Exception as exc:
+                self._record_cleanup_cancel(coordinator, index, None, error=exc)
 
-        worker.signals.result.connect(finish)
-        worker.signals.error.connect(fail)
-        starter(worker)
+        call_later(
+            self,
+            int(coordinator.remaining_sec() * 1000) + 1,
+            lambda c=coordinator: self._advance_order_cleanup(c, deadline=True),
+        )
+        self._advance_order_cleanup(coordinator)
         return True
+    def _on_cleanup_cancel_result(self, coordinator: OrderCleanupCoordinator, index: int, result: Any, error: Any = None):
+        if coordinator.future.done():
+            return
+        self._record_cleanup_cancel(coordinator, index, result, error=error)
+        self._advance_order_cleanup(coordinator)
+    def _notify_order_cleanup_event(self, code: str, order_no: str = ""):
+        """Realtime order feed hook: re-check the running cleanup when one of its orders changes."""
+        coordinator = getattr(self, "_order_cleanup_coordinator", None)
+        if isinstance(coordinator, OrderCleanupCoordinator) and coordinator.involves(code, order_no):
+            self._advance_order_cleanup(coordinator)
+    def _advance_order_cleanup(self, coordinator: OrderCleanupCoordinator, deadline: bool = False):
+        if coordinator.future.done():
+            return
+        coordinator.refresh(self._cleanup_target_is_active)
+        if coordinator.resolved() or deadline or coordinator.expired():
+            self._finish_order_cleanup(coordinator)
+            return
+        if not coordinator.cancels_done():
+            return
+
+        if coordinator.can_poll() and self._open_order_polling_supported():
+            coordinator.begin_poll()
+            start_rest_call(
+                self,
+                "get_open_orders",
+                str(getattr(self, "current_account", "") or ""),
+                on_result=lambda orders, c=coordinator: self._on_cleanup_open_orders(c, orders),
+                on_error=lambda _exc, c=coordinator: self._on_cleanup_open_orders(c, None),
+            )
+            return
+        if coordinator.poll_inflight:
+            return
+        awaiting_event = any(bool(target.get("cancel_success")) for target in coordinator.unresolved_targets())
+        if not awaiting_event:
+            # Nothing left that a realtime event could resolve (cancel requests failed).
+            self._finish_order_cleanup(coordinator)
+    def _on_cleanup_open_orders(self, coordinator: OrderCleanupCoordinator, orders: Any):
+        if coordinator.future.done():
+            return
+        if orders is None:
+            self._log_once(f"cleanup_open_orders:{coordinator.reason}", f"[order-cleanup] open-order poll failed ({coordinator.reason})")
+        coordinator.apply_open_orders(orders)
+        if not coordinator.resolved() and coordinator.can_poll():
+            poll_interval_ms = int(getattr(Config, "ORDER_CLEANUP_POLL_INTERVAL_MS", 500))
+            call_later(
+                self,
+                min(poll_interval_ms, int(coordinator.remaining_sec() * 1000) + 1),
+                lambda c=coordinator: self._advance_order_cleanup(c),
+            )
+            return
+        self._advance_order_cleanup(coordinator)
+    def _finish_order_cleanup(self, coordinator: OrderCleanupCoordinator):
+        if getattr(self, "_order_cleanup_coordinator", None) is coordinator:
+            self._order_cleanup_coordinator = None
+        self._order_cleanup_inflight = False
+        result = self._complete_order_cleanup(coordinator)
+        if not getattr(self, "is_running", False) and hasattr(self, "btn_start"):
+            self.btn_start.setEnabled(True)
+        coordinator.finish(result)
     def _cancel_pending_orders_before_stop(self) -> Dict[str, Any]:
         return self._cleanup_active_orders("stop_trading", timeout_sec=0.1)
@@ -0,0 +1,125 @@
+"""Order cleanup coordinator: concurrent cancels resolved by terminal events or a deadline."""
+
+import concurrent.futures
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+
+class OrderCleanupCoordinator:
+    """Tracks one cleanup run without blocking the caller.
+
+    All cancel requests are issued up front; each live target is then resolved
+    either because local pending state went terminal (realtime order feed),
+    because a `get_open_orders` poll no longer lists its order number, or
+    because the deadline passed. `future` resolves with the cleanup result.
+    """
+
+    def __init__(
+        self,
+        reason: str,
+        live_targets: List[Dict[str, Any]],
+        placeholders: List[Dict[str, Any]],
+        *,
+        timeout_sec: float = 8.0,
+        max_polls: int = 3,
+        now: Optional[float] = None,
+    ):
+        self.reason = reason
+        self.live_targets = live_targets
+        self.placeholders = placeholders
+        self.started_at = time.monotonic() if now is None else float(now)
+        self.deadline = self.started_at + max(0.0, float(timeout_sec or 0.0))
+        self.max_polls = max(0, int(max_polls))
+        self.future: "concurrent.futures.Future[Dict[str, Any]]" = concurrent.futures.Future()
+
+        self._awaiting_cancel: Set[int] = set(range(len(live_targets)))
+        self._unresolved: Set[int] = set(range(len(live_targets)))
+        self._by_order_no: Dict[str, int] = {}
+        for index, target in enumerate(live_targets):
+            order_no = str(target.get("order_no", "") or "").strip()
+            if order_no:
+                self._by_order_no[order_no] = index
+
+        self.polls = 0
+        self.poll_failures = 0
+        self.poll_inflight = False
+        self.events = 0
+
+    # ------------------------------------------------------------------
+    # Progress
+    # ------------------------------------------------------------------
+    def record_cancel(self, index: int, success: bool, message: str = ""):
+        if index not in self._awaiting_cancel:
+            return
+        self._awaiting_cancel.discard(index)
+        target = self.live_targets[index]
+        target["cancel_success"] = bool(success)
+        target["cancel_message"] = str(message or "")
+
+    def cancels_done(self) -> bool:
+        return not self._awaiting_cancel
+
+    def involves(self, code: str = "", order_no: str = "") -> bool:
+        order_key = str(order_no or "").strip()
+        if order_key and order_key in self._by_order_no:
+            return True
+        return any(str(self.live_targets[index].get("code", "")) == code for index in self._unresolved)
+
+    def refresh(self, is_active: Callable[[Dict[str, Any]], bool]) -> int:
+        """Drop targets whose local pending state is no longer active; returns how many remain."""
+        self.events += 1
+        for index in list(self._unresolved):
+            if not is_active(self.live_targets[index]):
+                self._unresolved.discard(index)
+        return len(self._unresolved)
+
+    def apply_open_orders(self, orders: Optional[Iterable[Any]]) -> int:
+        """Resolve targets the broker no longer lists as open (only after their cancel was answered).
+
+        `orders is None` is a failed poll, not an empty book: nothing is marked
+        `broker_closed`, so targets whose cancel failed still end as sync_failed.
+        """
+        self.poll_inflight = False
+        if orders is None:
+            self.poll_failures += 1
+            return len(self._unresolved)
+        open_nos = {str(getattr(order, "order_no", "") or "").strip() for order in orders}
+        for index in list(self._unresolved):
+            if index in self._awaiting_cancel:
+                continue
+            target = self.live_targets[index]
+            if str(target.get("order_no", "") or "").strip() not in open_nos:
+                target["broker_closed"] = True
+                self._unresolved.discard(index)
+        return len(self._unresolved)
+
+    def can_poll(self) -> bool:
+        return bool(self._unresolved) and self.cancels_done() and not self.poll_inflight and self.polls < self.max_polls
+
+    def begin_poll(self):
+        self.polls += 1
+        self.poll_inflight = True
+
+    def remaining_sec(self, now: Optional[float] = None) -> float:
+        now_ts = time.monotonic() if now is None else float(now)
+        return max(0.0, self.deadline - now_ts)
+
+    def expired(self, now: Optional[float] = None) -> bool:
+        return self.remaining_sec(now) <= 0.0
+
+    def resolved(self) -> bool:
+        return not self._unresolved
+
+    def unresolved_targets(self) -> List[Dict[str, Any]]:
+        return [self.live_targets[index] for index in sorted(self._unresolved)]
+
+    # ------------------------------------------------------------------
+    # Completion
+    # ------------------------------------------------------------------
+    def finish(self, result: Dict[str, Any]) -> bool:
+        if self.future.done():
+            return False
+        result.setdefault("elapsed_ms", round((time.monotonic() - self.started_at) * 1000.0, 1))
+        result.setdefault("polls", self.polls)
+        self.future.set_result(result)
+        return True
@@ -85,6 +85,8 @@ class TradingSessionLifecycleMixin(TraderMixinBase):
         )
         if execution_mode == "signal_only":
             self.log("[preflight] signal-only mode: broker order APIs will not be called.")
+        elif execution_mode == "paper":
+            self.log("[preflight] paper mode: orders are matched locally against realtime ticks.")
         if open_order_support:
             # ka10075 기반 미체결 주문 복구 활성화
             self.log("[preflight] open-order recovery enabled (ka10075).")
@@ -158,6 +160,9 @@ class TradingSessionLifecycleMixin(TraderMixinBase):
             return False
 
         self._log_trading_preflight(valid_codes)
+        sync_paper = getattr(self, "_sync_paper_broker", None)
+        if callable(sync_paper):
+            sync_paper()
 
         # Keep live routing constrained to KR stock long path in phase-1.
         is_mock = bool(hasattr(self, "chk_mock") and self.chk_mock.isChecked())
@@ -251,8 +256,7 @@ class TradingSessionLifecycleMixin(TraderMixinBase):
                         raise RuntimeError("유니버스 초기화에 성공한 종목이 없습니다.")
 
                     self.universe = universe
-                    self.table.setRowCount(len(initialized_codes))
-                    self._code_to_row = {code: idx for idx, code in enumerate(initialized_codes)}
+                    self._reset_trading_table(initialized_codes)
                     self._holding_or_pending_count = 0
 
                     for code in initialized_codes:
@@ -318,7 +322,12 @@ class TradingSessionLifecycleMixin(TraderMixinBase):
         was_running = self.is_running
         self._set_trading_stopped_state()
 
+        done: List[bool] = []
+
         def finalize_cleanup(cleanup_result):
+            if done:
+                return
+            done.append(True)
             unresolved_codes = set(cleanup_result.get("unresolved_codes", [])) if isinstance(cleanup_result, dict) else set()
             release_all_reserved = getattr(self, "_release_all_reserved_cash", None)
             if callable(release_all_reserved) and not unresolved_codes:
@@ -326,17 +335,20 @@ class TradingSessionLifecycleMixin(TraderMixinBase):
                 released_total = int(released) if isinstance(released, (int, float, str)) else 0
                 if released_total > 0 and hasattr(self, "log"):
                     self.log(f"Reserved cash reconciled on stop: +{released_total:,}")
+            # 정리 코디네이터는 실시간 주문체결(취소/체결) 이벤트로 종료를 판단하므로
+            # 정리가 끝난 뒤에 연결을 끊는다. 그 사이 매매가 다시 시작됐으면 연결을 유지한다.
+            if not getattr(self, "is_running", False):
+                self._disconnect_realtime_clients()
 
         async_started = False
         if not bool(getattr(self, "_shutdown_in_progress", False)):
             async_cleanup = getattr(self, "_cleanup_active_orders_async", None)
             if callable(async_cleanup):
                 async_started = bool(async_cleanup("stop_trading", on_done=finalize_cleanup))
-        if not async_started:
+        if not async_started and not done:
             cleanup_result = self._cancel_pending_orders_before_stop()
             finalize_cleanup(cleanup_result)
         self._last_exec_event.clear()
-        self._disconnect_realtime_clients()
 
         if was_running:
             self.log("매매 중지")
@@ -538,8 +550,7 @@ class TradingSessionLifecycleMixin(TraderMixinBase):
             return initialized_codes, target_universe, failed_codes
 
         self.universe = target_universe
-        self.table.setRowCount(len(initialized_codes))
-        self._code_to_row = {code: idx for idx, code in enumerate(initialized_codes)}
+        self._reset_trading_table(initialized_codes)
         self._holding_or_pending_count = 0
         self._dirty_codes.update(initialized_codes)
         self.sig_update_table.emit()
@@ -3,7 +3,7 @@
 from collections import deque
 import datetime
 import time
-from typing import Any, Deque, Dict, List, Literal, Optional, Tuple, overload
+from typing import Any, Deque, Dict, List, Literal, Optional, Set, Tuple, overload
 
 from PyQt6.QtCore import QCoreApplication, Qt, QTimer
 from PyQt6.QtGui import QColor
@@ -245,7 +245,13 @@ class TradingSessionPositionsMixin(TraderMixinBase):
         *,
         rebuild_strategy: bool = False,
         now_dt: Optional[datetime.datetime] = None,
+        changed_codes: Optional[Set[str]] = None,
     ) -> List[str]:
+        """Mirror non-universe account holdings into `external_positions`.
+
+        When `changed_codes` is given (delta sync), existing entries whose account
+        row and pending status are unchanged are left untouched.
+        """
         now = now_dt or datetime.datetime.now()
         mapping = self._external_positions_map()
         universe = getattr(self, "universe", {})
@@ -274,6 +280,25 @@ class TradingSessionPositionsMixin(TraderMixinBase):
 
         for code, position in next_external.items():
             previous = mapping.get(code, {})
+            pending = getattr(self, "_pending_order_state", {}).get(code, {})
+            if not pending:
+                pending = manual_pending_map.get(code, {})
+            status = "external_holding"
+            if self._pending_is_active_safe(pending):
+                side = str(pending.get("side", "") or "").lower()
+                if side == "sell":
+                    status = "sell_submitted"
+                elif side == "buy":
+                    status = "buy_submitted"
+            if (
+                changed_codes is not None
+                and code not in changed_codes
+                and isinstance(previous, dict)
+                and previous
+                and previous.get("status") == status
+            ):
+                continue
+
             previous_amount = int(previous.get("invest_amount", 0) or 0) if isinstance(previous, dict) else 0
             buy_price = max(0, int(getattr(position, "buy_price", 0) or 0))
             invest_amount = max(0, int(getattr(position, "buy_amount", 0) or 0))
@@ -287,16 +312,6 @@ class TradingSessionPositionsMixin(TraderMixinBase):
                 current_price=max(0, int(getattr(position, "current_price", 0) or 0)),
                 existing=previous,
             )
-            pending = getattr(self, "_pending_order_state", {}).get(code, {})
-            if not pending:
-                pending = manual_pending_map.get(code, {})
-            status = "external_holding"
-            if self._pending_is_active_safe(pending):
-                side = str(pending.get("side", "") or "").lower()
-                if side == "sell":
-                    status = "sell_submitted"
-                elif side == "buy":
-                    status = "buy_submitted"
 
             partial_levels = previous.get("partial_profit_levels", set()) if isinstance(previous, dict) else set()
             if not isinstance(partial_levels, set):
@@ -359,6 +374,10 @@ class TradingSessionPositionsMixin(TraderMixinBase):
     ) -> None:
         if reset_tracking and hasattr(self, "strategy"):
             self.strategy.reset_tracking()
+        sync_engine = getattr(self, "_position_sync_engine", None)
+        if sync_engine is not None:
+            # Full snapshot applied outside the delta path: next sync must not diff against stale rows.
+            sync_engine.reset()
 
         positions_by_code = {str(getattr(pos, "code", "") or "").strip(): pos for pos in positions or []}
         now = datetime.datetime.now()
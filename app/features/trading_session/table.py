@@ -6,9 +6,9 @@ import time
 from typing import Any, Deque, Dict, List, Literal, Optional, Tuple, overload
 
 from PyQt6.QtCore import QCoreApplication, Qt, QTimer
-from PyQt6.QtGui import QColor
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
+from PyQt6.QtWidgets import QMessageBox
 
+from app.support.trading_table_model import TradingTableModel
 from app.support.worker import Worker
 from config import Config
 from app.mixins._typing import TraderMixinBase
@@ -18,73 +18,45 @@ BackgroundUniversePayload = Tuple[List[str], Dict[str, Dict[str, Any]], List[str
 
 
 class TradingSessionTableMixin(TraderMixinBase):
+    def _trading_table_model(self) -> TradingTableModel:
+        model = getattr(self, "table_model", None)
+        if not isinstance(model, TradingTableModel):
+            model = TradingTableModel(lambda: self.universe)
+            self.table_model = model
+            set_model = getattr(getattr(self, "table", None), "setModel", None)
+            if callable(set_model):
+                set_model(model)
+        return model
+    def _reset_trading_table(self, codes: List[str]):
+        model = self._trading_table_model()
+        model.set_codes(codes)
+        self._code_to_row = model.row_map
     def _update_row(self, row, code):
         if row < 0:
             return
-        info = self.universe.get(code, {})
-        profit_rate = 0.0
-        if info.get("held", 0) > 0 and info.get("buy_price", 0) > 0:
-            profit_rate = (info["current"] - info["buy_price"]) / info["buy_price"] * 100
-
-        data = [
-            info.get("name", code),
-            f"{info.get('current', 0):,}",
-            f"{info.get('target', 0):,}",
-            info.get("status", ""),
-            str(info.get("held", 0)),
-            f"{info.get('buy_price', 0):,}",
-            f"{profit_rate:.2f}%",
-            f"{info.get('max_profit_rate', 0):.2f}%",
-            f"{info.get('invest_amount', 0):,}",
-        ]
-        for col, text in enumerate(data):
-            text_str = str(text)
-            item = self.table.item(row, col)
-            if item is None:
-                item = QTableWidgetItem(text_str)
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, col, item)
-            elif item.text() != text_str:
-                item.setText(text_str)
-
-            if col == 6:
-                if profit_rate > 0:
-                    item.setForeground(QColor("#e63946"))
-                elif profit_rate < 0:
-                    item.setForeground(QColor("#4361ee"))
+        self._trading_table_model().mark_dirty([code])
     def _refresh_table(self):
         if not self.universe or not self._dirty_codes:
             return
 
+        model = self._trading_table_model()
+        if model.sync_rows():
+            self._code_to_row = model.row_map
+
+        # 진단 탭도 같은 종목 정보를 표시하므로 dirty 코드를 함께 넘긴다.
+        diag_dirty = getattr(self, "_diagnostics_dirty_codes", None)
+        if isinstance(diag_dirty, set):
+            diag_dirty.update(self._dirty_codes)
+
         if "__all__" in self._dirty_codes:
-            codes_to_update = list(self.universe.keys())
             self._dirty_codes.clear()
-        else:
-            codes_to_update = []
-            limit = max(1, int(Config.TABLE_BATCH_LIMIT))
-            while self._dirty_codes and len(codes_to_update) < limit:
-                code = self._dirty_codes.pop()
-                if code in self.universe:
-                    codes_to_update.append(code)
-
-        if not codes_to_update:
+            model.mark_all_dirty()
             return
 
-        if len(self._code_to_row) != len(self.universe):
-            self.table.setRowCount(len(self.universe))
-            self._code_to_row = {code: idx for idx, code in enumerate(self.universe.keys())}
-
-        self.table.setUpdatesEnabled(False)
-        try:
-            for code in codes_to_update:
-                row = self._code_to_row.get(code)
-                if row is None:
-                    self._code_to_row = {c: idx for idx, c in enumerate(self.universe.keys())}
-                    row = self._code_to_row.get(code)
-                if row is not None:
-                    self._update_row(row, code)
-        finally:
-            self.table.setUpdatesEnabled(True)
+        # 포맷팅은 뷰가 보이는 행을 다시 그릴 때 data()에서 지연 수행된다.
+        codes_to_update = list(self._dirty_codes)
+        self._dirty_codes.clear()
+        model.mark_dirty(codes_to_update)
     def _emergency_liquidate(self):
         """긴급 전체 청산."""
         if not self.is_connected:
@@ -108,22 +80,33 @@ class TradingSessionTableMixin(TraderMixinBase):
 
         if confirm == QMessageBox.StandardButton.Yes:
             self._set_trading_stopped_state()
-            self._cleanup_active_orders("emergency_liquidate")
-            holding_targets = self._collect_liquidation_targets()
-            self.log("긴급 전체 청산 시작")
-            liquidated_count = 0
-            for code, info in holding_targets:
-                held = info.get("held", 0)
-                if held > 0:
-                    name = info.get("name", code)
-                    current = info.get("current", 0)
-                    self.log(f"  - {name} {held}주 청산 중...")
-                    self._execute_sell(code, held, current, "긴급청산")
-                    liquidated_count += 1
-
-            if self.sound:
-                self.sound.play_warning()
-            if self.telegram:
-                self.telegram.send(f"긴급 전체 청산: {liquidated_count}개 종목")
-
-            self.log(f"긴급 청산 완료: {liquidated_count}개 종목")
+            # 미체결 정리는 이벤트 기반으로 끝난 뒤 청산한다 (UI 스레드 대기 없음).
+            done: List[bool] = []
+
+            def liquidate(_cleanup_result=None):
+                if not done:
+                    done.append(True)
+                    self._liquidate_all_holdings()
+
+            if not self._cleanup_active_orders_async("emergency_liquidate", on_done=liquidate) and not done:
+                self._cleanup_active_orders("emergency_liquidate")
+                liquidate()
+    def _liquidate_all_holdings(self):
+        holding_targets = self._collect_liquidation_targets()
+        self.log("긴급 전체 청산 시작")
+        liquidated_count = 0
+        for code, info in holding_targets:
+            held = info.get("held", 0)
+            if held > 0:
+                name = info.get("name", code)
+                current = info.get("current", 0)
+                self.log(f"  - {name} {held}주 청산 중...")
+                self._execute_sell(code, held, current, "긴급청산")
+                liquidated_count += 1
+
+        if self.sound:
+            self.sound.play_warning()
+        if self.telegram:
+            self.telegram.send(f"긴급 전체 청산: {liquidated_count}개 종목")
+
+        self.log(f"긴급 청산 완료: {liquidated_count}개 종목")
@@ -30,7 +30,7 @@ class UIBuildBacktestMixin(TraderMixinBase):
         if filename and hasattr(self, "input_backtest_bars_path"):
             self.input_backtest_bars_path.setText(filename)
     def _select_backtest_intel_file(self):
-        filename, _ = QFileDialog.getOpenFileName(self, "인텔리전스 JSONL 선택", "", "JSONL (*.jsonl);;JSON (*.json);;All Files (*)")
+        filename, _ = QFileDialog.getOpenFileName(self, "인텔리전스 이벤트 선택", "", "JSONL (*.jsonl);;SQLite (*.db *.sqlite *.sqlite3);;JSON (*.json);;All Files (*)")
         if filename and hasattr(self, "input_backtest_intel_path"):
             self.input_backtest_intel_path.setText(filename)
     def _backtest_config_values_from_ui(self):
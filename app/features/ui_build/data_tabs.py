@@ -6,6 +6,7 @@ import json
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import *
 
+from app.features.diagnostics.model import DiagnosticsTableModel
 from app.support.backtest_runner import backtest_result_to_dict, metric_rows, run_backtest_from_files
 from app.support.ui_text import (
     ASSET_SCOPE_CHOICES,
@@ -90,35 +91,9 @@ class UIBuildDataTabsMixin(TraderMixinBase):
         action_row.addStretch()
         layout.addLayout(action_row)
 
-        self.diagnostic_table = QTableWidget()
-        cols = [
-            "코드",
-            "종목명",
-            "대기 주문 방향",
-            "대기 주문 사유",
-            "대기 만료 시각",
-            "동기화 상태",
-            "재시도 횟수",
-            "마지막 동기화 오류",
-            "최근 갱신",
-            "외부 데이터 상태",
-            "외부 데이터 시각",
-            "외부 데이터 경과(초)",
-            "시장 상태",
-            "보호 사유",
-            "인텔리전스 소스 상태",
-            "자동매매 정책",
-            "수량 배수",
-            "청산 정책",
-            "마지막 이벤트 ID",
-            "시장 위험 모드",
-            "주문 안정성 모드",
-            "대기 주문 상태",
-            "미체결 수량",
-            "동기화 실패 사유",
-        ]
-        self.diagnostic_table.setColumnCount(len(cols))
-        self.diagnostic_table.setHorizontalHeaderLabels(cols)
+        self.diagnostic_table = QTableView()
+        self.diagnostic_model = DiagnosticsTableModel(self._diagnostic_row, self._diagnostic_volatile_cell, self)
+        self.diagnostic_table.setModel(self.diagnostic_model)
         diagnostic_header = self.diagnostic_table.horizontalHeader()
         diagnostic_vertical_header = self.diagnostic_table.verticalHeader()
         if diagnostic_header is not None:
@@ -126,7 +101,10 @@ class UIBuildDataTabsMixin(TraderMixinBase):
         if diagnostic_vertical_header is not None:
             diagnostic_vertical_header.setVisible(False)
         self.diagnostic_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.diagnostic_table.itemSelectionChanged.connect(self._on_diagnostic_selection_changed)
+        self.diagnostic_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        diagnostic_selection = self.diagnostic_table.selectionModel()
+        if diagnostic_selection is not None:
+            diagnostic_selection.selectionChanged.connect(lambda *_args: self._on_diagnostic_selection_changed())
         layout.addWidget(self.diagnostic_table)
 
         self.diag_detail_panel = QPlainTextEdit()
@@ -17,6 +17,8 @@ from app.support.ui_text import (
     STRATEGY_CHOICES,
     populate_combo,
 )
+from app.support.log_console import LOG_LEVEL_FILTERS
+from app.support.trading_table_model import TradingTableModel
 from app.support.worker import Worker
 from app.support.widgets import NoScrollComboBox, NoScrollDoubleSpinBox, NoScrollSpinBox
 from config import Config
@@ -203,10 +205,9 @@ class UIBuildLayoutMixin(TraderMixinBase):
         splitter.setHandleWidth(6)
 
         # 주식 테이블
-        self.table = QTableWidget()
-        cols = ["종목명", "현재가", "목표가", "상태", "보유", "매입가", "수익률", "최고수익", "투자금"]
-        self.table.setColumnCount(len(cols))
-        self.table.setHorizontalHeaderLabels(cols)
+        self.table = QTableView()
+        self.table_model = TradingTableModel(lambda: self.universe, self)
+        self.table.setModel(self.table_model)
         table_vertical_header = self.table.verticalHeader()
         table_horizontal_header = self.table.horizontalHeader()
         if table_vertical_header is not None:
@@ -218,10 +219,25 @@ class UIBuildLayoutMixin(TraderMixinBase):
         splitter.addWidget(self.table)
 
         # 로그 영역
-        self.log_text = QTextEdit()
+        log_panel = QWidget()
+        log_layout = QVBoxLayout(log_panel)
+        log_layout.setContentsMargins(0, 0, 0, 0)
+        log_layout.setSpacing(2)
+        log_filter_row = QHBoxLayout()
+        log_filter_row.addStretch()
+        log_filter_row.addWidget(QLabel("로그 필터:"))
+        self.combo_log_level = NoScrollComboBox()
+        self.combo_log_level.addItems(list(LOG_LEVEL_FILTERS.keys()))
+        self.combo_log_level.currentTextChanged.connect(self._set_log_level_filter)
+        log_filter_row.addWidget(self.combo_log_level)
+        log_layout.addLayout(log_filter_row)
+
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMinimumHeight(100)
-        splitter.addWidget(self.log_text)
+        self.log_text.setMaximumBlockCount(Config.MAX_LOG_LINES)
+        log_layout.addWidget(self.log_text)
+        splitter.addWidget(log_panel)
 
         # 초기 비율 설정 (대략 3:1)
         splitter.setSizes([600, 200])
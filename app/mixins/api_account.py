@@ -15,7 +15,7 @@ from PyQt6.QtWidgets import (
 )
 
 from api import KiwoomAuth, KiwoomRESTClient, KiwoomWebSocketClient
-from app.support.worker import Worker
+from app.support.worker import Worker, start_rest_call
 from config import Config
 from telegram_notifier import TelegramNotifier
 from ._typing import TraderMixinBase
@@ -109,6 +109,9 @@ class APIAccountMixin(TraderMixinBase):
         try:
             self.auth = payload["auth"]
             self.rest_client = payload["rest_client"]
+            sync_paper = getattr(self, "_sync_paper_broker", None)
+            if callable(sync_paper):
+                sync_paper()
             self.ws_client = payload["ws_client"]
 
             self.combo_acc.blockSignals(True)
@@ -198,7 +201,16 @@ class APIAccountMixin(TraderMixinBase):
                 self.ws_client.disconnect()
             except Exception:
                 pass
+        close_rest = getattr(self.rest_client, "close", None)
+        if callable(close_rest):
+            try:
+                close_rest()
+            except Exception:
+                pass
         self._stop_telegram_notifier()
+        close_journal = getattr(self, "_close_order_journal", None)
+        if callable(close_journal):
+            close_journal()
         self.is_connected = False
         self.auth = None
         self.rest_client = None
@@ -224,6 +236,9 @@ class APIAccountMixin(TraderMixinBase):
 
     def _on_account_changed(self, account):
         self.current_account = (account or "").strip()
+        recover_journal = getattr(self, "_recover_order_journal", None)
+        if callable(recover_journal) and self.current_account:
+            recover_journal(self.current_account)
         self._refresh_account_info_async(force=True)
 
     def _refresh_account_info_async(self, force: bool = False):
@@ -240,10 +255,13 @@ class APIAccountMixin(TraderMixinBase):
         self._account_refresh_pending = True
         self._last_account_refresh_ts = now_ts
 
-        worker = Worker(self.rest_client.get_account_info, account)
-        worker.signals.result.connect(lambda info, acc=account: self._on_account_info_result(acc, info))
-        worker.signals.error.connect(lambda error, acc=account: self._on_account_info_error(acc, error))
-        self.threadpool.start(worker)
+        start_rest_call(
+            self,
+            "get_account_info",
+            account,
+            on_result=lambda info, acc=account: self._on_account_info_result(acc, info),
+            on_error=lambda error, acc=account: self._on_account_info_error(acc, error),
+        )
 
     def _on_account_info_result(self, account: str, info):
         self._account_refresh_pending = False
@@ -326,6 +326,11 @@ class DialogsProfilesMixin(TraderMixinBase):
             if not bool(order.get("validated", False)):
                 self.log("❌ 수동 주문 차단: 검증을 통과하지 않은 요청입니다.")
                 return
+            client_mismatch = getattr(self, "_order_client_mismatch", None)
+            mismatch = client_mismatch() if callable(client_mismatch) else ""
+            if mismatch:
+                self.log(f"❌ 수동 주문 차단: {mismatch}")
+                return
 
             # 실제 주문 실행 (Worker 사용)
             code = order['code']
@@ -807,6 +812,9 @@ class DialogsProfilesMixin(TraderMixinBase):
             ):
                 if key in settings:
                     setattr(self.config, key, settings[key])
+            sync_paper = getattr(self, "_sync_paper_broker", None)
+            if "execution_mode" in settings and callable(sync_paper):
+                sync_paper()
         if 'schedule' in settings and isinstance(settings['schedule'], dict):
             self.schedule = settings['schedule']
         if settings.get('theme') in ('dark', 'light'):
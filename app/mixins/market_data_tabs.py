@@ -1,8 +1,10 @@
 """Market data tabs mixin for KiwoomProTrader."""
 
+from typing import Any, Tuple
+
 from PyQt6.QtWidgets import QPushButton, QTableWidgetItem
 
-from app.support.worker import Worker
+from app.support.worker import Worker, start_rest_call
 from ._typing import TraderMixinBase
 
 
@@ -150,8 +152,6 @@ class MarketDataTabsMixin(TraderMixinBase):
             btn.setEnabled(False)
             btn.setText("조회 중...")
 
-        worker = Worker(self.rest_client.get_condition_list)
-
         def on_complete(conditions):
             if btn:
                 btn.setEnabled(True)
@@ -167,9 +167,7 @@ class MarketDataTabsMixin(TraderMixinBase):
                 btn.setText("목록 갱신")
             self.log(f"조건식 조회 실패: {e}")
 
-        worker.signals.result.connect(on_complete)
-        worker.signals.error.connect(on_error)
-        self.threadpool.start(worker)
+        start_rest_call(self, "get_condition_list", on_result=on_complete, on_error=on_error)
 
     def _execute_condition(self):
         """조건검색 실행."""
@@ -186,8 +184,6 @@ class MarketDataTabsMixin(TraderMixinBase):
             btn.setEnabled(False)
             btn.setText("검색 중...")
 
-        worker = Worker(self.rest_client.search_by_condition, cond_data["index"], cond_data["name"])
-
         def on_complete(results):
             if btn:
                 btn.setEnabled(True)
@@ -216,6 +212,9 @@ class MarketDataTabsMixin(TraderMixinBase):
 
             self.condition_info.setText(f"{len(results)}개 종목 검색됨")
             self.log(f"조건검색 완료: {len(results)}개")
+            record_results = getattr(self, "_record_market_screen_results", None)
+            if callable(record_results):
+                record_results("condition", results)
             refresh_candidates = getattr(self, "_refresh_candidate_universe_state", None)
             if callable(refresh_candidates):
                 refresh_candidates()
@@ -226,9 +225,14 @@ class MarketDataTabsMixin(TraderMixinBase):
                 btn.setText("검색 실행")
             self.log(f"조건검색 실패: {e}")
 
-        worker.signals.result.connect(on_complete)
-        worker.signals.error.connect(on_error)
-        self.threadpool.start(worker)
+        start_rest_call(
+            self,
+            "search_by_condition",
+            cond_data["index"],
+            cond_data["name"],
+            on_result=on_complete,
+            on_error=on_error,
+        )
 
     def _apply_condition_result(self):
         """조건검색 결과를 감시 종목에 반영."""
@@ -258,12 +262,13 @@ class MarketDataTabsMixin(TraderMixinBase):
             btn.setEnabled(False)
             btn.setText("조회 중...")
 
+        call: Tuple[Any, ...]
         if "거래량" in ranking_type:
-            worker = Worker(self.rest_client.get_volume_ranking, market, 30)
+            call = ("get_volume_ranking", market, 30)
         elif "상승" in ranking_type:
-            worker = Worker(self.rest_client.get_fluctuation_ranking, market, "1", 30)
+            call = ("get_fluctuation_ranking", market, "1", 30)
         else:
-            worker = Worker(self.rest_client.get_fluctuation_ranking, market, "2", 30)
+            call = ("get_fluctuation_ranking", market, "2", 30)
 
         def on_complete(data):
             if btn:
@@ -293,6 +298,9 @@ class MarketDataTabsMixin(TraderMixinBase):
                 self.ranking_table.setUpdatesEnabled(True)
 
             self.log(f"{ranking_type} 조회 완료")
+            record_results = getattr(self, "_record_market_screen_results", None)
+            if callable(record_results):
+                record_results("ranking", data)
             refresh_candidates = getattr(self, "_refresh_candidate_universe_state", None)
             if callable(refresh_candidates):
                 refresh_candidates()
@@ -303,6 +311,4 @@ class MarketDataTabsMixin(TraderMixinBase):
                 btn.setText("순위 조회")
             self.log(f"순위 조회 실패: {e}")
 
-        worker.signals.result.connect(on_complete)
-        worker.signals.error.connect(on_error)
-        self.threadpool.start(worker)
+        start_rest_call(self, *call, on_result=on_complete, on_error=on_error)
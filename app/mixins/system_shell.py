@@ -6,11 +6,14 @@ import os
 import sys
 import winreg
 from pathlib import Path
+from typing import Dict, Tuple
 
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QAction, QIcon, QKeySequence, QShortcut, QTextCursor
+from PyQt6.QtGui import QAction, QColor, QFont, QIcon, QKeySequence, QShortcut, QTextCharFormat, QTextCursor
 from PyQt6.QtWidgets import QMenu, QMessageBox, QSystemTrayIcon
 
+from app.support.jsonl_writer import close_jsonl_writers
+from app.support.log_console import LOG_LEVEL_COLORS, LOG_LEVEL_FILTERS, LOG_TIMESTAMP_COLOR, LogBuffer, LogEntry
 from config import Config
 from dark_theme import DARK_STYLESHEET
 from light_theme import LIGHT_STYLESHEET
@@ -334,45 +337,115 @@ class SystemShellMixin(TraderMixinBase):
         self.sig_log.emit(msg)
         self.logger.info(msg)
 
+    def _log_buffer_safe(self) -> LogBuffer:
+        buffer = getattr(self, "_log_buffer", None)
+        if not isinstance(buffer, LogBuffer):
+            buffer = LogBuffer(
+                max_lines=int(Config.MAX_LOG_LINES),
+                dedup_sec=float(getattr(Config, "LOG_DEDUP_SEC", 30)),
+            )
+            self._log_buffer = buffer
+        return buffer
+
     def _append_log(self, msg):
-        timestamp = f"[{datetime.datetime.now():%H:%M:%S}]"
-
-        if "실패" in msg or "오류" in msg:
-            color = "#f85149"
-            badge_style = "color: #f85149; font-weight: bold;"
-            level_mark = "ERR"
-        elif "경고" in msg or "손실" in msg:
-            color = "#d29922"
-            badge_style = "color: #d29922; font-weight: bold;"
-            level_mark = "WRN"
-        elif "성공" in msg or "완료" in msg or "시작" in msg:
-            color = "#3fb950"
-            badge_style = "color: #3fb950; font-weight: bold;"
-            level_mark = "SUC"
-        else:
-            color = "#e6edf3"
-            badge_style = "color: #8b949e;"
-            level_mark = "INF"
-
-        html = f"""
-        <div style="margin-bottom: 2px;">
-            <span style="color: #8b949e; font-family: monospace;">{timestamp}</span>
-            <span style="{badge_style} margin-left: 4px; margin-right: 4px;">[{level_mark}]</span>
-            <span style="color: {color};">{msg}</span>
-        </div>
-        """
-
-        self.log_text.append(html)
-        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
-        if self.log_text.document().blockCount() > Config.MAX_LOG_LINES:
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            for _ in range(50):
-                cursor.movePosition(
-                    QTextCursor.MoveOperation.Down,
-                    QTextCursor.MoveMode.KeepAnchor,
-                )
+        """메시지를 링 버퍼에 적재하고 프레임 단위 일괄 출력을 예약한다."""
+        self._log_buffer_safe().push(str(msg))
+        timer = getattr(self, "_log_flush_timer", None)
+        if timer is None:
+            try:
+                timer = QTimer(self)
+            except TypeError:
+                timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(self._flush_log_buffer)
+            self._log_flush_timer = timer
+        if not timer.isActive():
+            timer.start(max(0, int(getattr(Config, "LOG_FLUSH_INTERVAL_MS", 50))))
+
+    def _log_char_formats(self) -> Tuple[QTextCharFormat, Dict[str, Tuple[QTextCharFormat, QTextCharFormat]]]:
+        """(타임스탬프 서식, 레벨별 (배지, 본문) 서식) - 최초 호출 시 한 번만 생성."""
+        formats = getattr(self, "_log_formats", None)
+        if formats is None:
+            stamp = QTextCharFormat()
+            stamp.setForeground(QColor(LOG_TIMESTAMP_COLOR))
+            levels: Dict[str, Tuple[QTextCharFormat, QTextCharFormat]] = {}
+            for level, color in LOG_LEVEL_COLORS.items():
+                badge = QTextCharFormat()
+                badge.setForeground(QColor(LOG_TIMESTAMP_COLOR if level == "INF" else color))
+                if level != "INF":
+                    badge.setFontWeight(QFont.Weight.Bold)
+                body = QTextCharFormat()
+                body.setForeground(QColor(color))
+                levels[level] = (badge, body)
+            formats = (stamp, levels)
+            self._log_formats = formats
+        return formats
+
+    def _insert_log_entry(self, cursor: QTextCursor, entry: LogEntry):
+        stamp_format, level_formats = self._log_char_formats()
+        badge_format, body_format = level_formats.get(entry.level, level_formats["INF"])
+        stamp, badge, body = entry.render()
+        cursor.insertText(stamp, stamp_format)
+        cursor.insertText(badge, badge_format)
+        cursor.insertText(body, body_format)
+
+    def _log_visible_levels(self):
+        return getattr(self, "_log_level_filter", LOG_LEVEL_FILTERS["전체"])
+
+    def _flush_log_buffer(self):
+        """버퍼된 로그를 한 번의 편집 블록으로 출력 (최대 줄 수는 위젯이 유지)."""
+        buffer = self._log_buffer_safe()
+        if not buffer.has_pending:
+            return
+        updated, entries = buffer.drain()
+        widget = getattr(self, "log_text", None)
+        if widget is None:
+            return
+        levels = self._log_visible_levels()
+        entries = [entry for entry in entries if entry.level in levels]
+        rewrite_last = updated is not None and updated.seq == getattr(self, "_log_last_rendered_seq", None)
+        if not entries and not rewrite_last:
+            return
+
+        scrollbar = widget.verticalScrollBar()
+        follow = scrollbar is None or scrollbar.value() >= scrollbar.maximum()
+        cursor = QTextCursor(widget.document())
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if rewrite_last and updated is not None:
+            cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock, QTextCursor.MoveMode.KeepAnchor)
             cursor.removeSelectedText()
+            self._insert_log_entry(cursor, updated)
+        for entry in entries:
+            if not widget.document().isEmpty():
+                cursor.insertBlock()
+            self._insert_log_entry(cursor, entry)
+            self._log_last_rendered_seq = entry.seq
+        cursor.endEditBlock()
+        if follow and scrollbar is not None:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _set_log_level_filter(self, label: str):
+        """레벨 필터 변경 시 링 버퍼 내용으로 콘솔을 다시 그린다."""
+        self._log_level_filter = LOG_LEVEL_FILTERS.get(str(label), LOG_LEVEL_FILTERS["전체"])
+        widget = getattr(self, "log_text", None)
+        if widget is None:
+            return
+        buffer = self._log_buffer_safe()
+        buffer.drain()
+        widget.clear()
+        self._log_last_rendered_seq = None
+        cursor = QTextCursor(widget.document())
+        cursor.beginEditBlock()
+        for index, entry in enumerate(buffer.visible(self._log_level_filter)):
+            if index:
+                cursor.insertBlock()
+            self._insert_log_entry(cursor, entry)
+            self._log_last_rendered_seq = entry.seq
+        cursor.endEditBlock()
+        scrollbar = widget.verticalScrollBar()
+        if scrollbar is not None:
+            scrollbar.setValue(scrollbar.maximum())
 
     def closeEvent(self, a0):
         if a0 is None:
@@ -410,6 +483,9 @@ class SystemShellMixin(TraderMixinBase):
         self._shutdown_in_progress = True
         try:
             self.stop_trading()
+            close_journal = getattr(self, "_close_order_journal", None)
+            if callable(close_journal):
+                close_journal()
 
             if self.telegram:
                 self.telegram.stop()
@@ -439,6 +515,19 @@ class SystemShellMixin(TraderMixinBase):
                     else:
                         self._save_trade_history()
 
+            close_jsonl_writers()
+            provider_http = getattr(self, "_provider_http", None)
+            if provider_http is not None:
+                provider_http.close()
+            close_intel_store = getattr(self, "_close_intel_store", None)
+            if callable(close_intel_store):
+                close_intel_store()
+            close_macro_store = getattr(self, "_close_macro_series_store", None)
+            if callable(close_macro_store):
+                close_macro_store()
+            save_tail_indexes = getattr(self, "_save_jsonl_tail_indexes", None)
+            if callable(save_tail_indexes):
+                save_tail_indexes()
             event.accept()
         finally:
             self._force_quit_requested = False
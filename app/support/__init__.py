@@ -1,11 +1,13 @@
 ﻿from .execution_policy import ExecutionPolicy
-from .worker import Worker, WorkerSignals
+from .worker import Worker, WorkerSignals, start_rest_call, watch_future
 from .widgets import NoScrollComboBox, NoScrollDoubleSpinBox, NoScrollSpinBox
 
 __all__ = [
     "ExecutionPolicy",
     "Worker",
     "WorkerSignals",
+    "start_rest_call",
+    "watch_future",
     "NoScrollComboBox",
     "NoScrollDoubleSpinBox",
     "NoScrollSpinBox",
@@ -0,0 +1,127 @@
+"""Coalescing queue and content-hash cache for AI summary requests."""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+
+def summary_content_key(code: str, headlines: Iterable[str], disclosures: Iterable[str]) -> str:
+    """Hash of the symbol plus its headline and disclosure *sets* (order and repeats ignored)."""
+    material = json.dumps(
+        [str(code), sorted({str(item) for item in headlines if item}), sorted({str(item) for item in disclosures if item})],
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(material.encode("utf-8")).hexdigest()
+
+
+class AISummaryScheduler:
+    """Pending AI summary requests per code plus a cache of finished answers.
+
+    Triggers within `window_ms` are collected and flushed as one batched
+    prompt of at most `max_batch` codes; a later trigger for a code that is
+    still pending replaces its prompt. Answers are cached under the content
+    key for `cache_ttl_sec`, so a code whose headline and disclosure set is
+    unchanged reuses the previous answer without a call. Only one batch is
+    in flight at a time; the owner flushes again when it completes.
+    """
+
+    def __init__(self, window_ms: int = 1500, max_batch: int = 8, cache_ttl_sec: float = 6 * 3600, cache_entries: int = 256):
+        self.window_ms = max(0, int(window_ms))
+        self.max_batch = max(1, int(max_batch))
+        self.cache_ttl_sec = max(0.0, float(cache_ttl_sec))
+        self.cache_entries = max(1, int(cache_entries))
+        self._pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self.flush_armed = False
+        self.in_flight: Dict[str, str] = {}
+        self.cache_hits = 0
+        self.batches = 0
+        self.batched_codes = 0
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+    def cached(self, key: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, summary = entry
+        now = time.time() if now is None else float(now)
+        if now - stored_at > self.cache_ttl_sec:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        self.cache_hits += 1
+        return dict(summary)
+
+    def store(self, key: str, summary: Mapping[str, Any], now: Optional[float] = None):
+        if not key:
+            return
+        self._cache[key] = (time.time() if now is None else float(now), dict(summary))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_entries:
+            self._cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Queue
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, code: str, key: str, prompt: str, reason: str = "", story_key: str = "") -> bool:
+        """Queue (or refresh) the request for `code`; False if the same content is already in flight."""
+        if key and self.in_flight.get(code) == key:
+            return False
+        self._pending[code] = {"code": code, "key": key, "prompt": prompt, "reason": reason, "story_key": story_key}
+        return True
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Take up to `max_batch` requests in trigger order and mark them in flight."""
+        batch: List[Dict[str, Any]] = []
+        while self._pending and len(batch) < self.max_batch:
+            _code, request = self._pending.popitem(last=False)
+            batch.append(request)
+        self.in_flight = {request["code"]: request["key"] for request in batch}
+        if batch:
+            self.batches += 1
+            self.batched_codes += len(batch)
+        return batch
+
+    def finish(self):
+        self.in_flight = {}
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "in_flight": len(self.in_flight),
+            "batches": self.batches,
+            "batched_codes": self.batched_codes,
+            "cache_hits": self.cache_hits,
+            "cache_entries": len(self._cache),
+        }
+
+
+def build_batch_prompt(requests: Sequence[Mapping[str, Any]]) -> str:
+    blocks = [f"[{idx}] 종목코드 {request['code']}\n{request['prompt']}" for idx, request in enumerate(requests, start=1)]
+    return (
+        f"아래 {len(requests)}개 종목을 각각 요약한다. "
+        'items 배열에 종목마다 {"code", "summary", "stance", "risk_tags", "confidence", "action_hint"} 객체를 하나씩 담는다.\n\n'
+        + "\n\n".join(blocks)
+    )
+
+
+def split_batch_result(payload: Any) -> Dict[str, Dict[str, Any]]:
+    """`{"items": [{"code": ...}, ...]}` -> {code: item}; a bare single object is accepted too."""
+    if isinstance(payload, dict) and isinstance(payload.get("items"), list):
+        items = payload["items"]
+    elif isinstance(payload, list):
+        items = payload
+    else:
+        items = [payload]
+    result: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        if isinstance(item, dict) and str(item.get("code", "") or "").strip():
+            result[str(item["code"]).strip()] = item
+    return result
@@ -9,6 +9,8 @@ from typing import Any, Callable, Dict, Iterable, List
 
 from backtest.engine import BacktestBar, BacktestConfig, BacktestResult, EventDrivenBacktestEngine, PositionState
 
+INTEL_STORE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
 
 def _first_value(row: Dict[str, Any], *keys: str) -> Any:
     lowered = {str(key).strip().lower(): value for key, value in row.items()}
@@ -63,6 +65,8 @@ def load_backtest_bars_csv(path: str | Path) -> List[BacktestBar]:
             high = _to_float(_first_value(row, "high", "고가"), max(open_price, close))
             low = _to_float(_first_value(row, "low", "저가"), min(open_price, close))
             volume = _to_float(_first_value(row, "volume", "거래량"), 0.0)
+            bid = _to_float(_first_value(row, "bid", "매수호가"), 0.0)
+            ask = _to_float(_first_value(row, "ask", "매도호가"), 0.0)
             if close <= 0:
                 continue
             bars.append(
@@ -74,6 +78,8 @@ def load_backtest_bars_csv(path: str | Path) -> List[BacktestBar]:
                     low=low,
                     close=close,
                     volume=volume,
+                    bid=bid,
+                    ask=ask,
                 )
             )
     return sorted(bars, key=lambda bar: (bar.ts, bar.symbol))
@@ -105,6 +111,10 @@ def build_backtest_config(values: Dict[str, Any] | None = None) -> BacktestConfi
         timeframe=str(values.get("timeframe", "1d") or "1d"),
         commission_bps=float(values.get("commission_bps", 5.0) or 5.0),
         slippage_bps=float(values.get("slippage_bps", 3.0) or 3.0),
+        fill_model=str(values.get("fill_model", "flat") or "flat"),
+        impact_coef=float(values.get("impact_coef", 1.0) or 1.0),
+        max_participation=float(values.get("max_participation", 0.1) or 0.1),
+        fill_latency_ms=float(values.get("fill_latency_ms", 0.0) or 0.0),
     )
 
 
@@ -122,7 +132,15 @@ def run_backtest_from_files(
     events = []
     if intelligence_path:
         event_path = Path(intelligence_path)
-        if event_path.exists():
+        if event_path.suffix.lower() in INTEL_STORE_SUFFIXES:
+            # 저장소는 백테스트 구간(마지막 바 당일까지)과 대상 종목만 범위 조회한다.
+            last_day = max(bar.ts for bar in bars).replace(hour=23, minute=59, second=59, microsecond=999999)
+            events = EventDrivenBacktestEngine.load_intelligence_events_sqlite(
+                event_path,
+                end=last_day,
+                symbols={bar.symbol for bar in bars},
+            )
+        else:
             events = EventDrivenBacktestEngine.load_intelligence_events_jsonl(event_path)
     engine = EventDrivenBacktestEngine(build_backtest_config(config_values))
     return engine.run(
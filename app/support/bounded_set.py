@@ -0,0 +1,51 @@
+"""Insertion-ordered set that keeps only the most recently added items."""
+
+from collections import OrderedDict
+from typing import Hashable, Iterable, Iterator, Optional
+
+
+class BoundedOrderedSet:
+    """Set semantics with insertion order; adding past `maxlen` drops the oldest item.
+
+    Re-adding an item that is already present leaves its position alone,
+    matching `dict.fromkeys(old + new)[-maxlen:]` without rebuilding a list
+    on every update.
+    """
+
+    def __init__(self, maxlen: int = 200, items: Optional[Iterable[Hashable]] = None):
+        self.maxlen = max(1, int(maxlen))
+        self._items: "OrderedDict[Hashable, None]" = OrderedDict()
+        if items:
+            self.update(items)
+
+    def add(self, item: Hashable) -> bool:
+        """True if `item` was new."""
+        if item in self._items:
+            return False
+        self._items[item] = None
+        if len(self._items) > self.maxlen:
+            self._items.popitem(last=False)
+        return True
+
+    def update(self, items: Iterable[Hashable]) -> int:
+        """Add `items` in order; returns how many were new."""
+        return sum(1 for item in items if self.add(item))
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BoundedOrderedSet):
+            return list(self._items) == list(other._items)
+        if isinstance(other, list):
+            return list(self._items) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BoundedOrderedSet({list(self._items)!r}, maxlen={self.maxlen})"
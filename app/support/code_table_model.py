@@ -0,0 +1,181 @@
+"""Shared table model for views keyed by stock code (one row per code)."""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+
+# (display texts, {column: foreground color})
+RowData = Tuple[Sequence[str], Dict[int, QColor]]
+CellData = Tuple[str, Optional[QColor]]
+
+
+def _runs(values: List[int]) -> Iterator[Tuple[int, int]]:
+    """Yield (first, last) for each run of consecutive integers in a sorted list."""
+    start = prev = values[0]
+    for value in values[1:]:
+        if value != prev + 1:
+            yield start, prev
+            start = value
+        prev = value
+    yield start, prev
+
+
+class CodeTableModel(QAbstractTableModel):
+    """Rows are formatted on demand by `row_builder(code)` and cached until marked dirty.
+
+    `mark_dirty()` emits one `dataChanged` per contiguous run of dirty rows, and
+    `mark_columns_dirty()` invalidates whole columns listed in
+    `volatile_columns` (e.g. ages) which are never cached and are re-read
+    through `cell_builder(code, column)` only for cells the view repaints.
+    """
+
+    volatile_columns: Set[int] = set()
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        row_builder: Callable[[str], Optional[RowData]],
+        cell_builder: Optional[Callable[[str, int], Optional[CellData]]] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self._row_builder = row_builder
+        self._cell_builder = cell_builder
+        self._codes: List[str] = []
+        self._row_by_code: Dict[str, int] = {}
+        self._row_cache: Dict[int, RowData] = {}
+        self.format_count = 0
+        self.range_emit_count = 0
+
+    # ------------------------------------------------------------------
+    # Qt model API
+    # ------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._codes)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self.columns):
+                return self.columns[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole):
+            return None
+        row, column = index.row(), index.column()
+        if column in self.volatile_columns:
+            code = self.code_at(row)
+            cell = self._cell_builder(code, column) if self._cell_builder is not None and code else None
+            if cell is None:
+                return None
+            return cell[0] if role == Qt.ItemDataRole.DisplayRole else cell[1]
+        row_data = self._row(row)
+        if row_data is None:
+            return None
+        texts, colors = row_data
+        if role == Qt.ItemDataRole.DisplayRole:
+            return texts[column] if column < len(texts) else None
+        return colors.get(column)
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+    def _row(self, row: int) -> Optional[RowData]:
+        cached = self._row_cache.get(row)
+        if cached is not None:
+            return cached
+        if not 0 <= row < len(self._codes):
+            return None
+        cached = self._row_builder(self._codes[row])
+        if cached is None:
+            return None
+        self._row_cache[row] = cached
+        self.format_count += 1
+        return cached
+
+    def text(self, row: int, column: int) -> str:
+        value = self.data(self.index(row, column))
+        return "" if value is None else str(value)
+
+    def code_at(self, row: int) -> str:
+        return self._codes[row] if 0 <= row < len(self._codes) else ""
+
+    def row_of(self, code: str) -> Optional[int]:
+        return self._row_by_code.get(code)
+
+    @property
+    def codes(self) -> List[str]:
+        return self._codes
+
+    @property
+    def row_map(self) -> Dict[str, int]:
+        return self._row_by_code
+
+    def set_codes(self, codes: Iterable[str]):
+        """Replace the row order."""
+        self.beginResetModel()
+        self._codes = list(codes)
+        self._row_by_code = {code: idx for idx, code in enumerate(self._codes)}
+        self._row_cache.clear()
+        self.endResetModel()
+
+    def follow_codes(self, codes: Sequence[str]) -> bool:
+        """Adopt `codes` as the row order; a pure append becomes an insert. Returns True on change."""
+        codes = list(codes)
+        if codes == self._codes:
+            return False
+        prefix = len(self._codes)
+        if len(codes) > prefix and codes[:prefix] == self._codes:
+            self.beginInsertRows(QModelIndex(), prefix, len(codes) - 1)
+            for idx in range(prefix, len(codes)):
+                self._row_by_code[codes[idx]] = idx
+            self._codes = codes
+            self.endInsertRows()
+        else:
+            self.set_codes(codes)
+        return True
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+    def mark_dirty(self, codes: Iterable[str]) -> int:
+        """Invalidate the given codes and emit `dataChanged` per contiguous row range."""
+        rows = sorted({self._row_by_code[code] for code in codes if code in self._row_by_code})
+        if not rows:
+            return 0
+        for row in rows:
+            self._row_cache.pop(row, None)
+        last_col = len(self.columns) - 1
+        for start, end in _runs(rows):
+            self.dataChanged.emit(self.index(start, 0), self.index(end, last_col))
+            self.range_emit_count += 1
+        return len(rows)
+
+    def mark_all_dirty(self) -> int:
+        if not self._codes:
+            return 0
+        self._row_cache.clear()
+        self.dataChanged.emit(self.index(0, 0), self.index(len(self._codes) - 1, len(self.columns) - 1))
+        self.range_emit_count += 1
+        return len(self._codes)
+
+    def mark_columns_dirty(self, columns: Iterable[int]) -> int:
+        """Repaint volatile columns only; cached rows stay valid."""
+        cols = sorted(col for col in columns if col in self.volatile_columns)
+        if not cols or not self._codes:
+            return 0
+        last_row = len(self._codes) - 1
+        for start, end in _runs(cols):
+            self.dataChanged.emit(self.index(0, start), self.index(last_row, end))
+            self.range_emit_count += 1
+        return len(cols)
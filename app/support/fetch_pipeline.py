@@ -0,0 +1,85 @@
+"""Per-provider concurrent fetch pipeline with rate limits and a shared deadline."""
+
+import concurrent.futures
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional
+
+
+class DeadlineExceeded(Exception):
+    """The pipeline deadline passed before the call could start."""
+
+
+class RateLimiter:
+    """Thread-safe token bucket: `rate_per_sec` sustained, `burst` tokens at most."""
+
+    def __init__(self, rate_per_sec: float, burst: int = 1):
+        self.rate_per_sec = max(0.0, float(rate_per_sec))
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """Take one token, sleeping as needed; False if `deadline` (monotonic) would pass first."""
+        if self.rate_per_sec <= 0:
+            return True
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                wait = (1.0 - self._tokens) / self.rate_per_sec
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class FetchPipeline:
+    """One bounded thread pool and rate limiter per provider.
+
+    `limits` maps a provider name to `{"concurrency": int, "rate_per_sec":
+    float}`. Calls still queued or waiting for a token when the deadline
+    passes fail with `DeadlineExceeded` so the caller can deliver whatever
+    finished in time.
+    """
+
+    def __init__(self, limits: Mapping[str, Mapping[str, Any]], deadline_sec: float):
+        self.deadline = time.monotonic() + max(0.0, float(deadline_sec))
+        self._executors: Dict[str, concurrent.futures.ThreadPoolExecutor] = {}
+        self._limiters: Dict[str, RateLimiter] = {}
+        for name, spec in limits.items():
+            concurrency = max(1, int(spec.get("concurrency", 1) or 1))
+            self._executors[name] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix=f"intel-{name}"
+            )
+            self._limiters[name] = RateLimiter(float(spec.get("rate_per_sec", 0.0) or 0.0), burst=concurrency)
+        self.submitted = 0
+        self.expired = 0
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired_now(self) -> bool:
+        return time.monotonic() >= self.deadline
+
+    def submit(self, provider: str, fn: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+        executor = self._executors[provider]
+        limiter = self._limiters[provider]
+
+        def _call():
+            if self.expired_now() or not limiter.acquire(self.deadline):
+                self.expired += 1
+                raise DeadlineExceeded(provider)
+            return fn(*args)
+
+        self.submitted += 1
+        return executor.submit(_call)
+
+    def shutdown(self):
+        """Drop queued calls; calls already on the wire finish in the background."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
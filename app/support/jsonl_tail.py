@@ -0,0 +1,323 @@
+"""Incremental tail reader with a byte-offset sidecar index for JSONL logs."""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.support.jsonl_writer import jsonl_segment_paths
+
+INDEX_VERSION = 2
+BLOCK_SIZE = 64 * 1024
+
+
+def _parse(line: bytes) -> Optional[Dict[str, Any]]:
+    text = line.strip()
+    if not text:
+        return None
+    try:
+        record = json.loads(text.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _hour_key(record: Dict[str, Any]) -> str:
+    return str(record.get("ts", "") or "")[:13]
+
+
+class JsonlTailReader:
+    """Keeps the last N records of an append-only JSONL file in memory.
+
+    The first read seeks backwards from EOF in `BLOCK_SIZE` blocks; later
+    reads parse only the bytes appended since the last offset. A truncated,
+    replaced or rotated file (smaller size or different inode) resets the
+    reader. When the active file holds fewer than `limit` records (right
+    after a rotation), the tail is topped up from the newest rotated .gz
+    segments; segments never change, so each one is decompressed once.
+
+    The sidecar `<file>.idx.json` maps each hour (`ts[:13]`) to the byte span
+    from its first line to the end of its last line, and each symbol to the
+    hours it appears in, so `symbol_records()` only reads the hour spans that
+    contain the symbol. The first scan of a large file can run on a
+    background thread via `build_index_async()`.
+    """
+
+    def __init__(self, path: str, index_path: Optional[str] = None, *, index_save_interval_sec: float = 5.0):
+        self.path = Path(path)
+        self.index_path = Path(index_path) if index_path else self.path.with_name(f"{self.path.name}.idx.json")
+        self.index_save_interval_sec = max(0.0, float(index_save_interval_sec))
+        self.logger = logging.getLogger("JsonlTailReader")
+
+        self._tail: Deque[Dict[str, Any]] = deque(maxlen=1)
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_dirty = False
+        self._index_saved_at = 0.0
+        self._index_lock = threading.RLock()
+        self._index_thread: Optional[threading.Thread] = None
+
+        self._segment_tails: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
+        self.bytes_read = 0
+        self.full_reads = 0
+
+    # ------------------------------------------------------------------
+    # Tail
+    # ------------------------------------------------------------------
+    def _stat(self) -> Optional[os.stat_result]:
+        try:
+            return os.stat(self.path)
+        except OSError:
+            return None
+
+    def _reset(self, inode: Optional[int]):
+        self._tail = deque(maxlen=self._tail.maxlen)
+        self._offset = 0
+        self._inode = inode
+
+    def records(self, limit: int = 200) -> List[Dict[str, Any]]:
+        """Last `limit` records in file order."""
+        limit = max(1, int(limit))
+        stat = self._stat()
+        if stat is None:
+            self._reset(None)
+            return self._segment_records(limit)
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._reset(stat.st_ino)
+        if self._offset == 0 or limit > (self._tail.maxlen or 0):
+            self._load_tail(limit, stat.st_size)
+        elif stat.st_size > self._offset:
+            parsed, self._offset = self._read_range(self._offset, stat.st_size)
+            self._tail.extend(record for _offset, record in parsed)
+        tail = list(self._tail)
+        if len(tail) < limit:
+            tail = self._segment_records(limit - len(tail)) + tail
+        return tail[-limit:]
+
+    def _segment_records(self, limit: int) -> List[Dict[str, Any]]:
+        """Up to `limit` most recent records from the rotated segments, in file order."""
+        collected: List[Dict[str, Any]] = []
+        segments = jsonl_segment_paths(self.path)
+        for segment in reversed(segments):
+            key = str(segment)
+            read_limit, cached = self._segment_tails.get(key, (0, []))
+            if read_limit < limit:
+                cached = self._read_segment_tail(segment, limit)
+                self._segment_tails[key] = (limit, cached)
+            collected = cached[-(limit - len(collected)):] + collected
+            if len(collected) >= limit:
+                break
+        live = {str(segment) for segment in segments}
+        for key in [key for key in self._segment_tails if key not in live]:
+            del self._segment_tails[key]
+        return collected
+
+    def _read_segment_tail(self, segment: Path, limit: int) -> List[Dict[str, Any]]:
+        tail: Deque[Dict[str, Any]] = deque(maxlen=max(1, limit))
+        try:
+            with gzip.open(segment, "rb") as handle:
+                for line in handle:
+                    record = _parse(line)
+                    if record is not None:
+                        tail.append(record)
+        except (OSError, EOFError) as exc:
+            self.logger.warning(f"jsonl segment read failed ({segment.name}): {exc}")
+        return list(tail)
+
+    def _load_tail(self, limit: int, size: int):
+        """Collect the last `limit` complete lines by reading whole blocks backwards from EOF."""
+        self.full_reads += 1
+        chunks: List[bytes] = []
+        newlines = 0
+        position = size
+        try:
+            with open(self.path, "rb") as handle:
+                while position > 0 and newlines <= limit:
+                    step = min(BLOCK_SIZE, position)
+                    position -= step
+                    handle.seek(position)
+                    chunk = handle.read(step)
+                    self.bytes_read += len(chunk)
+                    newlines += chunk.count(b"\n")
+                    chunks.append(chunk)
+        except OSError as exc:
+            self.logger.warning(f"jsonl tail read failed ({self.path.name}): {exc}")
+            return
+        data = b"".join(reversed(chunks))
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].split(b"\n")
+        if position > 0 and lines:
+            # 블록 경계에서 잘린 첫 줄은 버린다.
+            lines = lines[1:]
+        tail: Deque[Dict[str, Any]] = deque(maxlen=max(limit, self._tail.maxlen or 1))
+        for line in lines:
+            record = _parse(line)
+            if record is not None:
+                tail.append(record)
+        self._tail = tail
+        self._offset = position + end
+
+    def _read_range(self, start: int, stop: int) -> Tuple[List[Tuple[int, Dict[str, Any]]], int]:
+        """Parse complete lines in [start, stop); returns (offset, record) pairs and the end offset."""
+        try:
+            with open(self.path, "rb") as handle:
+                handle.seek(start)
+                data = handle.read(max(0, stop - start))
+        except OSError as exc:
+            self.logger.warning(f"jsonl tail read failed ({self.path.name}): {exc}")
+            return [], start
+        self.bytes_read += len(data)
+        end = data.rfind(b"\n") + 1
+        parsed: List[Tuple[int, Dict[str, Any]]] = []
+        offset = start
+        for line in data[:end].split(b"\n")[:-1]:
+            record = _parse(line)
+            if record is not None:
+                parsed.append((offset, record))
+            offset += len(line) + 1
+        return parsed, start + end
+
+    # ------------------------------------------------------------------
+    # Sidecar index
+    # ------------------------------------------------------------------
+    def _empty_index(self, inode: Optional[int]) -> Dict[str, Any]:
+        return {"version": INDEX_VERSION, "inode": inode, "offset": 0, "hours": {}, "symbols": {}}
+
+    def _load_index(self, inode: Optional[int]) -> Dict[str, Any]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as handle:
+                index = json.load(handle)
+        except (OSError, ValueError):
+            return self._empty_index(inode)
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION or index.get("inode") != inode:
+            return self._empty_index(inode)
+        return index
+
+    def update_index(self) -> Dict[str, Any]:
+        """Index lines appended since the last update (a full scan only happens once per file)."""
+        with self._index_lock:
+            stat = self._stat()
+            inode = stat.st_ino if stat is not None else None
+            if self._index is None or self._index.get("inode") != inode:
+                self._index = self._load_index(inode)
+            index = self._index
+            size = stat.st_size if stat is not None else 0
+            if size < int(index.get("offset", 0)):
+                index = self._index = self._empty_index(inode)
+            start = int(index.get("offset", 0))
+            if size > start:
+                hours: Dict[str, List[int]] = index["hours"]
+                symbols: Dict[str, List[str]] = index["symbols"]
+                for offset, end, record in self._scan(start, size, index):
+                    hour = _hour_key(record)
+                    if not hour:
+                        continue
+                    # 시각이 뒤섞여 기록돼도 빠지지 않도록 시간대별 [최소 시작, 최대 끝] 구간을 둔다.
+                    span = hours.get(hour)
+                    if span is None:
+                        hours[hour] = [offset, end]
+                    else:
+                        span[0] = min(span[0], offset)
+                        span[1] = max(span[1], end)
+                    symbol = str(record.get("symbol", "") or "")
+                    if symbol:
+                        seen = symbols.setdefault(symbol, [])
+                        if not seen or seen[-1] != hour:
+                            seen.append(hour)
+                self._index_dirty = True
+            self._maybe_save_index()
+            return index
+
+    def index_ready(self) -> bool:
+        """True once an index is loaded and no background build is running."""
+        thread = self._index_thread
+        return self._index is not None and (thread is None or not thread.is_alive())
+
+    def build_index_async(self) -> None:
+        """Load or scan the index on a background thread (at most one at a time)."""
+        thread = self._index_thread
+        if thread is not None and thread.is_alive():
+            return
+        thread = threading.Thread(target=self.update_index, name=f"JsonlIndex[{self.path.name}]", daemon=True)
+        self._index_thread = thread
+        thread.start()
+
+    def _scan(self, start: int, stop: int, index: Dict[str, Any]):
+        """Yield (offset, end, record) over [start, stop) block by block, tracking the indexed offset."""
+        try:
+            with open(self.path, "rb") as handle:
+                handle.seek(start)
+                offset = start
+                carry = b""
+                while offset + len(carry) < stop:
+                    chunk = handle.read(min(BLOCK_SIZE * 16, stop - offset - len(carry)))
+                    if not chunk:
+                        break
+                    self.bytes_read += len(chunk)
+                    data = carry + chunk
+                    end = data.rfind(b"\n") + 1
+                    carry = data[end:]
+                    for line in data[:end].split(b"\n")[:-1]:
+                        record = _parse(line)
+                        if record is not None:
+                            yield offset, offset + len(line) + 1, record
+                        offset += len(line) + 1
+                    index["offset"] = offset
+        except OSError as exc:
+            self.logger.warning(f"jsonl index scan failed ({self.path.name}): {exc}")
+
+    def _maybe_save_index(self, force: bool = False):
+        if not self._index_dirty or self._index is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._index_saved_at < self.index_save_interval_sec:
+            return
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(self._index, handle, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as exc:
+            self.logger.warning(f"jsonl index save failed ({self.index_path.name}): {exc}")
+            return
+        self._index_dirty = False
+        self._index_saved_at = now
+
+    def save_index(self):
+        # 백그라운드 색인 중이면 건너뛴다 (다음 저장 때 반영).
+        if not self._index_lock.acquire(blocking=False):
+            return
+        try:
+            self._maybe_save_index(force=True)
+        finally:
+            self._index_lock.release()
+
+    def hour_ranges(self, hours: List[str]) -> List[Tuple[int, int]]:
+        """Byte spans of the given hours (newest first) according to the index."""
+        index = self._index or self.update_index()
+        spans = index["hours"]
+        return [(int(spans[hour][0]), int(spans[hour][1])) for hour in sorted(set(hours), reverse=True) if hour in spans]
+
+    def symbol_records(self, symbol: str, limit: int = 200) -> List[Dict[str, Any]]:
+        """Last `limit` records of `symbol`, reading only the hours that contain it."""
+        index = self.update_index()
+        hours = index["symbols"].get(str(symbol or ""), [])
+        # 시간대 구간은 겹칠 수 있으니 줄 오프셋으로 중복을 걸러 파일 순서로 모은다.
+        matched: Dict[int, Dict[str, Any]] = {}
+        for start, stop in self.hour_ranges(hours):
+            parsed, _end = self._read_range(start, stop)
+            matched.update((offset, record) for offset, record in parsed if record.get("symbol") == symbol)
+            if len(matched) >= limit:
+                break
+        collected = [matched[offset] for offset in sorted(matched)]
+        return collected[-max(1, int(limit)):]
+
+    def has_symbol(self, symbol: str) -> bool:
+        return str(symbol or "") in self.update_index()["symbols"]
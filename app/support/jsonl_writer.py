@@ -0,0 +1,366 @@
+"""Buffered background writer for append-only JSONL event logs."""
+
+import datetime
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+FSYNC_POLICIES = ("never", "interval", "batch")
+
+_STOP = object()
+
+
+def jsonl_segment_paths(path: Any) -> List[Path]:
+    """Rotated gzip segments of the JSONL log at `path`, oldest first."""
+    path = Path(path)
+    return sorted(path.parent.glob(f"{path.stem}.*{path.suffix}.gz"))
+
+
+def jsonl_writer_options(config: Any) -> Dict[str, Any]:
+    """Writer keyword arguments read from `Config`-style `EVENT_LOG_*` attributes."""
+    return {
+        "max_queue": int(getattr(config, "EVENT_LOG_QUEUE_MAX", 20000)),
+        "batch_lines": int(getattr(config, "EVENT_LOG_BATCH_LINES", 256)),
+        "flush_interval_sec": float(getattr(config, "EVENT_LOG_FLUSH_INTERVAL_MS", 200)) / 1000.0,
+        "fsync": str(getattr(config, "EVENT_LOG_FSYNC", "interval")),
+        "fsync_interval_sec": float(getattr(config, "EVENT_LOG_FSYNC_INTERVAL_SEC", 1.0)),
+        "rotate_bytes": int(getattr(config, "EVENT_LOG_ROTATE_BYTES", 64 * 1024 * 1024)),
+        "keep_segments": int(getattr(config, "EVENT_LOG_ROTATE_KEEP", 20)),
+        "block_timeout_sec": float(getattr(config, "EVENT_LOG_BLOCK_TIMEOUT_MS", 20)) / 1000.0,
+    }
+
+
+class JsonlWriter:
+    """One background thread per file; callers only serialize and enqueue.
+
+    Lines are written in batches once `batch_lines` accumulate or
+    `flush_interval_sec` passes after the first buffered line. `fsync` is
+    `"never"`, `"interval"` (at most every `fsync_interval_sec`) or `"batch"`
+    (after every batch write). When the active file reaches `rotate_bytes` it
+    is renamed to a timestamped segment and gzipped; only `keep_segments`
+    compressed segments are kept. A full queue blocks the caller for at most
+    `block_timeout_sec` and then drops the line. `on_batch`, if given, also
+    receives every written batch of lines on the writer thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_queue: int = 20000,
+        batch_lines: int = 256,
+        flush_interval_sec: float = 0.2,
+        fsync: str = "interval",
+        fsync_interval_sec: float = 1.0,
+        rotate_bytes: int = 64 * 1024 * 1024,
+        keep_segments: int = 20,
+        block_timeout_sec: float = 0.02,
+        on_batch: Optional[Callable[[List[str]], Any]] = None,
+    ):
+        self.path = Path(path)
+        self.batch_lines = max(1, int(batch_lines))
+        self.flush_interval_sec = max(0.001, float(flush_interval_sec))
+        self.fsync = fsync if fsync in FSYNC_POLICIES else "interval"
+        self.fsync_interval_sec = max(0.0, float(fsync_interval_sec))
+        self.rotate_bytes = max(0, int(rotate_bytes))
+        self.keep_segments = max(0, int(keep_segments))
+        self.block_timeout_sec = max(0.0, float(block_timeout_sec))
+        self.on_batch = on_batch
+        self.logger = logging.getLogger("JsonlWriter")
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._fh: Any = None
+        self._size = 0
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+        self._closed = False
+
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.batches = 0
+        self.fsync_count = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.sink_errors = 0
+        self.max_queue_depth = 0
+
+        self._thread = threading.Thread(target=self._run, name=f"JsonlWriter[{self.path.name}]", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Caller side
+    # ------------------------------------------------------------------
+    def append(self, record: Dict[str, Any]) -> bool:
+        """Serialize and enqueue one record; returns False if it was dropped."""
+        return self.append_line(json.dumps(record, ensure_ascii=False, default=str))
+
+    def append_line(self, line: str) -> bool:
+        if self._closed:
+            self.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            if self.block_timeout_sec <= 0:
+                self.dropped += 1
+                return False
+            self.blocked += 1
+            try:
+                self._queue.put(line, timeout=self.block_timeout_sec)
+            except queue.Full:
+                self.dropped += 1
+                return False
+        self.enqueued += 1
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        return True
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Block until every line enqueued so far is written; False on timeout."""
+        if self._closed or not self._thread.is_alive():
+            return not self._closed
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def attach_sink(
+        self, on_batch: Optional[Callable[[List[str]], Any]], timeout: float = 10.0
+    ) -> Optional[Tuple[int, List[Path]]]:
+        """Install `on_batch` between two batches on the writer thread.
+
+        Returns the active file size and the rotated segments at that point:
+        every line up to that size was written without the sink and every later
+        line goes through it, so a reader of that range sees each line once.
+        None on timeout.
+        """
+        snapshot: List[Tuple[int, List[Path]]] = []
+        done = threading.Event()
+
+        def _attach():
+            self.on_batch = on_batch
+            if self._fh is not None:
+                size = self._size
+            else:
+                try:
+                    size = os.path.getsize(self.path)
+                except OSError:
+                    size = 0
+            snapshot.append((size, self.segment_paths()))
+            done.set()
+
+        if self._closed or not self._thread.is_alive():
+            _attach()
+            return snapshot[0]
+        try:
+            self._queue.put(_attach, timeout=timeout)
+        except queue.Full:
+            return None
+        return snapshot[0] if done.wait(timeout) else None
+
+    def close(self, timeout: float = 5.0) -> bool:
+        if self._closed:
+            return True
+        self._closed = True
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return False
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "blocked": self.blocked,
+            "batches": self.batches,
+            "fsync_count": self.fsync_count,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+            "sink_errors": self.sink_errors,
+        }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+    def _run(self):
+        pending: List[str] = []
+        waiters: List[threading.Event] = []
+        deadline: Optional[float] = None
+        stop = False
+        while not stop:
+            now = time.monotonic()
+            timeout = self.flush_interval_sec if deadline is None else max(0.0, deadline - now)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                stop = True
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+            elif callable(item):
+                item()
+            elif item is not None:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval_sec
+            due = deadline is not None and time.monotonic() >= deadline
+            if pending and (stop or waiters or due or len(pending) >= self.batch_lines):
+                self._write_batch(pending)
+                pending = []
+                deadline = None
+            if self._unsynced and self.fsync == "interval" and (
+                stop or waiters or time.monotonic() - self._last_fsync >= self.fsync_interval_sec
+            ):
+                self._fsync()
+            for waiter in waiters:
+                waiter.set()
+            waiters.clear()
+        self._close_handle()
+
+    def _handle(self):
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+            self._size = self._fh.tell()
+        return self._fh
+
+    def _write_batch(self, lines: List[str]):
+        data = "\n".join(lines) + "\n"
+        try:
+            handle = self._handle()
+            handle.write(data)
+            handle.flush()
+        except OSError as exc:
+            self.write_errors += 1
+            self.dropped += len(lines)
+            self.logger.warning(f"jsonl write failed ({self.path.name}): {exc}")
+            self._close_handle()
+            return
+        self._size += len(data.encode("utf-8"))
+        self.written += len(lines)
+        self.batches += 1
+        self._unsynced = True
+        if self.fsync == "batch":
+            self._fsync()
+        if self.on_batch is not None:
+            try:
+                self.on_batch(lines)
+            except Exception as exc:
+                self.sink_errors += 1
+                self.logger.warning(f"jsonl batch sink failed ({self.path.name}): {exc}")
+        if self.rotate_bytes and self._size >= self.rotate_bytes:
+            self._rotate()
+
+    def _fsync(self):
+        if self._fh is None:
+            return
+        try:
+            os.fsync(self._fh.fileno())
+            self.fsync_count += 1
+        except OSError as exc:
+            self.logger.warning(f"jsonl fsync failed ({self.path.name}): {exc}")
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+
+    def _close_handle(self):
+        if self._fh is None:
+            return
+        try:
+            if self._unsynced and self.fsync != "never":
+                self._fsync()
+            self._fh.close()
+        except OSError:
+            pass
+        self._fh = None
+
+    def segment_paths(self) -> List[Path]:
+        """Rotated gzip segments, oldest first."""
+        return jsonl_segment_paths(self.path)
+
+    def _rotate(self):
+        self._close_handle()
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        segment = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        try:
+            os.replace(self.path, segment)
+            with open(segment, "rb") as src, gzip.open(f"{segment}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(segment)
+        except OSError as exc:
+            self.write_errors += 1
+            self.logger.warning(f"jsonl rotation failed ({self.path.name}): {exc}")
+            return
+        self.rotations += 1
+        self._size = 0
+        if self.keep_segments:
+            for old in self.segment_paths()[: -self.keep_segments]:
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+
+
+_writers: Dict[str, JsonlWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _key(path: Any) -> str:
+    return os.path.abspath(os.path.expanduser(str(path)))
+
+
+def get_jsonl_writer(path: Any, **options: Any) -> JsonlWriter:
+    """Process-wide writer for `path`; `options` only apply when it is first created."""
+    key = _key(path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None or writer._closed:
+            writer = JsonlWriter(key, **options)
+            _writers[key] = writer
+        return writer
+
+
+def flush_jsonl_writers(paths: Optional[Iterable[Any]] = None, timeout: float = 2.0) -> bool:
+    """Flush the writers for `paths` (all writers when None); False if any timed out."""
+    with _writers_lock:
+        if paths is None:
+            writers = list(_writers.values())
+        else:
+            writers = [_writers[k] for k in (_key(p) for p in paths if p) if k in _writers]
+    ok = True
+    for writer in writers:
+        ok = writer.flush(timeout) and ok
+    return ok
+
+
+def close_jsonl_writers(timeout: float = 5.0) -> bool:
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    ok = True
+    for writer in writers:
+        ok = writer.close(timeout) and ok
+    return ok
+
+
+def jsonl_writer_metrics() -> List[Dict[str, Any]]:
+    with _writers_lock:
+        return [writer.metrics() for writer in _writers.values()]
@@ -0,0 +1,95 @@
+"""Compiled multi-keyword matcher (Aho-Corasick) for headline and disclosure scanning."""
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Mapping, NamedTuple, Tuple
+
+
+class KeywordHit(NamedTuple):
+    start: int
+    end: int
+    keyword: str
+    categories: Tuple[str, ...]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"keyword": self.keyword, "categories": list(self.categories), "start": self.start, "end": self.end}
+
+
+class KeywordMatcher:
+    """Case-insensitive matcher over `{category: keywords}` built once.
+
+    `find()` walks the text a single time and reports every occurrence
+    (overlaps included) with its span in the original text, so scan cost
+    depends on the text length and the number of hits, not on how many
+    keywords are registered. A keyword listed under several categories is
+    reported once with all of them.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        owners: Dict[str, List[str]] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords or ():
+                key = str(keyword or "").strip().lower()
+                if not key:
+                    continue
+                bucket = owners.setdefault(key, [])
+                if category not in bucket:
+                    bucket.append(str(category))
+        self.keywords: Tuple[str, ...] = tuple(owners)
+        self._categories: Tuple[Tuple[str, ...], ...] = tuple(tuple(owners[key]) for key in self.keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for idx, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(idx)
+        self._link()
+
+    def _link(self):
+        queue: Deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                self._out[nxt].extend(self._out[self._fail[nxt]])
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> List[KeywordHit]:
+        """All keyword occurrences in `text`, ordered by end position."""
+        hits: List[KeywordHit] = []
+        if not text or not self.keywords:
+            return hits
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for pos, ch in enumerate(str(text).lower()):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                keyword = self.keywords[idx]
+                hits.append(KeywordHit(pos + 1 - len(keyword), pos + 1, keyword, self._categories[idx]))
+        return hits
+
+    def categories(self, text: str) -> Dict[str, List[str]]:
+        """Distinct matched keywords per category, in order of first occurrence."""
+        grouped: Dict[str, List[str]] = {}
+        for hit in self.find(text):
+            for category in hit.categories:
+                bucket = grouped.setdefault(category, [])
+                if hit.keyword not in bucket:
+                    bucket.append(hit.keyword)
+        return grouped
@@ -0,0 +1,113 @@
+"""Bounded log buffer behind the in-app log console."""
+
+import datetime
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+
+LOG_LEVEL_COLORS: Dict[str, str] = {
+    "ERR": "#f85149",
+    "WRN": "#d29922",
+    "SUC": "#3fb950",
+    "INF": "#e6edf3",
+}
+LOG_TIMESTAMP_COLOR = "#8b949e"
+
+# 콤보박스 라벨 -> 표시할 레벨
+LOG_LEVEL_FILTERS: Dict[str, Tuple[str, ...]] = {
+    "전체": ("INF", "SUC", "WRN", "ERR"),
+    "성공/경고/오류": ("SUC", "WRN", "ERR"),
+    "경고/오류": ("WRN", "ERR"),
+    "오류": ("ERR",),
+}
+
+
+def classify_log_level(msg: str) -> str:
+    if "실패" in msg or "오류" in msg:
+        return "ERR"
+    if "경고" in msg or "손실" in msg:
+        return "WRN"
+    if "성공" in msg or "완료" in msg or "시작" in msg:
+        return "SUC"
+    return "INF"
+
+
+@dataclass
+class LogEntry:
+    seq: int
+    ts: datetime.datetime
+    level: str
+    msg: str
+    count: int = 1
+
+    def render(self) -> Tuple[str, str, str]:
+        """(timestamp, badge, message) text parts for one console line."""
+        suffix = f" (x{self.count})" if self.count > 1 else ""
+        return f"[{self.ts:%H:%M:%S}]", f" [{self.level}] ", f"{self.msg}{suffix}"
+
+
+class LogBuffer:
+    """Ring of recent log lines plus the batch not yet flushed to the widget.
+
+    A message identical to the previous one within `dedup_sec` bumps that
+    entry's counter instead of adding a line; `drain()` reports it so the
+    console can rewrite just the last line.
+    """
+
+    def __init__(self, max_lines: int = 500, dedup_sec: float = 30.0):
+        self.max_lines = max(1, int(max_lines))
+        self.dedup_sec = max(0.0, float(dedup_sec))
+        self.entries: Deque[LogEntry] = deque(maxlen=self.max_lines)
+        self._pending: Deque[LogEntry] = deque(maxlen=self.max_lines)
+        self._updated: Optional[LogEntry] = None
+        self._seq = 0
+
+        self.pushed_total = 0
+        self.deduped_total = 0
+        self.dropped_total = 0
+
+    def push(self, msg: str, now: Optional[datetime.datetime] = None) -> LogEntry:
+        now = now or datetime.datetime.now()
+        text = str(msg)
+        self.pushed_total += 1
+        last = self.entries[-1] if self.entries else None
+        if last is not None and last.msg == text and (now - last.ts).total_seconds() <= self.dedup_sec:
+            last.count += 1
+            last.ts = now
+            self.deduped_total += 1
+            if not self._pending or self._pending[-1] is not last:
+                self._updated = last
+            return last
+
+        self._seq += 1
+        entry = LogEntry(self._seq, now, classify_log_level(text), text)
+        self.entries.append(entry)
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped_total += 1
+        self._pending.append(entry)
+        return entry
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._pending) or self._updated is not None
+
+    def drain(self) -> Tuple[Optional[LogEntry], List[LogEntry]]:
+        """Return (already-flushed entry whose counter changed, new entries) and reset the batch."""
+        updated, pending = self._updated, list(self._pending)
+        self._updated = None
+        self._pending.clear()
+        return updated, pending
+
+    def visible(self, levels: Iterable[str]) -> List[LogEntry]:
+        allowed = set(levels)
+        return [entry for entry in self.entries if entry.level in allowed]
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "lines": len(self.entries),
+            "pending": len(self._pending),
+            "pushed_total": self.pushed_total,
+            "deduped_total": self.deduped_total,
+            "dropped_total": self.dropped_total,
+        }
@@ -0,0 +1,78 @@
+"""In-memory index of condition-search and ranking results keyed by stock code."""
+
+import time
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Set
+
+
+class MarketScreenIndex:
+    """code -> {"code", "name", "sources": {source: rank}, "last_seen_ts"}.
+
+    Each screen source ("condition", "ranking") is replaced wholesale when a
+    new result arrives, mirroring what its table shows; a code that no
+    source lists any more is dropped. `generation` increases on every
+    replacement so consumers can skip work when nothing changed.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._members: Dict[str, Set[str]] = {}
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._entries
+
+    def replace_source(self, source: str, rows: Iterable[Mapping[str, Any]], now: Optional[float] = None) -> int:
+        """Replace the members of `source`; rows carry `code`, `name` and optional `rank`."""
+        now = time.time() if now is None else float(now)
+        previous = self._members.get(source, set())
+        current: Set[str] = set()
+        for position, row in enumerate(rows, start=1):
+            code = str(row.get("code", "") or "").strip()
+            if not code or code in current:
+                continue
+            try:
+                rank = int(row.get("rank", position) or position)
+            except (TypeError, ValueError):
+                rank = position
+            entry = self._entries.get(code)
+            if entry is None:
+                entry = {"code": code, "name": code, "sources": {}, "last_seen_ts": now}
+                self._entries[code] = entry
+            name = str(row.get("name", "") or "").strip()
+            if name:
+                entry["name"] = name
+            entry["sources"][source] = rank
+            entry["last_seen_ts"] = now
+            current.add(code)
+        for code in previous - current:
+            entry = self._entries.get(code)
+            if entry is None:
+                continue
+            entry["sources"].pop(source, None)
+            if not entry["sources"]:
+                del self._entries[code]
+        self._members[source] = current
+        self.generation += 1
+        return len(current)
+
+    def entry(self, code: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(code)
+
+    def sources_for(self, code: str) -> Set[str]:
+        entry = self._entries.get(code)
+        return set(entry["sources"]) if entry is not None else set()
+
+    def rank(self, code: str, source: str) -> Optional[int]:
+        entry = self._entries.get(code)
+        return entry["sources"].get(source) if entry is not None else None
+
+    def codes(self, source: Optional[str] = None) -> Set[str]:
+        if source is None:
+            return set(self._entries)
+        return set(self._members.get(source, set()))
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        return iter(list(self._entries.values()))
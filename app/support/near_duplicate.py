@@ -0,0 +1,134 @@
+"""Streaming near-duplicate headline index (MinHash LSH) over a rolling time window."""
+
+import hashlib
+import re
+import time
+from collections import deque
+from typing import Deque, Dict, FrozenSet, List, Optional, Tuple
+
+_TAG_RE = re.compile(r"\[[^\]]*\]|【[^】]*】|<[^>]*>")
+_NOISE_RE = re.compile(r"[^0-9a-z가-힣]+")
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_headline(text: str) -> str:
+    """Lowercase, drop bracketed tags ([속보], [단독] ...) and everything but letters/digits."""
+    return _NOISE_RE.sub("", _TAG_RE.sub(" ", str(text or "").lower()))
+
+
+def headline_shingles(text: str, size: int = 2) -> FrozenSet[str]:
+    """Character n-grams of the normalized headline (bigrams suit short Korean titles)."""
+    normalized = normalize_headline(text)
+    if len(normalized) <= size:
+        return frozenset([normalized]) if normalized else frozenset()
+    return frozenset(normalized[pos : pos + size] for pos in range(len(normalized) - size + 1))
+
+
+def jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+class NearDuplicateIndex:
+    """Assigns each headline to a story: the earliest similar headline still in the window.
+
+    Headlines are reduced to character-bigram sets and MinHash signatures of
+    `bands * rows` hashes. Only entries sharing a whole band are compared,
+    and a candidate joins the story when the exact Jaccard similarity of
+    the bigram sets is at least `threshold`. The band layout (8 x 4 by
+    default) puts the LSH cut-off near 0.6, so syndicated rewrites of one
+    story collide while different stories about the same company do not.
+    Entries older than `window_sec` are evicted in insertion order.
+    """
+
+    def __init__(self, window_sec: float = 6 * 3600, threshold: float = 0.6, bands: int = 8, rows: int = 4):
+        self.window_sec = max(1.0, float(window_sec))
+        self.threshold = max(0.0, min(1.0, float(threshold)))
+        self.bands = max(1, int(bands))
+        self.rows = max(1, int(rows))
+        seed = hashlib.blake2b(b"near-duplicate-index", digest_size=16).digest()
+        self._coefficients: List[Tuple[int, int]] = []
+        for idx in range(self.bands * self.rows):
+            digest = hashlib.blake2b(seed + idx.to_bytes(2, "big"), digest_size=16).digest()
+            self._coefficients.append(
+                (int.from_bytes(digest[:8], "big") % (_PRIME - 1) + 1, int.from_bytes(digest[8:], "big") % _PRIME)
+            )
+        self._entries: Deque[Tuple[float, Tuple[Tuple[int, Tuple[int, ...]], ...], FrozenSet[str], str, str]] = deque()
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[Tuple[FrozenSet[str], str]]] = {}
+        self._by_key: Dict[str, str] = {}
+        self._story_size: Dict[str, int] = {}
+        self.assigned = 0
+        self.clustered = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _band_keys(self, shingles: FrozenSet[str]) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+        hashed = [int.from_bytes(hashlib.blake2b(item.encode("utf-8"), digest_size=8).digest(), "big") for item in shingles]
+        signature = [min(((a * value + b) % _PRIME) & _MAX_HASH for value in hashed) for a, b in self._coefficients]
+        return tuple(
+            (band, tuple(signature[band * self.rows : (band + 1) * self.rows])) for band in range(self.bands)
+        )
+
+    def _evict(self, now: float):
+        cutoff = now - self.window_sec
+        while self._entries and self._entries[0][0] < cutoff:
+            _ts, band_keys, shingles, story_id, key = self._entries.popleft()
+            for band_key in band_keys:
+                bucket = self._buckets.get(band_key)
+                if bucket is None:
+                    continue
+                try:
+                    bucket.remove((shingles, story_id))
+                except ValueError:
+                    pass
+                if not bucket:
+                    del self._buckets[band_key]
+            if key and self._by_key.get(key) == story_id:
+                del self._by_key[key]
+            remaining = self._story_size.get(story_id, 0) - 1
+            if remaining > 0:
+                self._story_size[story_id] = remaining
+            else:
+                self._story_size.pop(story_id, None)
+
+    def _lookup(self, band_keys, shingles: FrozenSet[str]) -> Optional[str]:
+        best: Optional[str] = None
+        best_score = 0.0
+        for band_key in band_keys:
+            for other, story_id in self._buckets.get(band_key, ()):
+                score = jaccard(shingles, other)
+                if score >= self.threshold and score > best_score:
+                    best, best_score = story_id, score
+        return best
+
+    def assign(self, text: str, key: str = "", now: Optional[float] = None) -> str:
+        """Story id for `text`; `key` (an exact event id) short-circuits repeats of the same item."""
+        now = time.time() if now is None else float(now)
+        self._evict(now)
+        self.assigned += 1
+        if key and key in self._by_key:
+            self.clustered += 1
+            return self._by_key[key]
+        shingles = headline_shingles(text)
+        if not shingles:
+            return key
+        band_keys = self._band_keys(shingles)
+        story_id = self._lookup(band_keys, shingles)
+        if story_id is None:
+            story_id = key or hashlib.sha1("".join(sorted(shingles)).encode("utf-8")).hexdigest()[:16]
+        else:
+            self.clustered += 1
+        self._entries.append((now, band_keys, shingles, story_id, key))
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, []).append((shingles, story_id))
+        if key:
+            self._by_key[key] = story_id
+        self._story_size[story_id] = self._story_size.get(story_id, 0) + 1
+        return story_id
+
+    def story_size(self, story_id: str) -> int:
+        """Headlines currently in the window that belong to `story_id`."""
+        return self._story_size.get(story_id, 0)
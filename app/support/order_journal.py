@@ -0,0 +1,288 @@
+"""Append-only write-ahead journal for pending orders and reserved cash."""
+
+import datetime
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Pending-order keys stored as datetimes in memory and ISO strings on disk.
+_DATETIME_KEYS = ("until", "updated_at")
+
+
+def _encode_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    encoded: Dict[str, Any] = {}
+    for key, value in row.items():
+        if isinstance(value, datetime.datetime):
+            encoded[key] = value.isoformat()
+        elif key == "child_orders" and isinstance(value, list):
+            encoded[key] = [_encode_row(child) for child in value if isinstance(child, dict)]
+        else:
+            encoded[key] = value
+    return encoded
+
+
+def _decode_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    decoded = dict(row)
+    for key in _DATETIME_KEYS:
+        value = decoded.get(key)
+        if isinstance(value, str) and value:
+            try:
+                decoded[key] = datetime.datetime.fromisoformat(value)
+            except ValueError:
+                decoded[key] = None
+    children = decoded.get("child_orders")
+    if isinstance(children, list):
+        decoded["child_orders"] = [_decode_row(child) for child in children if isinstance(child, dict)]
+    return decoded
+
+
+def encode_pending(pending: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-safe copy of a `_pending_order_state` entry."""
+    return _encode_row(pending) if isinstance(pending, dict) else {}
+
+
+def decode_pending(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of `encode_pending`."""
+    return _decode_row(payload) if isinstance(payload, dict) else {}
+
+
+def _fsync_dir(path: Path) -> None:
+    """Make a rename/truncate inside `path` durable (no-op where directories can't be opened)."""
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@dataclass
+class JournalReplay:
+    """State rebuilt from the latest snapshot plus the journal tail."""
+
+    reserved_cash: Dict[str, int] = field(default_factory=dict)
+    pending: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    seq: int = 0
+    replayed: int = 0
+    skipped: int = 0
+    elapsed_ms: float = 0.0
+
+    @property
+    def empty(self) -> bool:
+        return not self.reserved_cash and not self.pending
+
+
+def apply_record(state: JournalReplay, record: Dict[str, Any]) -> None:
+    """Apply one journal record; records carry absolute values so replay is idempotent."""
+    op = str(record.get("op", "") or "")
+    code = str(record.get("code", "") or "")
+    if op == "cash" and code:
+        amount = max(0, int(record.get("amount", 0) or 0))
+        if amount > 0:
+            state.reserved_cash[code] = amount
+        else:
+            state.reserved_cash.pop(code, None)
+    elif op == "pending" and code:
+        entry = record.get("entry")
+        if isinstance(entry, dict):
+            state.pending[code] = decode_pending(entry)
+    elif op == "pending_clear" and code:
+        state.pending.pop(code, None)
+    elif op == "reset":
+        state.reserved_cash.clear()
+        state.pending.clear()
+
+
+class OrderJournal:
+    """fsync-batched JSONL journal with snapshot compaction.
+
+    Every record gets a monotonically increasing `seq`. `compact()` writes the
+    full state into the snapshot file (atomic replace) and truncates the
+    journal; `load()` replays only records newer than the snapshot, so a
+    crash between the two steps is harmless.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        snapshot_path: Optional[str] = None,
+        *,
+        fsync_batch: int = 32,
+        fsync_interval_sec: float = 1.0,
+        compact_every: int = 500,
+    ):
+        self.path = Path(path)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else self.path.with_suffix(".snapshot.json")
+        self.fsync_batch = max(1, int(fsync_batch))
+        self.fsync_interval_sec = max(0.0, float(fsync_interval_sec))
+        self.compact_every = max(1, int(compact_every))
+        self.logger = logging.getLogger("OrderJournal")
+
+        self._fh: Any = None
+        self._seq = 0
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+        self._records_since_compact = 0
+
+        self.appended_total = 0
+        self.fsync_count = 0
+        self.compaction_count = 0
+        self.write_errors = 0
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+    def load(self) -> JournalReplay:
+        """Rebuild state from disk and position the sequence after the last record."""
+        started = time.perf_counter()
+        state = JournalReplay()
+        snapshot_seq = 0
+        try:
+            if self.snapshot_path.exists():
+                with open(self.snapshot_path, "r", encoding="utf-8") as file:
+                    snapshot = json.load(file)
+                if isinstance(snapshot, dict):
+                    snapshot_seq = int(snapshot.get("seq", 0) or 0)
+                    for code, amount in (snapshot.get("reserved_cash") or {}).items():
+                        if int(amount or 0) > 0:
+                            state.reserved_cash[str(code)] = int(amount)
+                    for code, entry in (snapshot.get("pending") or {}).items():
+                        if isinstance(entry, dict):
+                            state.pending[str(code)] = decode_pending(entry)
+        except (OSError, ValueError, TypeError) as exc:
+            self.logger.warning(f"order journal snapshot unreadable: {exc}")
+
+        state.seq = snapshot_seq
+        try:
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as file:
+                    for line in file:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            # A torn final write after a crash; everything before it is intact.
+                            state.skipped += 1
+                            continue
+                        seq = int(record.get("seq", 0) or 0) if isinstance(record, dict) else 0
+                        if seq <= snapshot_seq:
+                            continue
+                        apply_record(state, record)
+                        state.replayed += 1
+                        state.seq = max(state.seq, seq)
+        except OSError as exc:
+            self.logger.warning(f"order journal unreadable: {exc}")
+
+        self._seq = state.seq
+        self._records_since_compact = state.replayed
+        state.elapsed_ms = (time.perf_counter() - started) * 1000.0
+        return state
+
+    # ------------------------------------------------------------------
+    # Append
+    # ------------------------------------------------------------------
+    def _handle(self):
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+        return self._fh
+
+    def append(self, op: str, code: str = "", **payload: Any) -> int:
+        self._seq += 1
+        record = {"seq": self._seq, "ts": time.time(), "op": op, "code": code}
+        record.update(payload)
+        try:
+            handle = self._handle()
+            handle.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            handle.flush()
+        except OSError as exc:
+            self.write_errors += 1
+            self.logger.warning(f"order journal write failed: {exc}")
+            return self._seq
+        self.appended_total += 1
+        self._records_since_compact += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_batch or (time.monotonic() - self._last_fsync) >= self.fsync_interval_sec:
+            self.sync()
+        return self._seq
+
+    def sync(self):
+        """fsync buffered records (called per batch and on close; `compact()` syncs its own rewrite)."""
+        if self._fh is None or self._unsynced <= 0:
+            return
+        try:
+            os.fsync(self._fh.fileno())
+            self.fsync_count += 1
+        except OSError as exc:
+            self.write_errors += 1
+            self.logger.warning(f"order journal fsync failed: {exc}")
+        self._unsynced = 0
+        self._last_fsync = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+    def should_compact(self) -> bool:
+        return self._records_since_compact >= self.compact_every
+
+    def compact(self, reserved_cash: Dict[str, int], pending: Dict[str, Dict[str, Any]]):
+        """Persist the full state as a snapshot and start an empty journal."""
+        self.sync()
+        snapshot = {
+            "seq": self._seq,
+            "ts": time.time(),
+            "reserved_cash": {str(code): int(amount) for code, amount in reserved_cash.items() if int(amount or 0) > 0},
+            "pending": {str(code): encode_pending(entry) for code, entry in pending.items() if isinstance(entry, dict)},
+        }
+        tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + ".tmp")
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(snapshot, file, ensure_ascii=False, default=str)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            # Truncate the journal only once the snapshot rename is durable.
+            _fsync_dir(self.snapshot_path.parent)
+            if self._fh is not None:
+                self._fh.close()
+            self._fh = open(self.path, "w", encoding="utf-8")
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            _fsync_dir(self.path.parent)
+            self.fsync_count += 1
+        except OSError as exc:
+            self.write_errors += 1
+            self.logger.warning(f"order journal compaction failed: {exc}")
+            return
+        self._records_since_compact = 0
+        self.compaction_count += 1
+
+    def close(self):
+        self.sync()
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except OSError:
+                pass
+            self._fh = None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "seq": self._seq,
+            "appended_total": self.appended_total,
+            "fsync_count": self.fsync_count,
+            "compaction_count": self.compaction_count,
+            "records_since_compact": self._records_since_compact,
+            "write_errors": self.write_errors,
+        }
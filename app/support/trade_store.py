@@ -0,0 +1,197 @@
+"""Append-only SQLite (WAL) store for trade history."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS trades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ts TEXT NOT NULL,
+        day TEXT NOT NULL,
+        code TEXT NOT NULL DEFAULT '',
+        type TEXT NOT NULL DEFAULT '',
+        profit INTEGER NOT NULL DEFAULT 0,
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_trades_day ON trades(day)",
+    "CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades(ts)",
+    "CREATE INDEX IF NOT EXISTS idx_trades_code_ts ON trades(code, ts)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+
+def empty_day_stats() -> Dict[str, int]:
+    return {"trades": 0, "sells": 0, "wins": 0, "total_profit": 0, "max_profit": 0, "max_loss": 0}
+
+
+def accumulate_day_stats(stats: Dict[str, int], record: Dict[str, Any]) -> Dict[str, int]:
+    """Fold one trade into `stats` (same rules as `TradeStore.day_stats`)."""
+    stats["trades"] += 1
+    if record.get("type") == "매도":
+        profit = int(record.get("profit", 0) or 0)
+        if stats["sells"] == 0:
+            stats["max_profit"] = profit
+            stats["max_loss"] = profit
+        else:
+            stats["max_profit"] = max(stats["max_profit"], profit)
+            stats["max_loss"] = min(stats["max_loss"], profit)
+        stats["sells"] += 1
+        stats["total_profit"] += profit
+        if profit > 0:
+            stats["wins"] += 1
+    return stats
+
+
+def _row_values(record: Dict[str, Any]) -> tuple:
+    ts = str(record.get("timestamp", "") or "")
+    return (
+        ts,
+        ts[:10],
+        str(record.get("code", "") or ""),
+        str(record.get("type", "") or ""),
+        int(record.get("profit", 0) or 0),
+        json.dumps(record, ensure_ascii=False, default=str),
+    )
+
+
+class TradeStore:
+    """Trade rows partitioned by `day` and indexed on timestamp and code.
+
+    Appends are single INSERT batches; daily statistics come from an indexed
+    aggregate query instead of scanning the whole history. One connection is
+    shared between the UI thread and the save worker behind a lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.logger = logging.getLogger("TradeStore")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.appended_total = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def append_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        rows = [_row_values(record) for record in records if isinstance(record, dict)]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT INTO trades (ts, day, code, type, profit, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        self.appended_total += len(rows)
+        return len(rows)
+
+    def delete_day(self, day: str) -> int:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN")
+                cursor = conn.execute("DELETE FROM trades WHERE day = ?", (day,))
+        return int(cursor.rowcount or 0)
+
+    def migrate_from_json(self, json_path: str) -> int:
+        """One-time import of the legacy JSON list; returns the number of imported rows."""
+        if not json_path or not os.path.exists(json_path):
+            return 0
+        with self._lock:
+            conn = self._connection()
+            done = conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone()
+            if done is not None:
+                return 0
+        with open(json_path, "r", encoding="utf-8") as file:
+            history = json.load(file)
+        records = [record for record in history if isinstance(record, dict)] if isinstance(history, list) else []
+        rows = [_row_values(record) for record in records]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT INTO trades (ts, day, code, type, profit, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)",
+                    (json.dumps({"source": str(json_path), "rows": len(rows), "ts": time.time()}),),
+                )
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def _records(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        records: List[Dict[str, Any]] = []
+        for (payload,) in rows:
+            try:
+                record = json.loads(payload)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+    def day_records(self, day: str) -> List[Dict[str, Any]]:
+        return self._records("SELECT payload FROM trades WHERE day = ? ORDER BY ts, id", (day,))
+
+    def iter_all(self) -> List[Dict[str, Any]]:
+        return self._records("SELECT payload FROM trades ORDER BY ts, id")
+
+    def day_stats(self, day: str) -> Dict[str, int]:
+        with self._lock:
+            conn = self._connection()
+            total = conn.execute("SELECT COUNT(*) FROM trades WHERE day = ?", (day,)).fetchone()
+            sells = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(profit > 0), 0), COALESCE(SUM(profit), 0), MAX(profit), MIN(profit) "
+                "FROM trades WHERE day = ? AND type = '매도'",
+                (day,),
+            ).fetchone()
+        stats = empty_day_stats()
+        stats["trades"] = int(total[0] or 0)
+        stats["sells"] = int(sells[0] or 0)
+        stats["wins"] = int(sells[1] or 0)
+        stats["total_profit"] = int(sells[2] or 0)
+        stats["max_profit"] = int(sells[3] or 0)
+        stats["max_loss"] = int(sells[4] or 0)
+        return stats
+
+    def count(self) -> int:
+        with self._lock:
+            row = self._connection().execute("SELECT COUNT(*) FROM trades").fetchone()
+        return int(row[0] or 0)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
@@ -0,0 +1,70 @@
+"""Model/view backing store for the main trading table."""
+
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from PyQt6.QtGui import QColor
+
+from app.support.code_table_model import CodeTableModel, RowData
+
+
+TRADING_TABLE_COLUMNS = ["종목명", "현재가", "목표가", "상태", "보유", "매입가", "수익률", "최고수익", "투자금"]
+PROFIT_COLUMN = 6
+
+_PROFIT_UP_COLOR = QColor("#e63946")
+_PROFIT_DOWN_COLOR = QColor("#4361ee")
+
+
+def _profit_rate(info: Mapping[str, Any]) -> float:
+    held = info.get("held", 0) or 0
+    buy_price = info.get("buy_price", 0) or 0
+    if held > 0 and buy_price > 0:
+        return (info.get("current", 0) - buy_price) / buy_price * 100
+    return 0.0
+
+
+def format_trading_row(code: str, info: Mapping[str, Any]) -> Tuple[Tuple[str, ...], float]:
+    """Display strings for one universe row plus its profit rate (used for coloring)."""
+    profit_rate = _profit_rate(info)
+    texts = (
+        str(info.get("name", code)),
+        f"{info.get('current', 0):,}",
+        f"{info.get('target', 0):,}",
+        str(info.get("status", "")),
+        str(info.get("held", 0)),
+        f"{info.get('buy_price', 0):,}",
+        f"{profit_rate:.2f}%",
+        f"{info.get('max_profit_rate', 0):.2f}%",
+        f"{info.get('invest_amount', 0):,}",
+    )
+    return texts, profit_rate
+
+
+class TradingTableModel(CodeTableModel):
+    """Reads rows straight from the trader universe; nothing is formatted until the view asks.
+
+    Refresh cost is bounded by the rows the view actually repaints rather
+    than by the universe size (see `CodeTableModel`).
+    """
+
+    def __init__(self, universe_getter: Callable[[], Mapping[str, Dict[str, Any]]], parent=None):
+        super().__init__(TRADING_TABLE_COLUMNS, self._format_row, parent=parent)
+        self._universe_getter = universe_getter
+
+    def _format_row(self, code: str) -> Optional[RowData]:
+        info = self._universe_getter().get(code)
+        if info is None:
+            return None
+        texts, profit_rate = format_trading_row(code, info)
+        colors = {}
+        if profit_rate > 0:
+            colors[PROFIT_COLUMN] = _PROFIT_UP_COLOR
+        elif profit_rate < 0:
+            colors[PROFIT_COLUMN] = _PROFIT_DOWN_COLOR
+        return texts, colors
+
+    def sync_rows(self) -> bool:
+        """Follow the universe key order; appended codes become inserted rows. Returns True on change."""
+        universe = self._universe_getter()
+        if len(universe) == len(self._codes) and all(code in universe for code in self._codes):
+            return False
+        return self.follow_codes(list(universe.keys()))
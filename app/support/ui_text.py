@@ -45,6 +45,7 @@ EXECUTION_POLICY_CHOICES: Sequence[ChoiceItem] = (
 
 EXECUTION_MODE_CHOICES: Sequence[ChoiceItem] = (
     ("신호 전용", "signal_only"),
+    ("모의 체결", "paper"),
     ("실주문", "live"),
 )
 
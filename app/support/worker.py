@@ -1,6 +1,8 @@
 """Background worker utilities for thread pool execution."""
 
-from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+import concurrent.futures
+
+from PyQt6.QtCore import QObject, QRunnable, QTimer, pyqtSignal, pyqtSlot
 
 
 class WorkerSignals(QObject):
@@ -8,6 +10,7 @@ class WorkerSignals(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(Exception)
     progress = pyqtSignal(int)
+    partial = pyqtSignal(object)
 
 class Worker(QRunnable):
     def __init__(self, fn, *args, **kwargs):
@@ -26,3 +29,66 @@ class Worker(QRunnable):
         except Exception as e:
             self.signals.error.emit(e)
 
+
+
+def watch_future(future, signals=None, dispatch=None) -> WorkerSignals:
+    """concurrent.futures.Future 완료를 WorkerSignals로 중계 (Qt 워커 점유 없음).
+
+    시그널 연결 후 호출해야 이미 완료된 Future의 결과를 놓치지 않는다.
+    `dispatch`가 주어지면 emit을 그 콜백(예: 코어 스케줄러의 post)으로 넘겨 소유 스레드에서 실행한다.
+    """
+    signals = signals or WorkerSignals()
+
+    def _emit(fut):
+        try:
+            result = fut.result()
+        except Exception as e:
+            signals.error.emit(e)
+            return
+        signals.result.emit(result)
+        signals.finished.emit(result)
+
+    def _done(fut):
+        if dispatch is None:
+            _emit(fut)
+        else:
+            dispatch(_emit, fut)
+
+    future.add_done_callback(_done)
+    return signals
+
+
+def call_later(owner, delay_ms: int, fn) -> None:
+    """`QTimer.singleShot` 대용: 헤드리스 코어(`core_scheduler` 보유)에서는 코어 루프 타이머를 쓴다."""
+    scheduler = getattr(owner, "core_scheduler", None)
+    if scheduler is not None:
+        scheduler.call_later(int(delay_ms), fn)
+        return
+    QTimer.singleShot(int(delay_ms), fn)
+
+
+def start_rest_call(owner, method_name: str, *args, on_result=None, on_error=None):
+    """REST 호출을 비동기 전송 계층으로 실행하고, 미지원 클라이언트는 스레드풀로 폴백."""
+    client = owner.rest_client
+    signals = WorkerSignals()
+    if on_result is not None:
+        signals.result.connect(on_result)
+    if on_error is not None:
+        signals.error.connect(on_error)
+
+    submit = getattr(client, "submit", None)
+    future = None
+    if callable(submit):
+        try:
+            future = submit(method_name, *args)
+        except (AttributeError, RuntimeError):
+            future = None
+    if isinstance(future, concurrent.futures.Future):
+        scheduler = getattr(owner, "core_scheduler", None)
+        watch_future(future, signals, dispatch=getattr(scheduler, "post", None))
+        return signals
+
+    worker = Worker(getattr(client, method_name), *args)
+    worker.signals = signals
+    owner.threadpool.start(worker)
+    return signals
@@ -1,4 +1,5 @@
 from .engine import BacktestBar, BacktestConfig, BacktestIntelligenceEvent, BacktestResult, EventDrivenBacktestEngine
+from .fill_model import FillModel, FillResult, FlatFillModel, MarketImpactFillModel, build_fill_model
 
 __all__ = [
     "BacktestBar",
@@ -6,4 +7,9 @@ __all__ = [
     "BacktestIntelligenceEvent",
     "BacktestResult",
     "EventDrivenBacktestEngine",
+    "FillModel",
+    "FillResult",
+    "FlatFillModel",
+    "MarketImpactFillModel",
+    "build_fill_model",
 ]
@@ -5,6 +5,7 @@ Phase-1 target: deterministic daily simulation with minute extensibility.
 
 from __future__ import annotations
 
+import gzip
 import json
 from collections import deque
 from dataclasses import dataclass, field
@@ -12,6 +13,10 @@ from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
 
+from data.intel_store import IntelStore
+
+from .fill_model import SESSION_MS, FillModel, FillResult, build_fill_model, timeframe_ms
+
 
 @dataclass
 class BacktestBar:
@@ -22,6 +27,8 @@ class BacktestBar:
     low: float
     close: float
     volume: float = 0.0
+    bid: float = 0.0
+    ask: float = 0.0
 
 
 @dataclass
@@ -54,6 +61,10 @@ class BacktestConfig:
     timeframe: str = "1d"
     commission_bps: float = 5.0
     slippage_bps: float = 3.0
+    fill_model: str = "flat"
+    impact_coef: float = 1.0
+    max_participation: float = 0.1
+    fill_latency_ms: float = 0.0
     tradable_start: time = time(9, 0)
     tradable_end: time = time(15, 20)
     use_shock_guard: bool = True
@@ -93,8 +104,9 @@ class BacktestResult:
 
 
 class EventDrivenBacktestEngine:
-    def __init__(self, config: Optional[BacktestConfig] = None):
+    def __init__(self, config: Optional[BacktestConfig] = None, fill_model: Optional[FillModel] = None):
         self.config = config or BacktestConfig()
+        self.fill_model = fill_model or build_fill_model(self.config)
 
     @staticmethod
     def _parse_timestamp(value: Any) -> Optional[datetime]:
@@ -108,54 +120,96 @@ class EventDrivenBacktestEngine:
         except ValueError:
             return None
 
+    @classmethod
+    def _intelligence_event_from_record(cls, record: Any) -> Optional[BacktestIntelligenceEvent]:
+        if not isinstance(record, dict):
+            return None
+        ts = cls._parse_timestamp(record.get("ts"))
+        if ts is None:
+            return None
+        payload = record.get("payload", {})
+        if not isinstance(payload, dict):
+            payload = {}
+        raw_ref = record.get("raw_ref", "")
+        if not payload and isinstance(raw_ref, str) and raw_ref:
+            try:
+                parsed = json.loads(raw_ref)
+                if isinstance(parsed, dict):
+                    payload = parsed
+            except Exception:
+                payload = {}
+        return BacktestIntelligenceEvent(
+            ts=ts,
+            scope=str(record.get("scope", "symbol") or "symbol"),
+            symbol=str(record.get("symbol", "") or ""),
+            source=str(record.get("source", "") or ""),
+            event_type=str(record.get("event_type", "") or ""),
+            score=float(record.get("score", 0.0) or 0.0),
+            tags=list(record.get("tags", []) or []),
+            summary=str(record.get("summary", "") or ""),
+            blocking=bool(record.get("blocking", False)),
+            event_id=str(record.get("event_id", "") or ""),
+            payload=payload,
+            raw_ref=raw_ref,
+        )
+
+    @staticmethod
+    def _sort_intelligence_events(records: List[BacktestIntelligenceEvent]) -> List[BacktestIntelligenceEvent]:
+        return sorted(records, key=lambda event: (event.ts, event.scope, event.symbol, event.event_type, event.event_id))
+
     @classmethod
     def load_intelligence_events_jsonl(cls, path: str | Path) -> List[BacktestIntelligenceEvent]:
+        """Events from a JSONL log plus its rotated `<stem>.*<suffix>.gz` segments (a .gz path is read directly)."""
         records: List[BacktestIntelligenceEvent] = []
         file_path = Path(path)
+        sources = [] if file_path.suffix == ".gz" else sorted(file_path.parent.glob(f"{file_path.stem}.*{file_path.suffix}.gz"))
+        if file_path.exists():
+            sources.append(file_path)
+        for source in sources:
+            opener = gzip.open if source.suffix == ".gz" else open
+            try:
+                with opener(source, "rt", encoding="utf-8") as handle:
+                    for line in handle:
+                        text = str(line or "").strip()
+                        if not text:
+                            continue
+                        try:
+                            record = json.loads(text)
+                        except json.JSONDecodeError:
+                            continue
+                        event = cls._intelligence_event_from_record(record)
+                        if event is not None:
+                            records.append(event)
+            except (OSError, EOFError):
+                # 잘린 gzip 세그먼트는 읽은 데까지만 쓴다.
+                continue
+        return cls._sort_intelligence_events(records)
+
+    @classmethod
+    def load_intelligence_events_sqlite(
+        cls,
+        path: str | Path,
+        *,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        symbols: Optional[Iterable[str]] = None,
+    ) -> List[BacktestIntelligenceEvent]:
+        """Range query against the intelligence store; market/sector events are kept for any symbol filter."""
+        file_path = Path(path)
         if not file_path.exists():
-            return records
-        with file_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                text = str(line or "").strip()
-                if not text:
-                    continue
-                try:
-                    record = json.loads(text)
-                except json.JSONDecodeError:
-                    continue
-                if not isinstance(record, dict):
-                    continue
-                ts = cls._parse_timestamp(record.get("ts"))
-                if ts is None:
-                    continue
-                payload = record.get("payload", {})
-                if not isinstance(payload, dict):
-                    payload = {}
-                raw_ref = record.get("raw_ref", "")
-                if not payload and isinstance(raw_ref, str) and raw_ref:
-                    try:
-                        parsed = json.loads(raw_ref)
-                        if isinstance(parsed, dict):
-                            payload = parsed
-                    except Exception:
-                        payload = {}
-                records.append(
-                    BacktestIntelligenceEvent(
-                        ts=ts,
-                        scope=str(record.get("scope", "symbol") or "symbol"),
-                        symbol=str(record.get("symbol", "") or ""),
-                        source=str(record.get("source", "") or ""),
-                        event_type=str(record.get("event_type", "") or ""),
-                        score=float(record.get("score", 0.0) or 0.0),
-                        tags=list(record.get("tags", []) or []),
-                        summary=str(record.get("summary", "") or ""),
-                        blocking=bool(record.get("blocking", False)),
-                        event_id=str(record.get("event_id", "") or ""),
-                        payload=payload,
-                        raw_ref=raw_ref,
-                    )
-                )
-        return sorted(records, key=lambda event: (event.ts, event.scope, event.symbol, event.event_type, event.event_id))
+            return []
+        store = IntelStore(str(file_path))
+        try:
+            rows = store.query_events(
+                start=start.isoformat() if start else None,
+                end=end.isoformat() if end else None,
+                symbols=sorted(set(symbols)) if symbols else None,
+                include_global=True,
+            )
+        finally:
+            store.close()
+        records = [event for event in (cls._intelligence_event_from_record(row) for row in rows) if event is not None]
+        return cls._sort_intelligence_events(records)
 
     def run(
         self,
@@ -172,12 +226,15 @@ class EventDrivenBacktestEngine:
         price_history: Dict[str, List[float]] = {}
         last_prices: Dict[str, float] = {}
         recent_slippage_bps: Deque[float] = deque(maxlen=500)
+        working_orders: Dict[str, Dict[str, Any]] = {}
+        volume_used: Dict[str, float] = {}
         order_fail_events: Deque[float] = deque(maxlen=500)
         global_risk_until: Optional[datetime] = None
         order_health_until: Optional[datetime] = None
         symbol_intelligence_state: Dict[str, Dict[str, Any]] = {}
         scoped_intelligence_state: Dict[str, Dict[str, Any]] = {"market": {}, "sector": {}, "theme": {}}
 
+        intraday = timeframe_ms(self.config.timeframe) < SESSION_MS
         ordered = sorted(bars, key=lambda bar: (bar.ts, bar.symbol))
         ordered_events = sorted(list(intelligence_events or []), key=lambda event: (event.ts, event.scope, event.symbol, event.event_type))
         event_idx = 0
@@ -245,102 +302,63 @@ class EventDrivenBacktestEngine:
                 elif order_health_until and bar.ts >= order_health_until:
                     order_health_until = None
 
-            fill_action = "sell" if action == "sell_partial" else action
-            fill_price = self._apply_costs(bar.close, fill_action)
-            if action in {"buy", "sell", "sell_partial", "short", "cover"} and fill_price > 0 and bar.close > 0:
-                slip_bps = abs((fill_price - bar.close) / bar.close) * 10000.0
-                recent_slippage_bps.append(slip_bps)
-
+            volume_used[bar.symbol] = 0.0
+            fill_args = (trades, working_orders, volume_used)
+            # 참여율 상한에 걸려 이월된 잔량: 신규 주문과 같은 시간대/진입 가드를 통과해야 이어서 체결한다.
+            order = working_orders.get(bar.symbol)
+            if order:
+                expected_side = "long" if order["side"] in {"buy", "sell"} else "short"
+                if symbol_state.side != expected_side:
+                    working_orders.pop(bar.symbol, None)
+                elif self._carry_allowed(
+                    order["side"],
+                    intraday=intraday,
+                    bar=bar,
+                    series=series,
+                    recent_slippage_bps=recent_slippage_bps,
+                    order_fail_events=order_fail_events,
+                    meta=meta,
+                    global_risk_until=global_risk_until,
+                    order_health_until=order_health_until,
+                ):
+                    cash = self._execute_fill(bar, symbol_state, order["side"], order["label"], order["qty"], cash, *fill_args)
+
+            action_trades = len(trades)
             if action == "buy" and symbol_state.side == "flat":
                 risk_cash = max(0.0, cash * allocation_per_trade)
                 if self.config.use_regime_sizing:
                     risk_cash *= self._regime_scale(series)
                 risk_cash *= self._market_intel_allocation_scale(effective_intelligence)
-                qty = (risk_cash / fill_price) if fill_price > 0 else 0.0
+                sizing_price = self._sizing_price(bar.close, "buy")
+                qty = (risk_cash / sizing_price) if sizing_price > 0 else 0.0
                 if qty > 0:
-                    cost = qty * fill_price
-                    cash -= cost
-                    symbol_state.side = "long"
-                    symbol_state.quantity = qty
-                    symbol_state.entry_price = fill_price
-                    symbol_state.peak_price = fill_price
-                    symbol_state.last_intel_event_id = ""
-                    trades.append({"ts": bar.ts.isoformat(), "symbol": bar.symbol, "side": "buy", "price": fill_price, "qty": qty})
+                    cash = self._execute_fill(bar, symbol_state, "buy", "buy", qty, cash, *fill_args)
 
             elif action == "sell_partial" and symbol_state.side == "long":
                 fraction = max(0.05, min(1.0, float(reduce_fraction if reduce_fraction is not None else self.config.reduce_size_ratio)))
                 qty = min(symbol_state.quantity, max(0.0, symbol_state.quantity * fraction))
                 if qty > 0:
-                    proceeds = qty * fill_price
-                    pnl = (fill_price - symbol_state.entry_price) * qty
-                    cash += proceeds
-                    symbol_state.quantity = max(0.0, symbol_state.quantity - qty)
-                    trades.append(
-                        {
-                            "ts": bar.ts.isoformat(),
-                            "symbol": bar.symbol,
-                            "side": "sell_reduce",
-                            "price": fill_price,
-                            "qty": qty,
-                            "pnl": pnl,
-                        }
-                    )
-                    if symbol_state.quantity <= 1e-9:
-                        symbol_state.side = "flat"
-                        symbol_state.quantity = 0.0
-                        symbol_state.entry_price = 0.0
-                        symbol_state.peak_price = 0.0
+                    cash = self._execute_fill(bar, symbol_state, "sell", "sell_reduce", qty, cash, *fill_args)
 
             elif action == "sell" and symbol_state.side == "long":
-                proceeds = symbol_state.quantity * fill_price
-                pnl = (fill_price - symbol_state.entry_price) * symbol_state.quantity
-                cash += proceeds
-                trades.append(
-                    {
-                        "ts": bar.ts.isoformat(),
-                        "symbol": bar.symbol,
-                        "side": "sell",
-                        "price": fill_price,
-                        "qty": symbol_state.quantity,
-                        "pnl": pnl,
-                    }
-                )
-                symbol_state.side = "flat"
-                symbol_state.quantity = 0.0
-                symbol_state.entry_price = 0.0
-                symbol_state.peak_price = 0.0
-                symbol_state.last_intel_event_id = ""
+                cash = self._execute_fill(bar, symbol_state, "sell", "sell", symbol_state.quantity, cash, *fill_args)
 
             elif action == "short" and symbol_state.side == "flat":
                 risk_cash = max(0.0, cash * allocation_per_trade)
                 if self.config.use_regime_sizing:
                     risk_cash *= self._regime_scale(series)
                 risk_cash *= self._market_intel_allocation_scale(effective_intelligence)
-                qty = (risk_cash / fill_price) if fill_price > 0 else 0.0
+                sizing_price = self._sizing_price(bar.close, "short")
+                qty = (risk_cash / sizing_price) if sizing_price > 0 else 0.0
                 if qty > 0:
-                    cash += qty * fill_price
-                    symbol_state.side = "short"
-                    symbol_state.quantity = qty
-                    symbol_state.entry_price = fill_price
-                    trades.append({"ts": bar.ts.isoformat(), "symbol": bar.symbol, "side": "short", "price": fill_price, "qty": qty})
+                    cash = self._execute_fill(bar, symbol_state, "short", "short", qty, cash, *fill_args)
 
             elif action == "cover" and symbol_state.side == "short":
-                cost = symbol_state.quantity * fill_price
-                pnl = (symbol_state.entry_price - fill_price) * symbol_state.quantity
-                cash -= cost
-                trades.append(
-                    {
-                        "ts": bar.ts.isoformat(),
-                        "symbol": bar.symbol,
-                        "side": "cover",
-                        "price": fill_price,
-                        "qty": symbol_state.quantity,
-                        "pnl": pnl,
-                    }
-                )
-                symbol_state.side = "flat"
-                symbol_state.quantity = 0.0
-                symbol_state.entry_price = 0.0
+                cash = self._execute_fill(bar, symbol_state, "cover", "cover", symbol_state.quantity, cash, *fill_args)
+
+            # 슬리피지 가드 표본은 기존처럼 신호 1건당 1개: 체결됐으면 모델 슬리피지, 아니면 가정치.
+            if action in {"buy", "sell", "sell_partial", "short", "cover"} and bar.close > 0:
+                recent_slippage_bps.append(self._slippage_sample(trades[action_trades:]))
 
             equity = cash + self._mark_to_market(positions, last_prices)
             equity_curve.append(equity)
@@ -348,6 +366,12 @@ class EventDrivenBacktestEngine:
         result = BacktestResult(equity_curve=equity_curve, trades=trades)
         result.metrics = self._calculate_metrics(equity_curve, trades, initial_cash)
         result.metrics["avg_slippage_bps"] = self._avg_abs_bps(recent_slippage_bps)
+        filled = [trade for trade in trades if "modeled_slippage_bps" in trade]
+        result.metrics["avg_modeled_slippage_bps"] = (
+            sum(float(trade["modeled_slippage_bps"]) for trade in filled) / len(filled) if filled else 0.0
+        )
+        result.metrics["avg_assumed_slippage_bps"] = float(self.config.slippage_bps) if filled else 0.0
+        result.metrics["unfilled_qty"] = sum(float(order["qty"]) for order in working_orders.values())
         return result
 
     @staticmethod
@@ -591,16 +615,88 @@ class EventDrivenBacktestEngine:
         combined["source_health"] = " | ".join(dict.fromkeys(source_health))
         return combined
 
-    def _apply_costs(self, raw_price: float, action: str) -> float:
-        if raw_price <= 0:
-            return 0.0
-        fee = self.config.commission_bps / 10000.0
-        slip = self.config.slippage_bps / 10000.0
-        if action in {"buy", "cover"}:
-            return raw_price * (1.0 + fee + slip)
-        if action in {"sell", "short"}:
-            return raw_price * (1.0 - fee - slip)
-        return raw_price
+    def _sizing_price(self, raw_price: float, action: str) -> float:
+        """Price used to size new positions: the assumed flat cost, before liquidity is known."""
+        return self.fill_model.price_with_costs(raw_price, action, float(self.config.slippage_bps))
+
+    def _carry_allowed(self, side: str, intraday: bool, bar: BacktestBar, **guard_state: Any) -> bool:
+        """Gate a carried-over remainder with the checks a new order of the same side would face."""
+        if intraday and not self._is_tradable_time(bar.ts):
+            return False
+        return self._apply_entry_guards(action=side, bar=bar, **guard_state) == side
+
+    def _execute_fill(
+        self,
+        bar: BacktestBar,
+        state: PositionState,
+        side: str,
+        label: str,
+        qty: float,
+        cash: float,
+        trades: List[Dict[str, Any]],
+        working_orders: Dict[str, Dict[str, Any]],
+        volume_used: Dict[str, float],
+    ) -> float:
+        used = float(volume_used.get(bar.symbol, 0.0))
+        fill: FillResult = self.fill_model.fill(bar, side, qty, used_qty=used)
+        if side == "buy" and fill.price > 0 and fill.qty * fill.price > cash:
+            # Modeled prices can exceed the sizing price; buy only what the cash covers and drop the rest.
+            fill = self.fill_model.fill(bar, side, max(0.0, cash) / fill.price, used_qty=used)
+            fill.unfilled_qty = 0.0
+        if fill.unfilled_qty > 1e-9:
+            working_orders[bar.symbol] = {"side": side, "label": label, "qty": fill.unfilled_qty}
+        else:
+            working_orders.pop(bar.symbol, None)
+        if fill.qty <= 0 or fill.price <= 0:
+            return cash
+        volume_used[bar.symbol] = used + fill.qty
+
+        trade: Dict[str, Any] = {"ts": bar.ts.isoformat(), "symbol": bar.symbol, "side": label, "price": fill.price, "qty": fill.qty}
+        if side in {"buy", "short"}:
+            if state.side == "flat":
+                state.side = "long" if side == "buy" else "short"
+                state.quantity = 0.0
+                state.entry_price = fill.price
+                state.peak_price = fill.price if side == "buy" else 0.0
+                state.last_intel_event_id = ""
+            total = state.quantity + fill.qty
+            state.entry_price = (state.entry_price * state.quantity + fill.price * fill.qty) / total
+            state.quantity = total
+            if side == "buy":
+                cash -= fill.qty * fill.price
+                state.peak_price = max(state.peak_price, fill.price)
+            else:
+                cash += fill.qty * fill.price
+        else:
+            if side == "sell":
+                trade["pnl"] = (fill.price - state.entry_price) * fill.qty
+                cash += fill.qty * fill.price
+            else:
+                trade["pnl"] = (state.entry_price - fill.price) * fill.qty
+                cash -= fill.qty * fill.price
+            state.quantity = max(0.0, state.quantity - fill.qty)
+            if state.quantity <= 1e-9:
+                state.side = "flat"
+                state.quantity = 0.0
+                state.entry_price = 0.0
+                if side == "sell":
+                    state.peak_price = 0.0
+                if label == "sell":
+                    state.last_intel_event_id = ""
+                working_orders.pop(bar.symbol, None)
+        trade.update(
+            {
+                "modeled_slippage_bps": fill.slippage_bps,
+                "assumed_slippage_bps": float(self.config.slippage_bps),
+                "unfilled_qty": fill.unfilled_qty,
+            }
+        )
+        trades.append(trade)
+        return cash
+
+    def _slippage_sample(self, action_trades: List[Dict[str, Any]]) -> float:
+        slippage_bps = action_trades[-1]["modeled_slippage_bps"] if action_trades else self.config.slippage_bps
+        return float(self.config.commission_bps) + float(slippage_bps)
 
     def _is_tradable_time(self, ts: datetime) -> bool:
         current = ts.time()
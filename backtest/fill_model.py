@@ -0,0 +1,189 @@
+"""Fill models for the event-driven backtest engine.
+
+`FlatFillModel` keeps the legacy fixed ``commission_bps + slippage_bps`` cost.
+`MarketImpactFillModel` prices each fill from the bar it trades in: half the
+quoted spread when the bar carries bid/ask, square-root impact on the order's
+share of bar volume, adverse drift over the order latency, and a per-bar
+participation cap (shared by every fill in the bar) whose remainder is left for
+later bars.
+
+The cost kernel only reads bar columns (close/high/low/volume/bid/ask) and the
+order size, so `estimate_slippage_bps` prices whole columns at once without any
+per-bar engine state.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .engine import BacktestBar, BacktestConfig
+
+BUY_SIDES = {"buy", "cover"}
+SELL_SIDES = {"sell", "short"}
+
+# KRX 정규장(09:00~15:30) 기준 일봉 1개의 길이
+SESSION_MS = 6.5 * 60 * 60 * 1000
+
+
+@dataclass
+class FillResult:
+    price: float
+    qty: float
+    unfilled_qty: float = 0.0
+    slippage_bps: float = 0.0
+    spread_bps: float = 0.0
+    impact_bps: float = 0.0
+    latency_bps: float = 0.0
+
+
+class FillModel:
+    """Base fill model: `fill()` prices one order against one bar."""
+
+    name = "base"
+
+    def __init__(self, commission_bps: float = 0.0, slippage_bps: float = 0.0):
+        self.commission_bps = float(commission_bps)
+        self.slippage_bps = float(slippage_bps)
+
+    def fillable_qty(self, bar: "BacktestBar", qty: float, used_qty: float = 0.0) -> float:
+        return max(0.0, float(qty))
+
+    def cost_components(self, bar: "BacktestBar", qty: float) -> Tuple[float, float, float]:
+        """(spread_bps, impact_bps, latency_bps) for trading `qty` in `bar`."""
+        return 0.0, self.slippage_bps, 0.0
+
+    def fill(self, bar: "BacktestBar", side: str, qty: float, used_qty: float = 0.0) -> FillResult:
+        """Price `qty` in `bar`; `used_qty` is what earlier fills already took from this bar."""
+        requested = max(0.0, float(qty))
+        filled = min(requested, self.fillable_qty(bar, requested, used_qty))
+        spread_bps, impact_bps, latency_bps = self.cost_components(bar, filled)
+        slippage_bps = spread_bps + impact_bps + latency_bps
+        return FillResult(
+            price=self.price_with_costs(bar.close, side, slippage_bps),
+            qty=filled,
+            unfilled_qty=max(0.0, requested - filled),
+            slippage_bps=slippage_bps,
+            spread_bps=spread_bps,
+            impact_bps=impact_bps,
+            latency_bps=latency_bps,
+        )
+
+    def price_with_costs(self, raw_price: float, side: str, slippage_bps: float) -> float:
+        if raw_price <= 0:
+            return 0.0
+        cost = (self.commission_bps + slippage_bps) / 10000.0
+        if side in BUY_SIDES:
+            return raw_price * (1.0 + cost)
+        if side in SELL_SIDES:
+            return raw_price * (1.0 - cost)
+        return raw_price
+
+
+class FlatFillModel(FillModel):
+    """Legacy model: every fill pays the configured slippage at the bar close, in full."""
+
+    name = "flat"
+
+
+class MarketImpactFillModel(FillModel):
+    """Spread + square-root impact + latency drift, capped at a share of bar volume.
+
+    Bars without volume or quotes fall back to the assumed `slippage_bps`, so
+    sparse CSVs keep the flat behaviour instead of trading for free.
+    """
+
+    name = "impact"
+
+    def __init__(
+        self,
+        commission_bps: float = 0.0,
+        slippage_bps: float = 0.0,
+        impact_coef: float = 1.0,
+        max_participation: float = 0.1,
+        latency_ms: float = 0.0,
+        bar_ms: float = SESSION_MS,
+    ):
+        super().__init__(commission_bps, slippage_bps)
+        self.impact_coef = max(0.0, float(impact_coef))
+        self.max_participation = max(0.0, float(max_participation))
+        self.latency_ms = max(0.0, float(latency_ms))
+        self.bar_ms = max(1.0, float(bar_ms))
+
+    def fillable_qty(self, bar: "BacktestBar", qty: float, used_qty: float = 0.0) -> float:
+        volume = float(bar.volume or 0.0)
+        if self.max_participation <= 0 or volume <= 0:
+            return max(0.0, float(qty))
+        budget = max(0.0, volume * self.max_participation - max(0.0, float(used_qty)))
+        return min(max(0.0, float(qty)), budget)
+
+    def cost_components(self, bar: "BacktestBar", qty: float) -> Tuple[float, float, float]:
+        return self._components(
+            float(bar.close or 0.0),
+            float(bar.high or 0.0),
+            float(bar.low or 0.0),
+            float(bar.volume or 0.0),
+            float(getattr(bar, "bid", 0.0) or 0.0),
+            float(getattr(bar, "ask", 0.0) or 0.0),
+            float(qty),
+        )
+
+    def estimate_slippage_bps(
+        self,
+        closes: Sequence[float],
+        highs: Sequence[float],
+        lows: Sequence[float],
+        volumes: Sequence[float],
+        bids: Sequence[float],
+        asks: Sequence[float],
+        qtys: Sequence[float],
+    ) -> List[float]:
+        """Modeled slippage for parallel bar/order columns (no commission, no cap)."""
+        return [
+            sum(self._components(c, h, l, v, b, a, q))
+            for c, h, l, v, b, a, q in zip(closes, highs, lows, volumes, bids, asks, qtys)
+        ]
+
+    def _components(
+        self, close: float, high: float, low: float, volume: float, bid: float, ask: float, qty: float
+    ) -> Tuple[float, float, float]:
+        if close <= 0:
+            return 0.0, 0.0, 0.0
+        has_quote = bid > 0 and ask > bid
+        if volume <= 0 and not has_quote:
+            return 0.0, self.slippage_bps, 0.0
+        spread_bps = ((ask - bid) / 2.0) / ((ask + bid) / 2.0) * 10000.0 if has_quote else 0.0
+        # 봉 변동폭을 변동성 대용으로 쓴다 (한 봉 안의 가격 이동 규모).
+        sigma_bps = max(0.0, high - low) / close * 10000.0
+        impact_bps = self.impact_coef * sigma_bps * math.sqrt(qty / volume) if volume > 0 and qty > 0 else 0.0
+        latency_bps = sigma_bps * math.sqrt(self.latency_ms / self.bar_ms) if self.latency_ms > 0 else 0.0
+        return spread_bps, impact_bps, latency_bps
+
+
+def timeframe_ms(timeframe: str) -> float:
+    """'1d' -> one regular session, 'Nm' -> N minutes, 'Nh' -> N hours."""
+    match = re.fullmatch(r"(\d*)\s*([mhd])", str(timeframe or "").strip().lower())
+    if not match:
+        return SESSION_MS
+    count = max(1, int(match.group(1) or 1))
+    unit = {"m": 60 * 1000, "h": 60 * 60 * 1000, "d": SESSION_MS}[match.group(2)]
+    return count * unit
+
+
+def build_fill_model(config: "BacktestConfig") -> FillModel:
+    name = str(getattr(config, "fill_model", "flat") or "flat").lower()
+    if name == FlatFillModel.name:
+        return FlatFillModel(config.commission_bps, config.slippage_bps)
+    if name == MarketImpactFillModel.name:
+        return MarketImpactFillModel(
+            commission_bps=config.commission_bps,
+            slippage_bps=config.slippage_bps,
+            impact_coef=config.impact_coef,
+            max_participation=config.max_participation,
+            latency_ms=config.fill_latency_ms,
+            bar_ms=timeframe_ms(config.timeframe),
+        )
+    raise ValueError(f"unknown backtest fill model: {name}")
@@ -0,0 +1,326 @@
+"""SQLite (WAL) store for market-intelligence events and decision audits."""
+
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+KIND_EVENTS = "events"
+KIND_AUDITS = "audits"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ts TEXT NOT NULL,
+        scope TEXT NOT NULL DEFAULT 'symbol',
+        symbol TEXT NOT NULL DEFAULT '',
+        source TEXT NOT NULL DEFAULT '',
+        event_type TEXT NOT NULL DEFAULT '',
+        event_id TEXT NOT NULL DEFAULT '',
+        score REAL NOT NULL DEFAULT 0,
+        blocking INTEGER NOT NULL DEFAULT 0,
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts)",
+    "CREATE INDEX IF NOT EXISTS idx_events_symbol_ts ON events(symbol, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_events_scope_ts ON events(scope, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type)",
+    """
+    CREATE TABLE IF NOT EXISTS audits (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ts TEXT NOT NULL,
+        symbol TEXT NOT NULL DEFAULT '',
+        allowed INTEGER NOT NULL DEFAULT 0,
+        reason TEXT NOT NULL DEFAULT '',
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_audits_ts ON audits(ts)",
+    "CREATE INDEX IF NOT EXISTS idx_audits_symbol_ts ON audits(symbol, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_audits_allowed_ts ON audits(allowed, ts)",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+_INSERT = {
+    KIND_EVENTS: (
+        "INSERT INTO events (ts, scope, symbol, source, event_type, event_id, score, blocking, payload) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    KIND_AUDITS: "INSERT INTO audits (ts, symbol, allowed, reason, payload) VALUES (?, ?, ?, ?, ?)",
+}
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _row_values(kind: str, record: Dict[str, Any], payload: str) -> Optional[tuple]:
+    ts = str(record.get("ts", "") or "")
+    if not ts:
+        return None
+    if kind == KIND_EVENTS:
+        return (
+            ts,
+            str(record.get("scope", "symbol") or "symbol"),
+            str(record.get("symbol", "") or ""),
+            str(record.get("source", "") or ""),
+            str(record.get("event_type", "") or ""),
+            str(record.get("event_id", "") or ""),
+            _float(record.get("score")),
+            1 if record.get("blocking") else 0,
+            payload,
+        )
+    return (
+        ts,
+        str(record.get("symbol", "") or ""),
+        1 if record.get("allowed") else 0,
+        str(record.get("reason", "") or ""),
+        payload,
+    )
+
+
+def _in_clause(column: str, values: Sequence[str]) -> Tuple[str, List[str]]:
+    return f"{column} IN ({', '.join('?' for _ in values)})", list(values)
+
+
+class IntelStore:
+    """Events and audits as indexed rows; the full JSON record rides along in `payload`.
+
+    Range queries use the `(ts)`, `(symbol, ts)` and `(scope, ts)` indexes,
+    so a week of one symbol or scope is an index range scan rather than a
+    full JSONL parse. One connection is shared between the UI thread and the
+    log writer thread behind a lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.logger = logging.getLogger("IntelStore")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.appended_total = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def _insert(self, kind: str, rows: List[tuple]) -> int:
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN")
+                conn.executemany(_INSERT[kind], rows)
+        self.appended_total += len(rows)
+        return len(rows)
+
+    def append(self, kind: str, records: Iterable[Dict[str, Any]]) -> int:
+        rows = []
+        for record in records:
+            if isinstance(record, dict):
+                row = _row_values(kind, record, json.dumps(record, ensure_ascii=False, default=str))
+                if row is not None:
+                    rows.append(row)
+        return self._insert(kind, rows)
+
+    def append_lines(self, kind: str, lines: Iterable[str]) -> int:
+        """Insert already-serialized JSONL lines (the log writer's batch) in one transaction."""
+        rows = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                row = _row_values(kind, record, line)
+                if row is not None:
+                    rows.append(row)
+        return self._insert(kind, rows)
+
+    def import_jsonl(
+        self,
+        kind: str,
+        jsonl_path: str,
+        batch_size: int = 5000,
+        *,
+        segments: Sequence[str] = (),
+        source: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> int:
+        """One-time import of an existing JSONL log; returns the number of imported rows.
+
+        Rotated gzip `segments` (oldest first) are read before the active log.
+        The active log's bytes are read from `source` (default `jsonl_path`;
+        the segment it was rotated into, if that happened meanwhile) and only
+        up to `max_bytes` when given. The import is recorded even when nothing
+        exists yet, so lines later inserted through the writer sink are not
+        imported a second time on the next start.
+        """
+        if not jsonl_path:
+            return 0
+        marker = f"jsonl_imported:{kind}:{os.path.abspath(jsonl_path)}"
+        with self._lock:
+            done = self._connection().execute("SELECT value FROM meta WHERE key = ?", (marker,)).fetchone()
+        if done is not None:
+            return 0
+        imported = 0
+        for segment in segments:
+            imported += self._import_file(kind, str(segment), batch_size)
+        imported += self._import_file(kind, str(source or jsonl_path), batch_size, max_bytes)
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (marker, json.dumps({"rows": imported, "ts": time.time()})),
+            )
+        return imported
+
+    def _import_file(self, kind: str, path: str, batch_size: int, max_bytes: Optional[int] = None) -> int:
+        imported = 0
+        consumed = 0
+        batch: List[str] = []
+        try:
+            handle = gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+        except OSError:
+            return 0
+        try:
+            with handle:
+                for raw in handle:
+                    consumed += len(raw)
+                    if max_bytes is not None and consumed > max_bytes:
+                        break
+                    text = raw.decode("utf-8", errors="replace").strip()
+                    if not text:
+                        continue
+                    batch.append(text)
+                    if len(batch) >= batch_size:
+                        imported += self.append_lines(kind, batch)
+                        batch = []
+        except (OSError, EOFError) as exc:
+            # 잘린 gzip 세그먼트는 읽은 데까지만 가져온다.
+            self.logger.warning(f"intel store import stopped at {path}: {exc}")
+        imported += self.append_lines(kind, batch)
+        return imported
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def _query(self, table: str, clauses: List[str], params: List[Any], limit: Optional[int]) -> List[Dict[str, Any]]:
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        if limit is not None:
+            # 최근 limit건을 인덱스 역순으로 가져온 뒤 시간순으로 되돌린다.
+            sql = f"SELECT payload FROM {table}{where} ORDER BY ts DESC, id DESC LIMIT ?"
+            params = params + [max(1, int(limit))]
+        else:
+            sql = f"SELECT payload FROM {table}{where} ORDER BY ts, id"
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        if limit is not None:
+            rows.reverse()
+        records: List[Dict[str, Any]] = []
+        for (payload,) in rows:
+            try:
+                record = json.loads(payload)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+    @staticmethod
+    def _range(clauses: List[str], params: List[Any], start: Optional[str], end: Optional[str]):
+        if start:
+            clauses.append("ts >= ?")
+            params.append(str(start))
+        if end:
+            clauses.append("ts <= ?")
+            params.append(str(end))
+
+    def query_events(
+        self,
+        *,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        symbols: Optional[Sequence[str]] = None,
+        scopes: Optional[Sequence[str]] = None,
+        event_types: Optional[Sequence[str]] = None,
+        include_global: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Events in time order within [start, end] (ISO strings).
+
+        With `include_global`, the `symbols` filter only applies to
+        `scope='symbol'` rows so market/sector events are kept. With `limit`,
+        only the latest `limit` matches are returned.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        self._range(clauses, params, start, end)
+        if symbols:
+            clause, values = _in_clause("symbol", list(symbols))
+            clauses.append(f"(scope != 'symbol' OR {clause})" if include_global else clause)
+            params.extend(values)
+        if scopes:
+            clause, values = _in_clause("scope", list(scopes))
+            clauses.append(clause)
+            params.extend(values)
+        if event_types:
+            clause, values = _in_clause("event_type", list(event_types))
+            clauses.append(clause)
+            params.extend(values)
+        return self._query("events", clauses, params, limit)
+
+    def query_audits(
+        self,
+        *,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        symbols: Optional[Sequence[str]] = None,
+        allowed: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        self._range(clauses, params, start, end)
+        if symbols:
+            clause, values = _in_clause("symbol", list(symbols))
+            clauses.append(clause)
+            params.extend(values)
+        if allowed is not None:
+            clauses.append("allowed = ?")
+            params.append(1 if allowed else 0)
+        return self._query("audits", clauses, params, limit)
+
+    def count(self, kind: str = KIND_EVENTS) -> int:
+        table = "audits" if kind == KIND_AUDITS else "events"
+        with self._lock:
+            row = self._connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+        return int(row[0] or 0)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
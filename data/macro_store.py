@@ -0,0 +1,127 @@
+"""SQLite (WAL) store for FRED macro observations, one row per series and date."""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS observations (
+        series_id TEXT NOT NULL,
+        date TEXT NOT NULL,
+        value REAL,
+        PRIMARY KEY (series_id, date)
+    ) WITHOUT ROWID
+    """,
+    "CREATE TABLE IF NOT EXISTS series_meta (series_id TEXT PRIMARY KEY, synced_at REAL NOT NULL)",
+)
+
+
+def _value(raw: Any) -> Optional[float]:
+    # FRED은 결측치를 "."으로 내려준다.
+    if raw in {".", "", None}:
+        return None
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+class MacroSeriesStore:
+    """Observation history per series, kept across restarts.
+
+    `last_date()` is where the next incremental fetch starts; missing values
+    are stored as NULL so a later revision of that date can fill them in.
+    Reads return FRED-shaped rows (`{"date", "value"}` with "." for missing)
+    so callers of `MacroProvider.get_series` see the same format either way.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.logger = logging.getLogger("MacroSeriesStore")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def upsert(self, series_id: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert or revise observations; returns the number of rows written."""
+        values = [
+            (series_id, str(row.get("date", "") or ""), _value(row.get("value")))
+            for row in rows
+            if isinstance(row, dict) and row.get("date")
+        ]
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN")
+                if values:
+                    conn.executemany(
+                        "INSERT INTO observations (series_id, date, value) VALUES (?, ?, ?) "
+                        "ON CONFLICT(series_id, date) DO UPDATE SET value = excluded.value",
+                        values,
+                    )
+                conn.execute(
+                    "INSERT OR REPLACE INTO series_meta (series_id, synced_at) VALUES (?, ?)",
+                    (series_id, time.time()),
+                )
+        return len(values)
+
+    def last_date(self, series_id: str) -> str:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT MAX(date) FROM observations WHERE series_id = ?", (series_id,)
+            ).fetchone()
+        return str(row[0]) if row and row[0] else ""
+
+    def synced_at(self, series_id: str) -> float:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT synced_at FROM series_meta WHERE series_id = ?", (series_id,)
+            ).fetchone()
+        return float(row[0]) if row else 0.0
+
+    def series(self, series_id: str, start_date: str = "", end_date: str = "") -> List[Dict[str, str]]:
+        clauses = ["series_id = ?"]
+        params: List[Any] = [series_id]
+        if start_date:
+            clauses.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            clauses.append("date <= ?")
+            params.append(end_date)
+        sql = f"SELECT date, value FROM observations WHERE {' AND '.join(clauses)} ORDER BY date"
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [{"date": date, "value": "." if value is None else repr(float(value))} for date, value in rows]
+
+    def history(self, series_id: str, limit: int) -> List[float]:
+        """The latest `limit` non-missing values, oldest first."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT value FROM observations WHERE series_id = ? AND value IS NOT NULL ORDER BY date DESC LIMIT ?",
+                (series_id, max(1, int(limit))),
+            ).fetchall()
+        return [float(row[0]) for row in reversed(rows)]
+
+    def latest_value(self, series_id: str) -> Optional[float]:
+        values = self.history(series_id, 1)
+        return values[-1] if values else None
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
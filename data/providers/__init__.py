@@ -1,6 +1,8 @@
 from .ai_provider import AIProvider
 from .csv_provider import CsvProvider
+from .dart_feed import DartDisclosureFeed
 from .dart_provider import DartProvider
+from .http_cache import ProviderHttpClient, configure_provider_http, provider_http_client
 from .kiwoom_provider import KiwoomProvider
 from .macro_provider import MacroProvider
 from .naver_trend_provider import NaverTrendProvider
@@ -10,10 +12,14 @@ from .stock_cache_provider import StockMasterCacheProvider
 __all__ = [
     "AIProvider",
     "CsvProvider",
+    "DartDisclosureFeed",
     "DartProvider",
     "KiwoomProvider",
     "MacroProvider",
     "NaverTrendProvider",
     "NewsProvider",
+    "ProviderHttpClient",
     "StockMasterCacheProvider",
+    "configure_provider_http",
+    "provider_http_client",
 ]
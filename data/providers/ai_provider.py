@@ -5,7 +5,17 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
-import requests
+from .http_cache import provider_http_client
+
+
+_SINGLE_INSTRUCTIONS = (
+    "Return JSON only with keys: summary, stance, risk_tags, confidence, action_hint. "
+    "Never include markdown."
+)
+_BATCH_INSTRUCTIONS = (
+    "Return JSON only as {\"items\": [...]} with one object per symbol, each with keys: "
+    "code, summary, stance, risk_tags, confidence, action_hint. Never include markdown."
+)
 
 
 class AIProvider:
@@ -25,15 +35,22 @@ class AIProvider:
     def available(self) -> bool:
         return bool(self.api_key)
 
-    def summarize_event(self, prompt: str, model: str) -> Dict[str, Any]:
+    def summarize_event(self, prompt: str, model: str, timeout: float = 20) -> Dict[str, Any]:
+        return self._summarize(prompt, model, _SINGLE_INSTRUCTIONS, timeout)
+
+    def summarize_batch(self, prompt: str, model: str, timeout: float = 20) -> Dict[str, Any]:
+        """One call for several symbols; the answer is `{"items": [{"code": ..., ...}, ...]}`."""
+        return self._summarize(prompt, model, _BATCH_INSTRUCTIONS, timeout)
+
+    def _summarize(self, prompt: str, model: str, instructions: str, timeout: float) -> Dict[str, Any]:
         if not self.available():
             self._mark("disabled", error="ai_api_key_missing")
             raise RuntimeError("ai_api_key_missing")
         if self.provider == "openai":
-            return self._summarize_openai(prompt, model)
-        return self._summarize_gemini(prompt, model)
+            return self._summarize_openai(prompt, model, instructions, timeout)
+        return self._summarize_gemini(prompt, model, instructions, timeout)
 
-    def _summarize_openai(self, prompt: str, model: str) -> Dict[str, Any]:
+    def _summarize_openai(self, prompt: str, model: str, instructions: str = _SINGLE_INSTRUCTIONS, timeout: float = 20) -> Dict[str, Any]:
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -41,19 +58,13 @@ class AIProvider:
         payload = {
             "model": str(model or "gpt-5-mini"),
             "messages": [
-                {
-                    "role": "system",
-                    "content": (
-                        "Return JSON only with keys: summary, stance, risk_tags, confidence, action_hint. "
-                        "Never include markdown."
-                    ),
-                },
+                {"role": "system", "content": instructions},
                 {"role": "user", "content": prompt},
             ],
             "response_format": {"type": "json_object"},
             "temperature": 0.2,
         }
-        response = requests.post(self.OPENAI_URL, headers=headers, json=payload, timeout=20)
+        response = provider_http_client().post("ai", self.OPENAI_URL, headers=headers, json=payload, timeout=timeout)
         response.raise_for_status()
         payload = response.json()
         choices = payload.get("choices", [])
@@ -67,20 +78,14 @@ class AIProvider:
         self._mark("ok_with_data")
         return result
 
-    def _summarize_gemini(self, prompt: str, model: str) -> Dict[str, Any]:
+    def _summarize_gemini(self, prompt: str, model: str, instructions: str = _SINGLE_INSTRUCTIONS, timeout: float = 20) -> Dict[str, Any]:
         url = self.GEMINI_URL.format(model=str(model or "gemini-2.5-flash-lite"))
         headers = {"Content-Type": "application/json"}
         payload = {
             "contents": [
                 {
                     "parts": [
-                        {
-                            "text": (
-                                "Return JSON only with keys: summary, stance, risk_tags, confidence, action_hint. "
-                                "Never include markdown.\n\n"
-                                f"{prompt}"
-                            )
-                        }
+                        {"text": f"{instructions}\n\n{prompt}"}
                     ]
                 }
             ],
@@ -89,7 +94,7 @@ class AIProvider:
                 "responseMimeType": "application/json",
             },
         }
-        response = requests.post(f"{url}?key={self.api_key}", headers=headers, json=payload, timeout=20)
+        response = provider_http_client().post("ai", f"{url}?key={self.api_key}", headers=headers, json=payload, timeout=timeout)
         response.raise_for_status()
         payload = response.json()
         candidates = payload.get("candidates", [])
@@ -0,0 +1,182 @@
+"""Market-wide DART disclosure feed polled incrementally by receipt number."""
+
+from __future__ import annotations
+
+import datetime
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+def _receipt_no(item: Dict[str, Any]) -> str:
+    return str(item.get("rcept_no", "") or item.get("rcp_no", "") or "")
+
+
+class DartDisclosureFeed:
+    """Polls the market-wide `list.json` feed and fans filings out by stock code.
+
+    Each `poll()` walks pages newest-first only until a page reaches the highest
+    receipt number already ingested (that page is still read in full, and
+    receipts repeated across shifting pages are dropped), so one cycle costs
+    O(new filings) calls regardless of how many codes are watched. Filings are mapped to a stock
+    code from the `stock_code` field, falling back to the provider's
+    corp_code index, and cached per code for `retention_days`. A code whose
+    history predates the feed (first watch, or a poll that hit `max_pages`
+    before reaching the cursor) is backfilled once with the per-company
+    query via `backfill()`.
+    """
+
+    def __init__(self, *, max_pages: int = 10, page_count: int = 100, retention_days: int = 30, per_code_limit: int = 50):
+        self.max_pages = max(1, int(max_pages))
+        self.page_count = max(1, min(int(page_count), 100))
+        self.retention_days = max(1, int(retention_days))
+        self.per_code_limit = max(1, int(per_code_limit))
+        self.cursor = ""
+        self._by_code: Dict[str, List[Dict[str, Any]]] = {}
+        self._backfilled: Set[str] = set()
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+
+        self.polls = 0
+        self.pages_fetched = 0
+        self.ingested = 0
+        self.unmapped = 0
+        self.backfills = 0
+        self.gaps = 0
+        self.last_status = "idle"
+        self.last_error = ""
+
+    # ------------------------------------------------------------------
+    # Market-wide polling
+    # ------------------------------------------------------------------
+    def poll(self, provider: Any, today: Optional[datetime.date] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch filings newer than the cursor; returns the new ones grouped by stock code."""
+        with self._poll_lock:
+            today = today or datetime.date.today()
+            end_date = today.strftime("%Y%m%d")
+            cursor = self.cursor
+            start_date = cursor[:8] if cursor else end_date
+            fresh: List[Dict[str, Any]] = []
+            seen: Set[str] = set()
+            reached_cursor = not cursor
+            failed = False
+            page_no = 1
+            while page_no <= self.max_pages:
+                items = provider.get_market_disclosures(start_date, end_date, page_no=page_no, page_count=self.page_count)
+                self.pages_fetched += 1
+                if str(getattr(provider, "last_status", "") or "") == "error":
+                    failed = True
+                    break
+                # 같은 날짜 안에서는 접수번호 순서가 보장되지 않으므로 페이지 전체를 읽는다.
+                for item in items:
+                    if not isinstance(item, dict):
+                        continue
+                    receipt_no = _receipt_no(item)
+                    if cursor and receipt_no and receipt_no <= cursor:
+                        reached_cursor = True
+                        continue
+                    if receipt_no and receipt_no in seen:
+                        # 조회 중 새 공시가 들어오면 다음 페이지에 같은 건이 밀려 나온다.
+                        continue
+                    seen.add(receipt_no)
+                    fresh.append(item)
+                total_page = int(getattr(provider, "last_total_page", 0) or 0)
+                if reached_cursor or not items or page_no >= total_page:
+                    reached_cursor = True
+                    break
+                page_no += 1
+            self.polls += 1
+            if failed:
+                # 중간 페이지가 실패하면 커서를 그대로 두고 다음 주기에 같은 구간을 다시 읽는다.
+                self.last_status = "error"
+                self.last_error = str(getattr(provider, "last_error", "") or "")
+                return {}
+            self.last_status = "ok_with_data" if fresh else "ok_empty"
+            self.last_error = ""
+            if not reached_cursor:
+                # 페이지 한도 안에서 이전 커서에 닿지 못했으면 그 사이 공시는 종목별 재조회로 메운다.
+                self.gaps += 1
+                with self._lock:
+                    self._backfilled.clear()
+            index = getattr(provider, "corp_index", None)
+            by_code = self._ingest(fresh, index)
+            with self._lock:
+                for item in fresh:
+                    receipt_no = _receipt_no(item)
+                    if receipt_no > self.cursor:
+                        self.cursor = receipt_no
+                self._prune(today)
+            return by_code
+
+    def _ingest(self, items: Iterable[Dict[str, Any]], index: Any = None, code: str = "") -> Dict[str, List[Dict[str, Any]]]:
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            stock_code = code or str(item.get("stock_code", "") or "").strip()
+            if not stock_code and index is not None:
+                stock_code = index.stock_code_for(str(item.get("corp_code", "") or ""))
+            if not stock_code:
+                self.unmapped += 1
+                continue
+            grouped.setdefault(stock_code, []).append(item)
+        added: Dict[str, List[Dict[str, Any]]] = {}
+        with self._lock:
+            for stock_code, rows in grouped.items():
+                cached = self._by_code.setdefault(stock_code, [])
+                known = {_receipt_no(row) for row in cached}
+                new_rows = [row for row in rows if _receipt_no(row) not in known]
+                if not new_rows:
+                    continue
+                cached.extend(new_rows)
+                cached.sort(key=_receipt_no, reverse=True)
+                del cached[self.per_code_limit :]
+                self.ingested += len(new_rows)
+                added[stock_code] = new_rows
+        return added
+
+    def _prune(self, today: datetime.date):
+        cutoff = (today - datetime.timedelta(days=self.retention_days)).strftime("%Y%m%d")
+        for stock_code in list(self._by_code):
+            rows = [row for row in self._by_code[stock_code] if _receipt_no(row)[:8] >= cutoff]
+            if rows:
+                self._by_code[stock_code] = rows
+            else:
+                del self._by_code[stock_code]
+
+    # ------------------------------------------------------------------
+    # Per-code reads and backfill
+    # ------------------------------------------------------------------
+    def recent(self, code: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Cached filings for `code`, newest receipt first."""
+        with self._lock:
+            rows = list(self._by_code.get(str(code or ""), []))
+        return rows[:limit] if limit is not None else rows
+
+    def needs_backfill(self, code: str) -> bool:
+        with self._lock:
+            return str(code or "") not in self._backfilled
+
+    def backfill(self, provider: Any, code: str, start_date: str, end_date: str, page_count: int = 10) -> List[Dict[str, Any]]:
+        """One per-company query for a code the feed has not covered yet."""
+        code = str(code or "")
+        items = provider.get_recent_disclosures(code, start_date=start_date, end_date=end_date, page_count=page_count)
+        self.backfills += 1
+        if str(getattr(provider, "last_status", "") or "") != "error":
+            self._ingest(items or [], code=code)
+            with self._lock:
+                self._backfilled.add(code)
+        return self.recent(code)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            cached_codes = len(self._by_code)
+        return {
+            "cursor": self.cursor,
+            "polls": self.polls,
+            "pages_fetched": self.pages_fetched,
+            "ingested": self.ingested,
+            "unmapped": self.unmapped,
+            "backfills": self.backfills,
+            "gaps": self.gaps,
+            "cached_codes": cached_codes,
+        }
@@ -7,26 +7,200 @@ from __future__ import annotations
 
 import json
 import os
+import struct
+import threading
+import time
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 from zipfile import ZipFile
 import xml.etree.ElementTree as ET
 
-import requests
+from .http_cache import provider_http_client
+
+
+_BIN_MAGIC = b"DCC1"
+_STOCK_WIDTH = 6
+_CORP_WIDTH = 8
+
+
+class CorpCodeIndex:
+    """Process-wide stock_code <-> corp_code map shared by every DartProvider.
+
+    Loaded once (binary cache first, then the JSON cache) and swapped
+    atomically on refresh, so lookups are dict hits with no file I/O. The
+    binary cache is a fixed-width table (6-byte stock code + 8-byte corp code).
+    A failed background refresh backs off (`RETRY_BASE_SEC`, doubling up to
+    `RETRY_MAX_SEC`) instead of retrying on every lookup.
+    """
+
+    RETRY_BASE_SEC = 300.0
+    RETRY_MAX_SEC = 6 * 3600.0
+
+    def __init__(self, cache_dir: Path):
+        self.json_path = cache_dir / "dart_corp_codes.json"
+        self.bin_path = cache_dir / "dart_corp_codes.bin"
+        self._maps: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self.loaded_at = 0.0
+        self.load_count = 0
+        self.refresh_failures = 0
+        self.refresh_failed_at = 0.0
+        self._retry_after = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        return self._maps is not None
+
+    def __len__(self) -> int:
+        return len(self._maps[0]) if self._maps is not None else 0
+
+    def stock_to_corp(self) -> Dict[str, str]:
+        """Copy of the stock -> corp map (the live map is shared and swapped, never mutated)."""
+        return dict(self._maps[0]) if self._maps is not None else {}
+
+    def lookup(self, stock_code: str) -> str:
+        maps = self._maps
+        return maps[0].get(stock_code, "") if maps is not None else ""
+
+    def stock_code_for(self, corp_code: str) -> str:
+        maps = self._maps
+        return maps[1].get(corp_code, "") if maps is not None else ""
+
+    def age_sec(self) -> float:
+        return time.time() - self.loaded_at if self.loaded_at else float("inf")
+
+    def swap(self, mapping: Dict[str, str], loaded_at: Optional[float] = None):
+        by_stock = {str(k): str(v) for k, v in mapping.items() if str(k) and str(v)}
+        by_corp = {corp: stock for stock, corp in by_stock.items()}
+        self._maps = (by_stock, by_corp)
+        self.loaded_at = time.time() if loaded_at is None else loaded_at
+        self.load_count += 1
+
+    def load_from_disk(self) -> bool:
+        """Populate from the binary cache, falling back to (and converting) the JSON cache."""
+        with self._lock:
+            if self._maps is not None:
+                return True
+            mapping = self._read_bin()
+            source = self.bin_path
+            if mapping is None:
+                mapping = self._read_json()
+                source = self.json_path
+                if mapping:
+                    self.persist_bin(mapping)
+            if not mapping:
+                return False
+            try:
+                mtime = source.stat().st_mtime
+            except OSError:
+                mtime = None
+            self.swap(mapping, loaded_at=mtime)
+            return True
+
+    def _read_bin(self) -> Optional[Dict[str, str]]:
+        try:
+            raw = self.bin_path.read_bytes()
+        except OSError:
+            return None
+        if len(raw) < 8 or raw[:4] != _BIN_MAGIC:
+            return None
+        (count,) = struct.unpack_from("<I", raw, 4)
+        width = _STOCK_WIDTH + _CORP_WIDTH
+        if len(raw) != 8 + count * width:
+            return None
+        body = raw[8:].decode("ascii", errors="replace")
+        return {
+            body[pos : pos + _STOCK_WIDTH]: body[pos + _STOCK_WIDTH : pos + width]
+            for pos in range(0, count * width, width)
+        }
+
+    def _read_json(self) -> Optional[Dict[str, str]]:
+        try:
+            payload = json.loads(self.json_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        return {str(k): str(v) for k, v in payload.items() if str(k) and str(v)}
+
+    def persist_bin(self, mapping: Dict[str, str]) -> bool:
+        rows = sorted(mapping.items())
+        if any(len(stock) != _STOCK_WIDTH or len(corp) != _CORP_WIDTH or not (stock + corp).isascii() for stock, corp in rows):
+            return False
+        body = "".join(stock + corp for stock, corp in rows).encode("ascii")
+        tmp_path = self.bin_path.with_name(f"{self.bin_path.name}.tmp")
+        try:
+            tmp_path.write_bytes(_BIN_MAGIC + struct.pack("<I", len(rows)) + body)
+            os.replace(tmp_path, self.bin_path)
+        except OSError:
+            return False
+        return True
+
+    def refresh_in_background(self, fetch: Callable[[], Dict[str, str]]) -> bool:
+        """Single-flight refresh; readers keep using the current map until the swap."""
+        with self._lock:
+            if self._refreshing or time.time() < self._retry_after:
+                return False
+            self._refreshing = True
+
+        def _run():
+            mapping: Dict[str, str] = {}
+            try:
+                mapping = fetch()
+            except Exception:
+                mapping = {}
+            finally:
+                self._record_refresh(bool(mapping))
+                self._refreshing = False
+
+        threading.Thread(target=_run, name="dart-corp-code-refresh", daemon=True).start()
+        return True
+
+    def _record_refresh(self, ok: bool):
+        now = time.time()
+        with self._lock:
+            if ok:
+                self.refresh_failures = 0
+                self._retry_after = 0.0
+                return
+            self.refresh_failures += 1
+            self.refresh_failed_at = now
+            self._retry_after = now + min(self.RETRY_MAX_SEC, self.RETRY_BASE_SEC * 2 ** (self.refresh_failures - 1))
+
+
+_corp_indexes: Dict[str, CorpCodeIndex] = {}
+_corp_indexes_lock = threading.Lock()
+
+
+def corp_code_index(cache_dir: Any) -> CorpCodeIndex:
+    key = os.path.abspath(str(cache_dir))
+    with _corp_indexes_lock:
+        index = _corp_indexes.get(key)
+        if index is None:
+            index = CorpCodeIndex(Path(key))
+            _corp_indexes[key] = index
+        return index
 
 
 class DartProvider:
     BASE_URL = "https://opendart.fss.or.kr/api"
     CORP_CODE_URL = f"{BASE_URL}/corpCode.xml"
+    CORP_CODE_REFRESH_SEC = 7 * 24 * 3600
+    # list.json 상태 코드: 000 정상, 013 조회 결과 없음, 그 외(키 오류/사용한도 초과 등)는 실패
+    STATUS_OK = "000"
+    STATUS_NO_DATA = "013"
 
     def __init__(self, api_key: str = "", cache_dir: str = "data"):
         self.api_key = api_key or os.getenv("OPEN_DART_API_KEY", "")
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_path = self.cache_dir / "dart_corp_codes.json"
+        self.corp_index = corp_code_index(self.cache_dir)
         self.last_status = "idle"
         self.last_error = ""
+        self.last_total_page = 0
 
     def _mark(self, status: str, error: str = ""):
         self.last_status = str(status or "idle")
@@ -42,7 +216,7 @@ class DartProvider:
         url = f"{self.BASE_URL}/company.json"
         params = {"crtfc_key": self.api_key, "corp_code": corp_code}
         try:
-            res = requests.get(url, params=params, timeout=10)
+            res = provider_http_client().get("dart", url, params=params, timeout=10)
             res.raise_for_status()
             payload = res.json()
             if str(payload.get("status")) != "000":
@@ -68,7 +242,7 @@ class DartProvider:
             "reprt_code": reprt_code,
         }
         try:
-            res = requests.get(url, params=params, timeout=10)
+            res = provider_http_client().get("dart", url, params=params, timeout=10)
             res.raise_for_status()
             payload = res.json()
             if str(payload.get("status")) != "000":
@@ -86,20 +260,17 @@ class DartProvider:
         if not self.available():
             self._mark("disabled")
             return {}
-        if not force_refresh and self.cache_path.exists():
-            try:
-                payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
-                if isinstance(payload, dict):
-                    self._mark("ok_with_data")
-                    return {str(k): str(v) for k, v in payload.items() if str(k) and str(v)}
-            except (OSError, json.JSONDecodeError):
-                pass
+        if not force_refresh and (self.corp_index.loaded or self.corp_index.load_from_disk()):
+            self._mark("ok_with_data")
+            return self.corp_index.stock_to_corp()
         try:
-            response = requests.get(self.CORP_CODE_URL, params={"crtfc_key": self.api_key}, timeout=20)
+            response = provider_http_client().get("dart", self.CORP_CODE_URL, params={"crtfc_key": self.api_key}, timeout=20, ttl=0)
             response.raise_for_status()
             mapping = self._parse_corp_code_zip(response.content)
             if mapping:
                 self.cache_path.write_text(json.dumps(mapping, ensure_ascii=False, indent=2), encoding="utf-8")
+                self.corp_index.persist_bin(mapping)
+                self.corp_index.swap(mapping)
             self._mark("ok_with_data" if mapping else "ok_empty")
             return mapping
         except Exception as exc:
@@ -110,8 +281,12 @@ class DartProvider:
         code = str(stock_code or "").strip()
         if not code:
             return ""
-        mapping = self.get_corp_code_map(force_refresh=force_refresh)
-        return str(mapping.get(code, "") or "")
+        index = self.corp_index
+        if force_refresh or not (index.loaded or index.load_from_disk()):
+            self.get_corp_code_map(force_refresh=True)
+        elif self.available() and index.age_sec() > self.CORP_CODE_REFRESH_SEC:
+            index.refresh_in_background(lambda: self.get_corp_code_map(force_refresh=True))
+        return index.lookup(code)
 
     def get_recent_disclosures(
         self,
@@ -137,7 +312,7 @@ class DartProvider:
             "last_reprt_at": "Y",
         }
         try:
-            res = requests.get(url, params=params, timeout=10)
+            res = provider_http_client().get("dart", url, params=params, timeout=10)
             res.raise_for_status()
             payload = res.json()
             if str(payload.get("status")) != "000":
@@ -151,6 +326,55 @@ class DartProvider:
             self._mark("error", error=str(exc))
             return []
 
+    def get_market_disclosures(
+        self,
+        start_date: str,
+        end_date: str,
+        page_no: int = 1,
+        page_count: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Market-wide `list.json` page (no corp_code), newest receipt first.
+
+        `last_total_page` holds the page count reported by the last call.
+        """
+        self.last_total_page = 0
+        if not self.available():
+            self._mark("disabled")
+            return []
+        url = f"{self.BASE_URL}/list.json"
+        params = {
+            "crtfc_key": self.api_key,
+            "bgn_de": start_date,
+            "end_de": end_date,
+            "page_no": max(1, int(page_no)),
+            "page_count": max(1, min(int(page_count), 100)),
+            "sort": "date",
+            "sort_mth": "desc",
+        }
+        try:
+            res = provider_http_client().get("dart", url, params=params, timeout=10)
+            res.raise_for_status()
+            payload = res.json()
+            status = str(payload.get("status"))
+            if status != self.STATUS_OK:
+                message = str(payload.get("message", "") or "")
+                if status == self.STATUS_NO_DATA:
+                    self._mark("ok_empty", error=message)
+                else:
+                    self._mark("error", error=f"{status}: {message}" if message else status)
+                return []
+            result = payload.get("list", [])
+            normalized = result if isinstance(result, list) else []
+            try:
+                self.last_total_page = int(payload.get("total_page", 0) or 0)
+            except (TypeError, ValueError):
+                self.last_total_page = 0
+            self._mark("ok_with_data" if normalized else "ok_empty")
+            return normalized
+        except Exception as exc:
+            self._mark("error", error=str(exc))
+            return []
+
     @staticmethod
     def _parse_corp_code_zip(raw: bytes) -> Dict[str, str]:
         mapping: Dict[str, str] = {}
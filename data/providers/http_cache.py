@@ -0,0 +1,409 @@
+"""Shared HTTP layer for external data providers.
+
+Pooled keep-alive sessions per host, an in-memory + on-disk response cache
+with per-provider TTLs, ETag/Last-Modified revalidation and
+stale-while-revalidate. Providers call `provider_http_client()` instead of
+bare `requests.get`/`post`.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 뉴스/공시는 갱신 주기(기본 60초)보다 짧게 잡아 같은 주기 안의 반복 조회만 로컬에서 응답하고,
+# 만료 후에는 바로 조건부 요청을 보낸다(이전 주기 본문을 돌려주면 새 기사가 한 주기 늦어진다).
+DEFAULT_TTL_SEC: Dict[str, float] = {"news": 50.0, "dart": 50.0, "datalab": 600.0, "macro": 1800.0, "ai": 0.0}
+DEFAULT_STALE_SEC: Dict[str, float] = {"news": 0.0, "dart": 0.0, "datalab": 1800.0, "macro": 3600.0, "ai": 0.0}
+DEFAULT_DISK_MAX_AGE_SEC = 7 * 24 * 3600.0
+DEFAULT_DISK_MAX_BYTES = 256 * 1024 * 1024
+_KEPT_HEADERS = ("ETag", "Last-Modified", "Content-Type")
+
+
+class CachedResponse:
+    """The subset of `requests.Response` the providers use."""
+
+    def __init__(self, status_code: int, content: bytes, headers: Mapping[str, str], url: str = "", cache_state: str = "miss"):
+        self.status_code = int(status_code)
+        self.content = content or b""
+        self.headers = dict(headers or {})
+        self.url = url
+        self.cache_state = cache_state
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content.decode("utf-8"))
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {urlsplit(self.url).path}")
+
+
+class ProviderHttpClient:
+    """One client per process, shared by every provider instance and thread.
+
+    `ttl_sec[provider]` is how long a 200 response is served without
+    touching the network; for the following `stale_sec[provider]` seconds
+    the cached body is still returned immediately while one background
+    conditional request refreshes it. Past that the request is made
+    synchronously with `If-None-Match`/`If-Modified-Since`, and a 304 just
+    renews the cached entry. A network failure falls back to any cached
+    body. TTL 0 (AI calls, corp-code downloads) bypasses the cache but still
+    uses the pooled session. Without `cache_dir` the cache is memory only.
+
+    The disk cache is pruned on the writing thread at the first store and
+    every `prune_every` stores after it: files untouched for
+    `disk_max_age_sec` go first, then the oldest until the directory fits in
+    `disk_max_bytes` (0 disables either limit).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        *,
+        ttl_sec: Optional[Mapping[str, float]] = None,
+        stale_sec: Optional[Mapping[str, float]] = None,
+        memory_entries: int = 512,
+        pool_maxsize: int = 8,
+        disk_max_age_sec: float = DEFAULT_DISK_MAX_AGE_SEC,
+        disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+        prune_every: int = 256,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl_sec: Dict[str, float] = dict(DEFAULT_TTL_SEC)
+        self.ttl_sec.update(ttl_sec or {})
+        self.stale_sec: Dict[str, float] = dict(DEFAULT_STALE_SEC)
+        self.stale_sec.update(stale_sec or {})
+        self.memory_entries = max(1, int(memory_entries))
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self.disk_max_age_sec = max(0.0, float(disk_max_age_sec))
+        self.disk_max_bytes = max(0, int(disk_max_bytes))
+        self.prune_every = max(1, int(prune_every))
+        self._stores_since_prune: Optional[int] = None
+        self.pruned_files = 0
+        self.logger = logging.getLogger("ProviderHttpClient")
+        self._sessions: Dict[str, requests.Session] = {}
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._revalidating: set = set()
+        self._revalidator: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+    def _session(self, url: str) -> requests.Session:
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            revalidator, self._revalidator = self._revalidator, None
+        if revalidator is not None:
+            revalidator.shutdown(wait=False, cancel_futures=True)
+        for session in sessions:
+            session.close()
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+    def _bucket(self, provider: str) -> Dict[str, float]:
+        bucket = self._stats.get(provider)
+        if bucket is None:
+            fields = ("hits", "stale_hits", "revalidated", "misses", "errors", "network_calls", "latency_ms_total")
+            bucket = {field: 0.0 for field in fields}
+            self._stats[provider] = bucket
+        return bucket
+
+    def _count(self, provider: str, field: str):
+        with self._lock:
+            self._bucket(provider)[field] += 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-provider counters with hit rate (cache-served share) and mean network latency."""
+        with self._lock:
+            snapshot = {provider: dict(bucket) for provider, bucket in self._stats.items()}
+        for bucket in snapshot.values():
+            requests_total = bucket["hits"] + bucket["stale_hits"] + bucket["revalidated"] + bucket["misses"] + bucket["errors"]
+            served = bucket["hits"] + bucket["stale_hits"] + bucket["revalidated"]
+            bucket["requests"] = requests_total
+            bucket["hit_rate"] = served / requests_total if requests_total else 0.0
+            calls = bucket["network_calls"]
+            bucket["avg_latency_ms"] = bucket["latency_ms_total"] / calls if calls else 0.0
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Cache storage
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _key(method: str, url: str, params: Optional[Mapping[str, Any]], json_body: Any) -> str:
+        material = json.dumps(
+            [method.upper(), url, sorted((str(k), str(v)) for k, v in (params or {}).items()), json_body],
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _disk_path(self, provider: str, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / provider / f"{key[:40]}.bin"
+
+    def _load(self, provider: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        path = self._disk_path(provider, key)
+        if path is None:
+            return None
+        try:
+            raw = path.read_bytes()
+            header, _sep, body = raw.partition(b"\n")
+            meta = json.loads(header.decode("utf-8"))
+        except (OSError, ValueError):
+            return None
+        entry = {"status": int(meta.get("status", 200)), "headers": meta.get("headers", {}), "stored_at": float(meta.get("stored_at", 0.0)), "body": body}
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _store(self, provider: str, key: str, entry: Dict[str, Any]):
+        self._remember(key, entry)
+        path = self._disk_path(provider, key)
+        if path is None:
+            return
+        meta = {"status": entry["status"], "headers": entry["headers"], "stored_at": entry["stored_at"]}
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(json.dumps(meta).encode("utf-8") + b"\n" + entry["body"])
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            self.logger.warning(f"http cache write failed ({provider}): {exc}")
+            return
+        with self._lock:
+            due = self._stores_since_prune is None or self._stores_since_prune + 1 >= self.prune_every
+            self._stores_since_prune = 0 if due else (self._stores_since_prune or 0) + 1
+        if due:
+            self.prune_disk()
+
+    def prune_disk(self) -> int:
+        """Apply the disk age/size limits; returns the number of removed files."""
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return 0
+        now = time.time()
+        files = []
+        for path in self.cache_dir.glob("*/*.bin"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort(key=lambda item: item[0])
+        total = sum(size for _mtime, size, _path in files)
+        removed = 0
+        for mtime, size, path in files:
+            expired = bool(self.disk_max_age_sec) and now - mtime > self.disk_max_age_sec
+            oversized = bool(self.disk_max_bytes) and total > self.disk_max_bytes
+            if not expired and not oversized:
+                # 오래된 순서로 정렬돼 있으므로 이후 파일은 모두 한도 안이다.
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self.pruned_files += removed
+        return removed
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+    def get(self, provider: str, url: str, **kwargs: Any) -> CachedResponse:
+        return self.request(provider, "GET", url, **kwargs)
+
+    def post(self, provider: str, url: str, **kwargs: Any) -> CachedResponse:
+        return self.request(provider, "POST", url, **kwargs)
+
+    def request(
+        self,
+        provider: str,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        json: Any = None,
+        timeout: float = 10,
+        ttl: Optional[float] = None,
+    ) -> CachedResponse:
+        ttl = float(self.ttl_sec.get(provider, 0.0) if ttl is None else ttl)
+        if ttl <= 0:
+            try:
+                response = self._send(provider, method, url, params, headers, json, timeout)
+            except requests.RequestException:
+                self._count(provider, "errors")
+                raise
+            self._count(provider, "misses")
+            return self._wrap(response, url, "bypass")
+        key = self._key(method, url, params, json)
+        entry = self._load(provider, key)
+        if entry is not None:
+            age = time.time() - float(entry.get("stored_at", 0.0))
+            if age < ttl:
+                self._count(provider, "hits")
+                return self._from_entry(entry, url, "hit")
+            if age < ttl + float(self.stale_sec.get(provider, 0.0)):
+                self._count(provider, "stale_hits")
+                self._revalidate_async(provider, key, method, url, params, headers, json, timeout)
+                return self._from_entry(entry, url, "stale")
+        try:
+            return self._fetch(provider, key, method, url, params, headers, json, timeout, entry)
+        except requests.RequestException:
+            if entry is None:
+                self._count(provider, "errors")
+                raise
+            # 네트워크 오류면 오래된 본문이라도 돌려준다 (stale-if-error).
+            self._count(provider, "stale_hits")
+            return self._from_entry(entry, url, "stale_error")
+
+    def _send(self, provider, method, url, params, headers, json_body, timeout) -> requests.Response:
+        started = time.perf_counter()
+        try:
+            return self._session(url).request(method, url, params=params, headers=headers, json=json_body, timeout=timeout)
+        finally:
+            latency_ms = (time.perf_counter() - started) * 1000.0
+            with self._lock:
+                bucket = self._bucket(provider)
+                bucket["network_calls"] += 1
+                bucket["latency_ms_total"] += latency_ms
+
+    def _fetch(self, provider, key, method, url, params, headers, json_body, timeout, entry) -> CachedResponse:
+        request_headers = dict(headers or {})
+        if entry is not None:
+            cached_headers = entry.get("headers", {})
+            if cached_headers.get("ETag"):
+                request_headers["If-None-Match"] = cached_headers["ETag"]
+            if cached_headers.get("Last-Modified"):
+                request_headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+        response = self._send(provider, method, url, params, request_headers, json_body, timeout)
+        if response.status_code == 304 and entry is not None:
+            renewed = dict(entry)
+            renewed["stored_at"] = time.time()
+            self._store(provider, key, renewed)
+            self._count(provider, "revalidated")
+            return self._from_entry(renewed, url, "revalidated")
+        self._count(provider, "misses")
+        if response.status_code == 200 and response.content:
+            self._store(
+                provider,
+                key,
+                {
+                    "status": 200,
+                    "headers": {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers},
+                    "stored_at": time.time(),
+                    "body": response.content,
+                },
+            )
+        return self._wrap(response, url, "miss")
+
+    def _revalidate_async(self, provider, key, method, url, params, headers, json_body, timeout):
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+            if self._revalidator is None:
+                self._revalidator = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="http-revalidate")
+            revalidator = self._revalidator
+
+        def _run():
+            try:
+                entry = self._load(provider, key)
+                self._fetch(provider, key, method, url, params, headers, json_body, timeout, entry)
+            except Exception as exc:
+                self.logger.debug(f"http revalidation failed ({provider}): {exc}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        try:
+            revalidator.submit(_run)
+        except RuntimeError:
+            with self._lock:
+                self._revalidating.discard(key)
+
+    @staticmethod
+    def _from_entry(entry: Dict[str, Any], url: str, state: str) -> CachedResponse:
+        return CachedResponse(int(entry.get("status", 200)), entry.get("body", b""), entry.get("headers", {}), url=url, cache_state=state)
+
+    @staticmethod
+    def _wrap(response: requests.Response, url: str, state: str) -> CachedResponse:
+        return CachedResponse(response.status_code, response.content, dict(response.headers), url=url, cache_state=state)
+
+
+_shared_client: Optional[ProviderHttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def provider_http_client() -> ProviderHttpClient:
+    """Process-wide client (memory-only cache until `configure_provider_http` is called)."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = ProviderHttpClient()
+        return _shared_client
+
+
+def configure_provider_http(
+    cache_dir: Optional[str] = None,
+    *,
+    ttl_sec: Optional[Mapping[str, float]] = None,
+    stale_sec: Optional[Mapping[str, float]] = None,
+    disk_max_age_sec: float = DEFAULT_DISK_MAX_AGE_SEC,
+    disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+) -> ProviderHttpClient:
+    """Replace the shared client (closing the old sessions) with the given cache settings."""
+    global _shared_client
+    client = ProviderHttpClient(
+        cache_dir, ttl_sec=ttl_sec, stale_sec=stale_sec, disk_max_age_sec=disk_max_age_sec, disk_max_bytes=disk_max_bytes
+    )
+    with _shared_lock:
+        previous, _shared_client = _shared_client, client
+    if previous is not None:
+        previous.close()
+    return client
@@ -1,16 +1,20 @@
 ﻿"""Macro data provider (FRED free API)."""
 
+import datetime
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-import requests
+from ..macro_store import MacroSeriesStore
+from .http_cache import provider_http_client
 
 
 class MacroProvider:
     BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 
-    def __init__(self, api_key: str = ""):
+    def __init__(self, api_key: str = "", store: Optional[MacroSeriesStore] = None, history_days: int = 400):
         self.api_key = api_key or os.getenv("FRED_API_KEY", "")
+        self.store = store
+        self.history_days = max(1, int(history_days))
         self.last_status = "idle"
         self.last_error = ""
 
@@ -35,7 +39,7 @@ class MacroProvider:
         if end_date:
             params["observation_end"] = end_date
         try:
-            res = requests.get(self.BASE_URL, params=params, timeout=10)
+            res = provider_http_client().get("macro", self.BASE_URL, params=params, timeout=10)
             res.raise_for_status()
             payload = res.json()
             observations = payload.get("observations", [])
@@ -46,7 +50,50 @@ class MacroProvider:
             self._mark("error", error=str(exc))
             return []
 
+    def sync_series(self, series_id: str) -> int:
+        """Fetch observations from the last stored date onward into the store.
+
+        The last stored date is requested again so a revised or previously
+        missing value for it is picked up; the first sync pulls
+        `history_days` of history. Returns the number of rows written.
+        """
+        if self.store is None:
+            return 0
+        start_date = self.store.last_date(series_id)
+        if not start_date:
+            start_date = (datetime.date.today() - datetime.timedelta(days=self.history_days)).isoformat()
+        rows = self.get_series(series_id, start_date=start_date)
+        if self.last_status == "error":
+            return 0
+        return self.store.upsert(series_id, rows)
+
+    def history(self, series_id: str, limit: int) -> List[float]:
+        """Latest `limit` stored non-missing values (oldest first); empty without a store."""
+        if self.store is None:
+            return []
+        return self.store.history(series_id, limit)
+
+    def history_features(self, series_ids: List[str], short: int = 5, long: int = 20) -> Dict[str, float]:
+        """`<id>_chg_<short>d` (change over `short` observations) and `<id>_avg_<long>d` from stored history."""
+        features: Dict[str, float] = {}
+        for series_id in series_ids:
+            sid = str(series_id or "").strip()
+            values = self.history(sid, max(short + 1, long)) if sid else []
+            if len(values) > short:
+                features[f"{sid}_chg_{short}d"] = values[-1] - values[-1 - short]
+            if len(values) >= long:
+                features[f"{sid}_avg_{long}d"] = sum(values[-long:]) / long
+        return features
+
     def latest_value(self, series_id: str) -> float:
+        if self.store is not None:
+            self.sync_series(series_id)
+            value = self.store.latest_value(series_id)
+            if value is None:
+                return 0.0
+            if self.last_status != "error":
+                self._mark("ok_with_data")
+            return value
         rows = self.get_series(series_id)
         if not rows:
             return 0.0
@@ -67,7 +114,11 @@ class MacroProvider:
             sid = str(series_id or "").strip()
             if not sid:
                 continue
-            bundle[sid] = self.get_series(sid, start_date=start_date, end_date=end_date)
+            if self.store is not None:
+                self.sync_series(sid)
+                bundle[sid] = self.store.series(sid, start_date=start_date, end_date=end_date)
+            else:
+                bundle[sid] = self.get_series(sid, start_date=start_date, end_date=end_date)
         return bundle
 
     def latest_values(self, series_ids: List[str]) -> Dict[str, float]:
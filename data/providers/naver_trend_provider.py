@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List
 
-import requests
+from .http_cache import provider_http_client
 
 
 class NaverTrendProvider:
@@ -47,7 +47,7 @@ class NaverTrendProvider:
             "Content-Type": "application/json",
         }
         try:
-            response = requests.post(self.BASE_URL, headers=headers, json=payload, timeout=10)
+            response = provider_http_client().post("datalab", self.BASE_URL, headers=headers, json=payload, timeout=10)
             response.raise_for_status()
             result = response.json()
             normalized = result if isinstance(result, dict) else {}
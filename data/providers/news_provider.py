@@ -6,7 +6,7 @@ from datetime import datetime
 from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List
 
-import requests
+from .http_cache import provider_http_client
 
 
 class NewsProvider:
@@ -39,7 +39,7 @@ class NewsProvider:
             "sort": str(sort or "date"),
         }
         try:
-            response = requests.get(self.BASE_URL, headers=headers, params=params, timeout=10)
+            response = provider_http_client().get("news", self.BASE_URL, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             payload = response.json()
             items = payload.get("items", [])
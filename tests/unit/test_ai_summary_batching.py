@@ -0,0 +1,101 @@
+import copy
+import unittest
+from unittest.mock import patch
+
+from app.mixins.market_intelligence import MarketIntelligenceMixin
+from config import Config
+
+
+class _FakeAIProvider:
+    calls = []
+    fail = False
+
+    def __init__(self, provider="gemini", api_key=""):
+        self.provider = provider
+
+    def summarize_batch(self, prompt, model, timeout=20):
+        codes = [line.split()[-1] for line in prompt.splitlines() if "종목코드" in line]
+        type(self).calls.append({"codes": codes, "timeout": timeout})
+        if type(self).fail:
+            raise RuntimeError("timeout")
+        return {"items": [{"code": code, "summary": f"{code} 요약", "stance": "bullish", "confidence": 0.9} for code in codes]}
+
+
+class _DummyConfig:
+    def __init__(self):
+        self.feature_flags = {"enable_external_data": True}
+        self.market_intelligence = copy.deepcopy(Config.DEFAULT_MARKET_INTELLIGENCE_CONFIG)
+        self.market_intelligence["ai"]["enabled"] = True
+
+
+class _Harness(MarketIntelligenceMixin):
+    def __init__(self, codes):
+        self.config = _DummyConfig()
+        self.universe = {
+            code: {
+                "name": f"NAME{code}",
+                "market_intel": {
+                    **copy.deepcopy(Config.DEFAULT_MARKET_INTEL_STATE),
+                    "news_headlines": [{"title": f"{code} 대규모 수주"}],
+                },
+            }
+            for code in codes
+        }
+        self._candidate_universe = {}
+        self._active_market_candidates = {}
+        self._portfolio_budget_scale = 1.0
+        self._market_intel_dirty_codes = set()
+
+
+class TestAISummaryBatching(unittest.TestCase):
+    def setUp(self):
+        _FakeAIProvider.calls = []
+        _FakeAIProvider.fail = False
+
+    def test_triggers_in_one_window_share_a_call_and_unchanged_content_hits_cache(self):
+        codes = ["005930", "000660", "035720"]
+        trader = _Harness(codes)
+        scheduler = trader._ai_summary_scheduler_safe()
+        with patch("app.features.market_intelligence.scoring_policy.AIProvider", _FakeAIProvider):
+            scheduler.flush_armed = True  # 수집 창이 열린 상태를 흉내 낸다
+            for code in codes:
+                trader._maybe_run_ai_summary(code, trader.universe[code], reason="event_trigger", story_key=f"story-{code}")
+            self.assertEqual(trader.universe["005930"]["market_intel"]["ai_story_key"], "")
+            trader._flush_ai_summary_batch()
+            self.assertEqual(trader.universe["005930"]["market_intel"]["ai_story_key"], "story-005930")
+
+            self.assertEqual([call["codes"] for call in _FakeAIProvider.calls], [codes])
+            self.assertEqual(trader.universe["000660"]["market_intel"]["ai_summary"]["summary"], "000660 요약")
+            self.assertEqual(trader._market_intel_dirty_codes, set(codes))
+            usage = trader._ai_usage_bucket()
+            self.assertEqual((usage["count"], usage["cost_krw"]), (1, 150))
+
+            again = trader._maybe_run_ai_summary("005930", trader.universe["005930"], reason="event_trigger")
+            self.assertEqual(again["summary"], "005930 요약")
+            self.assertEqual(len(_FakeAIProvider.calls), 1)
+
+            trader.universe["005930"]["market_intel"]["news_headlines"].append({"title": "005930 신제품"})
+            trader._maybe_run_ai_summary("005930", trader.universe["005930"], reason="event_trigger")
+            self.assertEqual([call["codes"] for call in _FakeAIProvider.calls][-1], ["005930"])
+        self.assertEqual(scheduler.metrics()["cache_hits"], 1)
+
+    def test_budget_and_errors_fall_back_to_rules(self):
+        trader = _Harness(["005930", "000660"])
+        trader.config.market_intelligence["ai"]["daily_budget_krw"] = 100
+        with patch("app.features.market_intelligence.scoring_policy.AIProvider", _FakeAIProvider):
+            _FakeAIProvider.fail = True
+            trader._maybe_run_ai_summary("005930", trader.universe["005930"], reason="event_trigger", story_key="story-1")
+            failed = trader.universe["005930"]["market_intel"]
+            self.assertEqual(failed["ai_summary"]["source"], "rules")
+            self.assertEqual(failed["sources"]["ai"]["status"], "error")
+
+            _FakeAIProvider.fail = False
+            trader._maybe_run_ai_summary("000660", trader.universe["000660"], reason="event_trigger")
+
+        self.assertEqual(len(_FakeAIProvider.calls), 1)
+        self.assertEqual(failed["ai_story_key"], "")
+        self.assertIn("budget_exceeded", trader.universe["000660"]["market_intel"]["ai_summary"]["summary"])
+
+
+if __name__ == "__main__":
+    unittest.main()
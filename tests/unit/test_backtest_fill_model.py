@@ -0,0 +1,135 @@
+import math
+import unittest
+from datetime import datetime, timedelta
+
+from backtest import BacktestBar, BacktestConfig, EventDrivenBacktestEngine, MarketImpactFillModel
+from backtest.fill_model import timeframe_ms
+
+
+def _bars(count, volume, symbol="AAA"):
+    start = datetime(2026, 1, 5)
+    return [
+        BacktestBar(symbol=symbol, ts=start + timedelta(days=idx), open=100.0, high=102.0, low=98.0, close=100.0, volume=volume)
+        for idx in range(count)
+    ]
+
+
+def _script(actions):
+    def signal_fn(bar, _positions):
+        return {bar.symbol: actions.get(bar.ts.day, "hold")}
+
+    return signal_fn
+
+
+class TestBacktestFillModel(unittest.TestCase):
+    def test_impact_spread_and_latency_scale_with_liquidity(self):
+        model = MarketImpactFillModel(commission_bps=5.0, slippage_bps=3.0, impact_coef=1.0, max_participation=0.0)
+        bar = BacktestBar("AAA", datetime(2026, 1, 5), 100.0, 102.0, 98.0, 100.0, volume=10_000)
+
+        small = model.fill(bar, "buy", 100)
+        large = model.fill(bar, "buy", 400)
+        self.assertAlmostEqual(small.impact_bps, 400.0 * math.sqrt(0.01))
+        self.assertAlmostEqual(large.impact_bps, 2 * small.impact_bps)
+        self.assertAlmostEqual(small.price, 100.0 * (1 + (5.0 + small.slippage_bps) / 10000.0))
+
+        quoted = BacktestBar("AAA", bar.ts, 100.0, 100.0, 100.0, 100.0, volume=10_000, bid=99.9, ask=100.1)
+        self.assertAlmostEqual(model.fill(quoted, "sell", 100).spread_bps, 10.0)
+        sparse = BacktestBar("AAA", bar.ts, 100.0, 102.0, 98.0, 100.0)
+        self.assertEqual(model.fill(sparse, "buy", 100).slippage_bps, 3.0)  # 거래량/호가 없으면 가정치
+
+        slow = MarketImpactFillModel(latency_ms=60_000, bar_ms=timeframe_ms("5m"))
+        self.assertAlmostEqual(slow.fill(bar, "buy", 0).latency_bps, 400.0 * math.sqrt(0.2))
+        self.assertEqual(
+            model.estimate_slippage_bps([100.0, 100.0], [102.0, 102.0], [98.0, 98.0], [10_000, 10_000], [0, 0], [0, 0], [100, 400]),
+            [small.slippage_bps, large.slippage_bps],
+        )
+
+    def test_participation_cap_splits_entry_across_bars(self):
+        cfg = BacktestConfig(commission_bps=0, slippage_bps=3, fill_model="impact", max_participation=0.1, use_slippage_guard=False)
+        result = EventDrivenBacktestEngine(cfg).run(_bars(12, 1000), _script({5: "buy"}), initial_cash=1_000_000)
+
+        buys = [trade for trade in result.trades if trade["side"] == "buy"]
+        self.assertEqual(len(buys), 10)
+        self.assertTrue(all(trade["qty"] <= 100.0 + 1e-9 for trade in buys))
+        self.assertAlmostEqual(sum(trade["qty"] for trade in buys), 100_000 / 100.03)
+        self.assertAlmostEqual(buys[-1]["unfilled_qty"], 0.0)
+        self.assertAlmostEqual(buys[0]["modeled_slippage_bps"], 400.0 * math.sqrt(0.1))
+        self.assertEqual(buys[0]["assumed_slippage_bps"], 3.0)
+        self.assertGreater(result.metrics["avg_modeled_slippage_bps"], result.metrics["avg_assumed_slippage_bps"])
+
+        flat = EventDrivenBacktestEngine(BacktestConfig(commission_bps=0, slippage_bps=3)).run(
+            _bars(12, 1000), _script({5: "buy"}), initial_cash=1_000_000
+        )
+        self.assertEqual([(t["qty"], t["modeled_slippage_bps"]) for t in flat.trades], [(100_000 / 100.03, 3.0)])
+
+    def test_carried_remainder_waits_for_tradable_time(self):
+        cfg = BacktestConfig(commission_bps=0, slippage_bps=3, fill_model="impact", max_participation=0.1, use_slippage_guard=False, timeframe="1h")
+        stamps = [datetime(2026, 1, 5, 15, 0), datetime(2026, 1, 5, 15, 25), datetime(2026, 1, 5, 20, 0), datetime(2026, 1, 6, 9, 0)]
+        bars = [BacktestBar("AAA", ts, 100.0, 102.0, 98.0, 100.0, volume=1000) for ts in stamps]
+
+        def signal_fn(bar, _positions):
+            return {bar.symbol: "buy" if bar.ts == stamps[0] else "hold"}
+
+        result = EventDrivenBacktestEngine(cfg).run(bars, signal_fn, initial_cash=1_000_000)
+        self.assertEqual([trade["ts"] for trade in result.trades], [stamps[0].isoformat(), stamps[3].isoformat()])
+
+    def test_carried_remainder_at_midnight_respects_intraday_hours(self):
+        cfg = BacktestConfig(commission_bps=0, slippage_bps=3, fill_model="impact", max_participation=0.1, use_slippage_guard=False, timeframe="1h")
+        stamps = [datetime(2026, 1, 5, 15, 0), datetime(2026, 1, 6, 0, 0), datetime(2026, 1, 6, 9, 0)]
+        bars = [BacktestBar("AAA", ts, 100.0, 102.0, 98.0, 100.0, volume=1000) for ts in stamps]
+
+        def signal_fn(bar, _positions):
+            return {bar.symbol: "buy" if bar.ts == stamps[0] else "hold"}
+
+        result = EventDrivenBacktestEngine(cfg).run(bars, signal_fn, initial_cash=1_000_000)
+        self.assertEqual([trade["ts"] for trade in result.trades], [stamps[0].isoformat(), stamps[2].isoformat()])
+
+    def test_participation_cap_is_shared_within_a_bar(self):
+        cfg = BacktestConfig(commission_bps=0, slippage_bps=3, fill_model="impact", max_participation=0.1, use_slippage_guard=False)
+        # 5일 전량 매수(이월 발생) -> 7일에는 이월 매수 잔량과 신규 매도가 같은 봉을 나눠 쓴다.
+        result = EventDrivenBacktestEngine(cfg).run(_bars(6, 1000), _script({5: "buy", 7: "sell"}), initial_cash=1_000_000)
+
+        per_bar = {}
+        for trade in result.trades:
+            per_bar[trade["ts"]] = per_bar.get(trade["ts"], 0.0) + trade["qty"]
+        self.assertTrue(all(qty <= 100.0 + 1e-9 for qty in per_bar.values()))
+        self.assertTrue(any(trade["side"] == "sell" for trade in result.trades))
+
+    def test_carried_buys_never_overdraw_cash(self):
+        cfg = BacktestConfig(
+            commission_bps=0, slippage_bps=3, fill_model="impact", max_participation=0.1, use_slippage_guard=False, impact_coef=5.0
+        )
+        result = EventDrivenBacktestEngine(cfg).run(
+            _bars(12, 100), _script({5: "buy"}), initial_cash=10_000, allocation_per_trade=1.0
+        )
+
+        cash = 10_000.0
+        for trade in result.trades:
+            cash -= trade["qty"] * trade["price"]
+            self.assertGreaterEqual(cash, -1e-6)
+
+    def test_slippage_guard_reacts_to_modeled_slippage(self):
+        actions = {5: "buy", 6: "sell", 7: "buy"}
+        impact = BacktestConfig(commission_bps=0, slippage_bps=3, fill_model="impact", max_participation=0.0)
+        flat = BacktestConfig(commission_bps=0, slippage_bps=3)
+
+        thin = EventDrivenBacktestEngine(impact).run(_bars(4, 5000), _script(actions), initial_cash=1_000_000)
+        baseline = EventDrivenBacktestEngine(flat).run(_bars(4, 5000), _script(actions), initial_cash=1_000_000)
+
+        self.assertEqual([trade["side"] for trade in thin.trades], ["buy", "sell"])
+        self.assertEqual([trade["side"] for trade in baseline.trades], ["buy", "sell", "buy"])
+        self.assertGreater(thin.metrics["avg_slippage_bps"], impact.max_slippage_bps)
+        with self.assertRaises(ValueError):
+            EventDrivenBacktestEngine(BacktestConfig(fill_model="vwap"))
+
+    def test_slippage_guard_samples_every_trade_signal(self):
+        # 체결되지 않은 신호(보유 없이 매도)도 기존처럼 가정 슬리피지 표본을 남긴다.
+        cfg = BacktestConfig(commission_bps=2, slippage_bps=3, fill_model="impact", max_participation=0.0)
+        result = EventDrivenBacktestEngine(cfg).run(_bars(2, 5000), _script({5: "sell", 6: "cover"}), initial_cash=1_000_000)
+
+        self.assertEqual(result.trades, [])
+        self.assertAlmostEqual(result.metrics["avg_slippage_bps"], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
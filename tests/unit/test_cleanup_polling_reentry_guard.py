@@ -1,8 +1,8 @@
-"""B1: cleanup 폴링 중 _on_order_execution 재진입 억제 검증.
+"""B1: cleanup 중 취소 이벤트 처리 검증.
 
-_cleanup_polling=True 인 동안 _on_order_execution 이 cancel/reject 이벤트를
-받아도 _pending_order_state 를 변경(cancelled/rejected 마킹)하지 않아야 한다.
-체결 fill 동기화 로그 자체는 남을 수 있으나 pending mutation 은 보류된다.
+cleanup 은 더 이상 processEvents() 로 이벤트 루프를 돌리지 않으므로 재진입 억제
+플래그가 없다. 취소 이벤트는 즉시 pending state 를 정리하고, 비동기 cleanup 은
+그 결과를 보고 대상을 종료 처리한다.
 """
 import unittest
 
@@ -82,7 +82,6 @@ class _Harness(OrderSyncMixin):
         self.telegram = None
         self.logger = _DummyLogger()
         self.sig_update_table = _DummySignal()
-        self._cleanup_polling = False
 
     def log(self, _msg):
         return None
@@ -121,35 +120,14 @@ class TestCleanupPollingReentryGuard(unittest.TestCase):
             "qty": 2,
         }
 
-    def test_pending_mutation_deferred_during_cleanup_polling(self):
+    def test_cancel_event_clears_pending_immediately(self):
         trader = _Harness()
-        # 폴링 중 상태 시뮬레이션
-        trader._cleanup_polling = True
-        original_state = dict(trader._pending_order_state["005930"])
 
-        # cancel/reject 성격의 이벤트(실제로는 취소 완료)를 전달
         cancel_event = self._cancel_event()
         cancel_event["order_status"] = "취소"
         trader._on_order_execution(cancel_event)
 
-        # pending state 가 mutated 되지 않는다(state 키 그대로).
-        pending = trader._pending_order_state.get("005930", {})
-        self.assertEqual(pending.get("state"), original_state["state"])
-        self.assertEqual(pending.get("remaining_qty"), original_state["remaining_qty"])
-        # reserved cash 도 보존된다.
-        self.assertEqual(trader._reserved_cash_by_code.get("005930"), 2000)
-        # 보류 로그가 남는다.
-        self.assertTrue(any("pending mutation deferred" in m for m in trader.logger.messages))
-
-    def test_pending_mutation_allowed_when_not_polling(self):
-        trader = _Harness()
-        trader._cleanup_polling = False
-
-        cancel_event = self._cancel_event()
-        cancel_event["order_status"] = "취소"
-        trader._on_order_execution(cancel_event)
-
-        # 폴링 중이 아니면 cancel 처리로 pending 이 정리된다.
+        # cancel 처리로 pending 이 바로 정리된다.
         # (_clear_pending_order 에 의해 pop 되거나 cancelled 로 마킹)
         pending = trader._pending_order_state.get("005930")
         if pending is not None:
@@ -0,0 +1,93 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from data.providers import dart_provider
+from data.providers.dart_provider import DartProvider
+
+
+class TestDartCorpCodeIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+        (self.cache_dir / "dart_corp_codes.json").write_text(
+            json.dumps({"005930": "00126380", "000660": "00164779"}), encoding="utf-8"
+        )
+
+    def tearDown(self):
+        dart_provider._corp_indexes.clear()
+        self._tmp.cleanup()
+
+    def test_index_loads_once_and_is_shared_between_providers(self):
+        first = DartProvider("key", cache_dir=str(self.cache_dir))
+        self.assertEqual(first.resolve_corp_code("005930"), "00126380")
+        self.assertTrue((self.cache_dir / "dart_corp_codes.bin").exists())
+
+        second = DartProvider("key", cache_dir=str(self.cache_dir))
+        with patch.object(Path, "read_text", side_effect=AssertionError("no I/O after load")), patch.object(
+            Path, "read_bytes", side_effect=AssertionError("no I/O after load")
+        ):
+            self.assertEqual(second.resolve_corp_code("000660"), "00164779")
+            self.assertEqual(second.resolve_corp_code("999999"), "")
+        self.assertIs(first.corp_index, second.corp_index)
+        self.assertEqual(first.corp_index.load_count, 1)
+        self.assertEqual(first.corp_index.stock_code_for("00164779"), "000660")
+
+    def test_binary_cache_is_preferred_and_stale_index_refreshes_in_background(self):
+        DartProvider("key", cache_dir=str(self.cache_dir)).resolve_corp_code("005930")
+        dart_provider._corp_indexes.clear()
+        (self.cache_dir / "dart_corp_codes.json").write_text("{}", encoding="utf-8")
+
+        provider = DartProvider("key", cache_dir=str(self.cache_dir))
+        self.assertEqual(provider.resolve_corp_code("005930"), "00126380")
+
+        gate = threading.Event()
+        refreshed = threading.Event()
+
+        def _fake_download(force_refresh=False):
+            gate.wait(2.0)
+            provider.corp_index.swap({"005930": "00999999"})
+            refreshed.set()
+            return provider.corp_index.stock_to_corp()
+
+        provider.corp_index.loaded_at = 1.0
+        with patch.object(provider, "get_corp_code_map", side_effect=_fake_download):
+            self.assertEqual(provider.resolve_corp_code("005930"), "00126380")
+            gate.set()
+            self.assertTrue(refreshed.wait(2.0))
+        self.assertEqual(provider.resolve_corp_code("005930"), "00999999")
+
+    def test_failed_refresh_backs_off_and_lookups_get_a_copy(self):
+        provider = DartProvider("key", cache_dir=str(self.cache_dir))
+        provider.resolve_corp_code("005930")
+        provider.corp_index.loaded_at = 1.0
+        calls = []
+        done = threading.Event()
+
+        def _failed_download(force_refresh=False):
+            calls.append(force_refresh)
+            done.set()
+            return {}
+
+        with patch.object(provider, "get_corp_code_map", side_effect=_failed_download):
+            provider.resolve_corp_code("005930")
+            self.assertTrue(done.wait(2.0))
+            deadline = time.monotonic() + 2.0
+            while provider.corp_index._refreshing and time.monotonic() < deadline:
+                time.sleep(0.01)
+            provider.resolve_corp_code("005930")
+        self.assertEqual(calls, [True])
+        self.assertEqual(provider.corp_index.refresh_failures, 1)
+        self.assertGreater(provider.corp_index.refresh_failed_at, 0.0)
+
+        snapshot = provider.corp_index.stock_to_corp()
+        snapshot["005930"] = "mutated"
+        self.assertEqual(provider.corp_index.lookup("005930"), "00126380")
+
+
+if __name__ == "__main__":
+    unittest.main()
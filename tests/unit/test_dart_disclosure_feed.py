@@ -0,0 +1,157 @@
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.mixins.market_intelligence import MarketIntelligenceMixin
+from config import Config
+from data.providers import DartDisclosureFeed, dart_provider
+from data.providers.dart_provider import CorpCodeIndex, DartProvider
+
+
+def _filing(receipt_no, corp_code, stock_code="", title="주요사항보고서"):
+    return {"rcept_no": receipt_no, "corp_code": corp_code, "stock_code": stock_code, "report_nm": title, "rcept_dt": receipt_no[:8]}
+
+
+class _FakeMarketDart:
+    def __init__(self, pages=None, by_code=None):
+        self.pages = pages or []
+        self.by_code = by_code or {}
+        self.market_calls = []
+        self.code_calls = []
+        self.last_status = "idle"
+        self.last_error = ""
+        self.last_total_page = 0
+        self.corp_index = CorpCodeIndex(Path("unused"))
+        self.corp_index.swap({"005930": "00126380", "000660": "00164779"})
+
+    def available(self):
+        return True
+
+    def get_market_disclosures(self, start_date, end_date, page_no=1, page_count=100):
+        self.market_calls.append((start_date, end_date, page_no))
+        self.last_total_page = len(self.pages)
+        items = list(self.pages[page_no - 1]) if page_no <= len(self.pages) else []
+        self.last_status = "ok_with_data" if items else "ok_empty"
+        return items
+
+    def get_recent_disclosures(self, code, start_date="", end_date="", page_count=10):
+        self.code_calls.append(code)
+        items = list(self.by_code.get(code, []))
+        self.last_status = "ok_with_data" if items else "ok_empty"
+        return items
+
+
+class _DummyConfig:
+    def __init__(self):
+        self.feature_flags = {"enable_external_data": True}
+        self.market_intelligence = dict(Config.DEFAULT_MARKET_INTELLIGENCE_CONFIG)
+        self.market_intelligence["providers"] = {"news": False, "dart": True, "datalab": False, "macro": False}
+
+
+class _Harness(MarketIntelligenceMixin):
+    def __init__(self, codes, dart):
+        self.config = _DummyConfig()
+        self.universe = {code: {"name": f"NAME{code}", "market_intel": dict(Config.DEFAULT_MARKET_INTEL_STATE)} for code in codes}
+        self._candidate_universe = {}
+        self._active_market_candidates = {}
+        self._market_dart_cursor_by_code = {}
+        self.dart = dart
+
+    def _build_dart_provider(self):
+        return self.dart
+
+    def log(self, _msg):
+        return None
+
+
+class TestDartDisclosureFeed(unittest.TestCase):
+    def test_poll_stops_at_cursor_and_fans_out_by_stock_code(self):
+        today = datetime.date(2026, 3, 10)
+        dart = _FakeMarketDart(pages=[[_filing("20260310000002", "00126380", "005930"), _filing("20260310000001", "00164779")]])
+        feed = DartDisclosureFeed()
+
+        first = feed.poll(dart, today=today)
+        self.assertEqual(sorted(first), ["000660", "005930"])
+        self.assertEqual(feed.cursor, "20260310000002")
+
+        dart.pages = [
+            [_filing("20260310000004", "00164779", "000660"), _filing("20260310000003", "99999999")],
+            [_filing("20260310000002", "00126380", "005930"), _filing("20260310000001", "00164779")],
+        ]
+        second = feed.poll(dart, today=today)
+        self.assertEqual(list(second), ["000660"])
+        self.assertEqual(dart.market_calls[-1], ("20260310", "20260310", 2))
+        self.assertEqual(feed.unmapped, 1)
+        self.assertEqual([row["rcept_no"] for row in feed.recent("000660")], ["20260310000004", "20260310000001"])
+        self.assertEqual(feed.cursor, "20260310000004")
+
+    def test_poll_reads_whole_page_and_drops_shifted_repeats(self):
+        today = datetime.date(2026, 3, 10)
+        dart = _FakeMarketDart(pages=[[_filing("20260310000002", "00126380", "005930")]])
+        feed = DartDisclosureFeed()
+        feed.poll(dart, today=today)
+
+        # 같은 날짜 안에서 커서보다 작은 접수번호 뒤에 새 공시가 올 수 있고, 페이지 경계에서 같은 건이 반복될 수 있다.
+        dart.pages = [
+            [_filing("20260310000004", "00164779", "000660")],
+            [_filing("20260310000004", "00164779", "000660"), _filing("20260310000002", "00126380", "005930"), _filing("20260310000005", "00126380", "005930")],
+        ]
+        added = feed.poll(dart, today=today)
+
+        self.assertEqual({code: [row["rcept_no"] for row in rows] for code, rows in added.items()}, {"000660": ["20260310000004"], "005930": ["20260310000005"]})
+        self.assertEqual(feed.ingested, 3)
+        self.assertEqual(feed.gaps, 0)
+        self.assertEqual(feed.cursor, "20260310000005")
+
+    def test_market_disclosures_report_api_status_errors(self):
+        class _Response:
+            def __init__(self, payload):
+                self.payload = payload
+
+            def raise_for_status(self):
+                return None
+
+            def json(self):
+                return self.payload
+
+        class _Client:
+            payload = {}
+
+            def get(self, *_args, **_kwargs):
+                return _Response(self.payload)
+
+        client = _Client()
+        with tempfile.TemporaryDirectory() as tmp, patch.object(dart_provider, "provider_http_client", return_value=client):
+            provider = DartProvider("key", cache_dir=tmp)
+            client.payload = {"status": "013", "message": "조회된 데이타가 없습니다."}
+            self.assertEqual(provider.get_market_disclosures("20260310", "20260310"), [])
+            self.assertEqual(provider.last_status, "ok_empty")
+
+            client.payload = {"status": "020", "message": "요청 제한을 초과하였습니다."}
+            self.assertEqual(provider.get_market_disclosures("20260310", "20260310"), [])
+            self.assertEqual((provider.last_status, provider.last_error), ("error", "020: 요청 제한을 초과하였습니다."))
+            dart_provider._corp_indexes.clear()
+
+    def test_worker_backfills_each_code_once_then_uses_the_feed(self):
+        codes = ["005930", "000660", "035720"]
+        today = datetime.date.today().strftime("%Y%m%d")
+        dart = _FakeMarketDart(by_code={"035720": [_filing(f"{today}000001", "00258801")]})
+        trader = _Harness(codes, dart)
+
+        first = trader._fetch_market_intelligence_worker(codes)
+        self.assertEqual(sorted(dart.code_calls), sorted(codes))
+        self.assertEqual(first["codes"]["035720"]["source_meta"]["dart"]["status"], "ok_with_data")
+        self.assertEqual(first["codes"]["005930"]["source_meta"]["dart"]["status"], "ok_empty")
+
+        dart.pages = [[_filing(f"{today}000009", "00126380", "005930")]]
+        second = trader._fetch_market_intelligence_worker(codes)
+        self.assertEqual(len(dart.code_calls), len(codes))
+        self.assertEqual([row["rcept_no"] for row in second["codes"]["005930"]["dart"]], [f"{today}000009"])
+        self.assertEqual(second["codes"]["005930"]["source_meta"]["dart"]["status"], "ok_with_data")
+        self.assertEqual(trader._market_dart_cursor_by_code["005930"], f"{today}000009")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,55 +1,11 @@
 import datetime
 import unittest
 from pathlib import Path
-from unittest.mock import patch
 
-from app.main_window import KiwoomProTrader
+from app.features.diagnostics import DiagnosticsMixin
 
 
-class _DummyItem:
-    def __init__(self, text=""):
-        self._text = str(text)
-        self.foreground = None
-
-    def text(self):
-        return self._text
-
-    def setText(self, text):
-        self._text = str(text)
-
-    def setTextAlignment(self, *_args, **_kwargs):
-        return None
-
-    def setForeground(self, color):
-        self.foreground = color
-
-
-class _DummyTable:
-    def __init__(self):
-        self._rows = 0
-        self._items = {}
-
-    def rowCount(self):
-        return self._rows
-
-    def setRowCount(self, rows):
-        self._rows = int(rows)
-
-    def setUpdatesEnabled(self, _enabled):
-        return None
-
-    def item(self, row, col):
-        return self._items.get((row, col))
-
-    def setItem(self, row, col, item):
-        self._items[(row, col)] = item
-
-
-class _Harness:
-    _diag_fmt_dt = staticmethod(KiwoomProTrader._diag_fmt_dt)
-    _diag_age_seconds = staticmethod(KiwoomProTrader._diag_age_seconds)
-    _refresh_diagnostics = KiwoomProTrader._refresh_diagnostics
-
+class _Harness(DiagnosticsMixin):
     def __init__(self):
         now = datetime.datetime.now() - datetime.timedelta(seconds=12)
         self.universe = {
@@ -69,7 +25,7 @@ class _Harness:
         self._guard_reason_by_code = {}
         self._global_risk_mode = "shock"
         self._order_health_mode = "normal"
-        self.diagnostic_table = _DummyTable()
+        self.diagnostic_table = None
 
 
 class TestDiagnosticsExternalColumns(unittest.TestCase):
@@ -85,52 +41,66 @@ class TestDiagnosticsExternalColumns(unittest.TestCase):
         ]
         source = "\n".join(
             file.read_text(encoding="utf-8")
-            for file in Path("app/features/ui_build").glob("*.py")
+            for folder in ("app/features/ui_build", "app/features/diagnostics")
+            for file in Path(folder).glob("*.py")
         )
         for col in cols:
             self.assertIn(col, source)
 
     def test_refresh_diagnostics_populates_external_values(self):
         trader = _Harness()
-        with patch("app.features.diagnostics.mixin.QTableWidgetItem", _DummyItem):
-            trader._refresh_diagnostics()
-
-        status_item = trader.diagnostic_table.item(0, 9)
-        updated_item = trader.diagnostic_table.item(0, 10)
-        age_item = trader.diagnostic_table.item(0, 11)
-        market_state_item = trader.diagnostic_table.item(0, 12)
-        guard_reason_item = trader.diagnostic_table.item(0, 13)
-        intel_source_item = trader.diagnostic_table.item(0, 14)
-        risk_mode_item = trader.diagnostic_table.item(0, 19)
-        self.assertIsNotNone(status_item)
-        self.assertIsNotNone(updated_item)
-        self.assertIsNotNone(age_item)
-        self.assertIsNotNone(market_state_item)
-        self.assertIsNotNone(guard_reason_item)
-        self.assertIsNotNone(intel_source_item)
-        self.assertIsNotNone(risk_mode_item)
-        assert status_item is not None
-        assert updated_item is not None
-        assert age_item is not None
-        assert market_state_item is not None
-        assert guard_reason_item is not None
-        assert intel_source_item is not None
-        assert risk_mode_item is not None
-        status = status_item.text()
-        updated = updated_item.text()
-        age = age_item.text()
-        market_state = market_state_item.text()
-        guard_reason = guard_reason_item.text()
-        intel_source = intel_source_item.text()
-        risk_mode = risk_mode_item.text()
-
-        self.assertEqual(status, "최신")
-        self.assertTrue(updated)
-        self.assertTrue(age.isdigit())
-        self.assertEqual(market_state, "정상")
-        self.assertEqual(guard_reason, "시장 쇼크 보호")
-        self.assertEqual(intel_source, "")
-        self.assertEqual(risk_mode, "시장 충격")
+        trader._refresh_diagnostics()
+        model = trader.diagnostic_model
+
+        self.assertEqual(model.text(0, 9), "최신")
+        self.assertTrue(model.text(0, 10))
+        self.assertTrue(model.text(0, 11).isdigit())
+        self.assertEqual(model.text(0, 12), "정상")
+        self.assertEqual(model.text(0, 13), "시장 쇼크 보호")
+        self.assertEqual(model.text(0, 14), "")
+        self.assertEqual(model.text(0, 19), "시장 충격")
+
+    def test_refresh_invalidates_only_dirty_rows_and_age_columns(self):
+        trader = _Harness()
+        trader.universe["000660"] = {"name": "SK하이닉스", "status": "watch"}
+        trader._refresh_diagnostics()
+        model = trader.diagnostic_model
+        for row in range(model.rowCount()):
+            model.text(row, 1)
+        self.assertEqual(model.format_count, 2)
+        changed = []
+        model.dataChanged.connect(lambda top, bottom, _roles=None: changed.append((top.row(), bottom.row(), top.column(), bottom.column())))
+
+        trader._diag_touch("000660", sync_status="ok", retry_count=3)
+        trader._refresh_diagnostics()
+
+        self.assertEqual(changed, [(1, 1, 0, 23)])
+        self.assertEqual(model.text(1, 6), "3")
+        self.assertEqual(model.text(0, 1), "삼성전자")
+        self.assertEqual(model.format_count, 3)
+
+        changed.clear()
+        trader._diagnostic_age_refresh_ts = 0.0
+        trader._refresh_diagnostics()
+        self.assertEqual(changed, [(0, 1, 9, 9), (0, 1, 11, 11), (0, 1, 19, 20)])
+        self.assertEqual(model.format_count, 3)
+
+    def test_row_insert_and_existing_row_change_in_the_same_tick(self):
+        trader = _Harness()
+        trader._refresh_diagnostics()
+        model = trader.diagnostic_model
+        trader._diag_touch("005930", retry_count=1)
+        trader._refresh_diagnostics()
+        self.assertEqual(model.text(0, 6), "1")
+
+        trader.universe["000660"] = {"name": "SK하이닉스", "status": "watch"}
+        trader._diag_touch("000660", sync_status="ok")
+        trader._diag_touch("005930", retry_count=2)
+        trader._refresh_diagnostics()
+
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.text(0, 6), "2")
+        self.assertEqual(model.text(1, 1), "SK하이닉스")
 
 
 if __name__ == "__main__":
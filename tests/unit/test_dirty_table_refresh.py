@@ -3,39 +3,64 @@
 from app.mixins.trading_session import TradingSessionMixin
 
 
-class _DummyTable:
-    def __init__(self):
-        self.row_count = 0
-        self.updates_enabled = True
-
-    def setUpdatesEnabled(self, value):
-        self.updates_enabled = bool(value)
-
-    def setRowCount(self, value):
-        self.row_count = int(value)
-
-
 class _Harness(TradingSessionMixin):
     def __init__(self):
-        self.universe = {"005930": {}, "000660": {}}
+        self.universe = {
+            "005930": {"name": "삼성전자", "current": 71000, "held": 1, "buy_price": 70000},
+            "000660": {"name": "SK하이닉스", "current": 150000},
+            "035420": {"name": "NAVER", "current": 200000},
+            "051910": {"name": "LG화학", "current": 400000},
+        }
         self._dirty_codes = {"005930"}
-        self._code_to_row = {"005930": 0, "000660": 1}
-        self.table = _DummyTable()
-        self.updated = []
-
-    def _update_row(self, row, code):
-        self.updated.append((row, code))
+        self._code_to_row = {}
 
 
 class TestDirtyTableRefresh(unittest.TestCase):
     def test_refresh_updates_only_dirty_codes(self):
         trader = _Harness()
+        model = trader._trading_table_model()
+        changed = []
+        model.dataChanged.connect(lambda top, bottom, _roles=None: changed.append((top.row(), bottom.row())))
 
         trader._refresh_table()
 
-        self.assertEqual(trader.updated, [(0, "005930")])
+        self.assertEqual(model.rowCount(), 4)
+        self.assertEqual(changed, [(0, 0)])
         self.assertEqual(trader._dirty_codes, set())
 
+        trader._dirty_codes.update({"005930", "000660", "051910"})
+        trader._refresh_table()
+
+        self.assertEqual(changed[1:], [(0, 1), (3, 3)])
+        self.assertEqual(model.format_count, 0)
+
+    def test_rows_are_formatted_lazily_and_cached(self):
+        trader = _Harness()
+        trader._refresh_table()
+        model = trader.table_model
+
+        self.assertEqual(model.data(model.index(0, 1)), "71,000")
+        self.assertEqual(model.data(model.index(0, 6)), "1.43%")
+        self.assertEqual(model.format_count, 1)
+
+        trader.universe["005930"]["current"] = 72000
+        trader._dirty_codes.add("005930")
+        trader._refresh_table()
+
+        self.assertEqual(model.data(model.index(0, 1)), "72,000")
+        self.assertEqual(model.format_count, 2)
+
+    def test_universe_append_inserts_rows(self):
+        trader = _Harness()
+        trader._reset_trading_table(list(trader.universe.keys()))
+        trader.universe["373220"] = {"name": "LG에너지솔루션", "current": 380000}
+        trader._dirty_codes.add("373220")
+
+        trader._refresh_table()
+
+        self.assertEqual(trader.table_model.rowCount(), 5)
+        self.assertEqual(trader._code_to_row["373220"], 4)
+
 
 if __name__ == "__main__":
     unittest.main()
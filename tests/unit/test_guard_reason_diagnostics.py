@@ -1,53 +1,10 @@
 ﻿import datetime
 import unittest
-from unittest.mock import patch
 
-from app.main_window import KiwoomProTrader
+from app.features.diagnostics import DiagnosticsMixin
 
 
-class _DummyItem:
-    def __init__(self, text=""):
-        self._text = str(text)
-
-    def text(self):
-        return self._text
-
-    def setText(self, text):
-        self._text = str(text)
-
-    def setTextAlignment(self, *_args, **_kwargs):
-        return None
-
-    def setForeground(self, _color):
-        return None
-
-
-class _DummyTable:
-    def __init__(self):
-        self._rows = 0
-        self._items = {}
-
-    def rowCount(self):
-        return self._rows
-
-    def setRowCount(self, rows):
-        self._rows = int(rows)
-
-    def setUpdatesEnabled(self, _enabled):
-        return None
-
-    def item(self, row, col):
-        return self._items.get((row, col))
-
-    def setItem(self, row, col, item):
-        self._items[(row, col)] = item
-
-
-class _Harness:
-    _diag_fmt_dt = staticmethod(KiwoomProTrader._diag_fmt_dt)
-    _diag_age_seconds = staticmethod(KiwoomProTrader._diag_age_seconds)
-    _refresh_diagnostics = KiwoomProTrader._refresh_diagnostics
-
+class _Harness(DiagnosticsMixin):
     def __init__(self):
         now = datetime.datetime.now() - datetime.timedelta(seconds=2)
         self.universe = {
@@ -67,32 +24,19 @@ class _Harness:
         self._guard_reason_by_code = {}
         self._global_risk_mode = "shock"
         self._order_health_mode = "normal"
-        self.diagnostic_table = _DummyTable()
+        self.diagnostic_table = None
 
 
 class TestGuardReasonDiagnostics(unittest.TestCase):
     def test_guard_reason_column_is_populated(self):
         trader = _Harness()
-        with patch("app.features.diagnostics.mixin.QTableWidgetItem", _DummyItem):
-            trader._refresh_diagnostics()
-
-        market_state_item = trader.diagnostic_table.item(0, 12)
-        guard_reason_item = trader.diagnostic_table.item(0, 13)
-        intel_source_item = trader.diagnostic_table.item(0, 14)
-        risk_mode_item = trader.diagnostic_table.item(0, 19)
-        self.assertIsNotNone(market_state_item)
-        self.assertIsNotNone(guard_reason_item)
-        self.assertIsNotNone(intel_source_item)
-        self.assertIsNotNone(risk_mode_item)
-        assert market_state_item is not None
-        assert guard_reason_item is not None
-        assert intel_source_item is not None
-        assert risk_mode_item is not None
-        self.assertEqual(market_state_item.text(), "정상")
-        self.assertEqual(guard_reason_item.text(), "시장 쇼크 보호")
-        self.assertEqual(intel_source_item.text(), "")
-        self.assertEqual(risk_mode_item.text(), "시장 충격")
+        trader._refresh_diagnostics()
+        model = trader.diagnostic_model
 
+        self.assertEqual(model.text(0, 12), "정상")
+        self.assertEqual(model.text(0, 13), "시장 쇼크 보호")
+        self.assertEqual(model.text(0, 14), "")
+        self.assertEqual(model.text(0, 19), "시장 충격")
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+import datetime
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.support.jsonl_writer import JsonlWriter
+from backtest.engine import EventDrivenBacktestEngine
+from data.intel_store import KIND_AUDITS, KIND_EVENTS, IntelStore
+
+
+def _event(day, hour, scope, symbol, event_type="news_risk"):
+    return {
+        "ts": f"2026-03-{day:02d}T{hour:02d}:00:00",
+        "scope": scope,
+        "symbol": symbol,
+        "source": "news",
+        "event_type": event_type,
+        "score": -10.0,
+        "payload": {"sector": "반도체"} if scope == "sector" else {},
+    }
+
+
+class TestIntelStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        self.store = IntelStore(str(self.base / "intel.db"))
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp.cleanup()
+
+    def test_jsonl_import_is_idempotent_and_range_queries_use_filters(self):
+        events = [_event(day, hour, "symbol", "005930" if hour % 2 else "000660") for day in range(1, 15) for hour in (9, 10, 11)]
+        events.append(_event(5, 12, "sector", "", "sector_block"))
+        jsonl = self.base / "events.jsonl"
+        jsonl.write_text("\n".join(json.dumps(e, ensure_ascii=False) for e in events) + "\n{broken\n", encoding="utf-8")
+
+        self.assertEqual(self.store.import_jsonl(KIND_EVENTS, str(jsonl)), len(events))
+        self.assertEqual(self.store.import_jsonl(KIND_EVENTS, str(jsonl)), 0)
+
+        week = self.store.query_events(start="2026-03-02", end="2026-03-08T23:59:59", symbols=["005930"])
+        self.assertEqual(len(week), 14)
+        self.assertTrue(all(r["symbol"] == "005930" for r in week))
+        self.assertEqual([r["ts"] for r in week], sorted(r["ts"] for r in week))
+
+        with_global = self.store.query_events(start="2026-03-05", end="2026-03-05T23:59:59", symbols=["005930"], include_global=True)
+        self.assertEqual([r["event_type"] for r in with_global][-1], "sector_block")
+        self.assertEqual(self.store.query_events(scopes=["sector"])[0]["payload"], {"sector": "반도체"})
+        latest = self.store.query_events(limit=2)
+        self.assertEqual([r["ts"] for r in latest], ["2026-03-14T10:00:00", "2026-03-14T11:00:00"])
+
+    def test_audit_lines_and_backtest_sqlite_loader(self):
+        lines = [
+            json.dumps({"ts": "2026-03-02T09:00:00", "symbol": "005930", "allowed": False, "reason": "blocked"}),
+            json.dumps({"ts": "2026-03-02T09:05:00", "symbol": "005930", "allowed": True, "reason": "ok"}),
+        ]
+        self.assertEqual(self.store.append_lines(KIND_AUDITS, lines), 2)
+        self.assertEqual([r["reason"] for r in self.store.query_audits(allowed=False)], ["blocked"])
+
+        self.store.append(
+            KIND_EVENTS,
+            [_event(1, 9, "symbol", "005930"), _event(2, 9, "market", "KR_MARKET"), _event(9, 9, "symbol", "005930"), _event(1, 9, "symbol", "000660")],
+        )
+        loaded = EventDrivenBacktestEngine.load_intelligence_events_sqlite(
+            self.base / "intel.db", end=datetime.datetime(2026, 3, 5), symbols={"005930"}
+        )
+        self.assertEqual([(e.scope, e.symbol, e.ts.day) for e in loaded], [("symbol", "005930", 1), ("market", "KR_MARKET", 2)])
+
+    def test_sink_attached_before_import_sees_every_line_once(self):
+        path = self.base / "events.jsonl"
+        writer = JsonlWriter(str(path), batch_lines=20, flush_interval_sec=5.0, rotate_bytes=3000, keep_segments=0)
+        try:
+            for idx in range(150):
+                writer.append(_event(1 + idx % 28, 9, "symbol", f"{idx:06d}"))
+            snapshot = writer.attach_sink(lambda lines: self.store.append_lines(KIND_EVENTS, lines))
+            for idx in range(150, 200):
+                writer.append(_event(1 + idx % 28, 9, "symbol", f"{idx:06d}"))
+            self.assertTrue(writer.flush(timeout=5.0))
+        finally:
+            writer.close()
+
+        assert snapshot is not None
+        cutoff, segments = snapshot
+        self.assertTrue(segments)  # 회전된 gzip 세그먼트도 가져온다
+        rotated = [seg for seg in writer.segment_paths() if seg not in segments]
+        self.store.import_jsonl(
+            KIND_EVENTS,
+            str(path),
+            segments=[str(seg) for seg in segments],
+            source=str(rotated[0]) if rotated else None,
+            max_bytes=cutoff,
+        )
+        symbols = sorted(r["symbol"] for r in self.store.query_events())
+        self.assertEqual(symbols, [f"{idx:06d}" for idx in range(200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
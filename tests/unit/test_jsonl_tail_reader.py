@@ -0,0 +1,97 @@
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.support import jsonl_tail
+from app.support.jsonl_tail import JsonlTailReader
+
+
+def _line(seq, symbol, hour):
+    return json.dumps({"ts": f"2026-01-05T{hour:02d}:{seq % 60:02d}:00", "symbol": symbol, "seq": seq}) + "\n"
+
+
+class TestJsonlTailReader(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "decision_audit.jsonl"
+        self._block = jsonl_tail.BLOCK_SIZE
+        jsonl_tail.BLOCK_SIZE = 256
+
+    def tearDown(self):
+        jsonl_tail.BLOCK_SIZE = self._block
+        self._tmp.cleanup()
+
+    def _append(self, lines):
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.writelines(lines)
+
+    def test_tail_reads_backwards_then_only_appended_bytes(self):
+        self._append(_line(seq, "005930", 9) for seq in range(500))
+        reader = JsonlTailReader(str(self.path))
+
+        self.assertEqual([r["seq"] for r in reader.records(limit=5)], [495, 496, 497, 498, 499])
+        first_read = reader.bytes_read
+        self.assertLess(first_read, self.path.stat().st_size // 4)
+
+        appended = _line(500, "000660", 10)
+        self._append([appended, '{"seq": 501, "partial"'])
+        self.assertEqual([r["seq"] for r in reader.records(limit=3)], [498, 499, 500])
+        self.assertEqual(reader.bytes_read - first_read, len(appended) + len('{"seq": 501, "partial"'))
+        self.assertEqual(reader.full_reads, 1)
+
+        self.path.write_text(_line(0, "035420", 11), encoding="utf-8")
+        self.assertEqual([r["symbol"] for r in reader.records(limit=3)], ["035420"])
+
+    def test_sidecar_index_limits_symbol_reads_to_its_hours(self):
+        lines = []
+        for hour in range(9, 15):
+            symbol = "000660" if hour == 10 else "005930"
+            lines.extend(_line(seq, symbol, hour) for seq in range(hour * 100, hour * 100 + 50))
+        self._append(lines)
+        reader = JsonlTailReader(str(self.path))
+
+        self.assertTrue(reader.has_symbol("000660"))
+        reader.save_index()
+        self.assertTrue(reader.index_path.exists())
+
+        restored = JsonlTailReader(str(self.path))
+        before = restored.bytes_read
+        records = restored.symbol_records("000660", limit=10)
+        self.assertEqual([r["seq"] for r in records], list(range(1040, 1050)))
+        self.assertLess(restored.bytes_read - before, self.path.stat().st_size // 4)
+
+        self._append([_line(2000, "000660", 15)])
+        self.assertEqual(restored.symbol_records("000660", limit=1)[0]["seq"], 2000)
+
+    def test_background_index_covers_out_of_order_hours(self):
+        lines = [_line(seq, "005930", 9) for seq in range(40)]
+        lines += [_line(seq, "000660", 10) for seq in range(40, 80)]
+        lines += [_line(seq, "005930", 9) for seq in range(80, 90)]  # 늦게 기록된 9시 줄
+        self._append(lines)
+        reader = JsonlTailReader(str(self.path))
+
+        self.assertFalse(reader.index_ready())
+        reader.build_index_async()
+        assert reader._index_thread is not None
+        reader._index_thread.join(5)
+        self.assertTrue(reader.index_ready())
+
+        records = reader.symbol_records("005930", limit=100)
+        self.assertEqual([r["seq"] for r in records], list(range(40)) + list(range(80, 90)))
+
+    def test_short_tail_is_topped_up_from_rotated_segments(self):
+        for stamp, seqs in (("20260105-090000-000000", range(0, 5)), ("20260105-100000-000000", range(5, 8))):
+            segment = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}.gz")
+            with gzip.open(segment, "wt", encoding="utf-8") as handle:
+                handle.writelines(_line(seq, "005930", 9) for seq in seqs)
+        reader = JsonlTailReader(str(self.path))
+        self.assertEqual([r["seq"] for r in reader.records(limit=4)], [4, 5, 6, 7])
+
+        self._append([_line(8, "005930", 10)])
+        self.assertEqual([r["seq"] for r in reader.records(limit=4)], [5, 6, 7, 8])
+
+
+if __name__ == "__main__":
+    unittest.main()
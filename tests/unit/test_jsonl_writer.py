@@ -0,0 +1,69 @@
+import gzip
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from app.support.jsonl_writer import JsonlWriter
+
+
+class TestJsonlWriter(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "events.jsonl"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_batches_flush_and_rotate_into_gzip_segments(self):
+        writer = JsonlWriter(
+            str(self.path), batch_lines=50, flush_interval_sec=5.0, fsync="batch", rotate_bytes=2000, keep_segments=2
+        )
+        for idx in range(200):
+            self.assertTrue(writer.append({"seq": idx, "symbol": "005930", "summary": "공시"}))
+        self.assertTrue(writer.flush(timeout=5.0))
+        self.assertTrue(writer.close())
+
+        metrics = writer.metrics()
+        self.assertEqual((metrics["written"], metrics["dropped"]), (200, 0))
+        self.assertLess(metrics["batches"], 200)
+        self.assertGreater(metrics["rotations"], 0)
+        self.assertEqual(metrics["fsync_count"], metrics["batches"])
+
+        segments = writer.segment_paths()
+        self.assertEqual(len(segments), 2)
+        kept = []
+        for segment in segments:
+            with gzip.open(segment, "rt", encoding="utf-8") as handle:
+                kept.extend(json.loads(line)["seq"] for line in handle)
+        if self.path.exists():
+            kept.extend(json.loads(line)["seq"] for line in self.path.read_text(encoding="utf-8").splitlines())
+        self.assertEqual(kept, sorted(kept))
+        self.assertEqual(kept[-1], 199)
+        with gzip.open(segments[0], "rt", encoding="utf-8") as handle:
+            self.assertEqual(json.loads(handle.readline())["summary"], "공시")
+
+    def test_full_queue_drops_instead_of_blocking_the_caller(self):
+        writer = JsonlWriter(str(self.path), max_queue=2, block_timeout_sec=0.0, flush_interval_sec=0.05)
+        gate = threading.Event()
+        original = writer._write_batch
+
+        def _slow_write(lines):
+            gate.wait(2.0)
+            original(lines)
+
+        writer._write_batch = _slow_write
+        results = [writer.append({"seq": idx}) for idx in range(50)]
+        gate.set()
+        self.assertTrue(writer.flush(timeout=5.0))
+        writer.close()
+
+        self.assertIn(False, results)
+        self.assertEqual(writer.dropped, results.count(False))
+        lines = self.path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), results.count(True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from app.mixins.market_intelligence import MarketIntelligenceMixin
+from app.support.keyword_matcher import KeywordMatcher
+from config import Config
+
+
+class _DummyConfig:
+    def __init__(self):
+        self.feature_flags = {"enable_external_data": True}
+        self.market_intelligence = dict(Config.DEFAULT_MARKET_INTELLIGENCE_CONFIG)
+
+
+class _Harness(MarketIntelligenceMixin):
+    def __init__(self):
+        self.config = _DummyConfig()
+        self.universe = {}
+        self._candidate_universe = {}
+        self._active_market_candidates = {}
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    def test_reports_every_overlapping_hit_with_spans_and_categories(self):
+        matcher = KeywordMatcher({"positive": ["수주", "계약"], "negative": ["CB"], "risk": ["cb", "전환사채"]})
+        text = "대규모 수주계약, 전환사채(CB) 발행"
+        hits = matcher.find(text)
+        self.assertEqual([hit.keyword for hit in hits], ["수주", "계약", "전환사채", "cb"])
+        cb = hits[-1]
+        self.assertEqual(text[cb.start : cb.end], "CB")
+        self.assertEqual(cb.categories, ("negative", "risk"))
+        self.assertEqual(matcher.categories(text)["risk"], ["전환사채", "cb"])
+
+        keywords = ["ab", "abc", "bc", "c", "bca", "aab", "a"]
+        naive = KeywordMatcher({"x": keywords})
+        rng = random.Random(7)
+        for _ in range(300):
+            sample = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+            expected = sorted((pos, pos + len(k), k) for k in keywords for pos in range(len(sample)) if sample.startswith(k, pos))
+            self.assertEqual(sorted((hit.start, hit.end, hit.keyword) for hit in naive.find(sample)), expected)
+
+    def test_scoring_reuses_one_matcher_until_the_dictionary_changes(self):
+        trader = _Harness()
+        info = {"name": "삼성전자", "market_intel": dict(Config.DEFAULT_MARKET_INTEL_STATE)}
+        result = trader._score_news_items(info, [{"title": "삼성전자 수주 소식"}])
+        first = trader._market_keyword_matcher()
+        self.assertIs(trader._market_keyword_matcher(), first)
+        self.assertEqual(result["headlines"][0]["keyword_hits"][0]["keyword"], "수주")
+        self.assertEqual(result["score"], 20.0)
+        self.assertEqual(trader._classify_disclosure_event("매매거래정지 안내"), "halt")
+
+        expanded = set(Config.MARKET_INTELLIGENCE_POSITIVE_KEYWORDS) | {"흑자전환"}
+        with patch.object(Config, "MARKET_INTELLIGENCE_POSITIVE_KEYWORDS", expanded):
+            rescored = trader._score_news_items(info, [{"title": "삼성전자 흑자전환"}])
+            self.assertIsNot(trader._market_keyword_matcher(), first)
+        self.assertEqual(rescored["sentiment"], "bullish")
+        briefed = {"name": "삼성전자", "market_intel": {**Config.DEFAULT_MARKET_INTEL_STATE, "news_headlines": rescored["headlines"]}}
+        self.assertIn("주요 키워드: 흑자전환", trader._build_briefing_summary("005930", briefed))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import datetime
+import unittest
+
+from PyQt6.QtGui import QTextDocument
+
+from app.mixins.system_shell import SystemShellMixin
+from app.support.log_console import LogBuffer
+
+
+class _DummyLogWidget:
+    def __init__(self):
+        self._document = QTextDocument()
+
+    def document(self):
+        return self._document
+
+    def verticalScrollBar(self):
+        return None
+
+    def clear(self):
+        self._document.clear()
+
+    def lines(self):
+        return self._document.toPlainText().split("\n")
+
+
+class _Harness(SystemShellMixin):
+    def __init__(self):
+        self.log_text = _DummyLogWidget()
+
+
+class TestLogBuffer(unittest.TestCase):
+    def test_repeated_lines_collapse_into_counter(self):
+        buffer = LogBuffer(max_lines=3, dedup_sec=5)
+        t0 = datetime.datetime(2026, 1, 2, 9, 0, 0)
+
+        buffer.push("시세 지연", now=t0)
+        buffer.push("시세 지연", now=t0 + datetime.timedelta(seconds=1))
+        updated, entries = buffer.drain()
+        self.assertIsNone(updated)
+        self.assertEqual([(entry.msg, entry.count) for entry in entries], [("시세 지연", 2)])
+
+        buffer.push("시세 지연", now=t0 + datetime.timedelta(seconds=2))
+        updated, entries = buffer.drain()
+        assert updated is not None
+        self.assertEqual((updated.count, entries), (3, []))
+
+        buffer.push("시세 지연", now=t0 + datetime.timedelta(seconds=30))
+        for idx in range(4):
+            buffer.push(f"주문 실패 {idx}", now=t0 + datetime.timedelta(seconds=31))
+        _updated, entries = buffer.drain()
+
+        self.assertEqual(len(buffer.entries), 3)
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(buffer.dropped_total, 2)
+        self.assertEqual(buffer.deduped_total, 2)
+        self.assertEqual(entries[-1].level, "ERR")
+
+
+class TestLogConsoleFlush(unittest.TestCase):
+    def test_batched_flush_rewrites_counter_and_filters_levels(self):
+        trader = _Harness()
+        trader._append_log("매매 시작")
+        trader._append_log("시세 수신")
+        trader._append_log("시세 수신")
+        self.assertEqual(trader.log_text.document().isEmpty(), True)
+
+        trader._flush_log_buffer()
+        lines = trader.log_text.lines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("[SUC] 매매 시작", lines[0])
+        self.assertTrue(lines[1].endswith("시세 수신 (x2)"))
+
+        trader._append_log("시세 수신")
+        trader._append_log("주문 실패")
+        trader._flush_log_buffer()
+        lines = trader.log_text.lines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[1].endswith("시세 수신 (x3)"))
+
+        trader._set_log_level_filter("경고/오류")
+        self.assertEqual(len(trader.log_text.lines()), 1)
+        self.assertIn("[ERR] 주문 실패", trader.log_text.lines()[0])
+
+        trader._append_log("주문 실패")
+        trader._append_log("시세 수신")
+        trader._flush_log_buffer()
+        self.assertEqual(trader.log_text.lines(), [trader.log_text.lines()[0]])
+        self.assertTrue(trader.log_text.lines()[0].endswith("주문 실패 (x2)"))
+
+
+if __name__ == "__main__":
+    unittest.main()
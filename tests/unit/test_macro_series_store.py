@@ -0,0 +1,105 @@
+import datetime
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from app.mixins.market_intelligence import MarketIntelligenceMixin
+from config import Config
+from data.macro_store import MacroSeriesStore
+from data.providers.macro_provider import MacroProvider
+
+
+class _Response:
+    def __init__(self, observations):
+        self._observations = observations
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {"observations": self._observations}
+
+
+class _Client:
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.calls = []
+
+    def get(self, provider, url, params=None, **kwargs):
+        self.calls.append(dict(params or {}))
+        return _Response(self.batches.pop(0))
+
+
+def _obs(date, value):
+    return {"date": date, "value": value}
+
+
+class _DummyConfig:
+    def __init__(self):
+        self.feature_flags = {"enable_external_data": True}
+        self.market_intelligence = dict(Config.DEFAULT_MARKET_INTELLIGENCE_CONFIG)
+        self.market_intelligence["providers"] = {"news": False, "dart": False, "datalab": False, "macro": True}
+        self.market_intelligence["macro_series"] = ["VIXCLS"]
+
+
+class _Harness(MarketIntelligenceMixin):
+    def __init__(self, provider):
+        self.config = _DummyConfig()
+        self.universe = {}
+        self._candidate_universe = {}
+        self._active_market_candidates = {}
+        self.provider = provider
+
+    def _build_macro_provider(self):
+        return self.provider
+
+    def log(self, _msg):
+        return None
+
+
+class TestMacroSeriesStore(unittest.TestCase):
+    def test_sync_fetches_from_last_stored_date_and_serves_bundle_from_disk(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = MacroSeriesStore(os.path.join(tmp_dir, "macro.db"))
+            provider = MacroProvider("key", store=store, history_days=30)
+            history = [_obs(f"2026-03-{day:02d}", str(20 + day)) for day in range(1, 8)] + [_obs("2026-03-08", ".")]
+            client = _Client([history, [_obs("2026-03-08", "29.5"), _obs("2026-03-09", "30.0")], [_obs("2026-03-09", "30.0")]])
+            with patch("data.providers.macro_provider.provider_http_client", return_value=client):
+                self.assertEqual(provider.latest_value("VIXCLS"), 27.0)
+                self.assertEqual(provider.latest_value("VIXCLS"), 30.0)
+                self.assertEqual(provider.last_status, "ok_with_data")
+                bundle = provider.get_series_bundle(["VIXCLS"], start_date="2026-03-07")
+
+            expected_start = (datetime.date.today() - datetime.timedelta(days=30)).isoformat()
+            self.assertEqual(client.calls[0]["observation_start"], expected_start)
+            self.assertEqual([call["observation_start"] for call in client.calls[1:]], ["2026-03-08", "2026-03-09"])
+            self.assertEqual([row["date"] for row in bundle["VIXCLS"]], ["2026-03-07", "2026-03-08", "2026-03-09"])
+            self.assertEqual(float(bundle["VIXCLS"][1]["value"]), 29.5)
+            features = provider.history_features(["VIXCLS"], short=5, long=5)
+            self.assertAlmostEqual(features["VIXCLS_chg_5d"], 30.0 - 24.0)
+            store.close()
+
+    def test_worker_serves_recently_synced_store_without_network_after_restart(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "macro.db")
+            seed = MacroSeriesStore(path)
+            seed.upsert("VIXCLS", [_obs(f"2026-03-{day:02d}", str(20 + day)) for day in range(1, 8)])
+            seed.close()
+
+            store = MacroSeriesStore(path)
+            client = _Client([])
+            trader = _Harness(MacroProvider("key", store=store))
+            with patch("data.providers.macro_provider.provider_http_client", return_value=client):
+                payload = trader._fetch_market_intelligence_worker([])
+
+            self.assertEqual(client.calls, [])
+            self.assertEqual(payload["macro_values"]["VIXCLS"], 27.0)
+            self.assertAlmostEqual(payload["macro_values"]["VIXCLS_chg_5d"], 5.0)
+            self.assertEqual(payload["source_statuses"]["macro"]["status"], "ok_with_data")
+            self.assertEqual(trader._derive_macro_regime(payload["macro_values"])["regime"], "risk_off")
+            store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import copy
+import datetime
+import unittest
+
+from app.mixins.market_intelligence import MarketIntelligenceMixin
+from app.support.bounded_set import BoundedOrderedSet
+from config import Config
+
+
+class _DummyConfig:
+    def __init__(self):
+        self.feature_flags = {"enable_external_data": True}
+        self.market_intelligence = copy.deepcopy(Config.DEFAULT_MARKET_INTELLIGENCE_CONFIG)
+
+
+class _Harness(MarketIntelligenceMixin):
+    def __init__(self):
+        self.config = _DummyConfig()
+        self.universe = {"005930": {"name": "삼성전자", "market_intel": dict(Config.DEFAULT_MARKET_INTEL_STATE)}}
+        self._candidate_universe = {}
+        self._active_market_candidates = {}
+        self._market_intel_dirty_codes = set()
+        self.score_calls = 0
+        self.policy_calls = 0
+
+    def _score_news_items(self, info, items):
+        self.score_calls += 1
+        return super()._score_news_items(info, items)
+
+    def _resolve_market_intel_policy(self, code, info):
+        self.policy_calls += 1
+        return super()._resolve_market_intel_policy(code, info)
+
+    def _maybe_emit_market_intel_alert(self, *args, **kwargs):
+        return None
+
+    def log(self, _msg):
+        return None
+
+
+def _row(dart_items):
+    return {
+        "news": [{"title": "삼성전자 신제품 공개", "link": "https://news.example/1", "published_at": "20260301"}],
+        "dart": dart_items,
+        "source_meta": {
+            source: {"status": "ok_with_data", "error": "", "updated_at": datetime.datetime.now()}
+            for source in ("news", "dart", "datalab", "macro")
+        },
+    }
+
+
+class TestMarketIntelIncrementalApply(unittest.TestCase):
+    def test_identical_payload_skips_rescoring_and_keeps_resolved_policy(self):
+        trader = _Harness()
+        filing = {"report_nm": "유상증자 결정", "rcept_no": "20260324000123", "rcept_dt": "20260324"}
+
+        trader._apply_market_intelligence_payload("005930", _row([filing]), {})
+        state = trader.universe["005930"]["market_intel"]
+        self.assertEqual(state["action_policy"], "force_exit")
+        self.assertIn("force_exit", state["briefing_summary"])
+        self.assertIsInstance(state["seen_event_ids"], BoundedOrderedSet)
+        self.assertEqual(len(state["seen_event_ids"]), 2)
+        self.assertEqual((trader.score_calls, trader.policy_calls), (1, 1))
+
+        trader._market_intel_dirty_codes.clear()
+        trader._apply_market_intelligence_payload("005930", _row([dict(filing)]), {})
+        self.assertEqual((trader.score_calls, trader.policy_calls), (1, 1))
+        self.assertEqual(trader._market_intel_dirty_codes, set())
+        self.assertIs(trader.universe["005930"]["market_intel"], state)
+
+        newer = {"report_nm": "단일판매ㆍ공급계약체결", "rcept_no": "20260324000200", "rcept_dt": "20260324"}
+        trader._apply_market_intelligence_payload("005930", _row([newer, filing]), {})
+        self.assertEqual(trader.score_calls, 2)
+        self.assertEqual(list(state["seen_event_ids"])[-1], trader._score_dart_events([newer])["events"][0]["event_id"])
+
+    def test_unchanged_inputs_still_reresolve_policy_when_block_expires(self):
+        trader = _Harness()
+        filing = {"report_nm": "유상증자 결정", "rcept_no": "20260324000123", "rcept_dt": "20260324"}
+        trader._apply_market_intelligence_payload("005930", _row([filing]), {})
+        state = trader.universe["005930"]["market_intel"]
+        # 장중 차단이 걸린 상태로 기록해 두고(시각과 무관하게), 차단이 끝난 뒤의 주기를 흉내 낸다.
+        state["dart_block_until"] = datetime.datetime.now() + datetime.timedelta(minutes=1)
+        trader._market_intel_fingerprints["005930"]["policy"] = trader._market_intel_policy_fingerprint(state)
+        state["dart_block_until"] = datetime.datetime.now() - datetime.timedelta(minutes=1)
+        calls = trader.policy_calls
+        trader._market_intel_dirty_codes.clear()
+
+        trader._apply_market_intelligence_payload("005930", _row([filing]), {})
+
+        self.assertEqual(trader.score_calls, 1)
+        self.assertEqual(trader.policy_calls, calls + 1)
+        self.assertEqual(trader._market_intel_dirty_codes, {"005930"})
+
+        seen = BoundedOrderedSet(3, ["a", "b"])
+        self.assertEqual(seen.update(["b", "c", "d"]), 2)
+        self.assertEqual(list(seen), ["b", "c", "d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
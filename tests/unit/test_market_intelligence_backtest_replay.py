@@ -1,6 +1,7 @@
 import unittest
 from datetime import datetime, timedelta
 from pathlib import Path
+import gzip
 import json
 import shutil
 import tempfile
@@ -110,6 +111,28 @@ class TestMarketIntelligenceBacktestReplay(unittest.TestCase):
 
         self.assertEqual(result.trades, [])
 
+    def test_jsonl_loader_reads_rotated_gzip_segments(self):
+        bars = self._bars()
+        tmpdir = tempfile.mkdtemp(dir=str(Path.cwd()))
+        try:
+            event_path = Path(tmpdir) / "market_intelligence_events.jsonl"
+
+            def _record(bar, event_type):
+                return json.dumps({"ts": bar.ts.isoformat(), "symbol": "AAA", "source": "news", "event_type": event_type}) + "\n"
+
+            segment = Path(tmpdir) / "market_intelligence_events.20250101-000000-000000.jsonl.gz"
+            with gzip.open(segment, "wt", encoding="utf-8") as handle:
+                handle.write(_record(bars[0], "rotated"))
+            event_path.write_text(_record(bars[1], "active"), encoding="utf-8")
+
+            events = EventDrivenBacktestEngine.load_intelligence_events_jsonl(event_path)
+            rotated_only = EventDrivenBacktestEngine.load_intelligence_events_jsonl(segment)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+        self.assertEqual([event.event_type for event in events], ["rotated", "active"])
+        self.assertEqual([event.event_type for event in rotated_only], ["rotated"])
+
     def test_jsonl_loader_supports_legacy_raw_ref_payload(self):
         bars = self._bars()
         tmpdir = tempfile.mkdtemp(dir=str(Path.cwd()))
@@ -0,0 +1,149 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from app.mixins.market_intelligence import MarketIntelligenceMixin
+from app.support.fetch_pipeline import DeadlineExceeded, FetchPipeline
+from config import Config
+from data.providers.dart_provider import DartProvider
+from data.providers.news_provider import NewsProvider
+
+
+class _DummyConfig:
+    def __init__(self):
+        self.feature_flags = {"enable_external_data": True}
+        self.market_intelligence = dict(Config.DEFAULT_MARKET_INTELLIGENCE_CONFIG)
+        self.market_intelligence["providers"] = {"news": True, "dart": True, "datalab": False, "macro": False}
+
+
+class _FakeNews(NewsProvider):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    crowded = threading.Event()  # 동시 호출이 목표치에 도달하면 set
+    released = threading.Event()  # 느린 질의를 풀어주는 신호
+    target = 0
+
+    def __init__(self, slow_query=""):
+        self.slow_query = slow_query
+        self.last_status = "idle"
+        self.last_error = ""
+
+    def available(self):
+        return True
+
+    def search(self, query, display=10, sort="date"):
+        with _FakeNews.lock:
+            _FakeNews.active += 1
+            _FakeNews.peak = max(_FakeNews.peak, _FakeNews.active)
+            if _FakeNews.active >= _FakeNews.target:
+                _FakeNews.crowded.set()
+        try:
+            if query == self.slow_query:
+                _FakeNews.released.wait(5.0)
+            else:
+                # 목표 동시성에 도달할 때까지 붙잡아 둔다 (직렬 실행이면 시간 초과로 실패)
+                _FakeNews.crowded.wait(5.0)
+        finally:
+            with _FakeNews.lock:
+                _FakeNews.active -= 1
+        self.last_status = "ok_with_data"
+        return [{"title": f"{query} 뉴스", "link": f"https://n.example/{query}", "published_at": None}]
+
+
+class _FakeDart(DartProvider):
+    def __init__(self):
+        self.last_status = "ok_empty"
+        self.last_error = ""
+
+    def available(self):
+        return True
+
+    def get_recent_disclosures(self, stock_code, start_date="", end_date="", page_count=10):
+        return []
+
+    def get_market_disclosures(self, start_date, end_date, page_no=1, page_count=100):
+        self.last_total_page = 0
+        return []
+
+
+class _Harness(MarketIntelligenceMixin):
+    def __init__(self, codes, slow_query=""):
+        self.config = _DummyConfig()
+        self.universe = {code: {"name": f"NAME{code}", "market_intel": dict(Config.DEFAULT_MARKET_INTEL_STATE)} for code in codes}
+        self._candidate_universe = {}
+        self._active_market_candidates = {}
+        self._market_dart_cursor_by_code = {}
+        self.slow_query = slow_query
+
+    def _build_news_provider(self):
+        return _FakeNews(slow_query=self.slow_query)
+
+    def _build_dart_provider(self):
+        return _FakeDart()
+
+    def log(self, _msg):
+        return None
+
+
+class TestMarketIntelligenceFetchPipeline(unittest.TestCase):
+    def setUp(self):
+        _FakeNews.active = 0
+        _FakeNews.peak = 0
+        _FakeNews.target = 0
+        _FakeNews.crowded = threading.Event()
+        _FakeNews.released = threading.Event()
+
+    def test_codes_fetch_concurrently_and_arrive_incrementally(self):
+        codes = [f"{idx:06d}" for idx in range(12)]
+        trader = _Harness(codes)
+        delivered = []
+        limits = {"news": {"concurrency": 4, "rate_per_sec": 0}, "dart": {"concurrency": 2, "rate_per_sec": 0}}
+
+        _FakeNews.target = 4
+        with patch.object(Config, "MARKET_INTEL_PROVIDER_LIMITS", limits):
+            payload = trader._fetch_market_intelligence_worker(codes, on_code=delivered.append)
+
+        self.assertEqual(sorted(item["code"] for item in delivered), codes)
+        self.assertEqual(sorted(payload["delivered"]), codes)
+        self.assertEqual(payload["codes"], {})
+        self.assertTrue(_FakeNews.crowded.is_set())
+        self.assertEqual(_FakeNews.peak, 4)
+        self.assertEqual(delivered[0]["row"]["source_meta"]["news"]["status"], "ok_with_data")
+        self.assertEqual(payload["source_statuses"]["news"]["status"], "ok_with_data")
+
+    def test_deadline_delivers_partial_rows(self):
+        codes = ["000001", "000002"]
+        trader = _Harness(codes, slow_query="NAME000002")
+        limits = {"news": {"concurrency": 2, "rate_per_sec": 0}, "dart": {"concurrency": 1, "rate_per_sec": 0}}
+
+        with patch.object(Config, "MARKET_INTEL_PROVIDER_LIMITS", limits), patch.object(
+            trader, "_market_intel_fetch_deadline_sec", return_value=0.3
+        ):
+            payload = trader._fetch_market_intelligence_worker(codes)
+        # 느린 질의가 아직 붙잡혀 있는 동안 결과가 돌아와야 한다
+        in_flight = _FakeNews.active
+        _FakeNews.released.set()
+
+        self.assertEqual(in_flight, 1)
+        self.assertEqual(payload["codes"]["000001"]["source_meta"]["news"]["status"], "ok_with_data")
+        slow = payload["codes"]["000002"]["source_meta"]["news"]
+        self.assertEqual((slow["status"], slow["error"]), ("partial", "deadline_exceeded"))
+        self.assertEqual(payload["source_statuses"]["news"]["status"], "partial")
+
+    def test_rate_limiter_expires_calls_past_the_deadline(self):
+        pipeline = FetchPipeline({"dart": {"concurrency": 1, "rate_per_sec": 2.0}}, deadline_sec=0.2)
+        futures = [pipeline.submit("dart", lambda value=value: value) for value in range(4)]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=2.0))
+            except DeadlineExceeded:
+                results.append(None)
+        pipeline.shutdown()
+        self.assertEqual(results[0], 0)
+        self.assertIn(None, results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from app.mixins.market_intelligence import MarketIntelligenceMixin
+from app.support.jsonl_writer import flush_jsonl_writers
 from config import Config
 
 
@@ -92,14 +93,31 @@ class TestMarketIntelligencePolicyRuntime(unittest.TestCase):
 
     def test_candidate_universe_promotes_dual_source_candidate(self):
         trader = _Harness()
-        trader.condition_table = _Table([["123456", "CANDI"], ["005930", "SAMSUNG"]])
-        trader.ranking_table = _Table([[1, "123456", "CANDI"]])
+        trader._record_market_screen_results("condition", [{"code": "123456", "name": "CANDI"}, {"code": "005930", "name": "SAMSUNG"}])
+        trader._record_market_screen_results("ranking", [{"rank": 1, "code": "123456", "name": "CANDI"}])
 
         trader._refresh_candidate_universe_state()
 
         self.assertIn("123456", trader._candidate_universe)
         self.assertIn("123456", trader._active_market_candidates)
         self.assertNotIn("005930", trader._active_market_candidates)
+        self.assertEqual(trader._ranking_intersection_score("123456"), 100.0)
+        self.assertEqual(trader._ranking_intersection_score("005930"), 50.0)
+
+    def test_candidate_universe_ignores_table_widgets_and_updates_pool_in_place(self):
+        trader = _Harness()
+        trader.condition_table = _Table([["654321", "TABLE_ONLY"]])
+        pool = trader._candidate_universe
+        trader._record_market_screen_results("condition", [{"code": "111111", "name": "ONE"}])
+        trader._refresh_candidate_universe_state()
+        self.assertIs(trader._candidate_universe, pool)
+        self.assertEqual(sorted(pool), ["111111"])
+
+        trader._record_market_screen_results("condition", [{"code": "222222", "name": "TWO"}])
+        trader._refresh_candidate_universe_state()
+        self.assertEqual(trader._market_screen_index.sources_for("111111"), set())
+        self.assertEqual(pool["222222"]["source_hits"], ["condition"])
+        self.assertEqual(trader._ranking_intersection_score("654321"), 0.0)
 
     def test_decision_audit_writes_snapshot(self):
         trader = _Harness()
@@ -114,7 +132,9 @@ class TestMarketIntelligencePolicyRuntime(unittest.TestCase):
         tmpdir = tempfile.mkdtemp(dir=str(Path.cwd()))
         try:
             audit_path = Path(tmpdir) / "decision_audit.jsonl"
-            with patch("app.features.market_intelligence.audit.Config.MARKET_INTELLIGENCE_DECISION_AUDIT_FILE", str(audit_path)):
+            with patch("app.features.market_intelligence.audit.Config.MARKET_INTELLIGENCE_DECISION_AUDIT_FILE", str(audit_path)), patch(
+                "app.features.market_intelligence.audit.Config.MARKET_INTELLIGENCE_DB_FILE", str(Path(tmpdir) / "intel.db")
+            ):
                 trader._record_decision_audit_event(
                     code="005930",
                     info=info,
@@ -124,11 +144,18 @@ class TestMarketIntelligencePolicyRuntime(unittest.TestCase):
                     metrics={"news_score": -80.0},
                     quantity=3,
                 )
+                self.assertTrue(flush_jsonl_writers([audit_path]))
+                store = trader._intel_store_safe()
+                assert store is not None
+                self.assertTrue(trader._intel_store_ready.wait(5))
+                stored = store.query_audits(symbols=["005930"])
+                trader._close_intel_store()
             record = json.loads(audit_path.read_text(encoding="utf-8").strip())
         finally:
             shutil.rmtree(tmpdir, ignore_errors=True)
 
         self.assertEqual(record["symbol"], "005930")
+        self.assertEqual(stored, [record])
         self.assertFalse(record["allowed"])
         self.assertEqual(record["action_policy"], "reduce_size")
         self.assertEqual(record["quantity"], 3)
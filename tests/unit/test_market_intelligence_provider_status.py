@@ -17,10 +17,20 @@ class _Response:
         return self._payload
 
 
+class _Client:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def get(self, provider, url, **kwargs):
+        self.calls.append((provider, url))
+        return self.response
+
+
 class TestMarketIntelligenceProviderStatus(unittest.TestCase):
     def test_news_provider_marks_empty_response(self):
         provider = NewsProvider("id", "secret")
-        with patch("data.providers.news_provider.requests.get", return_value=_Response({"items": []})):
+        with patch("data.providers.news_provider.provider_http_client", return_value=_Client(_Response({"items": []}))):
             result = provider.search("삼성전자")
 
         self.assertEqual(result, [])
@@ -29,7 +39,7 @@ class TestMarketIntelligenceProviderStatus(unittest.TestCase):
 
     def test_news_provider_marks_error_response(self):
         provider = NewsProvider("id", "secret")
-        with patch("data.providers.news_provider.requests.get", return_value=_Response(error="boom")):
+        with patch("data.providers.news_provider.provider_http_client", return_value=_Client(_Response(error="boom"))):
             result = provider.search("삼성전자")
 
         self.assertEqual(result, [])
@@ -0,0 +1,61 @@
+import datetime
+import unittest
+
+from app.mixins.market_intelligence import MarketIntelligenceMixin
+from app.support.near_duplicate import NearDuplicateIndex
+from config import Config
+
+
+class _DummyConfig:
+    def __init__(self):
+        self.feature_flags = {"enable_external_data": True}
+        self.market_intelligence = dict(Config.DEFAULT_MARKET_INTELLIGENCE_CONFIG)
+
+
+class _Harness(MarketIntelligenceMixin):
+    def __init__(self):
+        self.config = _DummyConfig()
+        self.universe = {}
+        self._candidate_universe = {}
+        self._active_market_candidates = {}
+
+
+class TestNewsStoryClustering(unittest.TestCase):
+    def test_syndicated_rewrites_share_a_story_until_the_window_expires(self):
+        index = NearDuplicateIndex(window_sec=60)
+        base = index.assign("삼성전자 대규모 수주 계약", key="a", now=0)
+        self.assertEqual(index.assign("[속보] 삼성전자, 대규모 수주 계약 체결", key="b", now=1), base)
+        self.assertEqual(index.assign("삼성전자 대규모 수주 계약 체결…2조원 규모", key="c", now=2), base)
+        self.assertNotEqual(index.assign("SK하이닉스 대규모 수주 계약", key="d", now=3), base)
+        self.assertNotEqual(index.assign("삼성전자 자사주 매입", key="e", now=4), base)
+        self.assertEqual(index.story_size(base), 3)
+
+        self.assertNotEqual(index.assign("삼성전자 대규모 수주 계약 체결", key="f", now=120), base)
+        self.assertEqual(len(index), 1)
+
+    def test_velocity_and_scoring_count_distinct_stories_across_codes(self):
+        trader = _Harness()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        samsung = {"name": "삼성전자", "market_intel": dict(Config.DEFAULT_MARKET_INTEL_STATE)}
+        items = [
+            {"title": "삼성전자 대규모 수주 계약", "link": "https://a.example/1", "published_at": now},
+            {"title": "[속보] 삼성전자, 대규모 수주 계약 체결", "link": "https://b.example/2", "published_at": now},
+            {"title": "삼성전자 대규모 수주계약 체결", "link": "https://c.example/3", "published_at": now},
+            {"title": "삼성전자 자사주 매입", "link": "https://d.example/4", "published_at": now},
+        ]
+
+        result = trader._score_news_items(samsung, items)
+
+        self.assertEqual([item["title"] for item in result["headlines"]], ["삼성전자 대규모 수주 계약", "삼성전자 자사주 매입"])
+        self.assertEqual(result["headlines"][0]["duplicate_count"], 2)
+        self.assertEqual(result["headline_velocity"], 2)
+        self.assertEqual(result["score"], 40.0)
+
+        partner = {"name": "삼성전자우", "aliases": ["삼성전자"], "market_intel": dict(Config.DEFAULT_MARKET_INTEL_STATE)}
+        rewrite = [{"title": "삼성전자, 대규모 수주 계약 체결 (종합)", "link": "https://e.example/5", "published_at": now}]
+        again = trader._score_news_items(partner, rewrite)
+        self.assertEqual(again["headlines"][0]["story_id"], result["headlines"][0]["story_id"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@
 
 - supports_open_orders 가 True 를 반환한다.
 - get_open_orders 가 ka400008 응답을 OpenOrder 리스트로 파싱한다.
-- 파싱 실패/빈 응답 시 예외를 전가하지 않고 빈 리스트를 반환한다.
+- 조회 실패/비정상 응답 시 예외를 전가하지 않고 None을 반환한다 (빈 리스트는 "미체결 없음").
 """
 import unittest
 from typing import cast
@@ -64,6 +64,7 @@ class TestOpenOrdersRestAdapter(unittest.TestCase):
         }
         client = _Client(response)
         orders = client.get_open_orders("12345678")
+        assert orders is not None
 
         self.assertEqual(len(orders), 2)
         o1 = orders[0]
@@ -88,17 +89,21 @@ class TestOpenOrdersRestAdapter(unittest.TestCase):
         self.assertEqual(data["tr_cd"], "ka10075")
         self.assertEqual(data["acnt_no"], "12345678")
 
-    def test_non_zero_return_code_returns_empty(self):
+    def test_non_zero_return_code_returns_none(self):
         client = _Client({"return_code": 1, "return_msg": "error"})
-        self.assertEqual(client.get_open_orders("12345678"), [])
+        self.assertIsNone(client.get_open_orders("12345678"))
 
-    def test_none_response_returns_empty(self):
+    def test_none_response_returns_none(self):
         client = _Client(None)
-        self.assertEqual(client.get_open_orders("12345678"), [])
+        self.assertIsNone(client.get_open_orders("12345678"))
 
-    def test_request_exception_returns_empty(self):
+    def test_request_exception_returns_none(self):
         client = _Client(raise_exc=RuntimeError("network"))
-        self.assertEqual(client.get_open_orders("12345678"), [])
+        self.assertIsNone(client.get_open_orders("12345678"))
+
+    def test_successful_empty_output_returns_empty_list(self):
+        self.assertEqual(_Client({"return_code": 0, "output": []}).get_open_orders("12345678"), [])
+        self.assertEqual(_Client({"return_code": 0}).get_open_orders("12345678"), [])
 
     def test_single_dict_output_normalized_to_list(self):
         client = _Client(
@@ -114,6 +119,7 @@ class TestOpenOrdersRestAdapter(unittest.TestCase):
             }
         )
         orders = client.get_open_orders("12345678")
+        assert orders is not None
         self.assertEqual(len(orders), 1)
         self.assertEqual(orders[0].code, "035420")
 
@@ -129,6 +135,7 @@ class TestOpenOrdersRestAdapter(unittest.TestCase):
             }
         )
         orders = client.get_open_orders("12345678")
+        assert orders is not None
         self.assertEqual(len(orders), 1)
         self.assertEqual(orders[0].order_no, "O555")
 
@@ -0,0 +1,134 @@
+import unittest
+
+from app.features.order_sync.order_book import PendingOrderBook
+from app.mixins.order_sync import OrderSyncMixin
+from app.mixins.trading_session import TradingSessionMixin
+
+
+class _DummySignal:
+    def emit(self):
+        return None
+
+
+class _DummyLogger:
+    def info(self, _msg):
+        return None
+
+    def warning(self, _msg):
+        return None
+
+
+class _Harness(TradingSessionMixin, OrderSyncMixin):
+    def __init__(self):
+        self.universe = {"005930": {"name": "SAMSUNG", "status": "buy_submitted", "held": 0, "current": 1000}}
+        self._pending_order_state = {}
+        self._manual_pending_state = {}
+        self._reserved_cash_by_code = {}
+        self._dirty_codes = set()
+        self.logger = _DummyLogger()
+        self.sig_update_table = _DummySignal()
+
+    def log(self, _msg):
+        return None
+
+
+def _children():
+    return [
+        {"order_no": "", "submitted_qty": 3, "filled_qty": 0, "remaining_qty": 3, "expected_price": 1000, "reserved_cash": 3000, "state": "submitted"},
+        {"order_no": "", "submitted_qty": 2, "filled_qty": 0, "remaining_qty": 2, "expected_price": 1010, "reserved_cash": 2020, "state": "submitted"},
+        {"order_no": "", "submitted_qty": 1, "filled_qty": 0, "remaining_qty": 1, "expected_price": 1020, "reserved_cash": 1020, "state": "submitted"},
+    ]
+
+
+class TestPendingOrderBook(unittest.TestCase):
+    def test_order_no_index_and_incremental_totals(self):
+        book = PendingOrderBook()
+        events = []
+        book.add_listener(events.append)
+        pending = {"side": "buy", "state": "submitted", "child_orders": _children()}
+        book.track("005930", pending)
+        children = pending["child_orders"]
+        book.bind_order_no("005930", children[1], "B2")
+
+        self.assertEqual(book.find("B2"), ("005930", children[1]))
+        self.assertIsNone(book.find("UNKNOWN"))
+
+        book.update_child("005930", children[1], filled_qty=2, remaining_qty=0, state="filled")
+        state, remaining = book.sync_aggregate("005930")
+
+        self.assertEqual((state, remaining), ("partial", 4))
+        self.assertEqual(pending["filled_qty"], 2)
+        self.assertEqual(pending["order_no"], "B2")
+        self.assertEqual(
+            [(e.scope, e.previous, e.state) for e in events],
+            [("child", "submitted", "filled"), ("order", "submitted", "partial")],
+        )
+
+        book.discard("005930", final_state="cancelled")
+        self.assertIsNone(book.find("B2"))
+        self.assertEqual(events[-1].state, "cancelled")
+
+    def test_active_children_skip_settled_prefix(self):
+        book = PendingOrderBook()
+        pending = {"state": "submitted", "child_orders": _children()}
+        book.track("005930", pending)
+        first = pending["child_orders"][0]
+        book.update_child("005930", first, filled_qty=3, remaining_qty=0, state="filled")
+
+        active = list(book.active_children("005930"))
+
+        self.assertEqual(len(active), 2)
+        self.assertIs(active[0], pending["child_orders"][1])
+
+
+class TestOrderSyncOrderBook(unittest.TestCase):
+    def test_split_buy_lifecycle_matches_full_refresh(self):
+        trader = _Harness()
+        trader._set_pending_order("005930", "buy", "BUY", child_orders=_children())
+        trader._update_pending_from_order_event("005930", order_no="A1", order_qty=3)
+        trader._update_pending_from_order_event("005930", order_no="A2", order_qty=2)
+        trader._update_pending_from_order_event("005930", order_no="A3", order_qty=1)
+
+        state, remaining, consumed = trader._apply_pending_fill("005930", 4)
+        self.assertEqual((state, remaining, consumed), ("partial", 2, 4010))
+
+        should_clear, _ = trader._apply_pending_cancel("005930", "A3", "cancelled")
+        self.assertFalse(should_clear)
+
+        pending = trader._pending_order_state["005930"]
+        incremental = {key: pending[key] for key in ("state", "submitted_qty", "filled_qty", "remaining_qty", "expected_price")}
+        trader._refresh_pending_order_aggregate("005930")
+        full = {key: pending[key] for key in ("state", "submitted_qty", "filled_qty", "remaining_qty", "expected_price")}
+        self.assertEqual(incremental, full)
+        self.assertEqual(pending["child_orders"][2]["state"], "cancelled")
+
+        book = trader._pending_order_book_safe()
+        located = book.find("A2")
+        assert located is not None
+        self.assertEqual(located[1]["remaining_qty"], 1)
+
+        trader._clear_pending_order("005930", final_state="cancelled")
+        self.assertIsNone(book.find("A1"))
+        self.assertNotIn("005930", book)
+
+    def test_cleanup_targets_follow_replaced_state_map(self):
+        trader = _Harness()
+        trader._set_pending_order("005930", "buy", "BUY", submitted_qty=2, order_no="O1")
+        trader._pending_order_state["000660"] = {
+            "side": "sell",
+            "state": "submitted",
+            "order_no": "O2",
+            "remaining_qty": 1,
+            "child_orders": [],
+        }
+        trader._pending_order_state.pop("005930")
+
+        live, placeholders = trader._collect_active_order_cleanup_targets()
+
+        self.assertEqual([t["order_no"] for t in live], ["O2"])
+        self.assertEqual(placeholders, [])
+        self.assertIsNone(trader._pending_order_book_safe().find("O1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+import concurrent.futures
+import unittest
+from typing import List, Optional
+from unittest.mock import patch
+
+from api.models import OpenOrder
+from app.features.trading_session.cleanup_coordinator import OrderCleanupCoordinator
+from app.mixins.execution_engine import ExecutionEngineMixin
+from app.mixins.order_sync import OrderSyncMixin
+from app.mixins.trading_session import TradingSessionMixin
+
+
+class _DummySignal:
+    def emit(self):
+        return None
+
+
+class _Result:
+    success = True
+    message = "ok"
+
+
+class _DummyThreadPool:
+    def start(self, _worker):
+        raise AssertionError("cleanup should go through rest_client.submit")
+
+
+class _DummyREST:
+    supports_open_orders = True
+
+    def __init__(self, open_orders=None, auto_complete=True):
+        self.open_orders = list(open_orders or [])
+        self.auto_complete = auto_complete
+        self.submitted = []
+        self.open_order_calls = 0
+
+    def submit(self, method_name, *args):
+        future = concurrent.futures.Future()
+        self.submitted.append((method_name, args, future))
+        if self.auto_complete:
+            future.set_result(getattr(self, method_name)(*args))
+        return future
+
+    def cancel_order(self, _account, _order_no, _code, _quantity):
+        return _Result()
+
+    def get_open_orders(self, _account) -> Optional[List[OpenOrder]]:
+        self.open_order_calls += 1
+        return list(self.open_orders)
+
+    def get_positions(self, _account):
+        return []
+
+
+class _FailingREST(_DummyREST):
+    """Cancel rejected and the open-order poll itself fails (None, not [])."""
+
+    def cancel_order(self, _account, _order_no, _code, _quantity):
+        result = _Result()
+        result.success = False
+        return result
+
+    def get_open_orders(self, _account):
+        self.open_order_calls += 1
+        return None
+
+
+class _Harness(TradingSessionMixin, OrderSyncMixin, ExecutionEngineMixin):
+    def __init__(self, rest_client):
+        self.universe = {
+            "005930": {"name": "삼성전자", "held": 0, "available_qty": 0, "status": "buy_submitted", "buy_price": 0, "invest_amount": 0},
+            "000660": {"name": "SK하이닉스", "held": 0, "available_qty": 0, "status": "buy_submitted", "buy_price": 0, "invest_amount": 0},
+        }
+        self.external_positions = {}
+        self._pending_order_state = {
+            "005930": {"side": "buy", "reason": "BUY", "state": "submitted", "order_no": "A1", "submitted_qty": 2, "filled_qty": 0, "remaining_qty": 2, "reserved_cash": 2000},
+            "000660": {"side": "buy", "reason": "BUY", "state": "submitted", "order_no": "B1", "submitted_qty": 1, "filled_qty": 0, "remaining_qty": 1, "reserved_cash": 1000},
+        }
+        self._manual_pending_state = {}
+        self._reserved_cash_by_code = {"005930": 2000, "000660": 1000}
+        self._last_exec_event = {}
+        self._position_sync_pending = set()
+        self._position_sync_batch = set()
+        self._position_sync_scheduled = False
+        self._position_sync_retry_count = 0
+        self._dirty_codes = set()
+        self._diagnostics_dirty_codes = set()
+        self._log_cooldown_map = {}
+        self._holding_or_pending_count = 0
+        self._sync_failed_codes = set()
+        self.sig_update_table = _DummySignal()
+        self.current_account = "12345678"
+        self.threadpool = _DummyThreadPool()
+        self.is_running = False
+        self.logs = []
+        self.rest_client = rest_client
+
+    def log(self, msg):
+        self.logs.append(str(msg))
+
+    def _diag_touch(self, *_args, **_kwargs):
+        return None
+
+    def _diag_clear_pending(self, *_args, **_kwargs):
+        return None
+
+
+class TestOrderCleanupCoordinator(unittest.TestCase):
+    def test_open_orders_resolve_only_answered_cancels(self):
+        targets = [{"code": "005930", "order_no": "A1"}, {"code": "000660", "order_no": "B1"}]
+        coordinator = OrderCleanupCoordinator("unit", targets, [], timeout_sec=5.0, max_polls=2, now=100.0)
+
+        coordinator.record_cancel(0, True, "ok")
+        self.assertFalse(coordinator.can_poll())
+        coordinator.apply_open_orders([])
+        self.assertEqual([row["order_no"] for row in coordinator.unresolved_targets()], ["B1"])
+
+        coordinator.record_cancel(1, True, "ok")
+        coordinator.begin_poll()
+        coordinator.apply_open_orders([OpenOrder(order_no="B1", code="000660", side="buy", quantity=1, remaining_qty=1)])
+        self.assertFalse(coordinator.resolved())
+        self.assertTrue(coordinator.involves("", "B1"))
+        self.assertTrue(coordinator.expired(now=105.0))
+
+        coordinator.apply_open_orders([])
+        self.assertTrue(coordinator.resolved())
+        self.assertTrue(coordinator.finish({"unresolved_codes": []}))
+        self.assertFalse(coordinator.finish({"unresolved_codes": ["late"]}))
+        self.assertEqual(coordinator.future.result()["polls"], 1)
+
+    def test_blocking_cleanup_resolves_from_one_open_order_poll(self):
+        client = _DummyREST(open_orders=[])
+        trader = _Harness(client)
+
+        result = trader._cleanup_active_orders("unit_test", timeout_sec=5.0)
+
+        self.assertEqual({args[1] for _name, args, _future in client.submitted}, {"A1", "B1"})
+        self.assertEqual(client.open_order_calls, 1)
+        self.assertEqual(result["unresolved_codes"], [])
+        self.assertEqual(result["polls"], 1)
+        self.assertEqual(trader._pending_order_state, {})
+        self.assertEqual(trader._reserved_cash_by_code, {})
+
+    def test_failed_poll_does_not_close_targets_whose_cancel_failed(self):
+        client = _FailingREST()
+        trader = _Harness(client)
+
+        result = trader._cleanup_active_orders("unit_test", timeout_sec=5.0)
+
+        self.assertEqual(result["unresolved_codes"], ["000660", "005930"])
+        self.assertEqual({code: row["state"] for code, row in trader._pending_order_state.items()}, {"005930": "sync_failed", "000660": "sync_failed"})
+        self.assertEqual(trader._reserved_cash_by_code, {"005930": 2000, "000660": 1000})
+        self.assertFalse(any(target.get("broker_closed") for target in result["live_targets"]))
+
+    def test_async_cleanup_finishes_on_realtime_terminal_events(self):
+        client = _DummyREST(auto_complete=False)
+        client.supports_open_orders = False
+        trader = _Harness(client)
+        results = []
+
+        started = trader._cleanup_active_orders_async("unit_async", on_done=results.append)
+
+        self.assertTrue(started)
+        self.assertEqual(len(client.submitted), 2)
+        for _name, _args, future in client.submitted:
+            future.set_result(_Result())
+        self.assertEqual(results, [])
+
+        trader._clear_pending_order("005930", final_state="cancelled")
+        trader._notify_order_cleanup_event("005930", "A1")
+        self.assertEqual(results, [])
+
+        trader._clear_pending_order("000660", final_state="cancelled")
+        trader._notify_order_cleanup_event("000660", "B1")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["unresolved_codes"], [])
+        self.assertFalse(trader._order_cleanup_inflight)
+        self.assertIsNone(trader._order_cleanup_coordinator)
+
+    def test_stop_keeps_realtime_feed_until_cleanup_finishes(self):
+        trader = _Harness(_DummyREST(auto_complete=False))
+        callbacks = []
+        with patch.object(trader, "_set_trading_stopped_state"), patch.object(
+            trader, "_cleanup_active_orders_async", side_effect=lambda _reason, on_done: callbacks.append(on_done) or True
+        ), patch.object(trader, "_disconnect_realtime_clients") as disconnect, patch.object(
+            trader, "_cancel_pending_orders_before_stop"
+        ) as sync_cleanup:
+            trader.stop_trading()
+            disconnect.assert_not_called()  # 취소/체결 이벤트를 받아야 정리가 끝난다
+
+            callbacks[0]({"unresolved_codes": []})
+            disconnect.assert_called_once_with()
+            sync_cleanup.assert_not_called()
+        self.assertEqual(trader._reserved_cash_by_code, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import datetime
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from api.models import OpenOrder
+from app.mixins.execution_engine import ExecutionEngineMixin
+from app.mixins.order_sync import OrderSyncMixin
+from app.support.order_journal import OrderJournal
+
+
+class _DummySignal:
+    def emit(self):
+        return None
+
+
+class _DummyLogger:
+    def info(self, _msg):
+        return None
+
+    def warning(self, _msg):
+        return None
+
+
+class _Harness(OrderSyncMixin, ExecutionEngineMixin):
+    def __init__(self):
+        self.universe = {}
+        self.external_positions = {}
+        self._pending_order_state = {}
+        self._manual_pending_state = {}
+        self._reserved_cash_by_code = {}
+        self._dirty_codes = set()
+        self.virtual_deposit = 100_000
+        self.current_account = "1234-5678"
+        self.rest_client = None
+        self.logger = _DummyLogger()
+        self.sig_update_table = _DummySignal()
+        self.logs = []
+
+    def log(self, msg):
+        self.logs.append(str(msg))
+
+
+def _children():
+    return [
+        {"order_no": "A1", "submitted_qty": 3, "filled_qty": 0, "remaining_qty": 3, "expected_price": 1000, "reserved_cash": 3000, "state": "submitted"},
+        {"order_no": "A2", "submitted_qty": 2, "filled_qty": 0, "remaining_qty": 2, "expected_price": 1000, "reserved_cash": 2000, "state": "submitted"},
+    ]
+
+
+class TestOrderJournal(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self._tmp.name) / "acct.wal.jsonl")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_replay_after_compaction_and_torn_tail(self):
+        journal = OrderJournal(self.path, fsync_batch=2, compact_every=1000)
+        journal.load()
+        journal.append("cash", "005930", amount=5000)
+        journal.append("pending", "005930", entry={"side": "buy", "state": "submitted", "until": datetime.datetime(2026, 1, 2, 9, 0)})
+        journal.compact({"005930": 5000}, {"005930": {"side": "buy", "state": "submitted"}})
+        journal.append("cash", "005930", amount=2000)
+        journal.append("cash", "000660", amount=700)
+        journal.append("pending_clear", "000660")
+        journal.close()
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write('{"seq": 99, "op": "cash", "code": "0')
+
+        replay = OrderJournal(self.path).load()
+
+        self.assertEqual(replay.reserved_cash, {"005930": 2000, "000660": 700})
+        self.assertEqual(replay.pending["005930"]["state"], "submitted")
+        self.assertEqual(replay.replayed, 3)
+        self.assertEqual(replay.skipped, 1)
+        self.assertEqual(replay.seq, 5)
+        self.assertGreaterEqual(journal.fsync_count, 1)
+
+    def test_datetimes_round_trip(self):
+        journal = OrderJournal(self.path)
+        journal.load()
+        until = datetime.datetime(2026, 1, 2, 9, 0, 5)
+        journal.append("pending", "005930", entry={"until": until, "child_orders": [{"updated_at": until}]})
+        journal.close()
+
+        entry = OrderJournal(self.path).load().pending["005930"]
+
+        self.assertEqual(entry["until"], until)
+        self.assertEqual(entry["child_orders"][0]["updated_at"], until)
+
+
+class TestOrderJournalRecovery(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._patch = patch("app.features.execution.order_journal.Config.ORDER_JOURNAL_DIR", self._tmp.name)
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def test_crash_recovery_then_open_order_reconcile(self):
+        trader = _Harness()
+        trader._open_order_journal(trader.current_account)
+        trader._reserve_cash_for_buy("005930", 5000)
+        trader._set_pending_order("005930", "buy", "BUY", child_orders=_children())
+        trader._apply_pending_fill("005930", 1)
+        # Simulate a crash: the journal is never closed or compacted.
+
+        restarted = _Harness()
+        restarted._recover_order_journal(restarted.current_account)
+
+        pending = restarted._pending_order_state["005930"]
+        self.assertEqual(pending["state"], "partial")
+        self.assertEqual(pending["remaining_qty"], 4)
+        self.assertEqual(restarted._reserved_cash_by_code, {"005930": 5000})
+
+        # A failed poll (None) is not "nothing open": restored orders and cash stay put.
+        restarted._reconcile_journal_with_open_orders(restarted.current_account, None, ["005930"])
+        self.assertEqual(restarted._pending_order_state["005930"]["remaining_qty"], 4)
+        self.assertEqual(restarted._reserved_cash_by_code, {"005930": 5000})
+
+        restarted._reconcile_journal_with_open_orders(
+            restarted.current_account,
+            [OpenOrder(order_no="A2", code="005930", side="buy", quantity=2, remaining_qty=2)],
+            ["005930"],
+        )
+
+        pending = restarted._pending_order_state["005930"]
+        self.assertEqual(pending["remaining_qty"], 2)
+        self.assertEqual(pending["child_orders"][0]["state"], "cancelled")
+        self.assertEqual(restarted._reserved_cash_by_code, {"005930": 3000})
+
+        restarted._close_order_journal()
+        replay = _Harness()._open_order_journal("1234-5678")
+        assert replay is not None
+        self.assertEqual(replay.reserved_cash, {"005930": 3000})
+        self.assertEqual(replay.pending["005930"]["remaining_qty"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
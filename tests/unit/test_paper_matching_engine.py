@@ -0,0 +1,184 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from api.models import AccountInfo, ExecutionData, OrderBook
+from api.paper_broker import LatencyModel, PaperBrokerClient, PaperMatchingEngine
+from app.core.trading_core import TradingCore
+from config import Config, TradingConfig
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _MarketDataREST:
+    def __init__(self, deposit=1_000_000, account_failures=0):
+        self.quotes = 0
+        self.account_calls = 0
+        self.account_failures = account_failures
+        self.deposit = deposit
+
+    def get_stock_quote(self, code):
+        self.quotes += 1
+        return None
+
+    def get_account_info(self, account_no):
+        self.account_calls += 1
+        if self.account_failures > 0:
+            self.account_failures -= 1
+            return None
+        return AccountInfo(account_no=account_no, deposit=self.deposit)
+
+
+class TestPaperMatchingEngine(unittest.TestCase):
+    def test_latency_queue_position_and_partial_fills(self):
+        clock = _Clock()
+        events = []
+        engine = PaperMatchingEngine(LatencyModel(50, 0), on_event=events.append, clock=clock)
+        engine.on_order_book(OrderBook("005930", [1010], [40], [1000, 990], [300, 500]))
+
+        order = engine.submit("005930", "buy", 100, 1000)
+        self.assertEqual([e["order_status"] for e in events], ["접수"])
+        engine.on_tick("005930", 1000, 500)
+        self.assertEqual(order.state, "pending")  # 지연 전 틱은 주문과 무관
+
+        clock.now = 0.06
+        engine.on_tick("005930", 1000, 200)
+        self.assertEqual((order.filled, order.queue_ahead), (0, 100))
+        engine.on_order_book(OrderBook("005930", [1010], [40], [1000, 990], [50, 500]))
+        engine.on_tick("005930", 1000, 80)
+        self.assertEqual((order.filled, order.queue_ahead), (30, 0))
+        engine.on_tick("005930", 990, 5)  # 관통 -> 잔량 전량 주문가 체결
+
+        fills = [e for e in events if e["order_status"] == "체결"]
+        self.assertEqual([(e["exec_qty"], e["exec_price"], e["unexec_qty"]) for e in fills], [(30, 1000, 70), (70, 1000, 0)])
+        self.assertEqual(fills[0]["order_type"], "1")
+
+        market = engine.submit("005930", "buy", 60, market=True)
+        clock.now = 0.2
+        engine.on_order_book(OrderBook("005930", [1010, 1020], [40, 100], [1000], [10]))
+        self.assertEqual(engine.fill_count, 4)
+        self.assertEqual(market.fill_value, 40 * 1010 + 20 * 1020)
+
+        resting = engine.submit("005930", "sell", 10, 1030)
+        clock.now = 0.3
+        engine.advance()
+        engine.modify(resting.order_no, 10, 1040)
+        engine.cancel(resting.order_no)
+        clock.now = 0.4
+        engine.advance()
+        self.assertEqual([e["order_type"] for e in events[-2:]], ["6", "4"])
+        self.assertEqual(events[-1]["order_status"], "취소")
+        self.assertEqual(engine.open_orders(), [])
+
+    def test_thousands_of_orders_match_in_one_pass(self):
+        engine = PaperMatchingEngine()
+        codes = [f"{idx:06d}" for idx in range(20)]
+        for idx in range(4000):
+            engine.submit(codes[idx % 20], "buy", 1 + idx % 5, 1000 - idx % 7)
+        engine.advance()
+        for code in codes:
+            engine.on_tick(code, 900, 10)
+        self.assertEqual(engine.open_orders(), [])
+        self.assertEqual(engine.fill_count, 4000)
+
+    def test_order_entry_cost_does_not_grow_with_order_history(self):
+        broker = PaperBrokerClient(cash=10**12)
+        broker.engine.latency = LatencyModel(0, 0)
+        codes = [f"{idx:06d}" for idx in range(20)]
+
+        started = time.perf_counter()
+        for idx in range(20_000):
+            code = codes[idx % 20]
+            self.assertTrue(broker.buy_limit("12345678", code, 1, 1000).success)
+            if idx % 3 == 0:
+                broker.engine.on_tick(code, 990, 0)  # 관통 체결 -> 장부에서 빠진다
+        for code in codes:
+            broker.engine.on_tick(code, 990, 0)
+        elapsed = time.perf_counter() - started
+
+        # 누적 주문 수에 비례해 훑던 구현은 2만 건에 수십 초가 걸렸다.
+        self.assertLess(elapsed, 10.0)
+        self.assertEqual(len(broker.engine.open_orders()), 0)
+        self.assertEqual(broker.engine.committed_buy_cash(), 0)
+        self.assertEqual(broker.cash, 10**12 - 20_000 * 1000)
+
+        resting = broker.buy_limit("12345678", "005930", 5, 900)
+        broker.engine.advance()
+        self.assertEqual(broker.engine.committed_buy_cash(), 4500)
+        broker.modify_order("12345678", resting.order_no, "005930", 3, 800)
+        broker.engine.advance()
+        self.assertEqual(broker.engine.committed_buy_cash(), 2400)
+        broker.cancel_order("12345678", resting.order_no, "005930", 3)
+        broker.engine.advance()
+        self.assertEqual((broker.engine.committed_buy_cash(), broker.engine.order(resting.order_no)), (0, None))
+
+    def test_cash_is_seeded_once_from_the_real_account(self):
+        inner = _MarketDataREST(deposit=500_000, account_failures=1)
+        broker = PaperBrokerClient(inner=inner)
+        self.assertEqual(broker.get_account_info("12345678").deposit, 0)  # 조회 실패 -> 다음 호출에 재시도
+        self.assertEqual(broker.get_account_info("12345678").deposit, 500_000)
+        self.assertTrue(broker.buy_limit("12345678", "005930", 10, 1000).success)
+        self.assertEqual(inner.account_calls, 2)
+
+        with patch.object(Config, "PAPER_INITIAL_CASH", 2_000_000):
+            configured = PaperBrokerClient(inner=_MarketDataREST())
+            self.assertEqual(configured.get_account_info("12345678").deposit, 2_000_000)
+            self.assertEqual(configured.inner.account_calls, 0)
+
+    def test_paper_mode_round_trip_through_order_sync(self):
+        config = TradingConfig()
+        config.execution_mode = "paper"
+        config.execution_policy = "limit"
+        inner = _MarketDataREST()
+        core = TradingCore(config, rest_client=inner, account="12345678", deposit=1_000_000)
+        core.universe["005930"] = {"name": "삼성전자", "status": "watch", "held": 0, "current": 1000, "cooldown_until": None}
+        core.is_running = True
+
+        broker = core._sync_paper_broker()
+        assert isinstance(broker, PaperBrokerClient)
+        broker.engine.latency = LatencyModel(0, 0)
+        broker.get_stock_quote("005930")
+        self.assertEqual(inner.quotes, 1)
+
+        core._execute_buy("005930", 10, 1000)
+        self.assertTrue(core.core_scheduler.run_until_idle(timeout=5.0, include_timers=True))
+        self.assertEqual(core._pending_order_state["005930"]["side"], "buy")
+
+        core._on_realtime(ExecutionData(code="005930", exec_price=990, exec_volume=3))
+        self.assertTrue(core.core_scheduler.run_until_idle(timeout=5.0, include_timers=True))
+
+        self.assertEqual(core.universe["005930"]["held"], 10)
+        self.assertEqual(core._pending_order_state, {})
+        self.assertEqual(broker.cash, 1_000_000 - 10_000)  # 실제 계좌 예수금으로 시작
+        self.assertEqual(inner.account_calls, 1)
+        self.assertEqual([(p.code, p.quantity, p.buy_price) for p in broker.get_positions("12345678")], [("005930", 10, 1000)])
+
+        with self.assertRaises(AttributeError):
+            broker.submit("get_stock_quote", "005930")  # 전송 계층 없는 inner -> 호출부 스레드풀 폴백
+
+        # 재연결: 새 원본 클라이언트가 대입돼도 같은 paper 장부로 다시 감싼다.
+        reconnected = _MarketDataREST()
+        core.rest_client = reconnected
+        self.assertEqual(core._order_client_mismatch(), "paper mode but broker client attached")
+        self.assertIs(core._sync_paper_broker(), broker)
+        self.assertIs(broker.inner, reconnected)
+        self.assertEqual(core._order_client_mismatch(), "")
+
+        core._set_execution_mode("live")
+        self.assertIs(core.rest_client, reconnected)
+        core.rest_client = broker
+        core._execute_sell("005930", 10, 1000, "TEST")
+        self.assertEqual(broker.engine.open_orders(), [])  # live 모드 + paper 클라이언트 -> 주문 거부
+        core._set_execution_mode("signal_only")
+        self.assertIs(core.rest_client, reconnected)
+        core.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
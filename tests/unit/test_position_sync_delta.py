@@ -0,0 +1,142 @@
+import unittest
+
+from api.models import Position
+from app.features.order_sync.sync_engine import PositionSyncEngine
+from app.mixins.order_sync import OrderSyncMixin
+
+
+class _DummySignal:
+    def emit(self):
+        return None
+
+
+class _DummyLogger:
+    def warning(self, _msg):
+        return None
+
+
+class _StrategyStub:
+    def update_market_investment(self, *_args, **_kwargs):
+        return None
+
+    def update_sector_investment(self, *_args, **_kwargs):
+        return None
+
+    def update_consecutive_results(self, *_args, **_kwargs):
+        return None
+
+
+class _Harness(OrderSyncMixin):
+    def __init__(self):
+        self.universe = {
+            "005930": {"name": "SAMSUNG", "status": "watch", "held": 0, "buy_price": 0, "invest_amount": 0, "current": 1000},
+            "000660": {"name": "HYNIX", "status": "watch", "held": 0, "buy_price": 0, "invest_amount": 0, "current": 2000},
+        }
+        self._position_sync_pending = set()
+        self._position_sync_batch = set()
+        self._position_sync_scheduled = False
+        self._position_sync_retry_count = 0
+        self._pending_order_state = {}
+        self._manual_pending_state = {}
+        self._last_exec_event = {}
+        self._sync_failed_codes = set()
+        self._dirty_codes = set()
+        self._holding_or_pending_count = 0
+        self._reserved_cash_by_code = {}
+        self._log_cooldown_map = {}
+        self.strategy = _StrategyStub()
+        self.sound = None
+        self.telegram = None
+        self.logger = _DummyLogger()
+        self.sig_update_table = _DummySignal()
+        self.trades = []
+
+    def _add_trade(self, record):
+        self.trades.append(record)
+
+    def log(self, _msg):
+        return None
+
+
+def _pos(code, qty, price=1000):
+    return Position(code=code, name=code, quantity=qty, available_qty=qty, buy_price=price, buy_amount=qty * price)
+
+
+class TestPositionSyncEngine(unittest.TestCase):
+    def test_snapshot_diff_reports_only_changed_and_removed_codes(self):
+        engine = PositionSyncEngine(base_delay_ms=100)
+
+        changed, removed = engine.apply_snapshot([_pos("005930", 10), _pos("000660", 5)])
+        self.assertEqual(changed, {"005930", "000660"})
+        self.assertEqual(removed, set())
+
+        changed, removed = engine.apply_snapshot([_pos("005930", 12)])
+        self.assertEqual(changed, {"005930"})
+        self.assertEqual(removed, {"000660"})
+
+        engine.reset()
+        changed, _ = engine.apply_snapshot([_pos("005930", 12)])
+        self.assertEqual(changed, {"005930"})
+
+    def test_delay_widens_with_fill_rate_and_respects_budget(self):
+        engine = PositionSyncEngine(base_delay_ms=100, max_delay_ms=400, fill_window_sec=2.0, max_syncs_per_sec=2.0)
+
+        engine.note_request(now=10.0)
+        self.assertEqual(engine.next_delay_ms(now=10.0), 100)
+
+        for ts in (10.1, 10.2, 10.3, 10.4, 10.5, 10.6, 10.7):
+            engine.note_request(now=ts, scheduled=True)
+        self.assertEqual(engine.next_delay_ms(now=10.7), 400)
+        self.assertEqual(engine.coalesced_requests, 7)
+
+        # Old fills fall out of the window; the sync budget (2/s) still enforces a 500ms gap.
+        engine.begin_sync(now=20.0)
+        self.assertEqual(engine.next_delay_ms(now=20.0), 400)
+        self.assertEqual(engine.next_delay_ms(now=20.45), 100)
+
+        self.assertEqual(engine.next_delay_ms(now=30.0, rest_backlog_sec=0.3), 300)
+
+    def test_latency_metrics_recorded(self):
+        engine = PositionSyncEngine(base_delay_ms=100)
+        engine.begin_sync(now=1.0)
+        engine.apply_snapshot([], now=1.25)
+
+        metrics = engine.metrics()
+        self.assertEqual(metrics["sync_count"], 1)
+        self.assertAlmostEqual(metrics["last_latency_ms"], 250.0)
+
+
+class TestPositionSyncDeltaApply(unittest.TestCase):
+    def test_unchanged_settled_rows_are_skipped(self):
+        trader = _Harness()
+        positions = [_pos("005930", 10)]
+
+        trader._on_position_sync_result({"005930", "000660"}, positions)
+        self.assertEqual(trader.universe["005930"]["held"], 10)
+        self.assertEqual(trader.universe["005930"]["status"], "holding")
+        # 000660 is absent from the account and already idle, so only 005930 is applied.
+        self.assertEqual(trader._position_sync_metrics()["last_rows_touched"], 1)
+
+        trader._dirty_codes.clear()
+        trader._on_position_sync_result({"005930", "000660"}, positions)
+
+        metrics = trader._position_sync_metrics()
+        self.assertEqual(metrics["last_rows_touched"], 0)
+        self.assertEqual(metrics["rows_skipped_total"], 3)
+        self.assertEqual(trader._dirty_codes, set())
+        self.assertEqual(len(trader.trades), 1)
+
+    def test_unchanged_row_with_local_drift_is_reapplied(self):
+        trader = _Harness()
+        positions = [_pos("005930", 10)]
+        trader._on_position_sync_result({"005930"}, positions)
+
+        trader.universe["005930"]["held"] = 7
+        trader._on_position_sync_result({"005930"}, positions)
+
+        self.assertEqual(trader.universe["005930"]["held"], 10)
+        self.assertEqual(trader._position_sync_metrics()["last_rows_touched"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from data.providers.http_cache import ProviderHttpClient
+
+
+class _Response:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class _Session:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, params=None, headers=None, json=None, timeout=None):
+        self.calls.append({"method": method, "url": url, "params": params, "headers": dict(headers or {})})
+        return self.responses.pop(0)
+
+
+class TestProviderHttpCache(unittest.TestCase):
+    def test_fresh_hit_then_conditional_304_renews_entry(self):
+        client = ProviderHttpClient(ttl_sec={"news": 60}, stale_sec={"news": 0})
+        session = _Session(
+            [
+                _Response(200, b'{"items": [1]}', {"ETag": '"v1"'}),
+                _Response(304),
+            ]
+        )
+        with patch.object(client, "_session", return_value=session):
+            first = client.get("news", "https://example.test/news", params={"query": "삼성전자"})
+            second = client.get("news", "https://example.test/news", params={"query": "삼성전자"})
+            self.assertEqual(first.json(), {"items": [1]})
+            self.assertEqual(second.cache_state, "hit")
+            self.assertEqual(len(session.calls), 1)
+
+            client._memory[next(iter(client._memory))]["stored_at"] = time.time() - 120
+            third = client.get("news", "https://example.test/news", params={"query": "삼성전자"})
+
+        self.assertEqual(third.cache_state, "revalidated")
+        self.assertEqual(third.json(), {"items": [1]})
+        self.assertEqual(session.calls[-1]["headers"].get("If-None-Match"), '"v1"')
+        stats = client.stats()["news"]
+        self.assertEqual((stats["hits"], stats["misses"], stats["revalidated"]), (1, 1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+        self.assertEqual(stats["network_calls"], 2)
+
+    def test_disk_cache_survives_restart_and_serves_stale_on_error(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            writer = ProviderHttpClient(tmp_dir, ttl_sec={"macro": 3600})
+            with patch.object(writer, "_session", return_value=_Session([_Response(200, b'{"v": 3.5}')])):
+                writer.get("macro", "https://example.test/fred", params={"series_id": "DGS10"})
+
+            reader = ProviderHttpClient(tmp_dir, ttl_sec={"macro": 3600})
+            session = _Session([])
+            with patch.object(reader, "_session", return_value=session):
+                cached = reader.get("macro", "https://example.test/fred", params={"series_id": "DGS10"})
+            self.assertEqual(cached.cache_state, "hit")
+            self.assertEqual(cached.json(), {"v": 3.5})
+            self.assertEqual(session.calls, [])
+
+            expired = ProviderHttpClient(tmp_dir, ttl_sec={"macro": 0.001}, stale_sec={"macro": 0})
+            broken = _Session([])
+            broken.request = lambda *args, **kwargs: (_ for _ in ()).throw(requests.ConnectionError("down"))
+            time.sleep(0.01)
+            with patch.object(expired, "_session", return_value=broken):
+                fallback = expired.get("macro", "https://example.test/fred", params={"series_id": "DGS10"})
+            self.assertEqual(fallback.cache_state, "stale_error")
+            self.assertEqual(fallback.json(), {"v": 3.5})
+
+    def test_disk_cache_prunes_expired_then_oldest_entries(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            client = ProviderHttpClient(tmp_dir, ttl_sec={"macro": 3600}, disk_max_age_sec=3600, disk_max_bytes=10_000, prune_every=1000)
+            bodies = [_Response(200, b"x" * 3000) for _ in range(5)]
+            with patch.object(client, "_session", return_value=_Session(bodies)):
+                for idx in range(5):
+                    client.get("macro", "https://example.test/fred", params={"series_id": f"S{idx}"})
+            files = list(os.scandir(os.path.join(tmp_dir, "macro")))
+            self.assertEqual(len(files), 5)  # 첫 저장 때만 정리하고 이후는 prune_every 주기를 기다린다
+            now = time.time()
+            for idx, entry in enumerate(sorted(files, key=lambda e: e.stat().st_mtime)):
+                stamp = now - 7200 if idx == 0 else now - 100 + idx
+                os.utime(entry.path, (stamp, stamp))
+
+            self.assertEqual(client.prune_disk(), 2)  # 만료 1개 + 용량 초과분 중 가장 오래된 1개
+            remaining = sorted(entry.stat().st_mtime for entry in os.scandir(os.path.join(tmp_dir, "macro")))
+            self.assertEqual(len(remaining), 3)
+            self.assertGreater(remaining[0], now - 99)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""REST 비동기 전송 계층(call_async/submit) 단위 테스트."""
+import asyncio
+import concurrent.futures
+import unittest
+from unittest.mock import MagicMock, patch
+
+from api.auth import KiwoomAuth
+from api.rest_client import KiwoomRESTClient
+
+
+def _positions_response():
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = {
+        "return_code": 0,
+        "stocks": [
+            {"stk_cd": "005930", "stk_nm": "삼성전자", "hold_qty": "10", "sell_psbl_qty": "10", "cur_prc": "-70,000"},
+        ],
+    }
+    return resp
+
+
+class TestRestClientAsyncTransport(unittest.TestCase):
+    def setUp(self):
+        self.auth = MagicMock(spec=KiwoomAuth)
+        self.auth.base_url = "https://mockapi.kiwoom.com"
+        self.auth.get_auth_header.return_value = {"Authorization": "bearer TEST_TOKEN"}
+        self.auth.session_namespace = "kiwoom_mock"
+        self.client = KiwoomRESTClient(self.auth)
+        self.client._min_request_interval = 0.0
+
+    def tearDown(self):
+        self.client.close()
+
+    @patch("api.async_transport.HTTPX_AVAILABLE", False)
+    @patch("requests.Session.post")
+    def test_submit_returns_future_with_parsed_result(self, mock_post):
+        mock_post.return_value = _positions_response()
+
+        future = self.client.submit("get_positions", "12345678")
+
+        self.assertIsInstance(future, concurrent.futures.Future)
+        positions = future.result(timeout=5)
+        assert positions is not None
+        self.assertEqual(positions[0].code, "005930")
+        self.assertEqual(positions[0].current_price, 70000)
+        headers = mock_post.call_args[1]["headers"]
+        self.assertEqual(headers.get("api-id"), "ka30001")
+
+    @patch("api.async_transport.HTTPX_AVAILABLE", False)
+    @patch("requests.Session.post")
+    def test_aio_namespace_is_awaitable(self, mock_post):
+        mock_post.return_value = _positions_response()
+
+        async def _run():
+            return await self.client.aio.get_positions("12345678")
+
+        positions = asyncio.run(_run())
+
+        assert positions is not None
+        self.assertEqual(len(positions), 1)
+
+    @patch("api.async_transport.HTTPX_AVAILABLE", False)
+    @patch("requests.Session.post")
+    def test_sync_api_unchanged_outside_transport(self, mock_post):
+        mock_post.return_value = _positions_response()
+
+        positions = self.client.get_positions("12345678")
+
+        assert positions is not None
+        self.assertEqual(positions[0].quantity, 10)
+        self.assertIsNone(self.client._transport)
+
+    def test_private_or_lifecycle_methods_are_rejected(self):
+        with self.assertRaises(AttributeError):
+            self.client.submit("_request", "POST", "/x")
+        with self.assertRaises(AttributeError):
+            self.client.submit("close")
+
+    @patch("api.async_transport.HTTPX_AVAILABLE", False)
+    @patch("requests.Session.post")
+    def test_submit_runs_the_request_plan_on_the_loop(self, mock_post):
+        mock_post.return_value = _positions_response()
+        self.client._min_request_interval = 0.05
+        transport = self.client._get_transport()
+
+        with patch.object(transport, "run_blocking", side_effect=AssertionError("per-call executor thread")):
+            futures = [self.client.submit("get_positions", "12345678") for _ in range(5)]
+            results = [future.result(timeout=5) for future in futures]
+            name = self.client.submit("get_stock_name", "005930").result(timeout=5)
+
+        # 속도 제한 대기열에 밀린 호출도 취소되지 않고 모두 응답을 받는다
+        self.assertTrue(all(positions and positions[0].code == "005930" for positions in results))
+        self.assertEqual(name, "")
+
+    def test_request_errors_are_thrown_into_the_plan(self):
+        async def _boom(*_args):
+            raise RuntimeError("loop transport failure")
+
+        with patch.object(self.client, "_request_async", _boom):
+            orders = self.client.submit("get_open_orders", "12345678").result(timeout=5)
+        self.assertIsNone(orders)  # get_open_orders 자체의 예외 처리로 None
+
+    def test_rate_limit_reserves_spaced_slots(self):
+        self.client._min_request_interval = 0.2
+        self.client._last_request_time = 0
+
+        first = self.client._reserve_request_slot()
+        second = self.client._reserve_request_slot()
+        third = self.client._reserve_request_slot()
+
+        self.assertEqual(first, 0.0)
+        self.assertAlmostEqual(second, 0.2, delta=0.05)
+        self.assertAlmostEqual(third, 0.4, delta=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import sqlite3
 import tempfile
 import unittest
 from pathlib import Path
@@ -11,13 +12,13 @@ class _Harness(PersistenceSettingsMixin):
 
 
 class TestTradeHistoryAtomicFailure(unittest.TestCase):
-    def test_worker_raises_when_atomic_replace_fails(self):
+    def test_worker_raises_when_store_cannot_be_opened(self):
         trader = _Harness()
         with tempfile.TemporaryDirectory() as tmpdir:
             target_directory = Path(tmpdir) / "history_as_directory"
             target_directory.mkdir()
-            with patch("app.features.persistence.trade_history.Config.TRADE_HISTORY_FILE", str(target_directory)):
-                with self.assertRaises(OSError):
+            with patch("app.features.persistence.trade_history.Config.TRADE_HISTORY_DB_FILE", str(target_directory)):
+                with self.assertRaises((OSError, sqlite3.Error)):
                     trader._save_trade_history_worker([{"seq": 1}])
 
 
@@ -1,7 +1,9 @@
+import threading
 import unittest
 from unittest.mock import patch
 
 from app.mixins.persistence_settings import PersistenceSettingsMixin
+from app.support.trade_store import TradeStore
 
 
 class _DummyLogger:
@@ -53,37 +55,49 @@ class _ThreadPool:
 class _Harness(PersistenceSettingsMixin):
     def __init__(self, sync_flush=False):
         self.trade_history = []
+        self._history_unsaved = []
         self._history_dirty = False
         self._history_save_inflight = False
         self._history_save_pending_snapshot = None
+        self._history_save_lock = threading.RLock()
+        self._history_save_inflight_batch = None
         self.threadpool = _ThreadPool()
         self.logger = _DummyLogger()
         self.config = type("Cfg", (), {"sync_history_flush_on_exit": bool(sync_flush)})()
         self.saved_payloads = []
-        self.synced_payload = None
+        self.synced_payloads = []
 
-    def _save_trade_history_worker(self, history):
-        self.saved_payloads.append(list(history))
+    def queue(self, record):
+        self.trade_history.append(record)
+        self._history_unsaved.append(record)
+        self._history_dirty = True
+
+    def _save_trade_history_worker(self, records):
+        self.saved_payloads.append(list(records))
         return None
 
-    def _save_trade_history_sync(self, history_snapshot=None):
-        payload = list(self.trade_history) if history_snapshot is None else list(history_snapshot)
-        self.synced_payload = payload
-        self._history_dirty = False
-        self._history_save_pending_snapshot = None
-        self._history_save_inflight = False
+    def _trade_store_safe(self):
+        harness = self
+
+        class _Store(TradeStore):
+            def append_many(self, records):
+                records = list(records)
+                harness.synced_payloads.append(records)
+                return len(records)
+
+        return _Store(":memory:")
 
 
 class TestTradeHistorySingleWriter(unittest.TestCase):
     @patch("app.features.persistence.trade_history.Worker", _FakeWorker)
-    def test_single_writer_keeps_latest_snapshot_order(self):
+    def test_single_writer_appends_batches_in_order(self):
         trader = _Harness(sync_flush=False)
-        trader.trade_history = [{"seq": 1}]
-        trader._history_dirty = True
+        trader.queue({"seq": 1})
         trader._save_trade_history()
 
-        trader.trade_history = [{"seq": 2}]
-        trader._history_dirty = True
+        trader.queue({"seq": 2})
+        trader._save_trade_history()
+        trader.queue({"seq": 3})
         trader._save_trade_history()
 
         self.assertEqual(len(trader.threadpool.queue), 1)
@@ -91,26 +105,42 @@ class TestTradeHistorySingleWriter(unittest.TestCase):
         self.assertEqual(len(trader.threadpool.queue), 1)
         trader.threadpool.run_next_success()
 
-        self.assertEqual(trader.saved_payloads, [[{"seq": 1}], [{"seq": 2}]])
+        self.assertEqual(trader.saved_payloads, [[{"seq": 1}], [{"seq": 2}, {"seq": 3}]])
         self.assertFalse(trader._history_dirty)
         self.assertFalse(trader._history_save_inflight)
         self.assertIsNone(trader._history_save_pending_snapshot)
 
     @patch("app.features.persistence.trade_history.Worker", _FakeWorker)
-    def test_exit_flush_persists_latest_snapshot_even_with_async_policy(self):
+    def test_exit_flush_persists_queued_records_even_with_async_policy(self):
         trader = _Harness(sync_flush=False)
-        trader.trade_history = [{"seq": 9}]
-        trader._history_dirty = True
+        trader.queue({"seq": 9})
         trader._save_trade_history()
 
-        trader.trade_history = [{"seq": 10}]
-        trader._history_dirty = True
+        trader.queue({"seq": 10})
         trader._save_trade_history()
+        trader.queue({"seq": 11})
 
         trader._flush_trade_history_on_exit()
 
-        self.assertEqual(trader.synced_payload, [{"seq": 10}])
+        # 아직 실행되지 않은 진행 중 배치(9)도 종료 저장에 포함되고, 늦게 도는 워커는 다시 쓰지 않는다.
+        self.assertEqual(trader.synced_payloads, [[{"seq": 9}, {"seq": 10}, {"seq": 11}]])
         self.assertFalse(trader._history_dirty)
+        trader.threadpool.run_next_success()
+        self.assertEqual(trader.saved_payloads, [])
+        self.assertEqual(len(trader.synced_payloads), 1)
+
+    @patch("app.features.persistence.trade_history.Worker", _FakeWorker)
+    def test_failed_batch_is_requeued_ahead_of_newer_records(self):
+        trader = _Harness(sync_flush=False)
+        trader.queue({"seq": 1})
+        trader._save_trade_history()
+        trader.queue({"seq": 2})
+        trader._save_trade_history()
+
+        trader.threadpool.queue.pop(0).signals.error.emit(OSError("disk full"))
+
+        self.assertTrue(trader._history_dirty)
+        self.assertEqual(trader._history_save_pending_snapshot, [{"seq": 1}, {"seq": 2}])
 
 
 if __name__ == "__main__":
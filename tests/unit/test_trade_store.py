@@ -0,0 +1,102 @@
+import datetime
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from app.mixins.persistence_settings import PersistenceSettingsMixin
+from app.support.trade_store import TradeStore
+
+
+class _DummyLogger:
+    def info(self, _msg):
+        return None
+
+    def warning(self, _msg):
+        return None
+
+    def error(self, _msg):
+        return None
+
+
+class _Harness(PersistenceSettingsMixin):
+    def __init__(self):
+        self.trade_history = []
+        self._history_dirty = False
+        self._history_save_lock = threading.RLock()
+        self._history_save_inflight_batch = None
+        self.trade_count = 0
+        self.win_count = 0
+        self.total_realized_profit = 0
+        self.daily_realized_profit = 0
+        self.logger = _DummyLogger()
+
+    def _refresh_history_table(self):
+        return None
+
+
+class TestTradeStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_json_migration_and_indexed_day_stats(self):
+        legacy = [
+            {"timestamp": "2026-01-02T09:00:00", "code": "005930", "type": "매수", "profit": 0},
+            {"timestamp": "2026-01-02T10:00:00", "code": "005930", "type": "매도", "profit": 1500},
+            {"timestamp": "2026-01-03T09:30:00", "code": "000660", "type": "매도", "profit": -700},
+        ]
+        json_path = self.base / "history.json"
+        json_path.write_text(json.dumps(legacy, ensure_ascii=False), encoding="utf-8")
+        store = TradeStore(str(self.base / "trades.db"))
+
+        self.assertEqual(store.migrate_from_json(str(json_path)), 3)
+        self.assertEqual(store.migrate_from_json(str(json_path)), 0)
+        store.append_many([{"timestamp": "2026-01-03T11:00:00", "code": "000660", "type": "매도", "profit": 300}])
+
+        self.assertEqual(store.count(), 4)
+        self.assertEqual([r["code"] for r in store.day_records("2026-01-02")], ["005930", "005930"])
+        self.assertEqual(
+            store.day_stats("2026-01-03"),
+            {"trades": 2, "sells": 2, "wins": 1, "total_profit": -400, "max_profit": 300, "max_loss": -700},
+        )
+        self.assertEqual(store.delete_day("2026-01-02"), 2)
+        self.assertEqual(store.count(), 2)
+        store.close()
+
+    def test_load_keeps_only_today_and_stats_stay_incremental(self):
+        today = datetime.datetime.now().strftime("%Y-%m-%d")
+        legacy = [
+            {"timestamp": "2020-01-02T09:00:00", "code": "005930", "type": "매도", "profit": 100},
+            {"timestamp": f"{today}T09:00:00", "code": "005930", "type": "매도", "profit": 500},
+        ]
+        json_path = self.base / "history.json"
+        json_path.write_text(json.dumps(legacy, ensure_ascii=False), encoding="utf-8")
+        trader = _Harness()
+
+        with patch("app.features.persistence.trade_history.Config.TRADE_HISTORY_FILE", str(json_path)), patch(
+            "app.features.persistence.trade_history.Config.TRADE_HISTORY_DB_FILE", str(self.base / "trades.db")
+        ):
+            trader._load_trade_history()
+            self.assertEqual(len(trader.trade_history), 1)
+            trader._add_trade({"code": "000660", "type": "매도", "profit": -200})
+
+            stats = trader._today_trade_stats()
+            self.assertEqual((stats["trades"], stats["sells"], stats["wins"], stats["total_profit"]), (2, 2, 1, 300))
+            self.assertEqual((stats["max_profit"], stats["max_loss"]), (500, -200))
+
+            trader._save_trade_history()
+            self.assertEqual(trader._trade_store_safe().count(), 3)
+            self.assertFalse(trader._history_dirty)
+            trader._history_day_stats = None
+            self.assertEqual(trader._today_trade_stats(), stats)
+            trader._trade_store_safe().close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import threading
+import unittest
+
+from api.models import ExecutionData
+from app.core.scheduler import CoreScheduler, CoreSignal
+from app.core.trading_core import TradingCore
+from config import TradingConfig
+
+
+class _REST:
+    def __init__(self):
+        self.sells = []
+        self.position_calls = 0
+        self.threads = set()
+
+    def sell_market(self, _account, code, quantity):
+        self.threads.add(threading.get_ident())
+        self.sells.append((code, quantity))
+        return type("Result", (), {"success": True, "order_no": "S1", "message": ""})()
+
+    def get_positions(self, _account):
+        self.position_calls += 1
+        return []
+
+
+def _core(rest):
+    config = TradingConfig()
+    config.execution_mode = "live"
+    config.execution_policy = "market"
+    core = TradingCore(config, rest_client=rest, account="12345678", deposit=1_000_000)
+    core.universe["005930"] = {
+        "name": "삼성전자",
+        "status": "holding",
+        "held": 10,
+        "buy_price": 1000,
+        "target": 0,
+        "current": 1000,
+        "price_history": [],
+        "minute_prices": [],
+    }
+    core.is_running = True
+    return core
+
+
+class TestTradingCoreHeadless(unittest.TestCase):
+    def test_tick_drives_stop_loss_sell_through_core_loop(self):
+        rest = _REST()
+        core = _core(rest)
+        logs, trades = [], []
+        core.subscribe("log", logs.append)
+        core.subscribe("trade", trades.append)
+
+        core.on_tick(ExecutionData(code="005930", exec_price=900, total_volume=100))
+        self.assertEqual(rest.sells, [])  # 틱은 루프에 큐잉될 뿐 즉시 처리되지 않는다
+
+        self.assertTrue(core.core_scheduler.run_until_idle(timeout=5.0, include_timers=True))
+
+        self.assertEqual(rest.sells, [("005930", 10)])
+        self.assertNotIn(threading.get_ident(), rest.threads)
+        self.assertTrue(any("SELL submitted" in line for line in logs))
+        # 디바운스 타이머 -> 잔고 동기화까지 코어 루프에서 이어져 청산이 확정된다.
+        self.assertEqual(rest.position_calls, 1)
+        self.assertEqual([(t["type"], t["quantity"], t["profit"]) for t in trades], [("매도", 10, -1000)])
+        self.assertEqual(core.universe["005930"]["held"], 0)
+        self.assertEqual(core._pending_order_state, {})
+        core.stop()
+
+    def test_order_event_is_handled_on_core_loop(self):
+        rest = _REST()
+        core = _core(rest)
+        logs, events = [], []
+        core.subscribe("log", logs.append)
+        core.subscribe("order_execution", events.append)
+
+        event = {"code": "005930", "order_type": "2", "order_status": "체결", "order_no": "S9", "exec_qty": 10, "exec_price": 1000}
+        core.on_order_event(event)
+        self.assertEqual(events, [])
+
+        self.assertTrue(core.core_scheduler.run_until_idle(timeout=5.0, include_timers=True))
+
+        self.assertEqual(events, [event])
+        self.assertTrue(any("매도 체결" in line for line in logs))
+        self.assertEqual(rest.position_calls, 1)
+        self.assertEqual(core.universe["005930"]["held"], 0)
+        core.stop()
+
+    def test_loop_thread_runs_timers_and_signals_in_order(self):
+        scheduler = CoreScheduler(name="core-test")
+        signal = CoreSignal(scheduler)
+        seen = []
+        done = threading.Event()
+
+        def record(tag):
+            seen.append((tag, threading.get_ident()))
+            if tag == "late":
+                done.set()
+
+        signal.connect(record)
+        scheduler.start()
+        scheduler.call_later(30, record, "late")
+        scheduler.call_later(5, record, "early")
+        signal.emit("signal")
+        self.assertTrue(done.wait(2.0))
+        scheduler.stop()
+
+        self.assertEqual([tag for tag, _ in seen], ["signal", "early", "late"])
+        self.assertEqual(len({ident for _, ident in seen}), 1)
+        self.assertNotEqual(seen[0][1], threading.get_ident())
+        with self.assertRaises(ValueError):
+            TradingCore().subscribe("unknown", print)
+
+
+if __name__ == "__main__":
+    unittest.main()